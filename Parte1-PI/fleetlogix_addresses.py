@@ -0,0 +1,158 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Direcciones Dominicanas Vectorizadas por Ciudad de Destino
+═══════════════════════════════════════════════════════════════════════════════
+Arma direcciones del tipo:
+
+    Av. 27 de Febrero #118, Naco, Santo Domingo
+
+a partir de tablas de componentes por ciudad (calles y sectores) en
+data/address_components.csv. Las ciudades sin componentes propios usan
+las filas genéricas (city = '*').
+
+La composición es vectorizada sobre columnas completas: por ciudad se
+precalculan las cabeceras "calle #número" y las colas ", sector, ciudad",
+y cada dirección es un gather de índices más UNA concatenación, sin
+llamadas por fila a Faker.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from fleetlogix_catalog import DATA_DIR
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_COMPONENTS_FILE = os.path.join(DATA_DIR, 'address_components.csv')
+
+# Ciudad comodín del archivo de componentes (calles y sectores genéricos)
+GENERIC_CITY = '*'
+
+# Números de casa posibles: 1..MAX_HOUSE_NUMBER
+MAX_HOUSE_NUMBER = 250
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: LIBRETA DE DIRECCIONES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AddressBook:
+    """
+    Componentes de dirección precompuestos por ciudad del catálogo
+
+    Atributos:
+        cities (numpy.array): Ciudades en el orden del CityCatalog
+        heads (numpy.array): "calle #número" de todos los juegos de calles
+        tails (numpy.array): ", sector, ciudad" de todas las ciudades
+    """
+
+    def __init__(self, cities, components):
+        """
+        Args:
+            cities (array-like): Ciudades (posición = índice de ciudad)
+            components (pd.DataFrame): Columnas city, component (street|sector), value
+        """
+        self.cities = np.asarray(cities, dtype=object)
+        self.index = pd.Index(self.cities)
+
+        unknown = set(components['component']) - {'street', 'sector'}
+        if unknown:
+            raise ValueError(f"Componentes de dirección desconocidos: {', '.join(sorted(unknown))}")
+
+        grouped = {
+            key: group['value'].tolist()
+            for key, group in components.groupby(['city', 'component'], sort=False)
+        }
+        numbers = np.array([str(n) for n in range(1, MAX_HOUSE_NUMBER + 1)], dtype=object)
+
+        heads, tails = [], []
+        head_offsets = {}
+        self.head_start = np.empty(len(self.cities), dtype=np.int64)
+        self.num_streets = np.empty(len(self.cities), dtype=np.int64)
+        self.tail_start = np.empty(len(self.cities), dtype=np.int64)
+        self.num_sectors = np.empty(len(self.cities), dtype=np.int64)
+        head_size = tail_size = 0
+
+        for i, city in enumerate(self.cities):
+            streets = grouped.get((city, 'street')) or grouped.get((GENERIC_CITY, 'street'))
+            sectors = grouped.get((city, 'sector')) or grouped.get((GENERIC_CITY, 'sector'))
+            if not streets or not sectors:
+                raise ValueError(f"Sin calles o sectores para '{city}' ni componentes genéricos ('{GENERIC_CITY}')")
+
+            # Las ciudades que comparten juego de calles (ej: genéricas) comparten cabeceras
+            key = tuple(streets)
+            if key not in head_offsets:
+                block = (np.array([f"{street} #" for street in streets], dtype=object)[:, None]
+                         + numbers[None, :]).ravel()
+                head_offsets[key] = head_size
+                heads.append(block)
+                head_size += len(block)
+
+            self.head_start[i] = head_offsets[key]
+            self.num_streets[i] = len(streets)
+            self.tail_start[i] = tail_size
+            self.num_sectors[i] = len(sectors)
+            tails.append(np.array([f", {sector}, {city}" for sector in sectors], dtype=object))
+            tail_size += len(sectors)
+
+        self.heads = np.concatenate(heads)
+        self.tails = np.concatenate(tails)
+
+    @classmethod
+    def from_file(cls, cities, components_file=DEFAULT_COMPONENTS_FILE):
+        """
+        Carga los componentes desde CSV (city, component, value)
+
+        Args:
+            cities (array-like): Ciudades del catálogo (CityCatalog.cities)
+            components_file (str): Ruta del CSV de componentes
+
+        Returns:
+            AddressBook: Libreta lista para componer direcciones
+        """
+        return cls(cities, pd.read_csv(components_file))
+
+    def city_index(self, city_names):
+        """
+        Posición de cada ciudad en el catálogo
+
+        Raises:
+            ValueError: Si alguna ciudad no está en el catálogo
+        """
+        positions = self.index.get_indexer(np.asarray(city_names, dtype=object))
+        if (positions < 0).any():
+            missing = sorted(set(np.asarray(city_names, dtype=object)[positions < 0]))
+            raise ValueError(f"Ciudades fuera del catálogo: {', '.join(missing)}")
+        return positions
+
+    def compose(self, city_index, random_state=None):
+        """
+        Una dirección por elemento de city_index, dentro de esa ciudad
+
+        Args:
+            city_index (np.array): Posición de ciudad por dirección (ver city_index())
+            random_state (np.random.Generator): Flujo aleatorio (ej: STREAMS...column('delivery_address'))
+
+        Returns:
+            numpy.array: Direcciones (dtype object)
+        """
+        rng = random_state if random_state is not None else np.random.default_rng()
+        city_index = np.asarray(city_index, dtype=np.int64)
+        n = len(city_index)
+
+        streets = (rng.random(n) * self.num_streets[city_index]).astype(np.int64)
+        numbers = rng.integers(0, MAX_HOUSE_NUMBER, n)
+        sectors = (rng.random(n) * self.num_sectors[city_index]).astype(np.int64)
+
+        heads = self.heads[self.head_start[city_index] + streets * MAX_HOUSE_NUMBER + numbers]
+        tails = self.tails[self.tail_start[city_index] + sectors]
+        return heads + tails
+
+    def __len__(self):
+        return len(self.cities)
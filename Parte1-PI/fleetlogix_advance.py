@@ -0,0 +1,287 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Avance de Estado Simulado (actualizaciones masivas)
+═══════════════════════════════════════════════════════════════════════════════
+Mueve hacia adelante el estado "actual" de la base de datos hasta un
+instante simulado:
+
+- Viajes in_progress cuya llegada calculada (salida + duración estimada de
+  la ruta × 0.8-1.2, igual que el generador) es <= --until → completed
+- Entregas pending con scheduled_datetime <= --until → delivered o failed
+  (viaje cancelado → siempre failed)
+
+Los cambios se calculan por lotes con NumPy, se copian (COPY) a tablas
+temporales de staging y se aplican con UN solo UPDATE ... FROM por tabla,
+en una única transacción. Nunca fila por fila.
+
+Constraints respetados:
+- chk_trips_arrival_after_departure: arrival = salida + duración > 0
+- chk_deliveries_datetime_order: delivered = min(scheduled + demora, until)
+  y scheduled <= until, por lo que delivered >= scheduled
+
+Uso:
+    python fleetlogix_advance.py --until "2026-01-15 12:00"
+    python fleetlogix_advance.py --until 2026-03-01 --dry-run
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import csv
+import io
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import fleetlogix_generator as flg
+from fleetlogix_streams import RandomStreams
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Filas leídas por lote del cursor del servidor
+FETCH_BATCH_SIZE = 50000
+
+# Variación de la duración real respecto a la estimada (igual que generate_trips)
+DURATION_VARIATION = (0.8, 1.2)
+
+# Demora máxima de una entrega respecto a su hora programada (minutos)
+MAX_DELIVERY_DELAY_MINUTES = 60
+
+# Probabilidad de éxito de una entrega vencida: proporción delivered / (delivered + failed)
+# de DELIVERY_STATUS_SAMPLER para viajes completados (0.85 / 0.90)
+DELIVERED_PROBABILITY = 0.85 / 0.90
+
+DUE_TRIPS_SQL = """
+    SELECT t.trip_id, t.departure_datetime, r.estimated_duration_hours
+    FROM trips t
+    JOIN routes r ON r.route_id = t.route_id
+    WHERE t.status = 'in_progress'
+      AND t.arrival_datetime IS NULL
+      AND t.departure_datetime < %s
+"""
+
+DUE_DELIVERIES_SQL = """
+    SELECT d.delivery_id, d.scheduled_datetime, t.status = 'cancelled'
+    FROM deliveries d
+    JOIN trips t ON t.trip_id = d.trip_id
+    WHERE d.delivery_status = 'pending'
+      AND d.scheduled_datetime <= %s
+"""
+
+# Las condiciones de estado se repiten en el UPDATE: si otra sesión cambió
+# la fila después de leerla, no se sobrescribe
+APPLY_TRIPS_SQL = """
+    UPDATE trips t
+    SET arrival_datetime = s.arrival_datetime,
+        status = 'completed'
+    FROM trip_advance s
+    WHERE t.trip_id = s.trip_id
+      AND t.status = 'in_progress'
+      AND t.arrival_datetime IS NULL
+      AND s.arrival_datetime > t.departure_datetime
+"""
+
+APPLY_DELIVERIES_SQL = """
+    UPDATE deliveries d
+    SET delivery_status = s.delivery_status,
+        delivered_datetime = s.delivered_datetime,
+        recipient_signature = s.recipient_signature
+    FROM delivery_advance s
+    WHERE d.delivery_id = s.delivery_id
+      AND d.delivery_status = 'pending'
+      AND (s.delivered_datetime IS NULL OR s.delivered_datetime >= d.scheduled_datetime)
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: CÁLCULO VECTORIZADO DE TRANSICIONES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def advance_trips(rows, until, rng):
+    """
+    Calcula la llegada de un lote de viajes en curso y conserva los ya vencidos
+
+    Args:
+        rows (list): Tuplas (trip_id, departure_datetime, estimated_duration_hours)
+        until (datetime): Instante simulado
+        rng (np.random.Generator): Flujo aleatorio de la duración
+
+    Returns:
+        pd.DataFrame: trip_id, arrival_datetime (solo arrival <= until)
+    """
+    batch = pd.DataFrame(rows, columns=['trip_id', 'departure_datetime', 'estimated_duration_hours'])
+    hours = batch['estimated_duration_hours'].astype(float).to_numpy() * rng.uniform(*DURATION_VARIATION, len(batch))
+    arrival = pd.to_datetime(batch['departure_datetime']) + pd.to_timedelta(hours, unit='h')
+
+    due = (arrival <= until).to_numpy()
+    return pd.DataFrame({'trip_id': batch['trip_id'][due], 'arrival_datetime': arrival[due]})
+
+
+def advance_deliveries(rows, until, rng):
+    """
+    Resuelve un lote de entregas pendientes vencidas (delivered o failed)
+
+    Args:
+        rows (list): Tuplas (delivery_id, scheduled_datetime, viaje_cancelado)
+        until (datetime): Instante simulado
+        rng (np.random.Generator): Flujo aleatorio del resultado
+
+    Returns:
+        pd.DataFrame: delivery_id, delivery_status, delivered_datetime, recipient_signature
+    """
+    batch = pd.DataFrame(rows, columns=['delivery_id', 'scheduled_datetime', 'trip_cancelled'])
+    scheduled = pd.to_datetime(batch['scheduled_datetime'])
+    cancelled = batch['trip_cancelled'].to_numpy(dtype=bool)
+
+    delivered = (rng.random(len(batch)) < DELIVERED_PROBABILITY) & ~cancelled
+    delay = pd.to_timedelta(rng.integers(0, MAX_DELIVERY_DELAY_MINUTES + 1, len(batch)), unit='m')
+    delivered_at = (scheduled + delay).clip(upper=pd.Timestamp(until))
+    signature = flg.SIGNATURE_SAMPLER.sample(len(batch), random_state=rng)
+
+    return pd.DataFrame({
+        'delivery_id': batch['delivery_id'],
+        'delivery_status': np.where(delivered, 'delivered', 'failed'),
+        'delivered_datetime': delivered_at.where(delivered),
+        'recipient_signature': signature.astype(bool) & delivered,
+    })
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: STAGING Y UPDATE ... FROM
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def copy_to_staging(cursor, table_name, df):
+    """
+    Copia un lote al staging temporal con COPY (CSV en memoria; vacío = NULL)
+    """
+    if df.empty:
+        return 0
+
+    buffer = io.StringIO()
+    df.to_csv(buffer, index=False, header=False, date_format='%Y-%m-%d %H:%M:%S.%f',
+              quoting=csv.QUOTE_MINIMAL)
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table_name} ({','.join(df.columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+    return len(df)
+
+
+def stage_transitions(conn, select_sql, until, staging_table, compute, rng):
+    """
+    Lee los candidatos con un cursor del servidor y copia sus transiciones al staging
+
+    Returns:
+        tuple: (candidatos leídos, filas en staging)
+    """
+    candidates = staged = 0
+    with conn.cursor(name=f"{staging_table}_candidates") as source, conn.cursor() as cursor:
+        source.itersize = FETCH_BATCH_SIZE
+        source.execute(select_sql, (until,))
+        while True:
+            rows = source.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            candidates += len(rows)
+            staged += copy_to_staging(cursor, staging_table, compute(rows, until, rng))
+    return candidates, staged
+
+
+def advance_state(until, seed=flg.RANDOM_SEED, dry_run=False):
+    """
+    Aplica todas las transiciones vencidas hasta `until` en una sola transacción
+
+    Args:
+        until (datetime): Instante simulado
+        seed (int): Semilla de los flujos aleatorios del avance
+        dry_run (bool): Calcular y reportar sin confirmar (ROLLBACK)
+
+    Returns:
+        dict: Conteos por tabla (candidatos, en staging, actualizados)
+    """
+    streams = RandomStreams(seed).table('advance')
+    conn = flg.get_connection()
+
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                CREATE TEMP TABLE trip_advance (
+                    trip_id INTEGER PRIMARY KEY,
+                    arrival_datetime TIMESTAMP NOT NULL
+                ) ON COMMIT DROP
+            """)
+            cursor.execute("""
+                CREATE TEMP TABLE delivery_advance (
+                    delivery_id INTEGER PRIMARY KEY,
+                    delivery_status VARCHAR(20) NOT NULL,
+                    delivered_datetime TIMESTAMP,
+                    recipient_signature BOOLEAN NOT NULL
+                ) ON COMMIT DROP
+            """)
+
+        # Viajes primero: su llegada no depende de las entregas
+        trip_candidates, trip_staged = stage_transitions(
+            conn, DUE_TRIPS_SQL, until, 'trip_advance', advance_trips, streams.column('arrival_datetime'))
+        delivery_candidates, delivery_staged = stage_transitions(
+            conn, DUE_DELIVERIES_SQL, until, 'delivery_advance', advance_deliveries, streams.column('delivery_status'))
+
+        with conn.cursor() as cursor:
+            cursor.execute(APPLY_TRIPS_SQL)
+            trips_updated = cursor.rowcount
+            cursor.execute(APPLY_DELIVERIES_SQL)
+            deliveries_updated = cursor.rowcount
+
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+
+        return {
+            'trips': (trip_candidates, trip_staged, trips_updated),
+            'deliveries': (delivery_candidates, delivery_staged, deliveries_updated),
+        }
+
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ ERROR al avanzar el estado: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: PUNTO DE ENTRADA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Avanzar viajes en curso y entregas pendientes hasta un instante simulado")
+    parser.add_argument('--until', required=True, type=datetime.fromisoformat,
+                        help="Instante simulado (ej: '2026-01-15 12:00')")
+    parser.add_argument('--seed', type=int, default=flg.RANDOM_SEED,
+                        help=f"Semilla de las transiciones (default: {flg.RANDOM_SEED})")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Calcular y reportar sin aplicar los cambios")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("="*70)
+    print(f"AVANCE DE ESTADO HASTA {args.until}" + (" (dry-run)" if args.dry_run else ""))
+    print("="*70)
+
+    start = time.time()
+    counts = advance_state(args.until, args.seed, args.dry_run)
+
+    for table, (candidates, staged, updated) in counts.items():
+        print(f"✓ {table}: {candidates:,} candidatos, {staged:,} vencidos, {updated:,} actualizados")
+    print(f"\n⏱️ {time.time() - start:.2f} segundos" + (" - cambios descartados (dry-run)" if args.dry_run else ""))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Tablas de Resumen de KPIs (agregados diarios)
+═══════════════════════════════════════════════════════════════════════════════
+Calcula durante la generación, sobre los DataFrames que ya están en memoria,
+los agregados diarios que los dashboards recalculaban desde trips/deliveries:
+
+- daily_vehicle_summary: por (fecha de salida, vehicle_id)
+- daily_route_summary:   por (fecha de salida, route_id)
+
+Métricas: viajes, viajes completados, km, combustible, factor de carga
+promedio, entregas entregadas/fallidas/pendientes y costo de peajes.
+
+Todo se calcula con group-bys vectorizados (sin recorrer filas en Python).
+Las tablas destino están definidas en fleetlogix_schema_completo.sql.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+import pandas as pd
+
+from fleetlogix_catalog import RouteTable
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Tabla destino → columna de agrupación (además de la fecha)
+SUMMARY_TABLES = {
+    'daily_vehicle_summary': 'vehicle_id',
+    'daily_route_summary': 'route_id'
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: HECHOS POR VIAJE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def trip_facts(trips_df, vehicles_df, routes_df, deliveries_df, first_trip_id=1):
+    """
+    Construye una fila de hechos por viaje con todas las métricas a agregar
+
+    Los atributos de vehículo y ruta se obtienen por gather directo sobre
+    arrays indexados por ID (vehicle_id y route_id son índice + 1; trip_id es
+    first_trip_id + índice), y los conteos de entregas por viaje con np.bincount.
+
+    Args:
+        trips_df (pd.DataFrame): Viajes generados
+        vehicles_df (pd.DataFrame): Vehículos generados
+        routes_df (pd.DataFrame): Rutas generadas
+        deliveries_df (pd.DataFrame): Entregas generadas
+        first_trip_id (int): trip_id de la primera fila (TRIP_ID_OFFSET + 1 en shards)
+
+    Returns:
+        pd.DataFrame: Hechos por viaje (summary_date, vehicle_id, route_id, ...)
+    """
+    num_trips = len(trips_df)
+    vehicle_ids = trips_df['vehicle_id'].to_numpy()
+    route_ids = trips_df['route_id'].to_numpy()
+
+    route_table = RouteTable(routes_df)
+    capacity = vehicles_df['capacity_kg'].to_numpy(dtype=np.float64)[vehicle_ids - 1]
+
+    trip_rows = deliveries_df['trip_id'].to_numpy() - first_trip_id
+    delivery_status = deliveries_df['delivery_status'].to_numpy()
+
+    def deliveries_with(status):
+        return np.bincount(trip_rows[delivery_status == status], minlength=num_trips)[:num_trips]
+
+    return pd.DataFrame({
+        'summary_date': pd.to_datetime(trips_df['departure_datetime']).dt.normalize().to_numpy(),
+        'vehicle_id': vehicle_ids,
+        'route_id': route_ids,
+        'completed': (trips_df['status'].to_numpy() == 'completed'),
+        'km': route_table.distance_km[route_ids],
+        'fuel_liters': trips_df['fuel_consumed_liters'].to_numpy(dtype=np.float64),
+        'load_factor': trips_df['total_weight_kg'].to_numpy(dtype=np.float64) / capacity,
+        'deliveries_delivered': deliveries_with('delivered'),
+        'deliveries_failed': deliveries_with('failed'),
+        'deliveries_pending': deliveries_with('pending'),
+        'toll_cost': route_table.toll_cost[route_ids]
+    })
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: AGREGADOS DIARIOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def summarize_facts(facts, key):
+    """
+    Agrega los hechos por viaje por (fecha, key)
+
+    Args:
+        facts (pd.DataFrame): Resultado de trip_facts()
+        key (str): 'vehicle_id' o 'route_id'
+
+    Returns:
+        pd.DataFrame: Una fila por día y clave, con las columnas de la tabla de resumen
+    """
+    summary = facts.groupby(['summary_date', key], sort=True).agg(
+        trips=('km', 'size'),
+        completed_trips=('completed', 'sum'),
+        total_km=('km', 'sum'),
+        fuel_liters=('fuel_liters', 'sum'),
+        avg_load_factor=('load_factor', 'mean'),
+        deliveries_delivered=('deliveries_delivered', 'sum'),
+        deliveries_failed=('deliveries_failed', 'sum'),
+        deliveries_pending=('deliveries_pending', 'sum'),
+        toll_cost=('toll_cost', 'sum')
+    ).reset_index()
+
+    summary['summary_date'] = summary['summary_date'].dt.date
+    summary[['total_km', 'fuel_liters', 'toll_cost']] = \
+        summary[['total_km', 'fuel_liters', 'toll_cost']].round(2)
+    summary['avg_load_factor'] = summary['avg_load_factor'].round(4)
+
+    return summary
+
+
+def build_summaries(trips_df, vehicles_df, routes_df, deliveries_df, first_trip_id=1):
+    """
+    Calcula todas las tablas de resumen a partir de los DataFrames generados
+
+    Args:
+        first_trip_id (int): trip_id de la primera fila de trips_df (ver trip_facts)
+
+    Returns:
+        dict: {nombre_tabla: pd.DataFrame}
+    """
+    facts = trip_facts(trips_df, vehicles_df, routes_df, deliveries_df, first_trip_id)
+    return {table: summarize_facts(facts, key) for table, key in SUMMARY_TABLES.items()}
@@ -0,0 +1,450 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Motor Analítico en Memoria con Caché
+═══════════════════════════════════════════════════════════════════════════════
+Responde un catálogo fijo de KPIs de flota directamente sobre los DataFrames
+generados, sin PostgreSQL:
+
+    fuel_efficiency_by_vehicle_type   km/L por tipo de vehículo
+    monthly_fuel_by_vehicle_type      litros por tipo de vehículo y mes
+    load_factor_by_vehicle_type       factor de carga promedio por tipo
+    on_time_rate_by_route             % de entregas a tiempo por ruta
+    delivery_success_by_route         % delivered / (delivered + failed) por ruta
+    driver_productivity               viajes, km y entregas por conductor
+    driver_hours                      horas en ruta por conductor dentro de la ventana
+    maintenance_cost_per_km           costo de mantenimiento por km por vehículo
+
+Todos los cálculos son vectorizados sobre una tabla de hechos por viaje que
+se construye una sola vez. Las consultas por instante o ventana (vehículos
+en ruta, horas por conductor) usan índices de intervalos por vehículo y por
+conductor (ver fleetlogix_intervals), también construidos una sola vez. Los resultados se memorizan por (KPI, filtros) y
+la caché se invalida al reemplazar el dataset con update().
+
+Uso:
+    engine = FleetAnalytics(vehicles_df, drivers_df, routes_df,
+                            trips_df, deliveries_df, maintenance_df)
+    engine.kpi('fuel_efficiency_by_vehicle_type')
+    engine.kpi('on_time_rate_by_route', start_date='2024-06-01', end_date='2024-06-30')
+    engine.vehicles_on_road('2024-06-03 08:00')
+
+    python fleetlogix_analytics.py --scale 0.1     # demo sobre un dataset generado
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+import pandas as pd
+
+from fleetlogix_catalog import RouteTable
+from fleetlogix_intervals import IntervalIndex
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Una entrega es "a tiempo" si se entregó hasta 30 minutos después de lo programado
+ON_TIME_TOLERANCE_MINUTES = 30
+
+# Filtros aceptados por kpi()
+FILTERS = ('start_date', 'end_date', 'vehicle_type', 'vehicle_id', 'route_id', 'driver_id')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: MOTOR ANALÍTICO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FleetAnalytics:
+    """
+    Motor de KPIs de flota sobre el dataset generado, con memoización
+    """
+
+    # Catálogo fijo de KPIs: nombre → (método, descripción)
+    CATALOG = {
+        'fuel_efficiency_by_vehicle_type': ('_fuel_efficiency_by_vehicle_type',
+                                            'Rendimiento km/L de viajes completados por tipo de vehículo'),
+        'monthly_fuel_by_vehicle_type': ('_monthly_fuel_by_vehicle_type',
+                                         'Combustible consumido por tipo de vehículo y mes'),
+        'load_factor_by_vehicle_type': ('_load_factor_by_vehicle_type',
+                                        'Factor de carga promedio (peso / capacidad) por tipo de vehículo'),
+        'on_time_rate_by_route': ('_on_time_rate_by_route',
+                                  f'Entregas a tiempo (≤ {ON_TIME_TOLERANCE_MINUTES} min) por ruta'),
+        'delivery_success_by_route': ('_delivery_success_by_route',
+                                      'Tasa de éxito delivered / (delivered + failed) por ruta'),
+        'driver_productivity': ('_driver_productivity',
+                                'Viajes, km y entregas realizadas por conductor'),
+        'driver_hours': ('_driver_hours',
+                         'Horas en ruta por conductor, recortadas a la ventana start_date-end_date'),
+        'maintenance_cost_per_km': ('_maintenance_cost_per_km',
+                                    'Costo de mantenimiento por km recorrido por vehículo'),
+    }
+
+    def __init__(self, vehicles_df, drivers_df, routes_df, trips_df, deliveries_df, maintenance_df):
+        self.version = 0
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+        self._set_frames(vehicles_df, drivers_df, routes_df, trips_df, deliveries_df, maintenance_df)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Gestión del dataset y de la caché
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _set_frames(self, vehicles_df, drivers_df, routes_df, trips_df, deliveries_df, maintenance_df):
+        self.vehicles_df = vehicles_df
+        self.drivers_df = drivers_df
+        self.routes_df = routes_df
+        self.trips_df = trips_df
+        self.deliveries_df = deliveries_df
+        self.maintenance_df = maintenance_df
+        self._trip_facts = None
+        self._delivery_facts = None
+        self._intervals = {}
+
+    def update(self, **frames):
+        """
+        Reemplaza uno o más DataFrames del dataset e invalida la caché
+
+        Ejemplo: engine.update(trips_df=new_trips, deliveries_df=new_deliveries)
+        """
+        unknown = set(frames) - {'vehicles_df', 'drivers_df', 'routes_df',
+                                 'trips_df', 'deliveries_df', 'maintenance_df'}
+        if unknown:
+            raise ValueError(f"DataFrames desconocidos: {', '.join(sorted(unknown))}")
+
+        current = {
+            'vehicles_df': self.vehicles_df, 'drivers_df': self.drivers_df,
+            'routes_df': self.routes_df, 'trips_df': self.trips_df,
+            'deliveries_df': self.deliveries_df, 'maintenance_df': self.maintenance_df
+        }
+        current.update(frames)
+        self._set_frames(**current)
+        self.invalidate()
+
+    def invalidate(self):
+        """
+        Descarta todos los resultados memorizados (nueva versión del dataset)
+        """
+        self.version += 1
+        self._cache.clear()
+
+    def catalog(self):
+        """
+        Retorna el catálogo de KPIs disponibles
+
+        Returns:
+            pd.DataFrame: Columnas kpi, descripción
+        """
+        return pd.DataFrame(
+            [(name, description) for name, (_, description) in self.CATALOG.items()],
+            columns=['kpi', 'descripcion']
+        )
+
+    def kpi(self, name, **filters):
+        """
+        Calcula (o recupera de caché) un KPI del catálogo
+
+        Args:
+            name (str): Nombre del KPI (ver CATALOG)
+            **filters: start_date, end_date (fecha de salida del viaje),
+                       vehicle_type, vehicle_id, route_id, driver_id
+                       (valor único o lista de valores)
+
+        Returns:
+            pd.DataFrame: Resultado del KPI (copia; la caché no se modifica)
+        """
+        if name not in self.CATALOG:
+            raise ValueError(f"KPI desconocido: {name}. Disponibles: {', '.join(self.CATALOG)}")
+
+        unknown = set(filters) - set(FILTERS)
+        if unknown:
+            raise ValueError(f"Filtros desconocidos: {', '.join(sorted(unknown))}")
+
+        key = (self.version, name, _freeze_filters(filters))
+        if key in self._cache:
+            self.hits += 1
+        else:
+            self.misses += 1
+            method = getattr(self, self.CATALOG[name][0])
+            self._cache[key] = method(self._trip_mask(filters), filters)
+
+        return self._cache[key].copy()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Tablas de hechos (construidas una vez por versión del dataset)
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def trip_facts(self):
+        """
+        Una fila por viaje con atributos de vehículo y ruta ya resueltos
+        """
+        if self._trip_facts is None:
+            trips = self.trips_df
+            vehicle_ids = trips['vehicle_id'].to_numpy()
+            route_ids = trips['route_id'].to_numpy()
+            route_table = RouteTable(self.routes_df)
+            departure = pd.to_datetime(trips['departure_datetime'])
+
+            self._trip_facts = pd.DataFrame({
+                'trip_id': np.arange(1, len(trips) + 1),
+                'vehicle_id': vehicle_ids,
+                'driver_id': trips['driver_id'].to_numpy(),
+                'route_id': route_ids,
+                'vehicle_type': self.vehicles_df['vehicle_type'].to_numpy()[vehicle_ids - 1],
+                'capacity_kg': self.vehicles_df['capacity_kg'].to_numpy(dtype=np.float64)[vehicle_ids - 1],
+                'origin_city': route_table.origin_city[route_ids],
+                'destination_city': route_table.destination_city[route_ids],
+                'departure_datetime': departure.to_numpy(),
+                'month': departure.dt.to_period('M').to_numpy(),
+                'km': route_table.distance_km[route_ids],
+                'fuel_liters': trips['fuel_consumed_liters'].to_numpy(dtype=np.float64),
+                'weight_kg': trips['total_weight_kg'].to_numpy(dtype=np.float64),
+                'status': trips['status'].to_numpy()
+            })
+        return self._trip_facts
+
+    @property
+    def delivery_facts(self):
+        """
+        Una fila por entrega con la ruta/vehículo/conductor de su viaje y el retraso
+        """
+        if self._delivery_facts is None:
+            deliveries = self.deliveries_df
+            trip_rows = deliveries['trip_id'].to_numpy() - 1
+            facts = self.trip_facts
+            delay = (pd.to_datetime(deliveries['delivered_datetime'])
+                     - pd.to_datetime(deliveries['scheduled_datetime'])).dt.total_seconds() / 60
+
+            self._delivery_facts = pd.DataFrame({
+                'trip_row': trip_rows,
+                'route_id': facts['route_id'].to_numpy()[trip_rows],
+                'driver_id': facts['driver_id'].to_numpy()[trip_rows],
+                'status': deliveries['delivery_status'].to_numpy(),
+                'delay_minutes': delay.to_numpy()
+            })
+        return self._delivery_facts
+
+    def intervals(self, by):
+        """
+        Índice de intervalos de los viajes por 'vehicle_id' o 'driver_id'
+        """
+        if by not in self._intervals:
+            self._intervals[by] = IntervalIndex.from_trips(self.trips_df, by=by, routes_df=self.routes_df)
+        return self._intervals[by]
+
+    def vehicles_on_road(self, when):
+        """
+        Viajes en ruta en el instante `when`, uno por fila (un vehículo puede
+        tener varios: el generador no impide asignaciones solapadas)
+
+        Returns:
+            pd.DataFrame: vehicle_id, vehicle_type, trip_id, departure_datetime
+        """
+        trips = self.intervals('vehicle_id').at(when)
+        trips.insert(1, 'vehicle_type', self.vehicles_df['vehicle_type'].to_numpy()[trips['vehicle_id'].to_numpy() - 1])
+        return trips.drop(columns='arrival_datetime').sort_values('vehicle_id', ignore_index=True)
+
+    def _trip_mask(self, filters):
+        """
+        Máscara booleana de viajes que cumplen los filtros
+        """
+        facts = self.trip_facts
+        mask = np.ones(len(facts), dtype=bool)
+
+        if filters.get('start_date') is not None:
+            mask &= facts['departure_datetime'].to_numpy() >= np.datetime64(pd.Timestamp(filters['start_date']))
+        if filters.get('end_date') is not None:
+            # end_date inclusivo: hasta el final del día indicado
+            end = pd.Timestamp(filters['end_date']).normalize() + pd.Timedelta(days=1)
+            mask &= facts['departure_datetime'].to_numpy() < np.datetime64(end)
+
+        for column in ('vehicle_type', 'vehicle_id', 'route_id', 'driver_id'):
+            if filters.get(column) is not None:
+                mask &= np.isin(facts[column].to_numpy(), np.atleast_1d(filters[column]))
+
+        return mask
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Catálogo de KPIs
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _fuel_efficiency_by_vehicle_type(self, mask, filters):
+        facts = self.trip_facts[mask & (self.trip_facts['status'].to_numpy() == 'completed')]
+        result = facts.groupby('vehicle_type').agg(
+            trips=('km', 'size'), total_km=('km', 'sum'), fuel_liters=('fuel_liters', 'sum')
+        )
+        result['km_per_liter'] = (result['total_km'] / result['fuel_liters']).round(3)
+        return result.reset_index()
+
+    def _monthly_fuel_by_vehicle_type(self, mask, filters):
+        facts = self.trip_facts[mask]
+        result = facts.groupby(['month', 'vehicle_type']).agg(
+            trips=('km', 'size'), fuel_liters=('fuel_liters', 'sum')
+        )
+        result['fuel_liters'] = result['fuel_liters'].round(2)
+        return result.reset_index()
+
+    def _load_factor_by_vehicle_type(self, mask, filters):
+        facts = self.trip_facts[mask]
+        load_factor = facts['weight_kg'] / facts['capacity_kg']
+        result = load_factor.groupby(facts['vehicle_type']).agg(['size', 'mean', 'min', 'max'])
+        result.columns = ['trips', 'avg_load_factor', 'min_load_factor', 'max_load_factor']
+        return result.round(4).reset_index()
+
+    def _filtered_deliveries(self, mask):
+        deliveries = self.delivery_facts
+        return deliveries[mask[deliveries['trip_row'].to_numpy()]]
+
+    def _on_time_rate_by_route(self, mask, filters):
+        deliveries = self._filtered_deliveries(mask)
+        delivered = deliveries[deliveries['status'].to_numpy() == 'delivered']
+        on_time = delivered['delay_minutes'] <= ON_TIME_TOLERANCE_MINUTES
+
+        result = on_time.groupby(delivered['route_id']).agg(['size', 'sum'])
+        result.columns = ['delivered', 'on_time']
+        result['on_time_rate'] = (result['on_time'] / result['delivered']).round(4)
+        return result.reset_index()
+
+    def _delivery_success_by_route(self, mask, filters):
+        deliveries = self._filtered_deliveries(mask)
+        counts = pd.crosstab(deliveries['route_id'], deliveries['status'])
+        for status in ('delivered', 'failed', 'pending'):
+            if status not in counts:
+                counts[status] = 0
+
+        result = counts[['delivered', 'failed', 'pending']].copy()
+        finished = result['delivered'] + result['failed']
+        result['success_rate'] = (result['delivered'] / finished.where(finished > 0)).round(4)
+        result.columns.name = None
+        return result.reset_index()
+
+    def _driver_productivity(self, mask, filters):
+        facts = self.trip_facts[mask]
+        result = facts.groupby('driver_id').agg(
+            trips=('km', 'size'), total_km=('km', 'sum'),
+            completed_trips=('status', lambda s: int((s == 'completed').sum()))
+        )
+
+        deliveries = self._filtered_deliveries(mask)
+        delivered = deliveries[deliveries['status'].to_numpy() == 'delivered']
+        result['deliveries_delivered'] = delivered.groupby('driver_id').size()
+        result['deliveries_delivered'] = result['deliveries_delivered'].fillna(0).astype(int)
+        result['total_km'] = result['total_km'].round(2)
+
+        return result.reset_index().sort_values('trips', ascending=False, ignore_index=True)
+
+    def _driver_hours(self, mask, filters):
+        # Los viajes que cruzan los bordes de la ventana cuentan solo la parte
+        # dentro de ella, por eso la ventana se resuelve con el índice y no
+        # con la máscara por fecha de salida
+        start = filters.get('start_date')
+        end = filters.get('end_date')
+        if end is not None:
+            end = pd.Timestamp(end).normalize() + pd.Timedelta(days=1)
+
+        other_filters = {k: v for k, v in filters.items() if k not in ('start_date', 'end_date')}
+        trip_mask = self._trip_mask(other_filters)
+
+        trips = self.intervals('driver_id').overlapping(start, end, keys=filters.get('driver_id'))
+        trips = trips[trip_mask[trips['trip_id'].to_numpy() - 1] & trips['arrival_datetime'].notna().to_numpy()]
+
+        window_start = trips['departure_datetime'] if start is None else trips['departure_datetime'].clip(lower=pd.Timestamp(start))
+        window_end = trips['arrival_datetime'] if end is None else trips['arrival_datetime'].clip(upper=end)
+        hours = (window_end - window_start).dt.total_seconds() / 3600
+
+        result = hours.groupby(trips['driver_id']).agg(['size', 'sum'])
+        result.columns = ['trips', 'hours']
+        result['hours'] = result['hours'].round(2)
+        return result.reset_index().sort_values('hours', ascending=False, ignore_index=True)
+
+    def _maintenance_cost_per_km(self, mask, filters):
+        facts = self.trip_facts[mask]
+        km = facts.groupby('vehicle_id')['km'].sum()
+
+        maintenance = self.maintenance_df
+        m_mask = np.isin(maintenance['vehicle_id'].to_numpy(), km.index.to_numpy())
+        maintenance_dates = pd.to_datetime(maintenance['maintenance_date'])
+        if filters.get('start_date') is not None:
+            m_mask &= (maintenance_dates >= pd.Timestamp(filters['start_date'])).to_numpy()
+        if filters.get('end_date') is not None:
+            m_mask &= (maintenance_dates <= pd.Timestamp(filters['end_date'])).to_numpy()
+
+        cost = maintenance[m_mask].groupby('vehicle_id')['cost'].sum()
+
+        result = pd.DataFrame({'total_km': km.round(2), 'maintenance_cost': cost}).fillna(0)
+        result['vehicle_type'] = self.vehicles_df['vehicle_type'].to_numpy()[result.index.to_numpy() - 1]
+        result['cost_per_km'] = (result['maintenance_cost'] / result['total_km'].where(result['total_km'] > 0)).round(4)
+        result.index.name = 'vehicle_id'
+        return result.reset_index()
+
+
+def _freeze_filters(filters):
+    """
+    Convierte los filtros en una clave hashable y canónica para la caché
+    """
+    frozen = []
+    for name in sorted(filters):
+        value = filters[name]
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, np.ndarray, pd.Series)):
+            value = tuple(sorted(np.asarray(value).tolist()))
+        elif name in ('start_date', 'end_date'):
+            value = pd.Timestamp(value)
+        frozen.append((name, value))
+    return tuple(frozen)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: DEMO SOBRE UN DATASET GENERADO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    import argparse
+    import contextlib
+    import io
+    import time
+
+    from tabulate import tabulate
+
+    import fleetlogix_generator as flg
+
+    parser = argparse.ArgumentParser(description="Catálogo de KPIs FleetLogix en memoria")
+    parser.add_argument('--scale', type=float, default=0.1, help="Factor de escala del dataset")
+    args = parser.parse_args(argv)
+
+    print(f"📊 Generando dataset en memoria (escala {args.scale}x)...")
+    flg.set_scale(args.scale)
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_df = flg.generate_vehicles()
+        drivers_df = flg.generate_drivers()
+        routes_df = flg.generate_routes()
+        trips_df = flg.generate_trips(vehicles_df, drivers_df, routes_df)
+        deliveries_df = flg.generate_deliveries(trips_df, routes_df)
+        maintenance_df = flg.generate_maintenance(trips_df, vehicles_df, routes_df)
+
+    engine = FleetAnalytics(vehicles_df, drivers_df, routes_df, trips_df, deliveries_df, maintenance_df)
+
+    for name in engine.CATALOG:
+        start = time.perf_counter()
+        result = engine.kpi(name)
+        first = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        engine.kpi(name)
+        cached = (time.perf_counter() - start) * 1000
+
+        print(f"\n▶ {name}  ({first:.1f} ms, en caché {cached:.2f} ms)")
+        print(tabulate(result.head(8), headers='keys', tablefmt='simple', showindex=False))
+
+    when = pd.Timestamp(flg.START_DATE) + pd.Timedelta(days=180, hours=8)
+    start = time.perf_counter()
+    on_road = engine.vehicles_on_road(when)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\n▶ vehículos en ruta el {when}: {on_road['vehicle_id'].nunique():,} de {len(vehicles_df):,} "
+          f"({len(on_road):,} viajes, {elapsed:.1f} ms)")
+    print(tabulate(on_road.head(8), headers='keys', tablefmt='simple', showindex=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Benchmark de Generación por Factor de Escala
+═══════════════════════════════════════════════════════════════════════════════
+Ejecuta cada generador (vehicles, drivers, routes, trips, deliveries,
+maintenance) a varios factores de escala y registra:
+- Throughput (registros/segundo)
+- Memoria pico (tracemalloc)
+- Exponente de escalado (pendiente log(tiempo) vs log(registros); 1.0 = lineal)
+
+Compara contra un baseline almacenado y falla (exit code 1) si algún
+generador pierde más throughput que el margen configurado. Los resultados
+registran el perfil de carga (--workload) y solo se comparan contra un
+baseline generado con el mismo perfil. Sin baseline comparable (falta el
+archivo o usa otro perfil) termina con exit code 0, salvo con
+--require-baseline, pensado para CI, donde termina con exit code 1.
+NO requiere PostgreSQL: solo ejecuta la generación en memoria.
+
+Uso:
+    python fleetlogix_benchmark.py                          # escalas 0.01 0.05 0.1
+    python fleetlogix_benchmark.py --scales 0.1 0.5 1
+    python fleetlogix_benchmark.py --save-baseline          # guardar baseline
+    python fleetlogix_benchmark.py --max-regression 0.15    # margen de 15%
+    python fleetlogix_benchmark.py --require-baseline       # CI: falla si no hay baseline
+    python fleetlogix_benchmark.py --workload zipf:1.2      # perfil de carga sesgado
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+from tabulate import tabulate
+
+import fleetlogix_generator as flg
+from fleetlogix_workload import parse_workload
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_SCALES = [0.01, 0.05, 0.1]
+DEFAULT_BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'baseline.json'
+)
+DEFAULT_MAX_REGRESSION = 0.20  # 20% menos throughput = regresión
+
+# Orden de ejecución (cada generador depende de los anteriores)
+GENERATORS = ['vehicles', 'drivers', 'routes', 'trips', 'deliveries', 'maintenance']
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: EJECUCIÓN DE GENERADORES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _generator_calls():
+    """
+    Retorna los generadores en orden, cada uno como función del estado previo
+    """
+    return [
+        ('vehicles', lambda st: flg.generate_vehicles()),
+        ('drivers', lambda st: flg.generate_drivers()),
+        ('routes', lambda st: flg.generate_routes()),
+        ('trips', lambda st: flg.generate_trips(st['vehicles'], st['drivers'], st['routes'])),
+        ('deliveries', lambda st: flg.generate_deliveries(st['trips'], st['routes'])),
+        ('maintenance', lambda st: flg.generate_maintenance(st['trips'], st['vehicles'], st['routes'])),
+    ]
+
+
+def run_pipeline(scale, measure_memory=False):
+    """
+    Ejecuta todos los generadores a un factor de escala y mide cada uno
+
+    La salida por consola de los generadores se descarta para no
+    contaminar las mediciones ni el reporte.
+
+    Args:
+        scale (float): Factor de escala (ver fleetlogix_generator.set_scale)
+        measure_memory (bool): Activar tracemalloc para medir memoria pico
+
+    Returns:
+        dict: {generador: {'rows', 'seconds', 'peak_mb'}}
+    """
+    flg.set_scale(scale)
+    flg.reset_random_state()
+
+    state = {}
+    results = {}
+
+    for name, call in _generator_calls():
+        if measure_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            state[name] = call(state)
+        elapsed = time.perf_counter() - start
+
+        peak_mb = None
+        if measure_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peak_mb = peak / 1024 / 1024
+
+        results[name] = {
+            'rows': len(state[name]),
+            'seconds': elapsed,
+            'peak_mb': peak_mb
+        }
+
+    return results
+
+
+def run_benchmark(scales, repeat=1, measure_memory=True):
+    """
+    Ejecuta el benchmark completo sobre varios factores de escala
+
+    El tiempo se toma como el mínimo de `repeat` ejecuciones sin tracemalloc
+    (que distorsiona los tiempos); la memoria pico se mide en una pasada aparte.
+
+    Args:
+        scales (list): Factores de escala a evaluar
+        repeat (int): Repeticiones de tiempo por escala
+        measure_memory (bool): Medir memoria pico en una pasada adicional
+
+    Returns:
+        dict: Resultados con metadatos, mediciones y exponentes de escalado
+    """
+    measurements = {name: {} for name in GENERATORS}
+
+    for scale in scales:
+        print(f"⏱️  Escala {scale}x...")
+        runs = [run_pipeline(scale) for _ in range(max(1, repeat))]
+        memory = run_pipeline(scale, measure_memory=True) if measure_memory else None
+
+        for name in GENERATORS:
+            seconds = min(run[name]['seconds'] for run in runs)
+            rows = runs[0][name]['rows']
+            measurements[name][str(scale)] = {
+                'rows': rows,
+                'seconds': round(seconds, 6),
+                'throughput': round(rows / seconds, 2) if seconds > 0 else None,
+                'peak_mb': round(memory[name]['peak_mb'], 3) if memory else None
+            }
+
+    flg.set_scale(1.0)
+
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'scales': scales,
+        'workload': flg.WORKLOAD.spec,
+        'generators': measurements,
+        'scaling_exponents': {
+            name: scaling_exponent(measurements[name]) for name in GENERATORS
+        }
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: ANÁLISIS Y COMPARACIÓN CONTRA BASELINE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def scaling_exponent(by_scale):
+    """
+    Estima el exponente k de tiempo ∝ registros^k por mínimos cuadrados en log-log
+
+    Returns:
+        float | None: Exponente (1.0 = lineal), None si hay menos de 2 escalas
+    """
+    points = [(m['rows'], m['seconds']) for m in by_scale.values()
+              if m['rows'] > 0 and m['seconds'] > 0]
+    rows = np.array([p[0] for p in points], dtype=np.float64)
+
+    if len(np.unique(rows)) < 2:
+        return None
+
+    seconds = np.array([p[1] for p in points], dtype=np.float64)
+    slope, _ = np.polyfit(np.log(rows), np.log(seconds), 1)
+    return round(float(slope), 3)
+
+
+def compare_with_baseline(results, baseline, max_regression):
+    """
+    Compara throughput actual contra el baseline por generador y escala
+
+    Args:
+        results (dict): Resultados de run_benchmark()
+        baseline (dict): Resultados almacenados previamente
+        max_regression (float): Pérdida máxima tolerada (0.20 = 20%)
+
+    Returns:
+        tuple: (filas [generador, escala, baseline, actual, cambio, estado],
+                True si algún generador superó el margen de regresión)
+    """
+    rows = []
+    regressed = False
+
+    for name in GENERATORS:
+        for scale, current in results['generators'][name].items():
+            previous = baseline.get('generators', {}).get(name, {}).get(scale)
+            if not previous or not previous.get('throughput') or not current['throughput']:
+                continue
+
+            change = current['throughput'] / previous['throughput'] - 1
+            failed = change < -max_regression
+            regressed = regressed or failed
+
+            rows.append([
+                name, f"{scale}x",
+                f"{previous['throughput']:,.0f}", f"{current['throughput']:,.0f}",
+                f"{change * 100:+.1f}%", "❌ REGRESIÓN" if failed else "✓"
+            ])
+
+    return rows, regressed
+
+
+def print_results(results):
+    """
+    Imprime la tabla de throughput, memoria pico y exponente de escalado
+    """
+    table = []
+    for name in GENERATORS:
+        for scale, m in results['generators'][name].items():
+            table.append([
+                name, f"{scale}x", f"{m['rows']:,}", f"{m['seconds']:.3f}",
+                f"{m['throughput']:,.0f}" if m['throughput'] else "-",
+                f"{m['peak_mb']:.1f}" if m['peak_mb'] is not None else "-"
+            ])
+        exponent = results['scaling_exponents'][name]
+        table.append([name, "exponente", "", "", f"{exponent}" if exponent is not None else "-", ""])
+
+    print("\n" + tabulate(
+        table,
+        headers=["Generador", "Escala", "Registros", "Segundos", "Registros/s", "Pico MB"],
+        tablefmt="simple"
+    ))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: PUNTO DE ENTRADA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de generadores FleetLogix")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help="Factores de escala a evaluar (default: 0.01 0.05 0.1)")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help="Repeticiones por escala; se toma el mejor tiempo")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_FILE,
+                        help="Archivo JSON de baseline")
+    parser.add_argument('--max-regression', type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="Pérdida máxima de throughput tolerada (0.20 = 20%%)")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Guardar los resultados como nuevo baseline")
+    parser.add_argument('--require-baseline', action='store_true',
+                        help="Fallar (exit 1) si no hay baseline comparable en lugar de omitir la comparación")
+    parser.add_argument('--output', help="Guardar resultados de esta ejecución en JSON")
+    parser.add_argument('--no-memory', action='store_true',
+                        help="Omitir la pasada de medición de memoria")
+    parser.add_argument('--workload', type=parse_workload, default=flg.WORKLOAD, metavar='PERFIL',
+                        help="Perfil de carga de los viajes (ver fleetlogix_workload; default: uniform)")
+    args = parser.parse_args(argv)
+
+    if args.require_baseline and args.save_baseline:
+        parser.error("--require-baseline compara contra un baseline existente; no use --save-baseline")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("═" * 80)
+    print("  FLEETLOGIX - BENCHMARK DE GENERACIÓN")
+    print("═" * 80)
+
+    flg.set_workload(args.workload)
+    print(f"🎲 Perfil de carga: {args.workload.spec} ({args.workload.describe()})")
+
+    results = run_benchmark(sorted(args.scales), args.repeat, not args.no_memory)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Resultados guardados en {args.output}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Baseline guardado en {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        if args.require_baseline:
+            print(f"\n❌ No existe baseline en {args.baseline} (--require-baseline; use --save-baseline)")
+            return 1
+        print(f"\nℹ️  No existe baseline en {args.baseline} (use --save-baseline)")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    # Baselines anteriores a los perfiles de carga fueron generados con el perfil uniforme
+    baseline_workload = baseline.get('workload', 'uniform')
+    if baseline_workload != results['workload']:
+        print(f"\nℹ️  El baseline usa el perfil '{baseline_workload}' y esta ejecución '{results['workload']}': "
+              f"no se comparan (guarde un baseline con --workload {results['workload']} --save-baseline)")
+        return 1 if args.require_baseline else 0
+
+    rows, regressed = compare_with_baseline(results, baseline, args.max_regression)
+
+    print(f"\n📈 Comparación contra baseline ({baseline.get('created_at', '?')}), "
+          f"margen {args.max_regression * 100:.0f}%:")
+    print(tabulate(rows, headers=["Generador", "Escala", "Baseline r/s", "Actual r/s", "Cambio", "Estado"],
+                   tablefmt="simple"))
+
+    if regressed:
+        print("\n❌ REGRESIÓN DE RENDIMIENTO DETECTADA")
+        return 1
+
+    print("\n✅ Sin regresiones de rendimiento")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
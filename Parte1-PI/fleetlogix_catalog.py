@@ -0,0 +1,281 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Catálogo de Ciudades y Generación Vectorizada de Rutas
+═══════════════════════════════════════════════════════════════════════════════
+Carga el catálogo de ciudades (depósitos) desde archivos de datos a una
+matriz de distancias NumPy y genera rutas de forma vectorizada, escalando
+a cientos de ciudades y miles de rutas.
+
+Archivos de datos (directorio data/):
+- city_catalog.csv:   city, latitude, longitude
+- city_distances.csv: origin, destination, distance_km (distancias reales
+                      por carretera; opcional, simétrico)
+
+Los pares sin distancia real se estiman con la distancia geodésica
+(haversine) multiplicada por un factor de sinuosidad de carretera.
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+DEFAULT_CATALOG_FILE = os.path.join(DATA_DIR, 'city_catalog.csv')
+DEFAULT_DISTANCES_FILE = os.path.join(DATA_DIR, 'city_distances.csv')
+
+# Radio medio de la Tierra (km) para la fórmula de haversine
+EARTH_RADIUS_KM = 6371.0
+
+# Sinuosidad típica de carretera: distancia real ≈ 1.3 × distancia en línea recta
+ROAD_FACTOR = 1.3
+
+# Límite de chk_routes_distance_positive (distance_km <= 500) y variación
+# máxima de ±10% aplicada a cada ruta alternativa
+MAX_ROUTE_DISTANCE_KM = 500
+ROUTE_DISTANCE_VARIATION = (0.9, 1.1)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: CATÁLOGO DE CIUDADES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def haversine_matrix(latitudes, longitudes):
+    """
+    Calcula la matriz de distancias geodésicas (km) entre todos los puntos
+
+    Args:
+        latitudes (array-like): Latitudes en grados
+        longitudes (array-like): Longitudes en grados
+
+    Returns:
+        numpy.ndarray: Matriz simétrica n x n de distancias en km
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+
+    a = (np.sin(dlat / 2) ** 2
+         + np.cos(lat[:, None]) * np.cos(lat[None, :]) * np.sin(dlon / 2) ** 2)
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class CityCatalog:
+    """
+    Catálogo de ciudades con matriz de distancias por carretera (km)
+
+    Atributos:
+        cities (numpy.array): Nombres de ciudades (posición = índice de matriz)
+        distance_matrix (numpy.ndarray): Distancias n x n en km
+        index (dict): {ciudad: posición}
+    """
+
+    def __init__(self, cities, distance_matrix):
+        self.cities = np.asarray(cities, dtype=object)
+        self.distance_matrix = np.ascontiguousarray(distance_matrix, dtype=np.float64)
+
+        n = len(self.cities)
+        if self.distance_matrix.shape != (n, n):
+            raise ValueError(
+                f"La matriz de distancias debe ser {n}x{n}, "
+                f"se recibió {self.distance_matrix.shape}"
+            )
+
+        self.index = {city: i for i, city in enumerate(self.cities)}
+        if len(self.index) != n:
+            raise ValueError("El catálogo contiene ciudades duplicadas")
+
+    @classmethod
+    def from_files(cls, catalog_file=DEFAULT_CATALOG_FILE,
+                   distances_file=DEFAULT_DISTANCES_FILE, road_factor=ROAD_FACTOR):
+        """
+        Carga el catálogo desde CSV y construye la matriz de distancias
+
+        Args:
+            catalog_file (str): CSV con columnas city, latitude, longitude
+            distances_file (str): CSV opcional con origin, destination, distance_km
+            road_factor (float): Multiplicador sobre la distancia geodésica para
+                                 los pares sin distancia real conocida
+
+        Returns:
+            CityCatalog: Catálogo listo para generar rutas
+        """
+        catalog = pd.read_csv(catalog_file)
+        cities = catalog['city'].to_numpy(dtype=object)
+
+        matrix = haversine_matrix(catalog['latitude'], catalog['longitude']) * road_factor
+
+        if distances_file and os.path.exists(distances_file):
+            known = pd.read_csv(distances_file)
+            position = pd.Series(np.arange(len(cities)), index=cities)
+
+            unknown = ~known['origin'].isin(position.index) | ~known['destination'].isin(position.index)
+            if unknown.any():
+                missing = sorted(set(known.loc[unknown, 'origin']) | set(known.loc[unknown, 'destination'])
+                                 - set(position.index))
+                raise ValueError(f"Distancias para ciudades fuera del catálogo: {', '.join(missing)}")
+
+            rows = position[known['origin']].to_numpy()
+            cols = position[known['destination']].to_numpy()
+            distances = known['distance_km'].to_numpy(dtype=np.float64)
+
+            # Distancias reales simétricas (ida = vuelta)
+            matrix[rows, cols] = distances
+            matrix[cols, rows] = distances
+
+        np.fill_diagonal(matrix, 0.0)
+        return cls(cities, matrix)
+
+    def distance(self, origin, destination):
+        """
+        Distancia por carretera entre dos ciudades del catálogo (km)
+        """
+        return self.distance_matrix[self.index[origin], self.index[destination]]
+
+    def route_pairs(self, max_distance_km=None):
+        """
+        Retorna todos los pares (origen, destino) válidos para rutas
+
+        Orden: origen mayor, destino menor (mismo orden que el catálogo).
+        Se excluyen los pares origen == destino y, si se indica, los pares
+        cuya distancia excede max_distance_km.
+
+        Returns:
+            tuple: (índices de origen, índices de destino) como arrays
+        """
+        n = len(self.cities)
+        origins, destinations = np.divmod(np.arange(n * n), n)
+
+        valid = (origins != destinations) & (self.distance_matrix.reshape(-1) > 0)
+        if max_distance_km is not None:
+            valid &= self.distance_matrix.reshape(-1) <= max_distance_km
+
+        return origins[valid], destinations[valid]
+
+    def to_dict(self):
+        """
+        Exporta la matriz como diccionario anidado {origen: {destino: km}}
+        """
+        return {
+            origin: dict(zip(self.cities, self.distance_matrix[i].tolist()))
+            for i, origin in enumerate(self.cities)
+        }
+
+    def __len__(self):
+        return len(self.cities)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: GENERACIÓN VECTORIZADA DE RUTAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def generate_route_frame(catalog, num_routes, random_state=None):
+    """
+    Genera num_routes rutas entre las ciudades del catálogo sin bucles Python
+
+    Los pares (origen, destino) se recorren en ciclos completos; el resto que
+    no completa un ciclo se elige al azar sin reemplazo, de modo que con
+    catálogos grandes las rutas cubren toda la red y no solo el primer origen.
+
+    Cada ruta aplica:
+    - Variación ±10% sobre la distancia base (rutas alternativas)
+    - Velocidad promedio 55-65 km/h para la duración estimada
+    - Peajes de ~$0.50-$1.50 por cada 50 km
+
+    Args:
+        catalog (CityCatalog): Catálogo de ciudades
+        num_routes (int): Cantidad de rutas a generar
+        random_state: np.random.Generator/RandomState (default: np.random)
+
+    Returns:
+        pd.DataFrame: Rutas con las columnas de la tabla routes
+    """
+    rs = np.random if random_state is None else random_state
+
+    # Excluir pares que con +10% de variación violarían distance_km <= 500
+    max_base = MAX_ROUTE_DISTANCE_KM / ROUTE_DISTANCE_VARIATION[1]
+    origins, destinations = catalog.route_pairs(max_distance_km=max_base)
+    num_pairs = len(origins)
+
+    if num_pairs == 0:
+        raise ValueError("El catálogo no tiene pares de ciudades válidos para rutas")
+
+    full_cycles, remainder = divmod(num_routes, num_pairs)
+    pair_idx = np.tile(np.arange(num_pairs), full_cycles)
+    if remainder:
+        extra = np.sort(rs.permutation(num_pairs)[:remainder])
+        pair_idx = np.concatenate([pair_idx, extra])
+
+    origin_idx = origins[pair_idx]
+    destination_idx = destinations[pair_idx]
+    base_distance = catalog.distance_matrix[origin_idx, destination_idx]
+
+    distance = np.round(base_distance * rs.uniform(*ROUTE_DISTANCE_VARIATION, size=num_routes), 2)
+    avg_speed = rs.uniform(55, 65, size=num_routes)
+    estimated_duration = np.round(distance / avg_speed, 2)
+    toll_cost = np.round((distance / 50) * rs.uniform(0.5, 1.5, size=num_routes), 2)
+
+    width = max(3, len(str(num_routes)))
+    route_codes = pd.Series(np.arange(1, num_routes + 1)).astype(str).str.zfill(width)
+
+    return pd.DataFrame({
+        'route_code': ('RT-' + route_codes).to_numpy(),
+        'origin_city': catalog.cities[origin_idx],
+        'destination_city': catalog.cities[destination_idx],
+        'distance_km': distance,
+        'estimated_duration_hours': estimated_duration,
+        'toll_cost': toll_cost
+    })
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: ATRIBUTOS DE RUTA INDEXADOS POR route_id
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RouteTable:
+    """
+    Atributos de rutas como arrays contiguos indexados directamente por route_id
+
+    La posición 0 es relleno (route_id es SERIAL y empieza en 1), de modo que
+    route_table.distance_km[route_ids] es un gather O(1) por viaje, sin iloc.
+    """
+
+    NUMERIC_COLUMNS = ('distance_km', 'estimated_duration_hours', 'toll_cost')
+    TEXT_COLUMNS = ('route_code', 'origin_city', 'destination_city')
+
+    def __init__(self, routes_df):
+        """
+        Args:
+            routes_df (pd.DataFrame): Rutas en orden de route_id (fila i = id i+1)
+        """
+        self.num_routes = len(routes_df)
+
+        for column in self.NUMERIC_COLUMNS:
+            values = np.empty(self.num_routes + 1, dtype=np.float64)
+            values[0] = np.nan
+            values[1:] = routes_df[column].to_numpy(dtype=np.float64)
+            setattr(self, column, values)
+
+        for column in self.TEXT_COLUMNS:
+            values = np.empty(self.num_routes + 1, dtype=object)
+            values[0] = None
+            values[1:] = routes_df[column].to_numpy(dtype=object)
+            setattr(self, column, values)
+
+    @property
+    def route_ids(self):
+        """Array de route_id válidos (1..num_routes)"""
+        return np.arange(1, self.num_routes + 1)
+
+    def __len__(self):
+        return self.num_routes
@@ -0,0 +1,335 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Almacén Columnar Intermedio en Archivos Mapeados en Memoria
+═══════════════════════════════════════════════════════════════════════════════
+Los generadores escriben cada columna UNA vez en disco (formato .npy) y los
+cargadores, validadores y exportadores - en el mismo proceso o en otros -
+la leen con np.load(mmap_mode='r'): sin pickle entre procesos y sin copias
+completas de la tabla, solo las páginas del lote que se está procesando.
+
+Estructura:
+    <directorio>/<tabla>/_manifest.json      filas y tipo de cada columna
+    <directorio>/<tabla>/<columna>.npy       numéricas, booleanas y fechas
+    <directorio>/<tabla>/<columna>.data.npy  texto: bytes UTF-8 concatenados
+    <directorio>/<tabla>/<columna>.offsets.npy  texto: inicio de cada valor
+    <directorio>/<tabla>/<columna>.nulls.npy    máscara de nulos (si hay)
+
+Uso:
+    store = ColumnStore('columnstore')
+    store.write_table('trips', trips_df)
+    for batch in store.table('trips').iter_frames(10000):
+        ...
+
+Exportar una tabla a CSV por lotes:
+    python fleetlogix_columnstore.py columnstore trips trips.csv
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import datetime
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+import pandas as pd
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_STORE_DIR = 'columnstore'
+DEFAULT_BATCH_SIZE = 10000
+MANIFEST_FILE = '_manifest.json'
+
+# Tipos de columna soportados
+NUMERIC = 'numeric'      # int, float, bool (NaN como nulo en float)
+DATETIME = 'datetime'    # datetime64 (NaT como nulo)
+DATE = 'date'            # datetime.date → datetime64[D]
+STRING = 'string'        # texto UTF-8 con offsets y máscara de nulos
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: CODIFICACIÓN DE COLUMNAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _column_kind(series):
+    """
+    Determina cómo se almacena una columna según su dtype y contenido
+    """
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_numeric_dtype(series):
+        return NUMERIC
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return DATETIME
+
+    first = series.dropna()
+    first = first.iloc[0] if len(first) else None
+    if isinstance(first, datetime.datetime):
+        return DATETIME
+    if isinstance(first, datetime.date):
+        return DATE
+    return STRING
+
+
+def _write_column(path, series):
+    """
+    Escribe una columna y retorna su entrada de manifiesto
+    """
+    kind = _column_kind(series)
+
+    if kind == NUMERIC:
+        values = series.to_numpy()
+        np.save(f"{path}.npy", values)
+        return {'kind': kind, 'dtype': values.dtype.str}
+
+    if kind == DATETIME:
+        values = pd.to_datetime(series).to_numpy()
+        np.save(f"{path}.npy", values)
+        return {'kind': kind, 'dtype': values.dtype.str}
+
+    if kind == DATE:
+        values = pd.to_datetime(series).to_numpy().astype('datetime64[D]')
+        np.save(f"{path}.npy", values)
+        return {'kind': kind, 'dtype': values.dtype.str}
+
+    nulls = series.isna().to_numpy()
+    encoded = [b'' if null else str(value).encode('utf-8')
+               for value, null in zip(series.to_numpy(dtype=object), nulls)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+
+    np.save(f"{path}.data.npy", np.frombuffer(b''.join(encoded), dtype=np.uint8))
+    np.save(f"{path}.offsets.npy", offsets)
+    if nulls.any():
+        np.save(f"{path}.nulls.npy", nulls)
+
+    return {'kind': kind, 'dtype': 'str', 'nullable': bool(nulls.any())}
+
+
+class StringColumn:
+    """
+    Columna de texto mapeada en memoria; decodifica solo el rango pedido
+    """
+
+    def __init__(self, path, nullable):
+        self.data = np.load(f"{path}.data.npy", mmap_mode='r')
+        self.offsets = np.load(f"{path}.offsets.npy", mmap_mode='r')
+        self.nulls = np.load(f"{path}.nulls.npy", mmap_mode='r') if nullable else None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def slice(self, start, stop):
+        """
+        Valores [start, stop) como array de objetos str (None para nulos)
+        """
+        offsets = np.asarray(self.offsets[start:stop + 1]) - self.offsets[start]
+        buffer = self.data[self.offsets[start]:self.offsets[stop]].tobytes()
+
+        values = np.empty(stop - start, dtype=object)
+        values[:] = [buffer[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+        if self.nulls is not None:
+            values[np.asarray(self.nulls[start:stop])] = None
+        return values
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: ALMACÉN COLUMNAR
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StoredTable:
+    """
+    Vista de solo lectura de una tabla del almacén
+
+    Implementa lo que necesitan los cargadores: len() e iter_frames(), además
+    de to_frame() para materializarla completa cuando no hay alternativa.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, MANIFEST_FILE), encoding='utf-8') as f:
+            manifest = json.load(f)
+
+        self.name = manifest['table']
+        self.num_rows = manifest['rows']
+        self.schema = manifest['columns']
+        self._columns = {}
+
+    @property
+    def columns(self):
+        """Nombres de columna en orden"""
+        return [column['name'] for column in self.schema]
+
+    def column(self, name):
+        """
+        Columna mapeada en memoria (sin copia)
+
+        Returns:
+            np.memmap | StringColumn: Array de solo lectura o columna de texto
+        """
+        if name not in self._columns:
+            spec = next(c for c in self.schema if c['name'] == name)
+            path = os.path.join(self.directory, name)
+            if spec['kind'] == STRING:
+                self._columns[name] = StringColumn(path, spec.get('nullable', False))
+            else:
+                self._columns[name] = np.load(f"{path}.npy", mmap_mode='r')
+        return self._columns[name]
+
+    def read_frame(self, start=0, stop=None, columns=None):
+        """
+        DataFrame con las filas [start, stop); solo ese rango se copia a memoria
+        """
+        stop = self.num_rows if stop is None else min(stop, self.num_rows)
+        data = {}
+
+        for spec in self.schema:
+            name = spec['name']
+            if columns is not None and name not in columns:
+                continue
+
+            column = self.column(name)
+            if spec['kind'] == STRING:
+                data[name] = column.slice(start, stop)
+            elif spec['kind'] == DATE:
+                data[name] = pd.Series(np.array(column[start:stop])).dt.date.to_numpy()
+            else:
+                data[name] = np.array(column[start:stop])
+
+        return pd.DataFrame(data, index=pd.RangeIndex(start, stop))
+
+    def iter_frames(self, batch_size=DEFAULT_BATCH_SIZE, columns=None):
+        """
+        Recorre la tabla en lotes de batch_size filas
+        """
+        for start in range(0, self.num_rows, batch_size):
+            yield self.read_frame(start, start + batch_size, columns)
+
+    def to_frame(self, columns=None):
+        """Materializa la tabla completa (mismo contenido que escribió el generador)"""
+        return self.read_frame(0, self.num_rows, columns)
+
+    def __len__(self):
+        return self.num_rows
+
+    def __getstate__(self):
+        # Al enviarla a otro proceso viaja solo la ruta, no los datos mapeados
+        state = self.__dict__.copy()
+        state['_columns'] = {}
+        return state
+
+
+class ColumnStore:
+    """
+    Directorio con una subcarpeta por tabla; cada columna en su propio archivo
+    """
+
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write_table(self, name, df):
+        """
+        Escribe (o reemplaza) una tabla completa
+
+        El manifiesto se escribe al final: una tabla sin manifiesto está
+        incompleta y no se puede abrir.
+        """
+        directory = os.path.join(self.directory, name)
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+        os.makedirs(directory)
+
+        schema = []
+        for column in df.columns:
+            spec = _write_column(os.path.join(directory, column), df[column])
+            schema.append({'name': column, **spec})
+
+        with open(os.path.join(directory, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump({'table': name, 'rows': len(df), 'columns': schema}, f, indent=2)
+
+        return self.table(name)
+
+    def table(self, name):
+        """
+        Abre una tabla escrita previamente (desde cualquier proceso)
+
+        Returns:
+            StoredTable: Vista mapeada en memoria
+        """
+        return StoredTable(os.path.join(self.directory, name))
+
+    def tables(self):
+        """Tablas completas disponibles en el almacén"""
+        return sorted(
+            entry for entry in os.listdir(self.directory)
+            if os.path.exists(os.path.join(self.directory, entry, MANIFEST_FILE))
+        )
+
+
+def iter_batches(source, batch_size):
+    """
+    Lotes de un DataFrame o de una StoredTable, con el mismo formato
+
+    Permite que los cargadores acepten ambos sin materializar la tabla.
+    """
+    if isinstance(source, StoredTable):
+        yield from source.iter_frames(batch_size)
+        return
+
+    for start in range(0, len(source), batch_size):
+        yield source.iloc[start:start + batch_size]
+
+
+def slice_rows(source, start, stop):
+    """
+    Filas [start, stop) de un DataFrame o de una StoredTable como DataFrame
+
+    Para cargadores que deciden el tamaño de cada lote sobre la marcha.
+    """
+    if isinstance(source, StoredTable):
+        return source.read_frame(start, stop)
+    return source.iloc[start:stop]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: EXPORTACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def export_csv(store, table_name, output_file, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Exporta una tabla del almacén a CSV por lotes (memoria = un lote)
+
+    Returns:
+        int: Registros exportados
+    """
+    table = store.table(table_name)
+    for i, batch in enumerate(table.iter_frames(batch_size)):
+        batch.to_csv(output_file, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    return len(table)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exportar una tabla del almacén columnar a CSV")
+    parser.add_argument('store', help="Directorio del almacén (ej: columnstore)")
+    parser.add_argument('table', nargs='?', help="Tabla a exportar (sin valor: listar tablas)")
+    parser.add_argument('output', nargs='?', help="Archivo CSV de salida (default: <tabla>.csv)")
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    store = ColumnStore(args.store)
+    if not args.table:
+        for name in store.tables():
+            print(f"{name}: {len(store.table(name)):,} registros")
+        return 0
+
+    output_file = args.output or f"{args.table}.csv"
+    rows = export_csv(store, args.table, output_file, args.batch_size)
+    print(f"✓ {args.table}: {rows:,} registros exportados a {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Reporte de Conformidad Estadística de los Datos Generados
+═══════════════════════════════════════════════════════════════════════════════
+Verifica que los DataFrames generados sigan las distribuciones configuradas:
+
+- Hora de salida de viajes      vs get_hourly_distribution()   (chi-cuadrado)
+- Estado de viajes 95/3/2       vs TRIP_STATUS_SAMPLER         (chi-cuadrado)
+- Entregas por viaje 2-6        vs DELIVERIES_PER_TRIP_SAMPLER (chi-cuadrado)
+- Estado de entregas 85/10/5    vs DELIVERY_STATUS_SAMPLER     (chi-cuadrado,
+                                   una prueba por estado del viaje)
+- Firma en entregas delivered   vs SIGNATURE_SAMPLER           (chi-cuadrado)
+- Factor de carga 50-95%        vs Uniforme(0.50, 0.95)        (Kolmogorov-Smirnov)
+- Variación de combustible ±10% vs Uniforme(0.90, 1.10)        (Kolmogorov-Smirnov)
+
+Cada distribución se calcula con una sola pasada vectorizada sobre el
+DataFrame (bincount / value_counts / sort), sin recorrer filas en Python.
+Los valores p se calculan sin scipy (gamma incompleta regularizada y
+distribución asintótica de Kolmogorov).
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from fleetlogix_catalog import RouteTable
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Nivel de significancia por prueba; bajo para que un generador sin cambios
+# no falle por azar con muchas pruebas, pero una deriva real sí se detecte
+DEFAULT_ALPHA = 0.001
+
+# Rangos uniformes documentados en generate_trips()
+LOAD_FACTOR_RANGE = (0.5, 0.95)
+FUEL_VARIATION_RANGE = (0.9, 1.1)
+
+# Consumo base mínimo (litros) para la prueba de combustible: por debajo,
+# el redondeo a 2 decimales distorsiona la razón consumo / consumo base
+MIN_BASE_FUEL_LITERS = 5.0
+
+# Iteraciones y tolerancia para la gamma incompleta
+_GAMMA_MAX_ITERATIONS = 500
+_GAMMA_EPSILON = 1e-14
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: VALORES P (SIN SCIPY)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def chi2_sf(statistic, dof):
+    """
+    P(X > statistic) para X ~ chi-cuadrado con `dof` grados de libertad
+
+    Es la gamma incompleta superior regularizada Q(dof/2, statistic/2):
+    serie de potencias si x < a + 1, fracción continua (Lentz) en otro caso.
+    """
+    if statistic <= 0:
+        return 1.0
+
+    a = dof / 2.0
+    x = statistic / 2.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+
+    if x < a + 1:
+        term = total = 1.0 / a
+        denominator = a
+        for _ in range(_GAMMA_MAX_ITERATIONS):
+            denominator += 1
+            term *= x / denominator
+            total += term
+            if abs(term) < abs(total) * _GAMMA_EPSILON:
+                break
+        return max(0.0, 1.0 - total * math.exp(log_prefix))
+
+    tiny = 1e-300
+    b = x + 1 - a
+    c = 1 / tiny
+    d = 1 / b
+    h = d
+    for i in range(1, _GAMMA_MAX_ITERATIONS):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = tiny if abs(d) < tiny else d
+        c = b + an / c
+        c = tiny if abs(c) < tiny else c
+        d = 1 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < _GAMMA_EPSILON:
+            break
+    return min(1.0, math.exp(log_prefix) * h)
+
+
+def kolmogorov_sf(statistic, n):
+    """
+    P(D_n > statistic) asintótica para la prueba KS de una muestra
+
+    Usa la corrección de Stephens: λ = (√n + 0.12 + 0.11/√n) · D.
+    """
+    if n == 0 or statistic <= 0:
+        return 1.0
+
+    sqrt_n = math.sqrt(n)
+    lam = (sqrt_n + 0.12 + 0.11 / sqrt_n) * statistic
+    if lam < 0.2:
+        return 1.0
+
+    total = 0.0
+    for j in range(1, 101):
+        term = 2 * (-1) ** (j - 1) * math.exp(-2 * j * j * lam * lam)
+        total += term
+        if abs(term) < 1e-12:
+            break
+    return min(1.0, max(0.0, total))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: PRUEBAS DE BONDAD DE AJUSTE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def categorical_test(name, observed, values, probabilities):
+    """
+    Prueba chi-cuadrado de una variable categórica contra su distribución
+
+    Args:
+        name (str): Nombre de la prueba en el reporte
+        observed (array-like): Valores observados (una fila por registro)
+        values (array-like): Categorías configuradas
+        probabilities (array-like): Probabilidades configuradas
+
+    Returns:
+        dict: test, n, statistic, dof, p_value, max_deviation
+    """
+    observed = pd.Series(np.asarray(observed))
+    values = list(np.asarray(values).tolist())
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+
+    counts = observed.value_counts()
+    n = int(counts.sum())
+    observed_counts = counts.reindex(values, fill_value=0).to_numpy(dtype=np.float64)
+    unexpected = n - int(observed_counts.sum())
+
+    if n == 0:
+        return _result(name, 'chi²', 0, 0.0, 0, 1.0, 0.0)
+
+    # Categorías con probabilidad 0 no aportan grados de libertad;
+    # cualquier valor fuera de la distribución es una falla directa
+    support = probabilities > 0
+    expected = probabilities[support] * n
+    statistic = float(np.sum((observed_counts[support] - expected) ** 2 / expected))
+    dof = int(support.sum()) - 1
+
+    p_value = chi2_sf(statistic, dof) if dof > 0 else 1.0
+    if unexpected or observed_counts[~support].any():
+        p_value = 0.0
+
+    deviation = float(np.max(np.abs(observed_counts / n - probabilities)))
+    return _result(name, 'chi²', n, statistic, dof, p_value, deviation)
+
+
+def uniform_test(name, observed, low, high, tolerance=0.0):
+    """
+    Prueba de Kolmogorov-Smirnov de una variable continua contra Uniforme(low, high)
+
+    `tolerance` admite valores apenas fuera del rango por redondeo; más allá
+    de ese margen cualquier valor es una falla directa.
+
+    Returns:
+        dict: test, n, statistic, dof, p_value, max_deviation
+    """
+    sample = np.sort(np.asarray(observed, dtype=np.float64))
+    sample = sample[~np.isnan(sample)]
+    n = len(sample)
+
+    if n == 0:
+        return _result(name, 'KS', 0, 0.0, None, 1.0, 0.0)
+
+    cdf = np.clip((sample - low) / (high - low), 0.0, 1.0)
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    statistic = float(max(np.max(ranks / n - cdf), np.max(cdf - (ranks - 1) / n)))
+
+    p_value = kolmogorov_sf(statistic, n)
+    if sample[0] < low - tolerance or sample[-1] > high + tolerance:
+        p_value = 0.0
+
+    return _result(name, 'KS', n, statistic, None, p_value, statistic)
+
+
+def _result(name, test, n, statistic, dof, p_value, deviation):
+    return {
+        'name': name,
+        'test': test,
+        'n': n,
+        'statistic': statistic,
+        'dof': dof,
+        'p_value': p_value,
+        'max_deviation': deviation
+    }
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: REPORTE DE CONFORMIDAD
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def check_conformance(trips_df, deliveries_df, vehicles_df, routes_df,
+                      samplers, km_per_liter, first_trip_id=1):
+    """
+    Ejecuta todas las pruebas de conformidad sobre los DataFrames generados
+
+    Args:
+        trips_df, deliveries_df, vehicles_df, routes_df (pd.DataFrame): Datos generados
+        samplers (dict): Distribuciones configuradas (CategoricalSampler /
+                         ConditionalSampler) con claves 'hourly', 'trip_status',
+                         'deliveries_per_trip', 'delivery_status' y 'signature'
+        km_per_liter (dict): {vehicle_type: rendimiento km/l}
+        first_trip_id (int): trip_id de la primera fila (TRIP_ID_OFFSET + 1 en shards)
+
+    Returns:
+        list: Un dict por prueba (ver categorical_test / uniform_test)
+    """
+    results = []
+    num_trips = len(trips_df)
+
+    # Hora de salida y estado de viajes
+    hours = pd.to_datetime(trips_df['departure_datetime']).dt.hour.to_numpy()
+    hourly = samplers['hourly']
+    results.append(categorical_test('hora de salida', hours, hourly.values, hourly.probabilities))
+
+    trip_status = trips_df['status'].to_numpy()
+    sampler = samplers['trip_status']
+    results.append(categorical_test('estado de viaje', trip_status, sampler.values, sampler.probabilities))
+
+    # Entregas por viaje (bincount sobre la fila del viaje; trip_id = first_trip_id + índice)
+    trip_rows = deliveries_df['trip_id'].to_numpy() - first_trip_id
+    per_trip = np.bincount(trip_rows, minlength=num_trips)[:num_trips]
+    sampler = samplers['deliveries_per_trip']
+    results.append(categorical_test('entregas por viaje', per_trip, sampler.values, sampler.probabilities))
+
+    # Estado de entregas condicionado al estado del viaje
+    delivery_status = deliveries_df['delivery_status'].to_numpy()
+    parent_status = trip_status[trip_rows]
+    conditional = samplers['delivery_status']
+    for code, parent in enumerate(conditional.parent_values):
+        mask = parent_status == parent
+        results.append(categorical_test(
+            f"estado de entrega | viaje {parent}", delivery_status[mask],
+            conditional.values, conditional.probabilities[code]
+        ))
+
+    delivered = delivery_status == 'delivered'
+    sampler = samplers['signature']
+    results.append(categorical_test(
+        'firma en entregas delivered',
+        deliveries_df['recipient_signature'].to_numpy()[delivered].astype(bool),
+        sampler.values, sampler.probabilities
+    ))
+
+    # Factor de carga = peso / capacidad (vehicle_id = índice + 1)
+    vehicle_ids = trips_df['vehicle_id'].to_numpy()
+    capacity = vehicles_df['capacity_kg'].to_numpy(dtype=np.float64)[vehicle_ids - 1]
+    load_factor = trips_df['total_weight_kg'].to_numpy(dtype=np.float64) / capacity
+    # total_weight_kg se redondea a 2 decimales: ±0.005 kg sobre la menor capacidad
+    results.append(uniform_test(
+        'factor de carga', load_factor, *LOAD_FACTOR_RANGE,
+        tolerance=0.005 / vehicles_df['capacity_kg'].to_numpy(dtype=np.float64).min()
+    ))
+
+    # Variación de combustible = consumo / (distancia / rendimiento)
+    route_table = RouteTable(routes_df)
+    efficiency = vehicles_df['vehicle_type'].map(km_per_liter).to_numpy(dtype=np.float64)[vehicle_ids - 1]
+    base_fuel = route_table.distance_km[trips_df['route_id'].to_numpy()] / efficiency
+    fuel = trips_df['fuel_consumed_liters'].to_numpy(dtype=np.float64)
+    reliable = base_fuel >= MIN_BASE_FUEL_LITERS
+    results.append(uniform_test(
+        'variación de combustible', fuel[reliable] / base_fuel[reliable], *FUEL_VARIATION_RANGE,
+        tolerance=0.005 / MIN_BASE_FUEL_LITERS
+    ))
+
+    return results
+
+
+def print_conformance_report(results, alpha=DEFAULT_ALPHA):
+    """
+    Imprime el reporte compacto de conformidad
+
+    Args:
+        results (list): Resultado de check_conformance()
+        alpha (float): Nivel de significancia por prueba
+
+    Returns:
+        bool: True si ninguna prueba rechaza la distribución configurada
+    """
+    rows = []
+    passed = True
+
+    for r in results:
+        ok = r['p_value'] >= alpha
+        passed = passed and ok
+        rows.append([
+            r['name'], r['test'], f"{r['n']:,}", f"{r['statistic']:.4f}",
+            r['dof'] if r['dof'] is not None else "-",
+            f"{r['p_value']:.4f}", f"{r['max_deviation'] * 100:.2f}%",
+            "✓" if ok else "❌"
+        ])
+
+    print(tabulate(
+        rows,
+        headers=["Distribución", "Prueba", "n", "Estadístico", "gl", "p", "Desv. máx", ""],
+        tablefmt="simple"
+    ))
+
+    if passed:
+        print(f"\n   ✅ Todas las distribuciones conformes (α = {alpha})")
+    else:
+        print(f"\n   ⚠️  Distribuciones fuera de lo configurado (α = {alpha})")
+
+    return passed
@@ -0,0 +1,349 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Flujo de Eventos en Tiempo Real (JSON Lines)
+═══════════════════════════════════════════════════════════════════════════════
+Convierte los viajes y entregas generados en una secuencia de eventos
+ordenada por timestamp para alimentar pipelines de streaming:
+
+- trip_departed        departure_datetime del viaje
+- delivery_scheduled   salida del viaje (la entrega queda despachada)
+- delivery_delivered   delivered_datetime
+- delivery_failed      scheduled_datetime de las entregas fallidas
+- trip_arrived         arrival_datetime (solo viajes con llegada)
+
+Cada tipo de evento es una fuente ya ordenada (argsort de su columna de
+tiempo, sin materializar objetos) y las fuentes se combinan con un merge
+k-way perezoso (heapq.merge): en memoria solo hay un bloque por fuente.
+
+La reproducción puede acelerarse (--speedup 3600 = 1 hora por segundo) o ir
+a máxima velocidad (--speedup 0) hacia stdout, un archivo o un socket local.
+
+Uso:
+    python fleetlogix_events.py --scale 0.1 --output events.jsonl
+    python fleetlogix_events.py --column-store columnstore --speedup 3600 --output tcp://127.0.0.1:9000
+    python fleetlogix_events.py --scale 0.01 --speedup 86400 | head
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import heapq
+import io
+import json
+import os
+import socket
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Eventos por bloque de formateo vectorizado en cada fuente
+CHUNK_SIZE = 8192
+
+# Adelanto mínimo (s) sobre el reloj de reproducción antes de dormir
+MIN_SLEEP_SECONDS = 0.005
+
+# Cada cuántos eventos se imprime el progreso en stderr
+PROGRESS_EVERY = 100000
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: FUENTES DE EVENTOS ORDENADAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _column(source, name):
+    """
+    Columna completa como array NumPy desde un DataFrame o una StoredTable
+
+    En una StoredTable las columnas numéricas y de fecha son memmaps (sin copia).
+    """
+    if isinstance(source, pd.DataFrame):
+        return source[name].to_numpy()
+
+    column = source.column(name)
+    if hasattr(column, 'slice'):
+        return column.slice(0, len(source))
+    return column
+
+
+def _timestamps(values):
+    """
+    Convierte una columna de fechas a microsegundos (int64) y máscara de válidos
+    """
+    values = np.asarray(values).astype('datetime64[us]')
+    return values.view(np.int64), ~np.isnat(values)
+
+
+def _event_source(priority, timestamps, valid, formatter, columns):
+    """
+    Generador perezoso de (timestamp, prioridad, línea JSON) en orden temporal
+
+    Solo se ordenan los índices (argsort estable de int64); las líneas JSON
+    se formatean por bloques de CHUNK_SIZE a medida que el merge las consume.
+
+    Args:
+        priority (int): Desempate entre tipos de evento con el mismo timestamp
+        timestamps (np.array): Microsegundos desde epoch por fila
+        valid (np.array): Filas que generan evento
+        formatter (callable): (iso, *columnas del bloque) → lista de líneas
+        columns (list): Arrays por fila que necesita el formateador
+    """
+    rows = np.flatnonzero(valid)
+    order = rows[np.argsort(timestamps[rows], kind='stable')]
+
+    for start in range(0, len(order), CHUNK_SIZE):
+        chunk = order[start:start + CHUNK_SIZE]
+        ts = timestamps[chunk]
+        iso = np.datetime_as_string(ts.astype('datetime64[us]').astype('datetime64[s]'))
+        lines = formatter(iso, *(np.asarray(column)[chunk] for column in columns))
+        yield from zip(ts.tolist(), [priority] * len(chunk), lines)
+
+
+def event_sources(trips, deliveries, first_trip_id=1):
+    """
+    Construye una fuente ordenada por tipo de evento
+
+    Args:
+        trips (pd.DataFrame | StoredTable): Viajes (trip_id = first_trip_id + posición)
+        deliveries (pd.DataFrame | StoredTable): Entregas (delivery_id = posición + 1)
+        first_trip_id (int): trip_id de la primera fila (TRIP_ID_OFFSET + 1 en shards)
+
+    Returns:
+        list: Generadores de (timestamp_us, prioridad, línea JSON)
+    """
+    trip_ids = np.arange(first_trip_id, first_trip_id + len(trips))
+    vehicle_ids = _column(trips, 'vehicle_id')
+    driver_ids = _column(trips, 'driver_id')
+    route_ids = _column(trips, 'route_id')
+    trip_status = _column(trips, 'status')
+    departure, has_departure = _timestamps(_column(trips, 'departure_datetime'))
+    arrival, has_arrival = _timestamps(_column(trips, 'arrival_datetime'))
+
+    delivery_ids = np.arange(1, len(deliveries) + 1)
+    delivery_trip_ids = np.asarray(_column(deliveries, 'trip_id'))
+    tracking = _column(deliveries, 'tracking_number')
+    delivery_status = _column(deliveries, 'delivery_status')
+    scheduled, has_scheduled = _timestamps(_column(deliveries, 'scheduled_datetime'))
+    delivered, has_delivered = _timestamps(_column(deliveries, 'delivered_datetime'))
+    trip_rows = delivery_trip_ids - first_trip_id
+    dispatched = departure[trip_rows]
+
+    # Campos numéricos y códigos sin caracteres especiales: se formatean
+    # directamente (json.dumps por evento no alcanzaría el throughput objetivo)
+    def trip_departed(iso, trip, vehicle, driver, route):
+        return [f'{{"ts":"{t}","event":"trip_departed","trip_id":{a},"vehicle_id":{b},'
+                f'"driver_id":{c},"route_id":{d}}}'
+                for t, a, b, c, d in zip(iso, trip.tolist(), vehicle.tolist(), driver.tolist(), route.tolist())]
+
+    def trip_arrived(iso, trip, vehicle, status):
+        return [f'{{"ts":"{t}","event":"trip_arrived","trip_id":{a},"vehicle_id":{b},"status":"{s}"}}'
+                for t, a, b, s in zip(iso, trip.tolist(), vehicle.tolist(), status)]
+
+    def delivery_event(event):
+        def formatter(iso, delivery, trip, number):
+            return [f'{{"ts":"{t}","event":"{event}","delivery_id":{a},"trip_id":{b},'
+                    f'"tracking_number":"{n}"}}'
+                    for t, a, b, n in zip(iso, delivery.tolist(), trip.tolist(), number)]
+        return formatter
+
+    delivery_columns = [delivery_ids, delivery_trip_ids, tracking]
+
+    # La prioridad ordena eventos simultáneos: salida → despacho → entrega/falla → llegada
+    return [
+        _event_source(0, departure, has_departure, trip_departed,
+                      [trip_ids, vehicle_ids, driver_ids, route_ids]),
+        _event_source(1, dispatched, has_departure[trip_rows],
+                      delivery_event('delivery_scheduled'), delivery_columns),
+        _event_source(2, delivered, has_delivered & (delivery_status == 'delivered'),
+                      delivery_event('delivery_delivered'), delivery_columns),
+        _event_source(2, scheduled, has_scheduled & (delivery_status == 'failed'),
+                      delivery_event('delivery_failed'), delivery_columns),
+        _event_source(3, arrival, has_arrival, trip_arrived,
+                      [trip_ids, vehicle_ids, trip_status]),
+    ]
+
+
+def event_stream(trips, deliveries, first_trip_id=1):
+    """
+    Merge k-way perezoso de todas las fuentes en orden de timestamp
+
+    Args:
+        first_trip_id (int): trip_id de la primera fila de trips (ver event_sources)
+
+    Returns:
+        iterator: (timestamp_us, línea JSON)
+    """
+    for ts, _, line in heapq.merge(*event_sources(trips, deliveries, first_trip_id)):
+        yield ts, line
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: REPRODUCCIÓN Y DESTINOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+@contextlib.contextmanager
+def open_output(destination):
+    """
+    Abre el destino de los eventos como archivo de texto
+
+    Destinos:
+        -                     stdout
+        tcp://host:puerto     escucha y envía al primer cliente que se conecta
+        unix:///ruta/socket   ídem sobre un socket Unix
+        <ruta>                archivo (se sobrescribe)
+    """
+    if destination in (None, '-'):
+        yield sys.stdout
+        return
+
+    if destination.startswith(('tcp://', 'unix://')):
+        if destination.startswith('tcp://'):
+            host, port = destination[len('tcp://'):].rsplit(':', 1)
+            server = socket.create_server((host, int(port)))
+        else:
+            path = destination[len('unix://'):]
+            if os.path.exists(path):
+                os.remove(path)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(path)
+            server.listen(1)
+
+        print(f"📡 Esperando consumidor en {destination}...", file=sys.stderr)
+        client, _ = server.accept()
+        stream = client.makefile('w', encoding='utf-8', buffering=1 << 16)
+        try:
+            yield stream
+        finally:
+            with contextlib.suppress(OSError):
+                stream.close()
+            client.close()
+            server.close()
+        return
+
+    with open(destination, 'w', encoding='utf-8', buffering=1 << 16) as f:
+        yield f
+
+
+def replay(events, output, speedup=0.0, limit=None):
+    """
+    Escribe los eventos como JSON lines respetando el tiempo simulado
+
+    Con speedup > 0, el evento con timestamp t se emite cuando el reloj de
+    pared alcanza (t - t0) / speedup; con speedup = 0 se emite lo más rápido
+    posible.
+
+    Args:
+        events (iterator): (timestamp_us, línea JSON) en orden
+        output: Archivo de texto destino
+        speedup (float): Segundos simulados por segundo real (0 = sin espera)
+        limit (int): Máximo de eventos a emitir (None = todos)
+
+    Returns:
+        tuple: (eventos emitidos, segundos de reproducción)
+    """
+    write = output.write
+    start = time.perf_counter()
+    first_ts = None
+    count = 0
+    scale = 1e-6 / speedup if speedup > 0 else 0.0
+
+    try:
+        for ts, line in events:
+            if scale:
+                if first_ts is None:
+                    first_ts = ts
+                ahead = (ts - first_ts) * scale - (time.perf_counter() - start)
+                if ahead > MIN_SLEEP_SECONDS:
+                    output.flush()
+                    time.sleep(ahead)
+
+            write(line)
+            write('\n')
+            count += 1
+
+            if count % PROGRESS_EVERY == 0:
+                print(f"   {count:,} eventos...", file=sys.stderr, end='\r')
+            if limit is not None and count >= limit:
+                break
+
+        output.flush()
+    except BrokenPipeError:
+        # El consumidor cerró la conexión (ej: "| head"): fin normal
+        pass
+
+    return count, time.perf_counter() - start
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: PUNTO DE ENTRADA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def load_entities(args):
+    """
+    Obtiene trips y deliveries desde el almacén columnar o generándolos en memoria
+
+    Returns:
+        tuple: (trips, deliveries, first_trip_id); en un shard los trip_id
+        empiezan en el inicio de su rango (trip_ids del manifiesto)
+    """
+    if args.column_store:
+        from fleetlogix_columnstore import ColumnStore
+        from fleetlogix_shards import SHARD_MANIFEST
+        store = ColumnStore(args.column_store)
+        first_trip_id = 1
+        manifest_path = os.path.join(args.column_store, SHARD_MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding='utf-8') as f:
+                first_trip_id = json.load(f)['trip_ids'][0]
+        return store.table('trips'), store.table('deliveries'), first_trip_id
+
+    import fleetlogix_generator as flg
+
+    flg.set_scale(args.scale)
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_df = flg.generate_vehicles()
+        drivers_df = flg.generate_drivers()
+        routes_df = flg.generate_routes()
+        trips_df = flg.generate_trips(vehicles_df, drivers_df, routes_df)
+        deliveries_df = flg.generate_deliveries(trips_df, routes_df)
+    return trips_df, deliveries_df, 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Flujo de eventos FleetLogix en orden temporal (JSON lines)")
+    parser.add_argument('--scale', type=float, default=0.1,
+                        help="Factor de escala si se generan los datos (default: 0.1)")
+    parser.add_argument('--column-store', metavar='DIR',
+                        help="Leer trips y deliveries del almacén columnar en lugar de generarlos")
+    parser.add_argument('--speedup', type=float, default=0.0,
+                        help="Segundos simulados por segundo real (ej: 3600); 0 = máxima velocidad")
+    parser.add_argument('--output', default='-',
+                        help="Destino: - (stdout), archivo, tcp://host:puerto o unix:///ruta")
+    parser.add_argument('--limit', type=int, help="Máximo de eventos a emitir")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    trips, deliveries, first_trip_id = load_entities(args)
+    print(f"📋 {len(trips):,} viajes y {len(deliveries):,} entregas → {args.output}", file=sys.stderr)
+
+    with open_output(args.output) as output:
+        count, seconds = replay(event_stream(trips, deliveries, first_trip_id), output, args.speedup, args.limit)
+
+    if count >= PROGRESS_EVERY:
+        print(file=sys.stderr)
+    rate = count / seconds if seconds > 0 else 0
+    print(f"✓ {count:,} eventos en {seconds:.2f} s ({rate:,.0f} eventos/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
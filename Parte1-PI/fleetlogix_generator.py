@@ -11,14 +11,41 @@ Tablas: vehicles, drivers, routes, trips, deliveries, maintenance
 """
 
 import os
+import io
+import argparse
+import contextlib
 import psycopg2
 import pandas as pd
 import numpy as np
-from faker import Faker
 from datetime import datetime, timedelta
+from statistics import NormalDist
 from dotenv import load_dotenv
 from tabulate import tabulate
+import shutil
 import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from fleetlogix_addresses import AddressBook, DEFAULT_COMPONENTS_FILE
+from fleetlogix_aggregates import build_summaries
+from fleetlogix_columnstore import ColumnStore, StoredTable, iter_batches, slice_rows, DEFAULT_STORE_DIR
+from fleetlogix_conformance import check_conformance, print_conformance_report, DEFAULT_ALPHA
+from fleetlogix_intervals import IntervalIndex, check_schedule, print_schedule_report
+from fleetlogix_odometer import OdometerLog, schedule_maintenance, TRIGGER_KM
+from fleetlogix_catalog import (
+    CityCatalog, RouteTable, generate_route_frame,
+    DEFAULT_CATALOG_FILE, DEFAULT_DISTANCES_FILE
+)
+from fleetlogix_profiling import StageProfiler, DEFAULT_PROFILE_DIR
+from fleetlogix_sampler import CategoricalSampler, ConditionalSampler
+from fleetlogix_shards import (
+    parse_shard, shard_range, shard_name, write_shard_manifest, verify_shards, merge_plan,
+    DEFAULT_SHARD_DIR, SHARD_MANIFEST
+)
+from fleetlogix_streams import RandomStreams
+from fleetlogix_workload import WorkloadProfile, parse_workload, top_share
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECCIÓN 1: CONFIGURACIÓN DEL SISTEMA
@@ -53,48 +80,49 @@ NUM_TRIPS = 100000      # Viajes en 2 años (2024-2025)
 NUM_DELIVERIES = 400000 # Entregas (2-6 por viaje, 4 más probable)
 NUM_MAINTENANCE = 5000  # Registros de mantenimiento (~1 cada 20 viajes)
 
+# Factor de escala aplicado sobre los conteos base (1.0 = dataset estándar)
+# Se modifica con set_scale() (ej: 10x para pruebas de volumen)
+SCALE_FACTOR = 1.0
+BASE_COUNTS = {
+    'routes': NUM_ROUTES,
+    'drivers': NUM_DRIVERS,
+    'trips': NUM_TRIPS,
+    'deliveries': NUM_DELIVERIES,
+    'maintenance': NUM_MAINTENANCE
+}
+
+# Generación distribuida (ver set_shard): este proceso genera el shard
+# SHARD_INDEX de SHARD_COUNT; sus viajes empiezan en trip_id TRIP_ID_OFFSET + 1
+SHARD_INDEX = 0
+SHARD_COUNT = 1
+TRIP_ID_OFFSET = 0
+# Mantenimientos de los shards anteriores y conteos de la generación completa
+MAINTENANCE_OFFSET = 0
+FULL_COUNTS = {table: BASE_COUNTS[table] for table in ('trips', 'deliveries', 'maintenance')}
+
 # ─────────────────────────────────────────────────────────────────────────────
-# 1.4 Matriz de Distancias Reales - República Dominicana (km)
+# 1.3.1 Período Operativo (2 años: 2024-2025)
 # ─────────────────────────────────────────────────────────────────────────────
-CITY_DISTANCES = {
-    'Santo Domingo': {
-        'Santo Domingo': 0,
-        'Santiago de los Caballeros': 155,
-        'La Romana': 115,
-        'Puerto Plata': 215,
-        'Punta Cana': 180
-    },
-    'Santiago de los Caballeros': {
-        'Santo Domingo': 155,
-        'Santiago de los Caballeros': 0,
-        'La Romana': 230,
-        'Puerto Plata': 65,
-        'Punta Cana': 285
-    },
-    'La Romana': {
-        'Santo Domingo': 115,
-        'Santiago de los Caballeros': 230,
-        'La Romana': 0,
-        'Puerto Plata': 295,
-        'Punta Cana': 65
-    },
-    'Puerto Plata': {
-        'Santo Domingo': 215,
-        'Santiago de los Caballeros': 65,
-        'La Romana': 295,
-        'Puerto Plata': 0,
-        'Punta Cana': 350
-    },
-    'Punta Cana': {
-        'Santo Domingo': 180,
-        'Santiago de los Caballeros': 285,
-        'La Romana': 65,
-        'Puerto Plata': 350,
-        'Punta Cana': 0
-    }
-}
+START_DATE = datetime(2024, 1, 1)
+END_DATE = datetime(2025, 12, 31, 23, 59, 59)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 1.4 Catálogo de Ciudades y Matriz de Distancias Reales - República Dominicana (km)
+# ─────────────────────────────────────────────────────────────────────────────
+# Se carga desde data/city_catalog.csv y data/city_distances.csv a una matriz
+# NumPy. Para redes más grandes (ej: 120 depósitos) basta con apuntar las
+# variables de entorno a otros archivos con el mismo formato.
+CITY_CATALOG_FILE = os.getenv('FLEETLOGIX_CITY_CATALOG', DEFAULT_CATALOG_FILE)
+CITY_DISTANCES_FILE = os.getenv('FLEETLOGIX_CITY_DISTANCES', DEFAULT_DISTANCES_FILE)
+
+CITY_CATALOG = CityCatalog.from_files(CITY_CATALOG_FILE, CITY_DISTANCES_FILE)
+
+CITIES = list(CITY_CATALOG.cities)
+
+# Calles y sectores por ciudad para las direcciones de entrega (data/address_components.csv)
+ADDRESS_COMPONENTS_FILE = os.getenv('FLEETLOGIX_ADDRESS_COMPONENTS', DEFAULT_COMPONENTS_FILE)
 
-CITIES = list(CITY_DISTANCES.keys())
+ADDRESS_BOOK = AddressBook.from_file(CITY_CATALOG.cities, ADDRESS_COMPONENTS_FILE)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1.5 Tipos de Vehículos y sus Características
@@ -125,15 +153,30 @@ VEHICLE_TYPES = {
 # ─────────────────────────────────────────────────────────────────────────────
 # 1.6 Tipos de Mantenimiento con Probabilidades y Costos (USD)
 # ─────────────────────────────────────────────────────────────────────────────
+# km_interval / day_interval: cada cuánto se repite el servicio en el modelo
+# por odómetro (--maintenance-model odometer), lo que ocurra primero
 MAINTENANCE_TYPES = {
-    'Cambio de aceite': {'probability': 0.30, 'cost_range': (50, 150)},
-    'Revisión de frenos': {'probability': 0.15, 'cost_range': (100, 300)},
-    'Cambio de llantas': {'probability': 0.10, 'cost_range': (200, 800)},
-    'Mantenimiento general': {'probability': 0.20, 'cost_range': (150, 500)},
-    'Revisión de motor': {'probability': 0.10, 'cost_range': (200, 600)},
-    'Alineación y balanceo': {'probability': 0.15, 'cost_range': (50, 120)}
+    'Cambio de aceite': {'probability': 0.30, 'cost_range': (50, 150), 'km_interval': 10000, 'day_interval': 180},
+    'Revisión de frenos': {'probability': 0.15, 'cost_range': (100, 300), 'km_interval': 30000, 'day_interval': 365},
+    'Cambio de llantas': {'probability': 0.10, 'cost_range': (200, 800), 'km_interval': 50000, 'day_interval': 730},
+    'Mantenimiento general': {'probability': 0.20, 'cost_range': (150, 500), 'km_interval': 20000, 'day_interval': 365},
+    'Revisión de motor': {'probability': 0.10, 'cost_range': (200, 600), 'km_interval': 60000, 'day_interval': 730},
+    'Alineación y balanceo': {'probability': 0.15, 'cost_range': (50, 120), 'km_interval': 15000, 'day_interval': 365}
 }
 
+# Modelo de mantenimiento (ver set_maintenance_model):
+# - 'proportional': exactamente NUM_MAINTENANCE registros repartidos según viajes
+# - 'odometer': un servicio al cruzar km_interval o day_interval de su tipo
+MAINTENANCE_MODELS = ['proportional', 'odometer']
+MAINTENANCE_MODEL = 'proportional'
+
+# km recorridos por año antes del período operativo (odómetro inicial según antigüedad)
+INITIAL_ANNUAL_KM_RANGE = (20000, 60000)
+
+# Perfil de carga de los viajes (ver set_workload y fleetlogix_workload):
+# popularidad de vehicle_id/driver_id/route_id y picos estacionales de salidas
+WORKLOAD = WorkloadProfile()
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 1.7 Proveedores de Mantenimiento
 # ─────────────────────────────────────────────────────────────────────────────
@@ -150,25 +193,180 @@ MAINTENANCE_PROVIDERS = [
 # SECCIÓN 2: INICIALIZACIÓN DE GENERADORES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# Configurar Faker para nombres en español y numpy para reproducibilidad
-fake = Faker('es_MX')
-Faker.seed(RANDOM_SEED)
+# Árbol de semillas: cada tabla y cada columna tiene su propio flujo aleatorio
+# (numpy y Faker en español) derivado de RANDOM_SEED (ver fleetlogix_streams),
+# independiente del orden y del tamaño de las demás tablas
+STREAMS = RandomStreams(RANDOM_SEED)
+
+# Estado global de numpy para los usos sin flujo explícito (random_state=None)
 np.random.seed(RANDOM_SEED)
 
 
+def reset_random_state(seed=RANDOM_SEED):
+    """
+    Reinicia el árbol de flujos por tabla y el estado global de numpy
+    para regenerar datos idénticos
+    
+    Args:
+        seed (int): Semilla a aplicar (default RANDOM_SEED)
+    """
+    global STREAMS
+    
+    STREAMS = RandomStreams(seed)
+    np.random.seed(seed)
+
+
+def transaction_streams(table):
+    """
+    Flujos de una tabla transaccional (trips, deliveries, maintenance)
+    
+    En modo shard cada shard usa su propio subárbol de semillas: sus filas
+    son deterministas y no dependen de los demás shards.
+    """
+    if SHARD_COUNT > 1:
+        return STREAMS.for_shard(SHARD_INDEX).table(table)
+    return STREAMS.table(table)
+
+
+def workload_keys(column, count, size, random_state):
+    """
+    Ids 1..count de una foreign key de trips según el perfil de carga
+    
+    Con popularidad uniforme equivale a `size` llamadas a
+    random_state.integers(1, count + 1) (mismos valores que el muestreo por
+    fila). Con zipf o hotset se muestrea de una tabla alias; la permutación
+    de rangos sale de STREAMS sin shard, por lo que todos los shards
+    comparten las mismas claves calientes.
+    """
+    sampler = WORKLOAD.key_sampler(count, STREAMS.table('workload').column(column))
+    if sampler is None:
+        return random_state.integers(1, count + 1, size=size)
+    return sampler.sample(size, random_state=random_state)
+
+
+def scaled_vehicle_count(base_count):
+    """
+    Cantidad de vehículos de un tipo según el factor de escala actual (mínimo 1)
+    """
+    return max(1, int(round(base_count * SCALE_FACTOR)))
+
+
+def set_scale(scale_factor):
+    """
+    Ajusta los conteos de registros a generar según un factor de escala
+    
+    Escala proporcionalmente vehículos (por tipo), conductores, rutas, viajes,
+    entregas y mantenimientos. Con scale_factor=1.0 se restauran los valores
+    estándar (505,650 registros).
+    
+    Args:
+        scale_factor (float): Multiplicador sobre los conteos base (ej: 0.1, 10)
+    """
+    global SCALE_FACTOR, NUM_VEHICLES, NUM_DRIVERS, NUM_ROUTES
+    global NUM_TRIPS, NUM_DELIVERIES, NUM_MAINTENANCE
+    global SHARD_INDEX, SHARD_COUNT, TRIP_ID_OFFSET, MAINTENANCE_OFFSET, FULL_COUNTS
+    
+    if scale_factor <= 0:
+        raise ValueError(f"El factor de escala debe ser positivo: {scale_factor}")
+    
+    SCALE_FACTOR = scale_factor
+    NUM_VEHICLES = sum(scaled_vehicle_count(specs['count']) for specs in VEHICLE_TYPES.values())
+    NUM_DRIVERS = max(1, int(round(BASE_COUNTS['drivers'] * scale_factor)))
+    NUM_ROUTES = max(1, int(round(BASE_COUNTS['routes'] * scale_factor)))
+    NUM_TRIPS = max(1, int(round(BASE_COUNTS['trips'] * scale_factor)))
+    NUM_DELIVERIES = max(2 * NUM_TRIPS, int(round(BASE_COUNTS['deliveries'] * scale_factor)))
+    NUM_MAINTENANCE = max(NUM_VEHICLES, int(round(BASE_COUNTS['maintenance'] * scale_factor)))
+    
+    # Los conteos vuelven a ser los de la generación completa
+    SHARD_INDEX, SHARD_COUNT, TRIP_ID_OFFSET, MAINTENANCE_OFFSET = 0, 1, 0, 0
+    FULL_COUNTS = {'trips': NUM_TRIPS, 'deliveries': NUM_DELIVERIES, 'maintenance': NUM_MAINTENANCE}
+
+
+def set_maintenance_model(model):
+    """
+    Selecciona el modelo de mantenimiento que usa generate_maintenance()
+    
+    Args:
+        model (str): 'proportional' u 'odometer' (ver MAINTENANCE_MODELS)
+    """
+    global MAINTENANCE_MODEL
+    
+    if model not in MAINTENANCE_MODELS:
+        raise ValueError(f"Modelo de mantenimiento desconocido: {model}. Disponibles: {', '.join(MAINTENANCE_MODELS)}")
+    MAINTENANCE_MODEL = model
+
+
+def set_workload(profile):
+    """
+    Selecciona el perfil de carga que usa generate_trips()
+    
+    Args:
+        profile (WorkloadProfile | str): Perfil o especificación (ej: 'zipf:1.2+seasonal')
+    """
+    global WORKLOAD
+    
+    WORKLOAD = profile if isinstance(profile, WorkloadProfile) else WorkloadProfile.parse(profile)
+
+
+def set_shard(index, count):
+    """
+    Restringe la generación transaccional al shard `index` de `count`
+    
+    Las tablas maestras no cambian (todos los shards las generan idénticas).
+    Viajes, entregas y mantenimientos se reparten en rangos contiguos
+    (ver fleetlogix_shards.shard_range) y el shard toma los trip_id
+    TRIP_ID_OFFSET + 1 .. TRIP_ID_OFFSET + NUM_TRIPS y los mantenimientos
+    MAINTENANCE_OFFSET .. MAINTENANCE_OFFSET + NUM_MAINTENANCE - 1 del
+    reparto completo por vehículo (ver generate_maintenance).
+    
+    Args:
+        index (int): Índice del shard (0..count-1)
+        count (int): Total de shards
+    
+    Returns:
+        tuple: Rango [inicio, fin) de trip_id del shard
+    """
+    global NUM_TRIPS, NUM_DELIVERIES, NUM_MAINTENANCE
+    global SHARD_INDEX, SHARD_COUNT, TRIP_ID_OFFSET, MAINTENANCE_OFFSET
+    
+    # Partir siempre de los conteos completos de la escala actual
+    set_scale(SCALE_FACTOR)
+    if count > NUM_TRIPS:
+        raise ValueError(f"Más shards ({count}) que viajes ({NUM_TRIPS:,}) a esta escala")
+    
+    trips_start, trips_stop = shard_range(NUM_TRIPS, index, count)
+    deliveries_start, deliveries_stop = shard_range(NUM_DELIVERIES, index, count)
+    maintenance_start, maintenance_stop = shard_range(NUM_MAINTENANCE, index, count)
+    
+    SHARD_INDEX, SHARD_COUNT, TRIP_ID_OFFSET = index, count, trips_start
+    MAINTENANCE_OFFSET = maintenance_start
+    NUM_TRIPS = trips_stop - trips_start
+    NUM_DELIVERIES = deliveries_stop - deliveries_start
+    NUM_MAINTENANCE = maintenance_stop - maintenance_start
+    
+    return trips_start + 1, trips_stop + 1
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECCIÓN 3: FUNCIONES DE CONEXIÓN Y GESTIÓN DE BASE DE DATOS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def get_connection():
+def get_connection(schema=None):
     """
     Establece conexión con PostgreSQL usando configuración de .env
     
+    Args:
+        schema (str): Schema para resolver nombres de tabla sin calificar
+                      (default: search_path del servidor, normalmente public)
+    
     Returns:
         psycopg2.connection: Objeto de conexión activa
     """
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
+        if schema:
+            conn = psycopg2.connect(**DB_CONFIG, options=f'-c search_path={schema}')
+        else:
+            conn = psycopg2.connect(**DB_CONFIG)
         return conn
     except Exception as e:
         print(f"❌ ERROR: No se pudo conectar a la base de datos")
@@ -235,22 +433,41 @@ def truncate_tables():
         conn = get_connection()
         cursor = conn.cursor()
         
-        # Verificar si hay datos antes de limpiar
-        cursor.execute("SELECT COUNT(*) FROM deliveries")
-        total_records = cursor.fetchone()[0]
-        
-        if total_records == 0:
+        # Verificar si hay datos antes de limpiar: con commit_every una carga
+        # fallida deja tablas parciales aunque deliveries siga vacía
+        tables_with_data = []
+        for table_name in tables_order:
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table_name})")
+            if cursor.fetchone()[0]:
+                tables_with_data.append(table_name)
+        
+        cursor.execute("SELECT to_regclass(%s) IS NOT NULL", (LOAD_CHECKPOINTS_TABLE,))
+        has_checkpoints = cursor.fetchone()[0]
+        if has_checkpoints:
+            cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {LOAD_CHECKPOINTS_TABLE})")
+            has_checkpoints = cursor.fetchone()[0]
+        
+        if not tables_with_data and not has_checkpoints:
             print("   ℹ️  Las tablas ya están vacías, omitiendo limpieza...")
             cursor.close()
             conn.close()
             return
         
-        print(f"   Registros actuales: {total_records:,} en deliveries")
+        if tables_with_data:
+            print(f"   Tablas con datos: {', '.join(tables_with_data)}")
         
-        # Usar TRUNCATE CASCADE desde la tabla padre más alta para máxima velocidad
-        cursor.execute("TRUNCATE TABLE vehicles RESTART IDENTITY CASCADE")
+        # TRUNCATE CASCADE de todas las tablas en una sola sentencia
+        # (en el schema particionado deliveries no tiene FK hacia trips, por lo
+        # que debe listarse explícitamente)
+        cursor.execute(f"TRUNCATE TABLE {', '.join(tables_order)} RESTART IDENTITY CASCADE")
         print(f"   ✓ Todas las tablas limpiadas con CASCADE")
         
+        # Los ids se reutilizan: las marcas de agua de validación y los
+        # checkpoints de carga ya no aplican
+        clear_watermarks(cursor)
+        if has_checkpoints:
+            cursor.execute(f"DELETE FROM {LOAD_CHECKPOINTS_TABLE}")
+        
         conn.commit()
         cursor.close()
         conn.close()
@@ -262,53 +479,293 @@ def truncate_tables():
         sys.exit(1)
 
 
-def load_data_to_table(df, table_name, batch_size=1000):
+def insert_batch(cursor, insert_query, batch):
+    """
+    Ejecuta el INSERT de un lote, con NaN/NaT como None para PostgreSQL
+    """
+    data = list(batch.astype(object).where(batch.notna(), None).itertuples(index=False, name=None))
+    cursor.executemany(insert_query, data)
+
+
+def insert_dataframe(cursor, df, table_name, batch_size=1000, show_progress=True):
+    """
+    Inserta un DataFrame en una tabla por lotes usando un cursor existente
+    
+    No hace commit: la transacción la controla quien llama.
+    Solo el lote en curso se convierte a objetos Python (sin copiar la tabla
+    completa), y `df` puede ser una StoredTable del almacén columnar.
+    
+    Args:
+        cursor: Cursor psycopg2 abierto
+        df (pd.DataFrame | StoredTable): Datos a insertar
+        table_name (str): Nombre de la tabla (o partición) destino
+        batch_size (int): Tamaño de lote para inserciones (default 1000)
+        show_progress (bool): Mostrar progreso en la misma línea de consola
+    
+    Returns:
+        int: Cantidad de registros insertados
+    """
+    # Obtener nombres de columnas del DataFrame
+    columns = list(df.columns)
+    placeholders = ','.join(['%s'] * len(columns))
+    columns_str = ','.join(columns)
+    
+    insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
+    
+    # Insertar en lotes para eficiencia
+    total_rows = len(df)
+    progress = 0
+    for batch in iter_batches(df, batch_size):
+        insert_batch(cursor, insert_query, batch)
+        
+        # Mostrar progreso
+        progress += len(batch)
+        if show_progress:
+            print(f"   Cargando {table_name}: {progress}/{total_rows} registros", end='\r')
+    
+    return total_rows
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 3.1 Carga adaptativa con checkpoints (reanudable)
+# ─────────────────────────────────────────────────────────────────────────────
+# El lote se ajusta durante la carga según los registros/segundo medidos y
+# cada commit registra en load_checkpoints el rango de filas y de ids
+# confirmado, en la MISMA transacción que los datos. Si la carga falla,
+# --resume continúa desde el último lote confirmado en lugar de desde cero.
+
+DEFAULT_COMMIT_EVERY = 50000    # Registros por commit (0 = un commit por tabla)
+MIN_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 50000
+
+LOAD_CHECKPOINTS_TABLE = 'load_checkpoints'
+
+
+class AdaptiveBatchSizer:
+    """
+    Ajusta el tamaño de lote buscando el máximo de registros/segundo
+    
+    Búsqueda por escalada: mientras el throughput mejora se sigue
+    multiplicando (o dividiendo) el lote; si cae por debajo del mejor medido
+    se vuelve al mejor tamaño y se invierte la dirección. El mejor valor se
+    degrada levemente en cada lote para seguir cambios durante la carga
+    (ej: índices que crecen).
+    """
+    
+    def __init__(self, initial=1000, minimum=MIN_BATCH_SIZE, maximum=MAX_BATCH_SIZE,
+                 growth=2.0, tolerance=0.10, decay=0.98, adaptive=True):
+        """
+        Args:
+            initial (int): Tamaño de lote inicial
+            minimum (int): Tamaño mínimo
+            maximum (int): Tamaño máximo
+            growth (float): Factor de cambio entre pasos
+            tolerance (float): Variación relativa considerada ruido
+            decay (float): Degradación del mejor throughput por lote
+            adaptive (bool): False = tamaño fijo (comportamiento clásico)
+        """
+        self.size = int(min(max(initial, minimum), maximum))
+        self.minimum, self.maximum = minimum, maximum
+        self.growth, self.tolerance, self.decay = growth, tolerance, decay
+        self.adaptive = adaptive
+        self.best_rate = 0.0
+        self.best_size = self.size
+        self.growing = True
+    
+    def record(self, rows, seconds):
+        """
+        Registra un lote medido y decide el tamaño del siguiente
+        """
+        if not self.adaptive or seconds <= 0:
+            return
+        
+        rate = rows / seconds
+        self.best_rate *= self.decay
+        
+        if rate > self.best_rate * (1 + self.tolerance):
+            self.best_rate, self.best_size = rate, self.size
+            factor = self.growth if self.growing else 1 / self.growth
+            self.size = int(min(max(self.size * factor, self.minimum), self.maximum))
+        elif rate < self.best_rate * (1 - self.tolerance):
+            self.growing = not self.growing
+            self.size = self.best_size
+
+
+def load_signature(total_rows):
+    """
+    Identifica los datos de una carga: solo se reanuda con la misma semilla,
+    escala, shard, perfil de carga, modelo de mantenimiento y cantidad de
+    filas (es decir, los mismos datos regenerados)
+    """
+    return (f"seed={STREAMS.seed} scale={SCALE_FACTOR} shard={SHARD_INDEX}/{SHARD_COUNT} "
+            f"workload={WORKLOAD.spec} maintenance={MAINTENANCE_MODEL} rows={total_rows}")
+
+
+def ensure_checkpoint_table(cursor):
+    """
+    Crea la tabla de checkpoints de carga si no existe
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {LOAD_CHECKPOINTS_TABLE} (
+            checkpoint_id SERIAL PRIMARY KEY,
+            table_name VARCHAR(100) NOT NULL,
+            signature TEXT NOT NULL,
+            first_row BIGINT NOT NULL,
+            last_row BIGINT NOT NULL,
+            first_id BIGINT,
+            last_id BIGINT,
+            batch_size INTEGER NOT NULL,
+            rows_per_second NUMERIC(12,1),
+            committed_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    """)
+
+
+def last_checkpoint(cursor, table_name):
+    """
+    Último lote confirmado de una tabla
+    
+    Returns:
+        tuple | None: (signature, last_row, last_id) o None si no hay checkpoints
+    """
+    cursor.execute(f"""
+        SELECT signature, last_row, last_id
+        FROM {LOAD_CHECKPOINTS_TABLE}
+        WHERE table_name = %s
+        ORDER BY last_row DESC
+        LIMIT 1
+    """, (table_name,))
+    return cursor.fetchone()
+
+
+def resume_position(cursor, table_name, signature, id_column):
+    """
+    Fila desde la que continuar una carga interrumpida
+    
+    Alinea la secuencia SERIAL con el último id confirmado: los nextval()
+    de los lotes revertidos no se devuelven, y sin este ajuste los ids (y
+    las FKs que los generadores asumen como posición + 1) se desplazarían.
+    
+    Returns:
+        int: Filas ya confirmadas (0 = cargar desde el inicio)
+    """
+    checkpoint = last_checkpoint(cursor, table_name)
+    
+    if checkpoint is None:
+        cursor.execute(f"SELECT EXISTS (SELECT 1 FROM {table_name})")
+        if cursor.fetchone()[0]:
+            raise RuntimeError(f"{table_name} tiene datos pero no checkpoints; no se puede reanudar "
+                               f"(ejecute sin --resume para recargar desde cero)")
+        if id_column:
+            # Un primer lote revertido también consumió ids de la secuencia
+            cursor.execute("SELECT setval(pg_get_serial_sequence(%s, %s), 1, false)", (table_name, id_column))
+        return 0
+    
+    checkpoint_signature, last_row, last_id = checkpoint
+    if checkpoint_signature != signature:
+        raise RuntimeError(f"Los checkpoints de {table_name} son de otros datos "
+                           f"({checkpoint_signature}); se esperaba {signature}")
+    
+    if id_column and last_id is not None:
+        cursor.execute(f"SELECT COALESCE(MAX({id_column}), 0) FROM {table_name}")
+        if cursor.fetchone()[0] != last_id:
+            raise RuntimeError(f"{table_name}: el máximo {id_column} no coincide con el último checkpoint ({last_id})")
+        cursor.execute("SELECT setval(pg_get_serial_sequence(%s, %s), %s)", (table_name, id_column, last_id))
+    
+    return last_row
+
+
+def load_data_to_table(df, table_name, batch_size=1000, commit_every=DEFAULT_COMMIT_EVERY,
+                       adaptive=True, resume=False):
     """
     Carga un DataFrame de pandas a una tabla de PostgreSQL usando inserciones por lotes
     
+    El tamaño de lote se adapta al throughput medido (ver AdaptiveBatchSizer)
+    y se confirma cada `commit_every` registros, registrando en
+    load_checkpoints el rango de filas e ids de cada commit.
+    
     Args:
-        df (pd.DataFrame): DataFrame con los datos a cargar
+        df (pd.DataFrame | StoredTable): Datos a cargar
         table_name (str): Nombre de la tabla destino
-        batch_size (int): Tamaño de lote para inserciones (default 1000)
+        batch_size (int): Tamaño de lote inicial (default 1000)
+        commit_every (int): Registros por commit (0 = un solo commit al final)
+        adaptive (bool): Ajustar el tamaño de lote según el throughput
+        resume (bool): Continuar desde el último checkpoint en lugar de desde cero
     """
+    total_rows = len(df)
+    columns = list(df.columns)
+    insert_query = (f"INSERT INTO {table_name} ({','.join(columns)}) "
+                    f"VALUES ({','.join(['%s'] * len(columns))})")
+    id_column = TABLE_PRIMARY_KEYS.get(table_name)
+    signature = load_signature(total_rows)
+    
     try:
         conn = get_connection()
         cursor = conn.cursor()
+        ensure_checkpoint_table(cursor)
+        
+        if resume:
+            row = resume_position(cursor, table_name, signature, id_column)
+            if row >= total_rows:
+                print(f"   ✓ {table_name}: ya cargada según checkpoints ({total_rows:,} registros)")
+                conn.commit()
+                cursor.close()
+                conn.close()
+                return
+            if row:
+                print(f"   ↻ {table_name}: reanudando desde el registro {row + 1:,}")
+        else:
+            row = 0
+            cursor.execute(f"DELETE FROM {LOAD_CHECKPOINTS_TABLE} WHERE table_name = %s", (table_name,))
+        conn.commit()
         
-        # Reemplazar NaN y NaT con None para PostgreSQL
-        df_clean = df.copy()
-        df_clean = df_clean.where(pd.notnull(df_clean), None)
-        
-        # Obtener nombres de columnas del DataFrame
-        columns = df_clean.columns.tolist()
-        placeholders = ','.join(['%s'] * len(columns))
-        columns_str = ','.join(columns)
-        
-        insert_query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
-        
-        # Insertar en lotes para eficiencia
-        total_rows = len(df_clean)
-        for i in range(0, total_rows, batch_size):
-            batch = df_clean.iloc[i:i+batch_size]
-            # Convertir cada fila a tupla, manejando NaN/NaT como None
-            data = []
-            for _, row in batch.iterrows():
-                row_data = tuple(None if pd.isna(val) else val for val in row)
-                data.append(row_data)
-            cursor.executemany(insert_query, data)
+        sizer = AdaptiveBatchSizer(batch_size, adaptive=adaptive)
+        chunk_start, chunk_first_id = row, None
+        load_start = time.perf_counter()
+        loaded = 0
+        
+        while row < total_rows:
+            batch = slice_rows(df, row, min(row + sizer.size, total_rows))
+            batch_size_used = sizer.size
             
-            # Mostrar progreso
-            progress = min(i + batch_size, total_rows)
-            print(f"   Cargando {table_name}: {progress}/{total_rows} registros", end='\r')
+            start = time.perf_counter()
+            insert_batch(cursor, insert_query, batch)
+            sizer.record(len(batch), time.perf_counter() - start)
+            
+            last_id = None
+            if id_column:
+                # nextval() es secuencial en esta sesión: el lote ocupa [currval - n + 1, currval]
+                cursor.execute("SELECT currval(pg_get_serial_sequence(%s, %s))", (table_name, id_column))
+                last_id = cursor.fetchone()[0]
+                if chunk_first_id is None:
+                    chunk_first_id = last_id - len(batch) + 1
+            
+            row += len(batch)
+            loaded += len(batch)
+            
+            if row == total_rows or (commit_every and row - chunk_start >= commit_every):
+                rate = loaded / (time.perf_counter() - load_start)
+                cursor.execute(f"""
+                    INSERT INTO {LOAD_CHECKPOINTS_TABLE}
+                        (table_name, signature, first_row, last_row, first_id, last_id, batch_size, rows_per_second)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """, (table_name, signature, chunk_start, row, chunk_first_id, last_id, batch_size_used, round(rate, 1)))
+                conn.commit()
+                chunk_start, chunk_first_id = row, None
+            
+            print(f"   Cargando {table_name}: {row}/{total_rows} registros (lote {batch_size_used:,})", end='\r')
         
-        conn.commit()
-        print(f"   ✓ {table_name}: {total_rows:,} registros cargados exitosamente" + " " * 20)
+        elapsed = max(time.perf_counter() - load_start, 1e-9)
+        print(f"   ✓ {table_name}: {loaded:,} registros cargados exitosamente "
+              f"({loaded / elapsed:,.0f} reg/s, lote final {sizer.size:,})" + " " * 20)
         
         cursor.close()
         conn.close()
         
     except Exception as e:
         print(f"\n❌ ERROR al cargar datos en {table_name}: {e}")
+        print(f"   Los lotes confirmados quedan registrados en {LOAD_CHECKPOINTS_TABLE}; "
+              f"use --resume para continuar")
         sys.exit(1)
 
 
@@ -333,31 +790,40 @@ def generate_vehicles():
     
     vehicles_data = []
     
+    # Un flujo aleatorio independiente por columna (ver fleetlogix_streams)
+    streams = STREAMS.table('vehicles')
+    plate_rng = streams.column('license_plate')
+    capacity_rng = streams.column('capacity_kg')
+    status_rng = streams.column('status')
+    fuel_rng = streams.column('fuel_type')
+    acquisition_fake = streams.faker('acquisition_date')
+    
     for vehicle_type, specs in VEHICLE_TYPES.items():
-        count = specs['count']
+        count = scaled_vehicle_count(specs['count'])
         cap_min, cap_max = specs['capacity_range']
         
-        for _ in range(count):
+        # Estados y combustibles muestreados en lote con tablas alias precompiladas
+        statuses = VEHICLE_STATUS_SAMPLER.sample(count, random_state=status_rng)
+        fuel_types = FUEL_TYPE_SAMPLER.sample(count, random_state=fuel_rng)
+        
+        for j in range(count):
             # Generar placa dominicana única (formato: A123456)
-            license_plate = f"{np.random.choice(list('ABCDEFGHJKLMNPQRSTUVWXYZ'))}{np.random.randint(100000, 999999)}"
+            license_plate = f"{plate_rng.choice(list('ABCDEFGHJKLMNPQRSTUVWXYZ'))}{plate_rng.integers(100000, 999999)}"
             
             # Capacidad dentro del rango específico del tipo de vehículo
-            capacity = round(np.random.uniform(cap_min, cap_max), 2)
+            capacity = round(capacity_rng.uniform(cap_min, cap_max), 2)
             
             # Fecha de adquisición entre 2018 y 2024
-            acquisition_date = fake.date_between(start_date='-8y', end_date='-1y')
+            acquisition_date = acquisition_fake.date_between(start_date='-8y', end_date='-1y')
             
             # Estado del vehículo: 90% activo, 5% inactivo, 5% en mantenimiento
-            status = np.random.choice(
-                ['active', 'inactive', 'maintenance'],
-                p=[0.90, 0.05, 0.05]
-            )
+            status = statuses[j]
             
             # Tipo de combustible: Diesel para camiones (80%), Gasolina para el resto
             if vehicle_type == 'Motocicleta':
                 fuel_type = 'Gasolina'
             else:
-                fuel_type = np.random.choice(['Diesel', 'Gasolina'], p=[0.8, 0.2])
+                fuel_type = fuel_types[j]
             
             vehicles_data.append({
                 'license_plate': license_plate,
@@ -370,9 +836,10 @@ def generate_vehicles():
     
     df = pd.DataFrame(vehicles_data)
     print(f"   ✓ {len(df)} vehículos generados")
-    print(f"   Distribución: Camión Grande={VEHICLE_TYPES['Camión Grande']['count']}, "
-          f"Camión Mediano={VEHICLE_TYPES['Camión Mediano']['count']}, "
-          f"Van={VEHICLE_TYPES['Van']['count']}, Motocicleta={VEHICLE_TYPES['Motocicleta']['count']}")
+    type_counts = df['vehicle_type'].value_counts()
+    print(f"   Distribución: Camión Grande={type_counts.get('Camión Grande', 0)}, "
+          f"Camión Mediano={type_counts.get('Camión Mediano', 0)}, "
+          f"Van={type_counts.get('Van', 0)}, Motocicleta={type_counts.get('Motocicleta', 0)}")
     
     return df
 
@@ -395,31 +862,40 @@ def generate_drivers():
     
     drivers_data = []
     
+    # Un flujo aleatorio independiente por columna (ver fleetlogix_streams)
+    streams = STREAMS.table('drivers')
+    first_name_fake = streams.faker('first_name')
+    last_name_fake = streams.faker('last_name')
+    license_rng = streams.column('license_number')
+    expiry_fake = streams.faker('license_expiry')
+    phone_rng = streams.column('phone')
+    hire_fake = streams.faker('hire_date')
+    
+    # Estados muestreados en lote con tabla alias precompilada
+    statuses = DRIVER_STATUS_SAMPLER.sample(NUM_DRIVERS, random_state=streams.column('status'))
+    
     for i in range(NUM_DRIVERS):
         # Código de empleado único con formato EMP-####
         employee_code = f"EMP-{i+1:04d}"
         
         # Nombre y apellido en español
-        first_name = fake.first_name()
-        last_name = fake.last_name()
+        first_name = first_name_fake.first_name()
+        last_name = last_name_fake.last_name()
         
         # Número de licencia único con 9 dígitos
-        license_number = f"LIC-{np.random.randint(100000000, 999999999)}"
+        license_number = f"LIC-{license_rng.integers(100000000, 999999999)}"
         
         # Fecha de expiración de licencia (2027-2030, siempre válida)
-        license_expiry = fake.date_between(start_date='+1y', end_date='+4y')
+        license_expiry = expiry_fake.date_between(start_date='+1y', end_date='+4y')
         
         # Teléfono dominicano (formato: +1-809-XXX-XXXX)
-        phone = f"+1-809-{np.random.randint(200, 999)}-{np.random.randint(1000, 9999)}"
+        phone = f"+1-809-{phone_rng.integers(200, 999)}-{phone_rng.integers(1000, 9999)}"
         
         # Fecha de contratación entre 2020 y 2025
-        hire_date = fake.date_between(start_date='-6y', end_date='-1m')
+        hire_date = hire_fake.date_between(start_date='-6y', end_date='-1m')
         
         # Estado: 92% activo, 5% inactivo, 3% en licencia
-        status = np.random.choice(
-            ['active', 'inactive', 'on_leave'],
-            p=[0.92, 0.05, 0.03]
-        )
+        status = statuses[i]
         
         drivers_data.append({
             'employee_code': employee_code,
@@ -441,57 +917,28 @@ def generate_drivers():
 
 def generate_routes():
     """
-    Genera 50 rutas entre las 5 ciudades principales de República Dominicana
+    Genera 50 rutas entre las ciudades del catálogo (por defecto las 5 principales
+    de República Dominicana)
     
     Ciudades: Santo Domingo, Santiago, La Romana, Puerto Plata, Punta Cana
     
-    Usa matriz de distancias reales con variación ±10% para rutas alternativas
+    Usa la matriz de distancias del catálogo con variación ±10% para rutas alternativas
     Calcula duración estimada basada en velocidad promedio de 55-65 km/h
     Calcula costos de peajes proporcionales a distancia (~$0.50-$1.50 por 50km)
     
+    La generación es vectorizada (fleetlogix_catalog.generate_route_frame) y
+    escala a miles de rutas sobre cientos de ciudades.
+    
     Returns:
         pd.DataFrame: DataFrame con 50 rutas
     """
     print("\n🛣️  Generando rutas entre ciudades...")
     
-    routes_data = []
-    route_id = 1
-    
     # Con 5 ciudades tenemos 20 combinaciones únicas (origen != destino)
-    # Para llegar a 50 rutas, generamos múltiples variantes por par de ciudades
-    while route_id <= NUM_ROUTES:
-        for origin in CITIES:
-            for destination in CITIES:
-                if origin != destination and route_id <= NUM_ROUTES:
-                    # Obtener distancia base de la matriz
-                    base_distance = CITY_DISTANCES[origin][destination]
-                    
-                    # Añadir variación ±10% para simular rutas alternativas
-                    distance = round(base_distance * np.random.uniform(0.9, 1.1), 2)
-                    
-                    # Calcular duración estimada (velocidad promedio 55-65 km/h)
-                    avg_speed = np.random.uniform(55, 65)
-                    estimated_duration = round(distance / avg_speed, 2)
-                    
-                    # Calcular costo de peajes (~$0.50-$1.50 por cada 50km)
-                    toll_cost = round((distance / 50) * np.random.uniform(0.5, 1.5), 2)
-                    
-                    # Código de ruta único
-                    route_code = f"RT-{route_id:03d}"
-                    
-                    routes_data.append({
-                        'route_code': route_code,
-                        'origin_city': origin,
-                        'destination_city': destination,
-                        'distance_km': distance,
-                        'estimated_duration_hours': estimated_duration,
-                        'toll_cost': toll_cost
-                    })
-                    
-                    route_id += 1
-    
-    df = pd.DataFrame(routes_data)
-    print(f"   ✓ {len(df)} rutas generadas entre 5 ciudades")
+    # Para llegar a 50 rutas, se recorren los pares en ciclos completos
+    df = generate_route_frame(CITY_CATALOG, NUM_ROUTES, random_state=STREAMS.table('routes').column('route'))
+    
+    print(f"   ✓ {len(df)} rutas generadas entre {len(CITY_CATALOG)} ciudades")
     print(f"   Rango de distancias: {df['distance_km'].min():.1f} - {df['distance_km'].max():.1f} km")
     
     return df
@@ -579,8 +1026,8 @@ def get_hourly_distribution():
     
     USO EN generate_trips():
     ────────────────────────
-    Este array se usa con np.random.choice() para seleccionar horas de salida
-    de manera ponderada, creando el patrón realista de operación logística.
+    Este array se compila en HOURLY_SAMPLER (tabla alias) para seleccionar horas
+    de salida de manera ponderada, creando el patrón realista de operación logística.
     
     Returns:
         numpy.array: Array de 24 valores que suman exactamente 1.0 (100%)
@@ -624,6 +1071,55 @@ def get_hourly_distribution():
     ])
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 5.1: DISTRIBUCIONES CATEGÓRICAS PRECOMPILADAS
+# ═══════════════════════════════════════════════════════════════════════════════
+# Cada distribución se compila UNA vez en una tabla alias (fleetlogix_sampler)
+# y todos los generadores la comparten para muestrear lotes completos en O(1)
+# por muestra, en lugar de llamar np.random.choice(..., p=...) por fila.
+
+HOURLY_SAMPLER = CategoricalSampler(np.arange(24), get_hourly_distribution())
+
+VEHICLE_STATUS_SAMPLER = CategoricalSampler(
+    ['active', 'inactive', 'maintenance'], [0.90, 0.05, 0.05]
+)
+
+# Solo aplica a camiones y vans (las motocicletas siempre usan Gasolina)
+FUEL_TYPE_SAMPLER = CategoricalSampler(['Diesel', 'Gasolina'], [0.8, 0.2])
+
+DRIVER_STATUS_SAMPLER = CategoricalSampler(
+    ['active', 'inactive', 'on_leave'], [0.92, 0.05, 0.03]
+)
+
+TRIP_STATUS_SAMPLER = CategoricalSampler(
+    ['completed', 'in_progress', 'cancelled'], [0.95, 0.03, 0.02]
+)
+
+DELIVERIES_PER_TRIP_SAMPLER = CategoricalSampler(
+    [2, 3, 4, 5, 6], [0.10, 0.20, 0.40, 0.20, 0.10]
+)
+
+# Estado de la entrega condicionado al estado del viaje:
+# - completed: delivered (85%), pending (10%), failed (5%)
+# - in_progress: entregas pendientes o algunas entregadas
+# - cancelled: pendientes o fallidas (nunca delivered)
+DELIVERY_STATUS_SAMPLER = ConditionalSampler({
+    'completed': {'delivered': 0.85, 'pending': 0.10, 'failed': 0.05},
+    'in_progress': {'delivered': 0.30, 'pending': 0.70},
+    'cancelled': {'pending': 0.60, 'failed': 0.40}
+})
+
+# 85% de las entregas delivered tienen firma del receptor
+SIGNATURE_SAMPLER = CategoricalSampler([True, False], [0.85, 0.15])
+
+MAINTENANCE_TYPE_SAMPLER = CategoricalSampler(
+    list(MAINTENANCE_TYPES.keys()),
+    [specs['probability'] for specs in MAINTENANCE_TYPES.values()]
+)
+
+MAINTENANCE_PROVIDER_SAMPLER = CategoricalSampler.uniform(MAINTENANCE_PROVIDERS)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # SECCIÓN 6: GENERACIÓN DE TABLA TRANSACCIONAL TRIPS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -656,7 +1152,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
     
     • HORA: Distribución NO uniforme usando get_hourly_distribution()
       - NO se usa distribución uniforme (sería poco realista)
-      - Se usa np.random.choice() con probabilidades ponderadas
+      - Se usa HOURLY_SAMPLER (tabla alias) con probabilidades ponderadas
       - Picos matutinos (7-8am) representan 8.5% de viajes cada uno
       - Madrugadas (0-5am) representan solo 0.5-2% cada una
       - ESTO CREA EL PATRÓN REALISTA DE OPERACIÓN
@@ -679,6 +1175,11 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
       - Referencia a tabla routes (route_id como PK)
       - Algunas rutas más populares que otras (distribución natural)
     
+    • Con un perfil de carga sesgado (--workload, ver set_workload) los tres
+      ids se muestrean de tablas alias con popularidad Zipf o hot-set, y con
+      picos estacionales los días de salida se ponderan por temporada (la
+      hora sigue get_hourly_distribution())
+    
     ┌────────────────────────────────────────────────────────────────────────┐
     │ PASO 3: RECUPERACIÓN DE DATOS DE RUTA                                   │
     └────────────────────────────────────────────────────────────────────────┘
@@ -818,17 +1319,38 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
     
     trips_data = []
     
-    # Obtener distribución horaria realista
-    hourly_probs = get_hourly_distribution()
+    # Horas de salida y estados muestreados en lote (tablas alias precompiladas
+    # a partir de get_hourly_distribution() y la distribución 95/3/2)
+    streams = transaction_streams('trips')
+    selected_hours = HOURLY_SAMPLER.sample(NUM_TRIPS, random_state=streams.column('departure_hour'))
+    trip_statuses = TRIP_STATUS_SAMPLER.sample(NUM_TRIPS, random_state=streams.column('status'))
+    
+    # Un flujo aleatorio independiente por columna (ver fleetlogix_streams)
+    departure_rng = streams.column('departure_datetime')
+    duration_rng = streams.column('duration')
+    fuel_rng = streams.column('fuel_consumed_liters')
+    weight_rng = streams.column('total_weight_kg')
+    arrival_rng = streams.column('arrival_datetime')
+    
+    # Atributos de ruta como arrays contiguos indexados por route_id
+    route_table = RouteTable(routes_df)
     
     # Crear diccionario de vehículos para lookup rápido
     vehicle_lookup = vehicles_df.set_index(vehicles_df.index + 1)[['vehicle_type', 'capacity_kg']].to_dict('index')
     
     # Fechas de inicio y fin del período operativo
-    start_date = datetime(2024, 1, 1)
-    end_date = datetime(2025, 12, 31, 23, 59, 59)
+    start_date = START_DATE
+    end_date = END_DATE
     total_seconds = int((end_date - start_date).total_seconds())
     
+    # Foreign keys y días de salida en lote según el perfil de carga (WORKLOAD)
+    vehicle_ids = workload_keys('vehicle_id', NUM_VEHICLES, NUM_TRIPS, streams.column('vehicle_id'))
+    driver_ids = workload_keys('driver_id', NUM_DRIVERS, NUM_TRIPS, streams.column('driver_id'))
+    route_ids = workload_keys('route_id', len(routes_df), NUM_TRIPS, streams.column('route_id'))
+    day_sampler = WORKLOAD.day_sampler(start_date, end_date)
+    departure_days = (day_sampler.sample(NUM_TRIPS, random_state=streams.column('departure_day'))
+                      if day_sampler is not None else None)
+    
     # Generar NUM_TRIPS viajes
     for i in range(NUM_TRIPS):
         # Mostrar progreso cada 10,000 registros
@@ -839,40 +1361,41 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
         # PASO 1: Seleccionar fecha y hora de salida
         # ═══════════════════════════════════════════════════════════════════
         
-        # Fecha aleatoria entre 2024-01-01 y 2025-12-31
-        random_seconds = np.random.randint(0, total_seconds)
+        # Fecha aleatoria entre 2024-01-01 y 2025-12-31 (o el día ponderado por temporada)
+        if departure_days is not None:
+            random_seconds = departure_days[i] * 86400
+        else:
+            random_seconds = departure_rng.integers(0, total_seconds)
         departure_datetime = start_date + timedelta(seconds=int(random_seconds))
         
         # Ajustar hora usando distribución horaria ponderada
-        selected_hour = np.random.choice(24, p=hourly_probs)
         departure_datetime = departure_datetime.replace(
-            hour=selected_hour,
-            minute=np.random.randint(0, 60),
-            second=np.random.randint(0, 60)
+            hour=int(selected_hours[i]),
+            minute=int(departure_rng.integers(0, 60)),
+            second=int(departure_rng.integers(0, 60))
         )
         
         # ═══════════════════════════════════════════════════════════════════
         # PASO 2: Asignar Foreign Keys
         # ═══════════════════════════════════════════════════════════════════
         
-        vehicle_id = np.random.randint(1, NUM_VEHICLES + 1)
-        driver_id = np.random.randint(1, NUM_DRIVERS + 1)
-        route_id = np.random.randint(1, len(routes_df) + 1)
+        vehicle_id = int(vehicle_ids[i])
+        driver_id = int(driver_ids[i])
+        route_id = int(route_ids[i])
         
         # ═══════════════════════════════════════════════════════════════════
         # PASO 3: Recuperar datos de la ruta seleccionada
         # ═══════════════════════════════════════════════════════════════════
         
-        route = routes_df.iloc[route_id - 1]
-        distance_km = route['distance_km']
-        estimated_duration_hours = route['estimated_duration_hours']
+        distance_km = route_table.distance_km[route_id]
+        estimated_duration_hours = route_table.estimated_duration_hours[route_id]
         
         # ═══════════════════════════════════════════════════════════════════
         # PASO 4: Calcular hora de llegada con consistencia temporal
         # ═══════════════════════════════════════════════════════════════════
         
         # Duración real varía ±20% de la estimada (tráfico, clima, etc.)
-        actual_duration_hours = estimated_duration_hours * np.random.uniform(0.8, 1.2)
+        actual_duration_hours = estimated_duration_hours * duration_rng.uniform(0.8, 1.2)
         duration_timedelta = timedelta(hours=actual_duration_hours)
         
         # arrival = departure + duración (SIEMPRE mayor que departure)
@@ -887,7 +1410,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
         km_per_liter = VEHICLE_TYPES[vehicle_type]['km_per_liter']
         
         # Consumo base con variación ±10%
-        fuel_consumed = (distance_km / km_per_liter) * np.random.uniform(0.9, 1.1)
+        fuel_consumed = (distance_km / km_per_liter) * fuel_rng.uniform(0.9, 1.1)
         fuel_consumed = round(fuel_consumed, 2)
         
         # ═══════════════════════════════════════════════════════════════════
@@ -895,7 +1418,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
         # ═══════════════════════════════════════════════════════════════════
         
         capacity_kg = vehicle_info['capacity_kg']
-        load_factor = np.random.uniform(0.5, 0.95)
+        load_factor = weight_rng.uniform(0.5, 0.95)
         total_weight_kg = round(capacity_kg * load_factor, 2)
         
         # ═══════════════════════════════════════════════════════════════════
@@ -903,10 +1426,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
         # ═══════════════════════════════════════════════════════════════════
         
         # 95% completed, 3% in_progress, 2% cancelled
-        status = np.random.choice(
-            ['completed', 'in_progress', 'cancelled'],
-            p=[0.95, 0.03, 0.02]
-        )
+        status = trip_statuses[i]
         
         # Aplicar reglas de negocio para arrival_datetime según status
         if status == 'in_progress':
@@ -914,7 +1434,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
             arrival_datetime = None
         elif status == 'cancelled':
             # 50% de cancelados no llegaron, 50% sí (cancelados después)
-            if np.random.random() < 0.5:
+            if arrival_rng.random() < 0.5:
                 arrival_datetime = None
         
         # Agregar viaje a la lista
@@ -937,6 +1457,10 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
     print(f"   • Completados: {len(df[df['status']=='completed']):,} ({len(df[df['status']=='completed'])/len(df)*100:.1f}%)")
     print(f"   • En progreso: {len(df[df['status']=='in_progress']):,} ({len(df[df['status']=='in_progress'])/len(df)*100:.1f}%)")
     print(f"   • Cancelados: {len(df[df['status']=='cancelled']):,} ({len(df[df['status']=='cancelled'])/len(df)*100:.1f}%)")
+    if not WORKLOAD.is_uniform:
+        print(f"   Perfil de carga {WORKLOAD.spec} ({WORKLOAD.describe()}):")
+        for column in ('vehicle_id', 'driver_id', 'route_id'):
+            print(f"   • 10% de {column} más activos: {top_share(df[column]) * 100:.1f}% de los viajes")
     
     return df
 
@@ -945,7 +1469,7 @@ def generate_trips(vehicles_df, drivers_df, routes_df):
 # SECCIÓN 7: GENERACIÓN DE TABLA TRANSACCIONAL DELIVERIES
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def generate_deliveries(trips_df):
+def generate_deliveries(trips_df, routes_df):
     """
     Genera exactamente 400,000 entregas (2-6 entregas por viaje, 4 más probable)
     
@@ -958,6 +1482,7 @@ def generate_deliveries(trips_df):
     
     Características:
     - Tracking number único (formato: DOM{trip_id:06d}{seq:02d}{random:04d})
+    - Dirección dominicana en la ciudad de destino de la ruta del viaje
     - Pesos distribuidos proporcionalmente del peso total del viaje
     - Horarios escalonados durante la duración del viaje
     - Estados: delivered (85%), pending (10%), failed (5%)
@@ -965,6 +1490,7 @@ def generate_deliveries(trips_df):
     
     Args:
         trips_df (pd.DataFrame): DataFrame con viajes generados
+        routes_df (pd.DataFrame): DataFrame con rutas (ciudad de destino)
     
     Returns:
         pd.DataFrame: DataFrame con exactamente 400,000 entregas
@@ -975,21 +1501,15 @@ def generate_deliveries(trips_df):
     
     deliveries_data = []
     
-    # Distribución de número de entregas por viaje
-    # Promedio esperado: 2*0.10 + 3*0.20 + 4*0.40 + 5*0.20 + 6*0.10 = 4.0
-    deliveries_per_trip_options = [2, 3, 4, 5, 6]
-    deliveries_per_trip_probs = [0.10, 0.20, 0.40, 0.20, 0.10]
-    
     # Pre-calcular cuántas entregas tendrá cada viaje para llegar a exactamente 400,000
     num_trips = len(trips_df)
     target_deliveries = NUM_DELIVERIES
     
     # Generar distribución inicial
-    deliveries_per_trip = np.random.choice(
-        deliveries_per_trip_options, 
-        size=num_trips, 
-        p=deliveries_per_trip_probs
-    )
+    # Promedio esperado: 2*0.10 + 3*0.20 + 4*0.40 + 5*0.20 + 6*0.10 = 4.0
+    streams = transaction_streams('deliveries')
+    count_rng = streams.column('deliveries_per_trip')
+    deliveries_per_trip = DELIVERIES_PER_TRIP_SAMPLER.sample(num_trips, random_state=count_rng)
     
     # Ajustar para llegar exactamente a 400,000
     current_total = deliveries_per_trip.sum()
@@ -998,42 +1518,62 @@ def generate_deliveries(trips_df):
     if diff > 0:
         # Necesitamos agregar entregas - incrementar algunos viajes que tienen < 6
         indices = np.where(deliveries_per_trip < 6)[0]
-        np.random.shuffle(indices)
+        count_rng.shuffle(indices)
         for i in indices[:abs(diff)]:
             deliveries_per_trip[i] += 1
     elif diff < 0:
         # Necesitamos quitar entregas - decrementar algunos viajes que tienen > 2
         indices = np.where(deliveries_per_trip > 2)[0]
-        np.random.shuffle(indices)
+        count_rng.shuffle(indices)
         for i in indices[:abs(diff)]:
             deliveries_per_trip[i] -= 1
     
+    # Estados de entrega condicionados al estado del viaje y firmas, en lote
+    parent_statuses = np.repeat(trips_df['status'].to_numpy(), deliveries_per_trip)
+    delivery_statuses = DELIVERY_STATUS_SAMPLER.sample(parent_statuses, random_state=streams.column('delivery_status'))
+    signatures = SIGNATURE_SAMPLER.sample(len(parent_statuses), random_state=streams.column('recipient_signature'))
+    position = 0
+    
+    # Un flujo aleatorio independiente por columna (ver fleetlogix_streams)
+    weight_rng = streams.column('package_weight_kg')
+    scheduled_rng = streams.column('scheduled_datetime')
+    tracking_rng = streams.column('tracking_number')
+    customer_fake = streams.faker('customer_name')
+    delivered_rng = streams.column('delivered_datetime')
+    
+    # Direcciones en la ciudad de destino de cada viaje, compuestas en lote
+    route_table = RouteTable(routes_df)
+    trip_cities = ADDRESS_BOOK.city_index(route_table.destination_city[trips_df['route_id'].to_numpy()])
+    delivery_addresses = ADDRESS_BOOK.compose(
+        np.repeat(trip_cities, deliveries_per_trip), random_state=streams.column('delivery_address')
+    )
+    
     for idx, trip in trips_df.iterrows():
-        trip_id = idx + 1
+        trip_id = TRIP_ID_OFFSET + idx + 1
         
         # Número de entregas pre-calculado para este viaje
         num_deliveries = deliveries_per_trip[idx]
         
         # Dividir peso total entre entregas (con variación)
-        weights = np.random.dirichlet(np.ones(num_deliveries)) * trip['total_weight_kg']
+        weights = weight_rng.dirichlet(np.ones(num_deliveries)) * trip['total_weight_kg']
         
         # Calcular intervalos de tiempo si el viaje tiene arrival
         if pd.notna(trip['arrival_datetime']):
             total_duration = (trip['arrival_datetime'] - trip['departure_datetime']).total_seconds()
-            time_intervals = np.sort(np.random.uniform(0, total_duration, num_deliveries))
+            time_intervals = np.sort(scheduled_rng.uniform(0, total_duration, num_deliveries))
         else:
             time_intervals = None
         
         # Generar cada entrega
         for seq in range(num_deliveries):
             # Tracking number único: DOM + trip_id (6 dígitos) + secuencia (2 dígitos) + random (4 dígitos)
-            tracking_number = f"DOM{trip_id:06d}{seq+1:02d}{np.random.randint(1000, 9999)}"
+            tracking_number = f"DOM{trip_id:06d}{seq+1:02d}{tracking_rng.integers(1000, 9999)}"
             
             # Nombre de cliente
-            customer_name = fake.name()
+            customer_name = customer_fake.name()
             
-            # Dirección de entrega
-            delivery_address = fake.address().replace('\n', ', ')
+            # Dirección de entrega (ciudad de destino de la ruta)
+            delivery_address = delivery_addresses[position]
             
             # Peso del paquete (mínimo 0.1 kg para evitar pesos <= 0)
             package_weight = max(0.1, round(weights[seq], 2))
@@ -1043,41 +1583,26 @@ def generate_deliveries(trips_df):
                 scheduled_datetime = trip['departure_datetime'] + timedelta(seconds=time_intervals[seq])
             else:
                 # Para viajes sin arrival, programar en futuro cercano
-                scheduled_datetime = trip['departure_datetime'] + timedelta(hours=np.random.uniform(1, 8))
+                scheduled_datetime = trip['departure_datetime'] + timedelta(hours=scheduled_rng.uniform(1, 8))
             
-            # Estado de la entrega: delivered (85%), pending (10%), failed (5%)
-            # Solo viajes completados pueden tener entregas delivered
-            if trip['status'] == 'completed':
-                delivery_status = np.random.choice(
-                    ['delivered', 'pending', 'failed'],
-                    p=[0.85, 0.10, 0.05]
-                )
-            elif trip['status'] == 'in_progress':
-                # Viajes en progreso: entregas pendientes o algunas entregadas
-                delivery_status = np.random.choice(
-                    ['delivered', 'pending'],
-                    p=[0.30, 0.70]
-                )
-            else:  # cancelled
-                # Viajes cancelados: pendientes o fallidas
-                delivery_status = np.random.choice(
-                    ['pending', 'failed'],
-                    p=[0.60, 0.40]
-                )
+            # Estado de la entrega según el estado del viaje (ver DELIVERY_STATUS_SAMPLER)
+            delivery_status = delivery_statuses[position]
             
             # Fecha y hora de entrega real (solo si delivered)
             if delivery_status == 'delivered':
                 # Entrega entre 0 y +60 minutos del horario programado (nunca antes)
-                delivered_datetime = scheduled_datetime + timedelta(minutes=np.random.randint(0, 61))
+                delivered_datetime = scheduled_datetime + timedelta(minutes=int(delivered_rng.integers(0, 61)))
             else:
                 delivered_datetime = None
             
             # Firma del receptor (85% de los entregados tienen firma)
             if delivery_status == 'delivered':
-                recipient_signature = np.random.choice([True, False], p=[0.85, 0.15])
+                recipient_signature = signatures[position]
             else:
                 recipient_signature = False
             
+            position += 1
+            
             deliveries_data.append({
                 'trip_id': trip_id,
                 'tracking_number': tracking_number,
@@ -1091,8 +1616,8 @@ def generate_deliveries(trips_df):
             })
         
         # Mostrar progreso cada 10,000 viajes procesados
-        if (trip_id) % 10000 == 0:
-            print(f"   Procesados {trip_id:,}/{len(trips_df):,} viajes...")
+        if (idx + 1) % 10000 == 0:
+            print(f"   Procesados {idx + 1:,}/{len(trips_df):,} viajes...")
     
     df = pd.DataFrame(deliveries_data)
     
@@ -1110,10 +1635,87 @@ def generate_deliveries(trips_df):
 # SECCIÓN 8: GENERACIÓN DE TABLA TRANSACCIONAL MAINTENANCE
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def generate_maintenance(trips_df, vehicles_df):
+def allocate_maintenance(trips_per_vehicle, target_total, count_rng):
+    """
+    Mantenimientos por vehículo proporcionales a sus viajes, con al menos 1
+    por vehículo y ajustados al azar para sumar exactamente target_total
+    
+    Args:
+        trips_per_vehicle (dict): {vehicle_id: viajes} (vehículos sin viajes pueden faltar)
+        target_total (int): Total de mantenimientos (NUM_MAINTENANCE)
+        count_rng (np.random.Generator): Flujo del ajuste
+    
+    Returns:
+        dict: {vehicle_id: mantenimientos} para 1..NUM_VEHICLES
+    """
+    # Base: NUM_MAINTENANCE / NUM_VEHICLES = 5000 / 200 = 25 por vehículo en promedio
+    total_trips = sum(trips_per_vehicle.values())
+    maintenance_counts = {}
+    
+    for vehicle_id in range(1, NUM_VEHICLES + 1):
+        num_trips = trips_per_vehicle.get(vehicle_id, 0)
+        # Proporción de viajes de este vehículo
+        proportion = num_trips / total_trips if total_trips > 0 else 1/NUM_VEHICLES
+        maintenance_counts[vehicle_id] = max(1, int(target_total * proportion))
+    
+    # Ajustar para llegar exactamente al total
+    diff = target_total - sum(maintenance_counts.values())
+    
+    vehicle_ids = list(range(1, NUM_VEHICLES + 1))
+    if diff > 0:
+        # Agregar mantenimientos a vehículos aleatorios
+        selected = count_rng.choice(vehicle_ids, size=abs(diff), replace=True)
+        for vid in selected:
+            maintenance_counts[vid] += 1
+    elif diff < 0:
+        # Quitar mantenimientos de vehículos con más de 1
+        candidates = [v for v in vehicle_ids if maintenance_counts[v] > 1]
+        selected = count_rng.choice(candidates, size=min(abs(diff), len(candidates)), replace=False)
+        for vid in selected:
+            maintenance_counts[vid] -= 1
+    
+    return maintenance_counts
+
+
+def full_trips_per_vehicle():
+    """
+    Viajes por vehículo de la generación completa, desde cualquier shard
+    
+    Repite solo el muestreo de vehicle_id de cada shard (mismo flujo y
+    tamaño que generate_trips en ese shard), sin generar sus viajes.
+    
+    Returns:
+        dict: {vehicle_id: viajes}
+    """
+    counts = np.zeros(NUM_VEHICLES + 1, dtype=np.int64)
+    for shard in range(SHARD_COUNT):
+        start, stop = shard_range(FULL_COUNTS['trips'], shard, SHARD_COUNT)
+        rng = STREAMS.for_shard(shard).table('trips').column('vehicle_id')
+        counts += np.bincount(workload_keys('vehicle_id', NUM_VEHICLES, stop - start, rng),
+                              minlength=NUM_VEHICLES + 1)
+    return {vehicle_id: int(count) for vehicle_id, count in enumerate(counts) if vehicle_id and count}
+
+
+def shard_maintenance_counts(full_counts, offset, size):
+    """
+    Tramo [offset, offset + size) del reparto completo, en orden de vehicle_id
+    
+    Returns:
+        dict: {vehicle_id: mantenimientos del shard} (0 si el tramo no lo incluye)
+    """
+    counts = np.array([full_counts[vehicle_id] for vehicle_id in range(1, NUM_VEHICLES + 1)])
+    ends = np.cumsum(counts)
+    taken = np.minimum(ends, offset + size) - np.maximum(ends - counts, offset)
+    return {vehicle_id: int(max(0, n)) for vehicle_id, n in enumerate(taken, start=1)}
+
+
+def generate_maintenance(trips_df, vehicles_df, routes_df=None):
     """
     Genera exactamente 5,000 registros de mantenimiento (~1 por cada 20 viajes por vehículo)
     
+    Con MAINTENANCE_MODEL = 'odometer' delega en generate_maintenance_by_odometer()
+    (requiere routes_df).
+    
     Tipos de mantenimiento con probabilidades:
     - Cambio de aceite: 30% ($50-$150)
     - Revisión de frenos: 15% ($100-$300)
@@ -1132,97 +1734,86 @@ def generate_maintenance(trips_df, vehicles_df):
     Args:
         trips_df (pd.DataFrame): DataFrame con viajes generados
         vehicles_df (pd.DataFrame): DataFrame con vehículos generados
+        routes_df (pd.DataFrame): DataFrame con rutas (solo modelo 'odometer')
     
     Returns:
         pd.DataFrame: DataFrame con exactamente 5,000 mantenimientos
     """
+    if MAINTENANCE_MODEL == 'odometer':
+        return generate_maintenance_by_odometer(trips_df, vehicles_df, routes_df)
+    
     print("\n🔧 Generando registros de mantenimiento...")
     print(f"   Objetivo: {NUM_MAINTENANCE:,} registros exactos")
     print("   Frecuencia: ~1 mantenimiento por cada 20 viajes por vehículo")
     
     maintenance_data = []
     
-    # Contar viajes por vehículo
-    trips_per_vehicle = trips_df.groupby('vehicle_id').size().to_dict()
-    
-    # Obtener fechas de viajes por vehículo
-    vehicle_trip_dates = trips_df.groupby('vehicle_id')['departure_datetime'].apply(list).to_dict()
-    
-    # Preparar tipos y probabilidades de mantenimiento
-    maintenance_types = list(MAINTENANCE_TYPES.keys())
-    maintenance_probs = [MAINTENANCE_TYPES[mt]['probability'] for mt in maintenance_types]
-    
-    # Calcular distribución de mantenimientos para cada vehículo para llegar a exactamente 5,000
-    # Base: NUM_MAINTENANCE / NUM_VEHICLES = 5000 / 200 = 25 por vehículo en promedio
-    target_total = NUM_MAINTENANCE
-    base_per_vehicle = target_total // NUM_VEHICLES  # 25
-    extra_count = target_total % NUM_VEHICLES  # 0 en este caso
-    
-    # Asignar mantenimientos por vehículo (proporcional a sus viajes)
-    total_trips = sum(trips_per_vehicle.values())
-    maintenance_counts = {}
-    
-    for vehicle_id in range(1, NUM_VEHICLES + 1):
-        num_trips = trips_per_vehicle.get(vehicle_id, 0)
-        # Proporción de viajes de este vehículo
-        proportion = num_trips / total_trips if total_trips > 0 else 1/NUM_VEHICLES
-        maintenance_counts[vehicle_id] = max(1, int(target_total * proportion))
+    # Viajes, primera y última salida por vehículo desde el índice de intervalos
+    vehicle_span = IntervalIndex.from_trips(trips_df, by='vehicle_id').span()
+    trips_per_vehicle = vehicle_span['trips'].to_dict()
+    
+    # Distribución de mantenimientos por vehículo para llegar a exactamente 5,000.
+    # En modo shard el reparto se hace una sola vez sobre la generación
+    # completa (el mínimo de 1 por vehículo aplicado en cada shard inflaría
+    # el total) y el shard toma su tramo
+    streams = transaction_streams('maintenance')
+    if SHARD_COUNT > 1:
+        full_counts = allocate_maintenance(full_trips_per_vehicle(), FULL_COUNTS['maintenance'],
+                                           STREAMS.table('maintenance').column('maintenance_count'))
+        maintenance_counts = shard_maintenance_counts(full_counts, MAINTENANCE_OFFSET, NUM_MAINTENANCE)
+    else:
+        maintenance_counts = allocate_maintenance(trips_per_vehicle, NUM_MAINTENANCE,
+                                                  streams.column('maintenance_count'))
     
-    # Ajustar para llegar exactamente a 5,000
-    current_total = sum(maintenance_counts.values())
-    diff = target_total - current_total
+    # Tipos y proveedores muestreados en lote con tablas alias precompiladas
+    total_maintenances = sum(maintenance_counts.values())
+    sampled_types = MAINTENANCE_TYPE_SAMPLER.sample(total_maintenances, random_state=streams.column('maintenance_type'))
+    sampled_providers = MAINTENANCE_PROVIDER_SAMPLER.sample(total_maintenances, random_state=streams.column('performed_by'))
+    position = 0
     
-    vehicle_ids = list(range(1, NUM_VEHICLES + 1))
-    if diff > 0:
-        # Agregar mantenimientos a vehículos aleatorios
-        selected = np.random.choice(vehicle_ids, size=abs(diff), replace=True)
-        for vid in selected:
-            maintenance_counts[vid] += 1
-    elif diff < 0:
-        # Quitar mantenimientos de vehículos con más de 1
-        candidates = [v for v in vehicle_ids if maintenance_counts[v] > 1]
-        selected = np.random.choice(candidates, size=min(abs(diff), len(candidates)), replace=False)
-        for vid in selected:
-            maintenance_counts[vid] -= 1
+    # Un flujo aleatorio independiente por columna (ver fleetlogix_streams)
+    date_rng = streams.column('maintenance_date')
+    cost_rng = streams.column('cost')
+    next_rng = streams.column('next_maintenance_date')
     
     for vehicle_id in range(1, NUM_VEHICLES + 1):
         # Número de mantenimientos asignados a este vehículo
-        num_maintenances = maintenance_counts.get(vehicle_id, 1)
+        num_maintenances = maintenance_counts[vehicle_id]
         
-        # Obtener fechas de viajes de este vehículo
-        trip_dates = vehicle_trip_dates.get(vehicle_id, [])
-        if not trip_dates:
+        # Rango de salidas de este vehículo
+        if vehicle_id not in trips_per_vehicle:
             # Si no hay viajes, usar fechas del período operativo
             min_date = START_DATE.date()
             max_date = END_DATE.date()
         else:
-            min_date = min(trip_dates).date()
-            max_date = max(trip_dates).date()
+            min_date = vehicle_span.at[vehicle_id, 'first_departure'].date()
+            max_date = vehicle_span.at[vehicle_id, 'last_departure'].date()
         
         # Generar mantenimientos
         for _ in range(num_maintenances):
             # Fecha de mantenimiento entre los viajes del vehículo
             days_range = (max_date - min_date).days
             if days_range > 0:
-                maintenance_date = min_date + timedelta(days=np.random.randint(0, days_range))
+                maintenance_date = min_date + timedelta(days=int(date_rng.integers(0, days_range)))
             else:
                 maintenance_date = min_date
             
-            # Seleccionar tipo de mantenimiento según probabilidades
-            maintenance_type = np.random.choice(maintenance_types, p=maintenance_probs)
+            # Tipo de mantenimiento según probabilidades
+            maintenance_type = sampled_types[position]
             
             # Costo según el rango del tipo de mantenimiento
             cost_min, cost_max = MAINTENANCE_TYPES[maintenance_type]['cost_range']
-            cost = round(np.random.uniform(cost_min, cost_max), 2)
+            cost = round(cost_rng.uniform(cost_min, cost_max), 2)
             
             # Descripción genérica
             description = f"{maintenance_type} programado para vehículo #{vehicle_id}"
             
             # Próximo mantenimiento: 75-105 días después
-            next_maintenance_date = maintenance_date + timedelta(days=np.random.randint(75, 105))
+            next_maintenance_date = maintenance_date + timedelta(days=int(next_rng.integers(75, 105)))
             
             # Proveedor de mantenimiento
-            performed_by = np.random.choice(MAINTENANCE_PROVIDERS)
+            performed_by = sampled_providers[position]
+            position += 1
             
             maintenance_data.append({
                 'vehicle_id': vehicle_id,
@@ -1246,14 +1837,216 @@ def generate_maintenance(trips_df, vehicles_df):
     return df
 
 
-# ═══════════════════════════════════════════════════════════════════════════════
-# SECCIÓN 9: VALIDACIÓN EXHAUSTIVA DE DATOS
-# ═══════════════════════════════════════════════════════════════════════════════
+def generate_maintenance_by_odometer(trips_df, vehicles_df, routes_df):
+    """
+    Genera mantenimientos a partir del kilometraje acumulado de cada vehículo
+    
+    Lógica:
+    - Odómetro inicial según la antigüedad del vehículo al inicio del período
+      (INITIAL_ANNUAL_KM_RANGE km por año desde acquisition_date)
+    - Odómetro después de cada viaje terminado: suma acumulada de
+      routes.distance_km en orden de salida (ver fleetlogix_odometer)
+    - Un servicio de cada tipo al cruzar su km_interval, o su day_interval
+      si pasa ese tiempo sin llegar a los km (lo que ocurra primero)
+    - Fecha = salida del viaje que cruzó el umbral (o la fecha vencida)
+    - Próximo mantenimiento proyectado con el ritmo de km diarios del
+      vehículo, sin pasar de day_interval
+    
+    El número de registros resulta del kilometraje (no es NUM_MAINTENANCE):
+    ~27 por vehículo en 2 años a la escala estándar.
+    
+    Args:
+        trips_df (pd.DataFrame): DataFrame con viajes generados
+        vehicles_df (pd.DataFrame): DataFrame con vehículos generados
+        routes_df (pd.DataFrame): DataFrame con rutas (distance_km)
+    
+    Returns:
+        pd.DataFrame: Mantenimientos con odometer_km
+    """
+    if routes_df is None:
+        raise ValueError("El modelo 'odometer' requiere routes_df para las distancias")
+    
+    print("\n🔧 Generando registros de mantenimiento por odómetro...")
+    print("   Umbrales: " + ", ".join(f"{name} {specs['km_interval']:,} km / {specs['day_interval']} días"
+                                      for name, specs in MAINTENANCE_TYPES.items()))
+    
+    streams = transaction_streams('maintenance')
+    
+    # Odómetro inicial: años desde la adquisición hasta el inicio del período
+    vehicle_ids = np.arange(1, len(vehicles_df) + 1)
+    acquired = pd.to_datetime(vehicles_df['acquisition_date']).to_numpy(dtype='datetime64[s]')
+    years_before = np.clip((np.datetime64(START_DATE, 's') - acquired).astype(np.int64) / (365.25 * 86400), 0, None)
+    annual_km = streams.column('initial_odometer').uniform(*INITIAL_ANNUAL_KM_RANGE, len(vehicle_ids))
+    initial_km = pd.Series(np.round(years_before * annual_km, 1), index=vehicle_ids)
+    
+    # Solo los viajes terminados suman km (los in_progress aún no llegan)
+    finished = pd.to_datetime(trips_df['arrival_datetime']).notna().to_numpy()
+    route_table = RouteTable(routes_df)
+    departures = np.asarray(pd.to_datetime(trips_df['departure_datetime']), dtype='datetime64[s]').astype(np.int64)
+    log = OdometerLog(
+        trips_df['vehicle_id'].to_numpy()[finished],
+        departures[finished],
+        route_table.distance_km[trips_df['route_id'].to_numpy()[finished]],
+        initial_km
+    )
+    
+    intervals = {name: (specs['km_interval'], specs['day_interval']) for name, specs in MAINTENANCE_TYPES.items()}
+    events = schedule_maintenance(log, intervals, random_state=streams.column('interval_phase'))
+    n = len(events)
+    
+    maintenance_types = events['maintenance_type'].to_numpy()
+    cost_min = np.array([MAINTENANCE_TYPES[t]['cost_range'][0] for t in maintenance_types], dtype=np.float64)
+    cost_max = np.array([MAINTENANCE_TYPES[t]['cost_range'][1] for t in maintenance_types], dtype=np.float64)
+    cost = np.round(streams.column('cost').uniform(cost_min, cost_max), 2)
+    
+    # Próximo servicio: días hasta recorrer km_interval al ritmo del vehículo, máximo day_interval
+    history_days = np.maximum(1.0, (log.times[log.offsets[1:] - 1] - log.times[log.offsets[:-1]]) / 86400)
+    daily_km = pd.Series(log.total_km().to_numpy() / history_days, index=log.key_values)
+    km_interval = np.array([MAINTENANCE_TYPES[t]['km_interval'] for t in maintenance_types], dtype=np.float64)
+    day_interval = np.array([MAINTENANCE_TYPES[t]['day_interval'] for t in maintenance_types], dtype=np.float64)
+    vehicle_daily_km = daily_km.reindex(events['vehicle_id']).to_numpy()
+    days_to_next = np.minimum(day_interval, np.ceil(km_interval / np.maximum(vehicle_daily_km, 1e-9)))
+    days_to_next = np.maximum(1, days_to_next).astype(np.int64)
+    
+    maintenance_date = events['service_seconds'].to_numpy().astype('datetime64[s]').astype('datetime64[D]')
+    odometer_km = np.round(events['odometer_km'].to_numpy(), 1)
+    by_km = events['trigger'].to_numpy() == TRIGGER_KM
+    reasons = np.where(by_km, ' por kilometraje', ' por tiempo')
+    
+    df = pd.DataFrame({
+        'vehicle_id': events['vehicle_id'].to_numpy(),
+        'maintenance_date': pd.to_datetime(maintenance_date).date,
+        'maintenance_type': maintenance_types,
+        'description': (maintenance_types.astype(object) + reasons.astype(object) + ' a los '
+                        + pd.Series(odometer_km).map('{:,.0f} km'.format).to_numpy(dtype=object)
+                        + ' para vehículo #' + events['vehicle_id'].astype(str).to_numpy(dtype=object)),
+        'cost': cost,
+        'next_maintenance_date': pd.to_datetime(maintenance_date + days_to_next.astype('timedelta64[D]')).date,
+        'performed_by': MAINTENANCE_PROVIDER_SAMPLER.sample(n, random_state=streams.column('performed_by')),
+        'odometer_km': odometer_km,
+    })
+    
+    print(f"   ✓ {len(df):,} registros de mantenimiento generados")
+    print(f"   Promedio: {len(df)/max(len(vehicles_df), 1):.1f} mantenimientos por vehículo, "
+          f"{by_km.mean()*100 if n else 0:.1f}% disparados por kilometraje")
+    print(f"   Kilometraje del período: {log.total_km().mean():,.0f} km promedio por vehículo")
+    
+    return df
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 8.1: GENERACIÓN PARALELA DE TABLAS INDEPENDIENTES
+# ═══════════════════════════════════════════════════════════════════════════════
+# Como cada tabla tiene su propio flujo aleatorio (STREAMS), las tablas sin
+# dependencias entre sí se pueden generar en procesos separados con el mismo
+# resultado que la generación secuencial:
+#   - vehicles, drivers, routes       (maestras, sin dependencias)
+#   - deliveries, maintenance          (dependen solo de trips y las maestras)
+
+GENERATORS = {
+    'vehicles': generate_vehicles,
+    'drivers': generate_drivers,
+    'routes': generate_routes,
+    'trips': generate_trips,
+    'deliveries': generate_deliveries,
+    'maintenance': generate_maintenance
+}
+
+
+def _init_generation_worker(scale_factor, seed, shard_index=0, shard_count=1, maintenance_model='proportional',
+                            workload='uniform'):
+    """
+    Replica en el proceso worker la escala, el shard, el modelo de mantenimiento,
+    el perfil de carga y la semilla del proceso principal
+    """
+    set_scale(scale_factor)
+    set_maintenance_model(maintenance_model)
+    set_workload(workload)
+    if shard_count > 1:
+        set_shard(shard_index, shard_count)
+    reset_random_state(seed)
+
+
+def _run_generation_task(table_name, args, store_dir=None, profile=None):
+    """
+    Ejecuta un generador en el worker capturando su salida por consola
+    
+    Con store_dir, la tabla se escribe en el almacén columnar y no se
+    devuelve (el proceso principal la abre mapeada en memoria, sin pickle).
+    Con profile (StageProfiler.settings), el generador se perfila en el
+    worker como la etapa generate_<tabla>.
+    
+    Returns:
+        tuple: (tabla, DataFrame o None, salida por consola, (etapas, pilas) perfiladas)
+    """
+    # Las entradas que llegan como StoredTable se leen del almacén en este proceso
+    args = [arg.to_frame() if isinstance(arg, StoredTable) else arg for arg in args]
+    profiler = StageProfiler(**profile) if profile else StageProfiler(enabled=False)
+    
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        with profiler.stage(f'generate_{table_name}'):
+            df = GENERATORS[table_name](*args)
+    
+    if store_dir:
+        ColumnStore(store_dir).write_table(table_name, df)
+        df = None
+    return table_name, df, output.getvalue(), profiler.collected()
+
+
+def generate_tables_parallel(tasks, workers, store=None, profiler=None):
+    """
+    Genera varias tablas independientes en procesos separados
+    
+    La salida de cada generador se imprime completa y en el orden de
+    `tasks` al terminar, para que no se intercale entre procesos.
+    
+    Args:
+        tasks (list): [(tabla, argumentos del generador)]
+        workers (int): Procesos en paralelo
+        store (ColumnStore): Almacén columnar opcional; si se indica, los
+                             workers escriben ahí y se retornan StoredTable
+        profiler (StageProfiler): Perfilador de main(); cada tabla se perfila
+                                  en su worker como generate_<tabla>
+    
+    Returns:
+        dict: {tabla: pd.DataFrame o StoredTable}
+    """
+    outputs = {}
+    frames = {}
+    
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        initializer=_init_generation_worker,
+        initargs=(SCALE_FACTOR, STREAMS.seed, SHARD_INDEX, SHARD_COUNT, MAINTENANCE_MODEL, WORKLOAD.spec)
+    ) as executor:
+        store_dir = store.directory if store is not None else None
+        profile = profiler.settings if profiler is not None and profiler.enabled else None
+        futures = [executor.submit(_run_generation_task, name, args, store_dir, profile) for name, args in tasks]
+        for future in as_completed(futures):
+            table_name, df, output, (stages, folded) = future.result()
+            frames[table_name] = store.table(table_name) if store is not None else df
+            outputs[table_name] = output
+            if profile:
+                profiler.merge(stages, folded)
+    
+    for table_name, _ in tasks:
+        print(outputs[table_name], end='')
+    
+    return frames
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 9: VALIDACIÓN EXHAUSTIVA DE DATOS
+# ═══════════════════════════════════════════════════════════════════════════════
 
-def validate_data():
+def validate_data(schema=None):
     """
     Realiza validación exhaustiva de consistencia y lógica de los datos cargados
     
+    Args:
+        schema (str): Schema a validar (default: el vivo; ej: staging en --staging)
+    
     Validaciones realizadas:
     1. Conteos de registros por tabla
     2. Integridad referencial (todos los FKs válidos)
@@ -1264,11 +2057,11 @@ def validate_data():
     7. Fechas válidas (no futuras, licencias no expiradas)
     """
     print("\n" + "═" * 80)
-    print("VALIDACIÓN EXHAUSTIVA DE DATOS")
+    print("VALIDACIÓN EXHAUSTIVA DE DATOS" + (f" (schema {schema})" if schema else ""))
     print("═" * 80)
     
     try:
-        conn = get_connection()
+        conn = get_connection(schema)
         cursor = conn.cursor()
         
         validation_passed = True
@@ -1554,109 +2347,1716 @@ def validate_data():
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# SECCIÓN 10: FUNCIÓN PRINCIPAL
+# SECCIÓN 9.1: VALIDACIÓN POR MUESTREO (DATASETS MUY GRANDES)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def main():
+# Tablas con menos filas estimadas que este umbral se validan completas
+SAMPLING_MIN_ROWS = 100000
+
+# Ventanas de IDs consecutivos usadas por el muestreo por rangos de clave
+KEYRANGE_WINDOWS = 20
+
+# Clave primaria de cada tabla (para muestreo por rangos y exclusión de la propia fila)
+TABLE_PRIMARY_KEYS = {
+    'vehicles': 'vehicle_id',
+    'drivers': 'driver_id',
+    'routes': 'route_id',
+    'trips': 'trip_id',
+    'deliveries': 'delivery_id',
+    'maintenance': 'maintenance_id'
+}
+
+# Chequeos por muestreo: (nombre, tabla muestreada, condición de violación sobre la fila s)
+SAMPLED_CHECKS = [
+    ('trips → vehicles', 'trips',
+     "NOT EXISTS (SELECT 1 FROM vehicles v WHERE v.vehicle_id = s.vehicle_id)"),
+    ('trips → drivers', 'trips',
+     "NOT EXISTS (SELECT 1 FROM drivers d WHERE d.driver_id = s.driver_id)"),
+    ('trips → routes', 'trips',
+     "NOT EXISTS (SELECT 1 FROM routes r WHERE r.route_id = s.route_id)"),
+    ('deliveries → trips', 'deliveries',
+     "NOT EXISTS (SELECT 1 FROM trips t WHERE t.trip_id = s.trip_id)"),
+    ('maintenance → vehicles', 'maintenance',
+     "NOT EXISTS (SELECT 1 FROM vehicles v WHERE v.vehicle_id = s.vehicle_id)"),
+    ('arrival > departure', 'trips',
+     "s.arrival_datetime IS NOT NULL AND s.arrival_datetime <= s.departure_datetime"),
+    ('viajes sin fechas futuras', 'trips',
+     "s.departure_datetime > CURRENT_TIMESTAMP"),
+    ('delivered >= scheduled', 'deliveries',
+     "s.delivered_datetime IS NOT NULL AND s.delivered_datetime < s.scheduled_datetime"),
+    ('license_plate única', 'vehicles',
+     "EXISTS (SELECT 1 FROM vehicles v2 WHERE v2.license_plate = s.license_plate "
+     "AND v2.vehicle_id <> s.vehicle_id)"),
+    ('employee_code único', 'drivers',
+     "EXISTS (SELECT 1 FROM drivers d2 WHERE d2.employee_code = s.employee_code "
+     "AND d2.driver_id <> s.driver_id)"),
+    ('tracking_number único', 'deliveries',
+     "EXISTS (SELECT 1 FROM deliveries d2 WHERE d2.tracking_number = s.tracking_number "
+     "AND d2.delivery_id <> s.delivery_id)"),
+    ('suma entregas ≤ peso viaje', 'trips',
+     "(SELECT COALESCE(SUM(d.package_weight_kg), 0) FROM deliveries d WHERE d.trip_id = s.trip_id) "
+     "> s.total_weight_kg * 1.01"),
+    ('capacidad en rango', 'vehicles',
+     "s.capacity_kg <= 0 OR s.capacity_kg > 15000"),
+    ('distancia de ruta en rango', 'routes',
+     "s.distance_km <= 0 OR s.distance_km > 500"),
+    ('combustible en rango', 'trips',
+     "s.fuel_consumed_liters <= 0 OR s.fuel_consumed_liters > 1000"),
+    ('peso de viaje en rango', 'trips',
+     "s.total_weight_kg <= 0 OR s.total_weight_kg > 15000")
+]
+
+
+def wilson_interval(violations, sample_size, confidence=0.95):
     """
-    Función principal que orquesta todo el proceso de generación y carga de datos
+    Intervalo de confianza de Wilson para una tasa de violaciones
+    
+    A diferencia del intervalo normal, es válido con 0 violaciones observadas:
+    con n filas muestreadas sin violaciones, el límite superior indica la tasa
+    máxima de violaciones compatible con la muestra.
+    
+    Args:
+        violations (int): Violaciones encontradas en la muestra
+        sample_size (int): Filas muestreadas
+        confidence (float): Nivel de confianza (default 0.95)
+    
+    Returns:
+        tuple: (límite inferior, límite superior) de la tasa de violaciones
+    """
+    if sample_size == 0:
+        return 0.0, 1.0
+    
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = violations / sample_size
+    denominator = 1 + z ** 2 / sample_size
+    center = (p + z ** 2 / (2 * sample_size)) / denominator
+    margin = z * ((p * (1 - p) / sample_size + z ** 2 / (4 * sample_size ** 2)) ** 0.5) / denominator
+    
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def sample_source(cursor, table, fraction, method, seed, estimated_rows):
+    """
+    Construye la expresión FROM que muestrea una fracción de la tabla
+    
+    Métodos:
+    - system:    TABLESAMPLE SYSTEM (por bloques, no lee el resto de la tabla)
+    - bernoulli: TABLESAMPLE BERNOULLI (por fila, más uniforme, lee toda la tabla)
+    - keyrange:  ventanas aleatorias de IDs consecutivos resueltas por el índice
+                 de la clave primaria (útil si la tabla no admite TABLESAMPLE)
+    
+    Las tablas con menos de SAMPLING_MIN_ROWS filas estimadas se leen completas.
+    
+    Returns:
+        str: Expresión SQL para usar como "FROM <expresión> s"
+    """
+    if estimated_rows < SAMPLING_MIN_ROWS or fraction >= 1:
+        return table
+    
+    if method in ('system', 'bernoulli'):
+        return f"{table} TABLESAMPLE {method.upper()} ({fraction * 100:.6f}) REPEATABLE ({seed})"
+    
+    pk = TABLE_PRIMARY_KEYS[table]
+    cursor.execute(f"SELECT MIN({pk}), MAX({pk}) FROM {table}")
+    min_id, max_id = cursor.fetchone()
+    if min_id is None:
+        return table
+    
+    span = max_id - min_id + 1
+    width = max(1, int(span * fraction / KEYRANGE_WINDOWS))
+    rng = np.random.RandomState(seed)
+    starts = np.sort(rng.randint(min_id, max(min_id + 1, max_id - width + 2), size=KEYRANGE_WINDOWS))
+    
+    windows = ' OR '.join(f"{pk} BETWEEN {int(a)} AND {int(a) + width - 1}" for a in starts)
+    return f"(SELECT * FROM {table} WHERE {windows})"
+
+
+def validate_data_sampled(fraction=0.01, method='system', confidence=0.95, seed=RANDOM_SEED,
+                          schema=None):
+    """
+    Validación rápida por muestreo para datasets de cientos de millones de filas
+    
+    Ejecuta los chequeos de integridad referencial, consistencia temporal,
+    unicidad, coherencia de pesos y rangos sobre una fracción de cada tabla,
+    y estima la tasa de violaciones con un intervalo de confianza de Wilson.
+    
+    Cualquier violación encontrada en la muestra es una violación real, por lo
+    que el chequeo falla; sin violaciones, el límite superior acota la tasa
+    que podría haber pasado desapercibida. validate_data() sigue disponible
+    para la validación exhaustiva.
+    
+    Los chequeos de FK y unicidad resuelven cada fila muestreada por índice
+    (PK o UNIQUE); el de pesos usa idx_deliveries_trip_id si existe (--optimize).
+    
+    Args:
+        fraction (float): Fracción de filas a muestrear (0.01 = 1%)
+        method (str): 'system', 'bernoulli' o 'keyrange'
+        confidence (float): Nivel de confianza del intervalo (default 0.95)
+        seed (int): Semilla para muestras repetibles
+        schema (str): Schema a validar (default: public)
+    
+    Returns:
+        bool: True si no se encontraron violaciones en la muestra
     """
     print("\n" + "═" * 80)
-    print("  FLEETLOGIX - GENERADOR DE DATOS SINTÉTICOS")
-    print("  Sistema de Gestión de Transporte y Logística")
+    print(f"VALIDACIÓN POR MUESTREO ({fraction * 100:g}% · {method} · confianza {confidence * 100:g}%)"
+          + (f" (schema {schema})" if schema else ""))
     print("═" * 80)
-    print(f"\n  📊 Configuración:")
-    print(f"     • Vehículos: {NUM_VEHICLES:,}")
-    print(f"     • Conductores: {NUM_DRIVERS:,}")
-    print(f"     • Rutas: {NUM_ROUTES:,}")
-    print(f"     • Viajes: {NUM_TRIPS:,}")
-    print(f"     • Entregas: ~400,000")
-    print(f"     • Mantenimientos: ~5,000")
-    print(f"     • Total aproximado: ~505,650 registros")
-    print(f"\n  🎲 Semilla aleatoria: {RANDOM_SEED} (reproducible)")
-    print(f"  📅 Período operativo: 2024-2025 (2 años)")
-    print("\n" + "═" * 80)
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 1: Verificaciones Previas
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n🔍 PASO 1: Verificando requisitos previos...")
+    try:
+        conn = get_connection(schema)
+        cursor = conn.cursor()
+        
+        # Conteos estimados desde el catálogo (sin COUNT(*) completo)
+        cursor.execute("""
+            SELECT c.relname, GREATEST(c.reltuples, 0)::bigint
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = ANY(%s)
+        """, (schema or 'public', ALL_TABLES))
+        estimated_rows = dict(cursor.fetchall())
+        
+        print("\n[1] Conteos estimados (pg_class.reltuples)...")
+        for table in ALL_TABLES:
+            print(f"    ✓ {table}: ~{estimated_rows.get(table, 0):,} registros")
+        
+        print("\n[2] Chequeos sobre la muestra...")
+        sources = {}
+        results = []
+        validation_passed = True
+        
+        for name, table, violation in SAMPLED_CHECKS:
+            if table not in sources:
+                sources[table] = sample_source(
+                    cursor, table, fraction, method, seed, estimated_rows.get(table, 0)
+                )
+            
+            cursor.execute(f"""
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE {violation})
+                FROM {sources[table]} s
+            """)
+            sampled, violations = cursor.fetchone()
+            low, high = wilson_interval(violations, sampled, confidence)
+            
+            passed = violations == 0
+            validation_passed = validation_passed and passed
+            results.append([
+                name, f"{sampled:,}", f"{violations:,}",
+                f"{(violations / sampled if sampled else 0) * 100:.4f}%",
+                f"[{low * 100:.4f}%, {high * 100:.4f}%]",
+                "✓" if passed else "❌"
+            ])
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR durante la validación por muestreo: {e}")
+        return False
     
-    if not verify_tables():
-        print("\n❌ ERROR: Las tablas no existen. Ejecute fleetlogix_db_schema.sql primero.")
-        sys.exit(1)
+    print(tabulate(
+        results,
+        headers=["Chequeo", "Muestra", "Violaciones", "Tasa", f"IC {confidence * 100:g}%", ""],
+        tablefmt="simple"
+    ))
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 2: Limpieza de Tablas
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n🔧 PASO 2: Preparando base de datos...")
-    truncate_tables()
+    print("\n" + "═" * 80)
+    if validation_passed:
+        print("✅ VALIDACIÓN POR MUESTREO EXITOSA: Sin violaciones en la muestra")
+    else:
+        print("⚠️  VALIDACIÓN POR MUESTREO CON ERRORES: Ejecute la validación exhaustiva")
+    print("═" * 80)
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 3: Generación de Tablas Maestras
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n📋 PASO 3: Generando tablas maestras...")
-    print("─" * 80)
+    return validation_passed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 9.2: VALIDACIÓN INCREMENTAL POR MARCAS DE AGUA
+# ═══════════════════════════════════════════════════════════════════════════════
+# Guarda en validation_watermarks el último id validado de cada tabla
+# transaccional y en cada corrida valida solo los ids nuevos (hasta el MAX
+# actual, fijado al inicio) más las filas padre que referencian, con los
+# mismos chequeos que la validación por muestreo. El costo depende del
+# tamaño del lote nuevo, no del de la tabla.
+#
+# Solo cubre filas insertadas: las actualizaciones de filas ya validadas
+# (ej: fleetlogix_advance.py) requieren la validación exhaustiva.
+
+VALIDATION_WATERMARKS_TABLE = 'validation_watermarks'
+
+INCREMENTAL_TABLES = ['trips', 'deliveries', 'maintenance']
+
+
+def ensure_watermark_table(cursor):
+    """
+    Crea la tabla de marcas de agua de validación si no existe
+    """
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {VALIDATION_WATERMARKS_TABLE} (
+            table_name VARCHAR(100) PRIMARY KEY,
+            table_oid OID NOT NULL,
+            last_validated_id BIGINT NOT NULL,
+            rows_validated BIGINT NOT NULL,
+            validated_at TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    """)
+
+
+def clear_watermarks(cursor):
+    """
+    Descarta las marcas de agua (tras TRUNCATE ... RESTART IDENTITY los ids se reutilizan)
+    """
+    cursor.execute("SELECT to_regclass(%s)", (VALIDATION_WATERMARKS_TABLE,))
+    if cursor.fetchone()[0] is not None:
+        cursor.execute(f"DELETE FROM {VALIDATION_WATERMARKS_TABLE}")
+
+
+def incremental_bounds(cursor):
+    """
+    Rango de ids (desde, hasta] a validar por tabla transaccional
     
-    vehicles_df = generate_vehicles()
-    drivers_df = generate_drivers()
-    routes_df = generate_routes()
+    La marca se descarta (se valida desde 0) si la tabla fue reemplazada
+    (otro OID, ej: intercambio blue/green) o si supera el MAX actual.
     
-    print(f"\n✓ Tablas maestras generadas: {len(vehicles_df) + len(drivers_df) + len(routes_df):,} registros")
+    Returns:
+        dict: {tabla: (último id validado, MAX(id) actual)}
+    """
+    cursor.execute(f"SELECT table_name, table_oid, last_validated_id FROM {VALIDATION_WATERMARKS_TABLE}")
+    stored = {table: (oid, last_id) for table, oid, last_id in cursor.fetchall()}
+    
+    bounds = {}
+    for table in INCREMENTAL_TABLES:
+        pk = TABLE_PRIMARY_KEYS[table]
+        cursor.execute(f"SELECT %s::regclass::oid, COALESCE(MAX({pk}), 0) FROM {table}", (table,))
+        oid, max_id = cursor.fetchone()
+        
+        last_id = 0
+        if table in stored:
+            stored_oid, stored_id = stored[table]
+            if stored_oid != oid or stored_id > max_id:
+                print(f"    ℹ️  {table}: la tabla fue reemplazada o reiniciada, se valida desde el inicio")
+            else:
+                last_id = stored_id
+        bounds[table] = (last_id, max_id)
+    return bounds
+
+
+def incremental_sources(bounds):
+    """
+    Expresiones FROM con las filas nuevas y las filas padre que referencian
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 4: Generación de Tablas Transaccionales
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n📊 PASO 4: Generando tablas transaccionales...")
-    print("─" * 80)
+    - trips: viajes nuevos y viajes con entregas nuevas (coherencia de pesos)
+    - deliveries, maintenance: filas nuevas
+    - vehicles, drivers, routes: referenciados por viajes o mantenimientos nuevos
     
-    trips_df = generate_trips(vehicles_df, drivers_df, routes_df)
-    deliveries_df = generate_deliveries(trips_df)
-    maintenance_df = generate_maintenance(trips_df, vehicles_df)
+    Returns:
+        dict: {tabla: expresión SQL para usar como "FROM <expresión> s"}
+    """
+    def new_rows(table, column='*'):
+        pk = TABLE_PRIMARY_KEYS[table]
+        low, high = bounds[table]
+        return f"SELECT {column} FROM {table} WHERE {pk} > {int(low)} AND {pk} <= {int(high)}"
+    
+    return {
+        'trips': f"(SELECT * FROM trips WHERE trip_id IN ({new_rows('trips', 'trip_id')} "
+                 f"UNION {new_rows('deliveries', 'trip_id')}))",
+        'deliveries': f"({new_rows('deliveries')})",
+        'maintenance': f"({new_rows('maintenance')})",
+        'vehicles': f"(SELECT * FROM vehicles WHERE vehicle_id IN ({new_rows('trips', 'vehicle_id')} "
+                    f"UNION {new_rows('maintenance', 'vehicle_id')}))",
+        'drivers': f"(SELECT * FROM drivers WHERE driver_id IN ({new_rows('trips', 'driver_id')}))",
+        'routes': f"(SELECT * FROM routes WHERE route_id IN ({new_rows('trips', 'route_id')}))",
+    }
+
+
+def validate_data_incremental(schema=None):
+    """
+    Valida solo las filas nuevas desde la última validación incremental exitosa
     
-    total_transactional = len(trips_df) + len(deliveries_df) + len(maintenance_df)
-    print(f"\n✓ Tablas transaccionales generadas: {total_transactional:,} registros")
+    Ejecuta los chequeos de SAMPLED_CHECKS (integridad referencial, orden
+    temporal, unicidad, coherencia de pesos y rangos) sobre los ids nuevos de
+    trips, deliveries y maintenance y sobre las filas padre que referencian.
+    Los chequeos de FK y unicidad resuelven cada fila por índice; el de pesos
+    usa idx_deliveries_trip_id si existe (--optimize).
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 5: Carga a Base de Datos
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n💾 PASO 5: Cargando datos a PostgreSQL...")
-    print("─" * 80)
+    Si todos pasan, las marcas avanzan al MAX(id) leído al inicio en la misma
+    transacción; si alguno falla, no avanzan y la próxima corrida revisa de
+    nuevo el mismo lote.
     
-    load_data_to_table(vehicles_df, 'vehicles')
-    load_data_to_table(drivers_df, 'drivers')
-    load_data_to_table(routes_df, 'routes')
-    load_data_to_table(trips_df, 'trips')
-    load_data_to_table(deliveries_df, 'deliveries')
-    load_data_to_table(maintenance_df, 'maintenance')
+    Args:
+        schema (str): Schema a validar (default: public)
     
-    total_records = len(vehicles_df) + len(drivers_df) + len(routes_df) + len(trips_df) + len(deliveries_df) + len(maintenance_df)
-    print(f"\n✓ Total de registros cargados: {total_records:,}")
+    Returns:
+        bool: True si el lote nuevo no tiene violaciones
+    """
+    print("\n" + "═" * 80)
+    print("VALIDACIÓN INCREMENTAL (MARCAS DE AGUA)" + (f" (schema {schema})" if schema else ""))
+    print("═" * 80)
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # PASO 6: Validación de Datos
-    # ─────────────────────────────────────────────────────────────────────────
-    print("\n✅ PASO 6: Validando consistencia y coherencia de datos...")
-    print("─" * 80)
+    try:
+        conn = get_connection(schema)
+        cursor = conn.cursor()
+        ensure_watermark_table(cursor)
+        
+        print("\n[1] Filas nuevas desde la última validación...")
+        bounds = incremental_bounds(cursor)
+        for table, (low, high) in bounds.items():
+            print(f"    ✓ {table}: {max(0, high - low):,} filas nuevas (ids {low + 1:,} a {high:,})")
+        
+        if all(high <= low for low, high in bounds.values()):
+            print("\n✅ Sin filas nuevas: nada que validar")
+            conn.commit()
+            cursor.close()
+            conn.close()
+            return True
+        
+        print("\n[2] Chequeos sobre el lote nuevo y sus filas padre...")
+        sources = incremental_sources(bounds)
+        results = []
+        validation_passed = True
+        
+        for name, table, violation in SAMPLED_CHECKS:
+            cursor.execute(f"""
+                SELECT COUNT(*), COUNT(*) FILTER (WHERE {violation})
+                FROM {sources[table]} s
+            """)
+            checked, violations = cursor.fetchone()
+            passed = violations == 0
+            validation_passed = validation_passed and passed
+            results.append([name, table, f"{checked:,}", f"{violations:,}", "✓" if passed else "❌"])
+        
+        if validation_passed:
+            for table, (low, high) in bounds.items():
+                cursor.execute(f"""
+                    INSERT INTO {VALIDATION_WATERMARKS_TABLE}
+                        (table_name, table_oid, last_validated_id, rows_validated, validated_at)
+                    VALUES (%s, %s::regclass::oid, %s, %s, NOW())
+                    ON CONFLICT (table_name) DO UPDATE
+                    SET table_oid = EXCLUDED.table_oid,
+                        last_validated_id = EXCLUDED.last_validated_id,
+                        rows_validated = EXCLUDED.rows_validated,
+                        validated_at = EXCLUDED.validated_at
+                """, (table, table, high, max(0, high - low)))
+        conn.commit()
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR durante la validación incremental: {e}")
+        return False
     
-    validation_success = validate_data()
+    print(tabulate(results, headers=["Chequeo", "Tabla", "Filas", "Violaciones", ""], tablefmt="simple"))
     
-    # ─────────────────────────────────────────────────────────────────────────
-    # RESUMEN FINAL
-    # ─────────────────────────────────────────────────────────────────────────
     print("\n" + "═" * 80)
-    print("  RESUMEN FINAL")
+    if validation_passed:
+        print("✅ VALIDACIÓN INCREMENTAL EXITOSA: marcas de agua actualizadas")
+    else:
+        print("⚠️  VALIDACIÓN INCREMENTAL CON ERRORES: las marcas de agua no avanzan")
     print("═" * 80)
     
-    summary_data = [
-        ["Tabla", "Registros"],
-        ["─" * 20, "─" * 15],
-        ["vehicles", f"{len(vehicles_df):,}"],
-        ["drivers", f"{len(drivers_df):,}"],
-        ["routes", f"{len(routes_df):,}"],
-        ["trips", f"{len(trips_df):,}"],
-        ["deliveries", f"{len(deliveries_df):,}"],
-        ["maintenance", f"{len(maintenance_df):,}"],
+    return validation_passed
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 10: OPTIMIZACIÓN POST-CARGA (ÍNDICES DE FK, ANALYZE, CLUSTER)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Índices sobre foreign keys que el schema no crea (nombre, tabla, columna)
+# Sin ellos los anti-joins y el join de pesos de validate_data, y las consultas
+# analíticas posteriores, recurren a sequential scans
+FK_INDEXES = [
+    ('idx_trips_vehicle_id', 'trips', 'vehicle_id'),
+    ('idx_trips_driver_id', 'trips', 'driver_id'),
+    ('idx_trips_route_id', 'trips', 'route_id'),
+    ('idx_deliveries_trip_id', 'deliveries', 'trip_id'),
+    ('idx_maintenance_vehicle_id', 'maintenance', 'vehicle_id')
+]
+
+# Orden físico opcional: entregas agrupadas por viaje, viajes por fecha de salida
+CLUSTER_TARGETS = [
+    ('deliveries', 'idx_deliveries_trip_id'),
+    ('trips', 'idx_trips_departure')
+]
+
+ALL_TABLES = ['vehicles', 'drivers', 'routes', 'trips', 'deliveries', 'maintenance']
+
+
+def optimize_database(cluster=False):
+    """
+    Etapa opcional post-carga para dejar la base lista para consultas analíticas
+    
+    Pasos:
+    1. Crea los índices de foreign keys con CREATE INDEX CONCURRENTLY
+       (un índice inválido de un intento previo fallido se elimina y se recrea)
+    2. Ejecuta ANALYZE en las 6 tablas para que el planner tenga estadísticas
+    3. Opcional: CLUSTER de deliveries por trip_id y trips por departure_datetime,
+       seguido de un nuevo ANALYZE (cambia la correlación física)
+    
+    CONCURRENTLY no puede ejecutarse dentro de una transacción, por lo que la
+    conexión trabaja en modo autocommit. CLUSTER toma un lock exclusivo sobre
+    la tabla mientras la reescribe.
+    
+    Con el schema particionado (fleetlogix_schema_particionado.sql) PostgreSQL
+    no admite CONCURRENTLY sobre la tabla padre: esos índices se crean de forma
+    normal (se propagan a cada partición) y se omite el CLUSTER.
+    
+    Args:
+        cluster (bool): Reordenar físicamente deliveries y trips
+    
+    Returns:
+        list: Filas [paso, segundos] con el tiempo de cada paso, o None si falla
+    """
+    print("\n⚙️  Optimizando base de datos post-carga...")
+    
+    timings = []
+    
+    def timed(step, sql):
+        start = time.perf_counter()
+        cursor.execute(sql)
+        elapsed = time.perf_counter() - start
+        timings.append([step, elapsed])
+        print(f"   ✓ {step}: {elapsed:.2f} s")
+    
+    try:
+        conn = get_connection()
+        conn.autocommit = True
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT relname FROM pg_class WHERE relkind = 'p'")
+        partitioned = {row[0] for row in cursor.fetchall()}
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 1: Índices de foreign keys (concurrentes)
+        # ─────────────────────────────────────────────────────────────────────
+        for index_name, table, column in FK_INDEXES:
+            if table in partitioned:
+                timed(f"CREATE INDEX {index_name}",
+                      f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({column})")
+                continue
+            
+            cursor.execute("""
+                SELECT i.indisvalid
+                FROM pg_class c
+                JOIN pg_index i ON i.indexrelid = c.oid
+                WHERE c.relname = %s AND c.relkind = 'i'
+            """, (index_name,))
+            existing = cursor.fetchone()
+            
+            if existing and not existing[0]:
+                print(f"   ℹ️  {index_name} quedó inválido en un intento anterior, recreando...")
+                cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+            
+            timed(f"CREATE INDEX {index_name}",
+                  f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table}({column})")
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 2: Estadísticas para el planner
+        # ─────────────────────────────────────────────────────────────────────
+        for table in ALL_TABLES:
+            timed(f"ANALYZE {table}", f"ANALYZE {table}")
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 3: Orden físico (opcional)
+        # ─────────────────────────────────────────────────────────────────────
+        if cluster:
+            for table, index_name in CLUSTER_TARGETS:
+                if table in partitioned:
+                    print(f"   ℹ️  {table} está particionada por mes, se omite CLUSTER")
+                    continue
+                timed(f"CLUSTER {table} USING {index_name}", f"CLUSTER {table} USING {index_name}")
+                timed(f"ANALYZE {table}", f"ANALYZE {table}")
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"❌ ERROR durante la optimización: {e}")
+        return None
+    
+    total = sum(seconds for _, seconds in timings)
+    print("\n" + tabulate(
+        [[step, f"{seconds:.2f}"] for step, seconds in timings] + [["TOTAL", f"{total:.2f}"]],
+        headers=["Paso", "Segundos"], tablefmt="simple"
+    ))
+    
+    return timings
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 11: CARGA PARTICIONADA POR MES (TRIPS, DELIVERIES)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Tablas particionadas en fleetlogix_schema_particionado.sql: (id, clave de partición)
+PARTITION_KEYS = {
+    'trips': ('trip_id', 'departure_datetime'),
+    'deliveries': ('delivery_id', 'scheduled_datetime')
+}
+
+
+def partition_name(table_name, month):
+    """
+    Nombre de la partición mensual de una tabla (ej: trips_2024_01)
+    
+    Args:
+        table_name (str): Tabla particionada
+        month (pd.Period): Mes de la partición
+    """
+    return f"{table_name}_{month.year}_{month.month:02d}"
+
+
+def ensure_partitions(cursor, table_name, months):
+    """
+    Crea bajo demanda las particiones mensuales que todavía no existen
+    
+    Args:
+        cursor: Cursor psycopg2 abierto
+        table_name (str): Tabla particionada (trips o deliveries)
+        months (iterable): Meses (pd.Period) que recibirán filas
+    """
+    for month in months:
+        cursor.execute(
+            f"CREATE TABLE IF NOT EXISTS {partition_name(table_name, month)} "
+            f"PARTITION OF {table_name} FOR VALUES FROM (%s) TO (%s)",
+            (month.start_time.to_pydatetime(), (month + 1).start_time.to_pydatetime())
+        )
+
+
+def load_partitioned_table(df, table_name, workers=1, batch_size=1000):
+    """
+    Carga trips o deliveries directamente en sus particiones mensuales
+    
+    Proceso:
+    1. Asigna IDs explícitos (índice + 1), igual que el SERIAL en carga secuencial,
+       para que deliveries.trip_id siga apuntando al viaje correcto aunque las
+       particiones se carguen en paralelo y en cualquier orden
+    2. Agrupa las filas por mes de la clave de partición y crea las particiones
+       que falten
+    3. Inserta cada grupo directamente en su partición (sin enrutamiento por la
+       tabla padre), con `workers` conexiones en paralelo
+    4. Sincroniza la secuencia SERIAL con el último ID cargado
+    
+    Cada partición se confirma por separado: si una falla, las demás quedan cargadas.
+    
+    Args:
+        df (pd.DataFrame): DataFrame de trips o deliveries
+        table_name (str): 'trips' o 'deliveries'
+        workers (int): Particiones cargadas en paralelo (una conexión por worker)
+        batch_size (int): Tamaño de lote para inserciones (default 1000)
+    """
+    id_column, partition_column = PARTITION_KEYS[table_name]
+    
+    # El agrupamiento por mes necesita acceso aleatorio a todas las filas
+    if isinstance(df, StoredTable):
+        df = df.to_frame()
+    
+    # IDs explícitos en la primera columna
+    frame = df.assign(**{id_column: np.arange(1, len(df) + 1)})
+    frame = frame[[id_column] + [c for c in df.columns if c != id_column]]
+    
+    months = pd.to_datetime(frame[partition_column]).dt.to_period('M')
+    groups = frame.groupby(months, sort=True).indices
+    unpartitioned = frame[months.isna().to_numpy()]
+    
+    print(f"   Cargando {table_name} en {len(groups)} particiones mensuales "
+          f"({workers} worker{'s' if workers > 1 else ''})...")
+    
+    def load_partition(month, positions):
+        name = partition_name(table_name, month)
+        worker_conn = get_connection()
+        worker_cursor = worker_conn.cursor()
+        count = insert_dataframe(worker_cursor, frame.iloc[positions], name, batch_size, show_progress=False)
+        worker_conn.commit()
+        worker_cursor.close()
+        worker_conn.close()
+        return name, count
+    
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        ensure_partitions(cursor, table_name, groups.keys())
+        conn.commit()
+        
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = [executor.submit(load_partition, month, positions)
+                       for month, positions in groups.items()]
+            for future in as_completed(futures):
+                name, count = future.result()
+                print(f"   ✓ {name}: {count:,} registros")
+        
+        # Filas sin clave de partición: se enrutan por la tabla padre (partición DEFAULT)
+        if len(unpartitioned) > 0:
+            insert_dataframe(cursor, unpartitioned, table_name, batch_size, show_progress=False)
+            print(f"   ✓ {table_name}_default: {len(unpartitioned):,} registros")
+        
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table_name}', '{id_column}'), %s)",
+            (max(1, len(frame)),)
+        )
+        conn.commit()
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR al cargar datos particionados en {table_name}: {e}")
+        sys.exit(1)
+    
+    print(f"   ✓ {table_name}: {len(frame):,} registros cargados en {len(groups)} particiones")
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 12: TABLAS DE RESUMEN DE KPIs
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def load_summary_tables(summaries, batch_size=1000):
+    """
+    Reemplaza el contenido de las tablas de resumen en una sola transacción
+    
+    Los agregados se calculan en memoria con fleetlogix_aggregates.build_summaries()
+    sobre los DataFrames recién generados; aquí solo se cargan.
+    
+    Args:
+        summaries (dict): {nombre_tabla: pd.DataFrame} de build_summaries()
+        batch_size (int): Tamaño de lote para inserciones (default 1000)
+    
+    Returns:
+        bool: True si se cargaron todas las tablas, False en caso contrario
+    """
+    print("\n📈 Cargando tablas de resumen de KPIs...")
+    
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT table_name 
+            FROM information_schema.tables 
+            WHERE table_schema = 'public' 
+            AND table_name = ANY(%s)
+        """, (list(summaries.keys()),))
+        existing_tables = {row[0] for row in cursor.fetchall()}
+        
+        missing_tables = [t for t in summaries if t not in existing_tables]
+        if missing_tables:
+            print(f"   ❌ FALTAN TABLAS: {', '.join(missing_tables)}")
+            print(f"   Ejecute la sección TABLAS DE RESUMEN de fleetlogix_schema_completo.sql")
+            cursor.close()
+            conn.close()
+            return False
+        
+        # Reemplazo atómico: los dashboards ven los agregados anteriores hasta el commit
+        cursor.execute(f"TRUNCATE TABLE {', '.join(summaries.keys())}")
+        for table_name, df in summaries.items():
+            insert_dataframe(cursor, df, table_name, batch_size)
+            print(f"   ✓ {table_name}: {len(df):,} registros cargados exitosamente" + " " * 20)
+        
+        conn.commit()
+        cursor.close()
+        conn.close()
+        
+        return True
+        
+    except Exception as e:
+        print(f"\n❌ ERROR al cargar tablas de resumen: {e}")
+        return False
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 12.1: CARGA BLUE/GREEN (SCHEMA DE STAGING + INTERCAMBIO ATÓMICO)
+# ═══════════════════════════════════════════════════════════════════════════════
+# En lugar de vaciar las tablas en producción y recargarlas (los consumidores
+# verían tablas vacías o a medio cargar durante toda la ventana), se carga un
+# schema de staging completo y se intercambia con el schema vivo en una sola
+# transacción. Si la carga o la validación fallan, producción no se toca.
+
+SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fleetlogix_schema_completo.sql')
+LIVE_SCHEMA = 'public'
+STAGING_SCHEMA = 'fleetlogix_staging'
+PREVIOUS_SCHEMA = 'fleetlogix_previous'
+
+
+def create_staging_schema(cursor):
+    """
+    Crea el schema de staging desde fleetlogix_schema_completo.sql y difiere
+    las foreign keys e índices secundarios para la carga masiva
+    
+    Las tablas quedan UNLOGGED (sin WAL) y sin FKs ni índices secundarios;
+    solo se conservan PK y UNIQUE. Las definiciones eliminadas se retornan
+    para recrearlas después de la carga.
+    
+    Returns:
+        tuple: (tablas del schema, [(tabla, constraint, definición FK)], [definición de índice])
+    """
+    cursor.execute(f"DROP SCHEMA IF EXISTS {STAGING_SCHEMA} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {STAGING_SCHEMA}")
+    cursor.execute(f"SET search_path TO {STAGING_SCHEMA}")
+    
+    with open(SCHEMA_FILE, encoding='utf-8') as f:
+        cursor.execute(f.read())
+    
+    cursor.execute("""
+        SELECT tablename FROM pg_tables WHERE schemaname = %s ORDER BY tablename
+    """, (STAGING_SCHEMA,))
+    staged_tables = [row[0] for row in cursor.fetchall()]
+    
+    cursor.execute("""
+        SELECT c.conrelid::regclass::text, c.conname, pg_get_constraintdef(c.oid)
+        FROM pg_constraint c
+        JOIN pg_namespace n ON n.oid = c.connamespace
+        WHERE n.nspname = %s AND c.contype = 'f'
+    """, (STAGING_SCHEMA,))
+    foreign_keys = cursor.fetchall()
+    
+    # Índices que no respaldan PK/UNIQUE
+    cursor.execute("""
+        SELECT i.indexname, i.indexdef
+        FROM pg_indexes i
+        WHERE i.schemaname = %s
+        AND NOT EXISTS (
+            SELECT 1 FROM pg_constraint c
+            JOIN pg_namespace n ON n.oid = c.connamespace
+            WHERE n.nspname = i.schemaname AND c.conname = i.indexname
+        )
+    """, (STAGING_SCHEMA,))
+    indexes = cursor.fetchall()
+    
+    for table_name, constraint_name, _ in foreign_keys:
+        cursor.execute(f"ALTER TABLE {table_name} DROP CONSTRAINT {constraint_name}")
+    for index_name, _ in indexes:
+        cursor.execute(f"DROP INDEX {index_name}")
+    
+    # Sin FKs entre tablas, el orden de SET UNLOGGED no importa
+    for table_name in staged_tables:
+        cursor.execute(f"ALTER TABLE {table_name} SET UNLOGGED")
+    
+    return staged_tables, foreign_keys, [definition for _, definition in indexes]
+
+
+def finalize_staging_schema(cursor, staged_tables, foreign_keys, indexes):
+    """
+    Vuelve las tablas de staging a LOGGED, recrea índices y FKs diferidos y
+    actualiza estadísticas
+    
+    Las FKs se validan en bloque al agregarse (un solo recorrido por tabla)
+    en lugar de fila por fila durante los INSERT.
+    """
+    for table_name in staged_tables:
+        cursor.execute(f"ALTER TABLE {table_name} SET LOGGED")
+    for definition in indexes:
+        cursor.execute(definition)
+    for table_name, constraint_name, definition in foreign_keys:
+        cursor.execute(f"ALTER TABLE {table_name} ADD CONSTRAINT {constraint_name} {definition}")
+    for table_name in staged_tables:
+        cursor.execute(f"ANALYZE {table_name}")
+
+
+def swap_staging_schema(staged_tables):
+    """
+    Intercambia las tablas de staging con las del schema vivo en una transacción
+    
+    Las tablas vivas pasan a PREVIOUS_SCHEMA (disponibles para rollback manual
+    hasta la próxima carga) y las de staging a LIVE_SCHEMA. Los lectores solo
+    esperan el instante del ALTER ... SET SCHEMA; nunca ven tablas vacías.
+    Las secuencias SERIAL, índices y constraints acompañan a cada tabla.
+    
+    Returns:
+        bool: True si el intercambio se confirmó
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute(f"DROP SCHEMA IF EXISTS {PREVIOUS_SCHEMA} CASCADE")
+        cursor.execute(f"CREATE SCHEMA {PREVIOUS_SCHEMA}")
+        
+        cursor.execute("""
+            SELECT tablename FROM pg_tables WHERE schemaname = %s AND tablename = ANY(%s)
+        """, (LIVE_SCHEMA, staged_tables))
+        live_tables = [row[0] for row in cursor.fetchall()]
+        
+        for table_name in live_tables:
+            cursor.execute(f"ALTER TABLE {LIVE_SCHEMA}.{table_name} SET SCHEMA {PREVIOUS_SCHEMA}")
+        for table_name in staged_tables:
+            cursor.execute(f"ALTER TABLE {STAGING_SCHEMA}.{table_name} SET SCHEMA {LIVE_SCHEMA}")
+        cursor.execute(f"DROP SCHEMA {STAGING_SCHEMA}")
+        
+        conn.commit()
+        return True
+        
+    except Exception as e:
+        conn.rollback()
+        print(f"\n❌ ERROR en el intercambio de schemas (producción sin cambios): {e}")
+        return False
+        
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def load_via_staging(tables, summaries=None, batch_size=1000, validate=validate_data):
+    """
+    Carga blue/green: staging UNLOGGED → índices/FKs → validación → intercambio
+    
+    Args:
+        tables (list): [(nombre_tabla, DataFrame)] en orden de dependencias
+        summaries (dict): Tablas de resumen opcionales {nombre_tabla: DataFrame}
+        batch_size (int): Tamaño de lote para inserciones (default 1000)
+        validate (callable): Validación a ejecutar sobre staging; recibe schema=
+    
+    Se publican todas las tablas del schema, incluidas las de resumen: sin
+    `summaries` quedan vacías en lugar de conservar agregados de datos anteriores.
+    
+    Returns:
+        bool: True si los datos nuevos quedaron publicados en el schema vivo
+    """
+    print(f"\n🟦 Cargando en schema de staging '{STAGING_SCHEMA}' (producción intacta)...")
+    
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        staged_tables, foreign_keys, indexes = create_staging_schema(cursor)
+        conn.commit()
+        print(f"   ✓ Schema creado: {len(staged_tables)} tablas UNLOGGED, "
+              f"{len(foreign_keys)} FKs y {len(indexes)} índices diferidos")
+        
+        for table_name, df in list(tables) + list((summaries or {}).items()):
+            start = time.perf_counter()
+            insert_dataframe(cursor, df, table_name, batch_size)
+            conn.commit()
+            print(f"   ✓ {table_name}: {len(df):,} registros en {time.perf_counter() - start:.1f} s" + " " * 20)
+        
+        start = time.perf_counter()
+        finalize_staging_schema(cursor, staged_tables, foreign_keys, indexes)
+        conn.commit()
+        print(f"   ✓ LOGGED, índices y FKs recreados en {time.perf_counter() - start:.1f} s")
+        
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR al cargar staging (producción sin cambios): {e}")
+        return False
+    
+    if not validate(schema=STAGING_SCHEMA):
+        print(f"\n❌ Validación fallida: se conserva '{STAGING_SCHEMA}' para inspección, producción sin cambios")
+        return False
+    
+    print(f"\n🔀 Intercambiando '{STAGING_SCHEMA}' ↔ '{LIVE_SCHEMA}' en una transacción...")
+    if not swap_staging_schema(staged_tables):
+        return False
+    
+    print(f"   ✓ Datos nuevos publicados; los anteriores quedan en '{PREVIOUS_SCHEMA}'")
+    return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 12.2: FUSIÓN DE SHARDS (GENERACIÓN DISTRIBUIDA)
+# ═══════════════════════════════════════════════════════════════════════════════
+# Cada nodo ejecuta --shard i/N y escribe su almacén local con manifiesto
+# (ver fleetlogix_shards). La fusión verifica todos los manifiestos y carga
+# las maestras una vez y las transaccionales shard por shard: al cargar en
+# orden, los trip_id SERIAL coinciden con los rangos que usó cada shard.
+
+def merge_shards(directory, batch_size=1000):
+    """
+    Verifica los shards de un directorio y los carga en PostgreSQL
+    
+    Args:
+        directory (str): Carpeta con los directorios shard-*
+        batch_size (int): Tamaño de lote para inserciones (default 1000)
+    
+    Returns:
+        bool: True si todos los shards se verificaron y cargaron
+    """
+    print(f"\n🧩 Verificando shards en {directory}/...")
+    manifests, errors = verify_shards(directory)
+    if errors:
+        for error in errors:
+            print(f"   ❌ {error}")
+        print("\n❌ Fusión cancelada: la base de datos no fue modificada")
+        return False
+    
+    expected_trips = manifests[-1]['trip_ids'][1] - 1
+    print(f"   ✓ {len(manifests)} shards completos y consistentes ({expected_trips:,} viajes)")
+    
+    # Los totales fusionados deben ser los de una generación completa a esa escala
+    set_scale(manifests[0]['scale'])
+    expected = dict(FULL_COUNTS)
+    merged_rows = {table_name: sum(m['tables'][table_name]['rows'] for m in manifests)
+                   for table_name in expected}
+    mismatched = [table_name for table_name in expected if merged_rows[table_name] != expected[table_name]]
+    for table_name in mismatched:
+        print(f"   ❌ {table_name}: {merged_rows[table_name]:,} registros en los shards, "
+              f"se esperaban {expected[table_name]:,} a escala {SCALE_FACTOR}")
+    if mismatched:
+        print("\n❌ Fusión cancelada: la base de datos no fue modificada")
+        return False
+    
+    if not verify_tables():
+        print("\n❌ ERROR: Las tablas no existen. Ejecute fleetlogix_schema_completo.sql primero.")
+        return False
+    truncate_tables()
+    
+    try:
+        conn = get_connection()
+        cursor = conn.cursor()
+        
+        for table_name, parts in merge_plan(manifests):
+            start = time.perf_counter()
+            rows = 0
+            for part in parts:
+                rows += insert_dataframe(cursor, part, table_name, batch_size)
+            conn.commit()
+            print(f"   ✓ {table_name}: {rows:,} registros de {len(parts)} shard(s) "
+                  f"en {time.perf_counter() - start:.1f} s" + " " * 20)
+        
+        # Las entregas de cada shard referencian trip_id globales: deben coincidir
+        cursor.execute("SELECT COUNT(*), COALESCE(MAX(trip_id), 0) FROM trips")
+        count, max_trip_id = cursor.fetchone()
+        loaded = {}
+        for table_name in ('deliveries', 'maintenance'):
+            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+            loaded[table_name] = cursor.fetchone()[0]
+        cursor.close()
+        conn.close()
+        
+    except Exception as e:
+        print(f"\n❌ ERROR al cargar los shards: {e}")
+        return False
+    
+    if count != expected_trips or max_trip_id != expected_trips:
+        print(f"❌ trip_id asignados (máx {max_trip_id:,}) no coinciden con los shards ({expected_trips:,}); "
+              f"la secuencia de trips no empezó en 1")
+        return False
+    
+    for table_name, rows in loaded.items():
+        if rows != expected[table_name]:
+            print(f"❌ {table_name}: {rows:,} registros cargados, se esperaban {expected[table_name]:,}")
+            return False
+    
+    return True
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 12.3: ESTIMACIÓN DE TIEMPO, MEMORIA Y TAMAÑO (DRY-RUN)
+# ═══════════════════════════════════════════════════════════════════════════════
+# Genera dos muestras pequeñas (escala s y 2s), mide tiempo, memoria en
+# DataFrame, pico de generación y bytes en el destino, y ajusta por tabla
+# costo = fijo + por_registro × registros. Con una sola muestra el costo
+# fijo (samplers, archivos, sesión) se extrapolaría como si fuera por
+# registro e inflaría las tablas pequeñas.
+
+DEFAULT_ESTIMATE_SAMPLE = 0.01
+ESTIMATE_SINKS = ['postgres', 'columnstore', 'csv']
+
+# Página de metadatos de cada índice btree (no escala con las filas)
+BTREE_METAPAGE_BYTES = 8192
+
+
+def _estimate_generator_calls():
+    """Generadores en orden, cada uno como función de las tablas previas"""
+    return [
+        ('vehicles', lambda st: generate_vehicles()),
+        ('drivers', lambda st: generate_drivers()),
+        ('routes', lambda st: generate_routes()),
+        ('trips', lambda st: generate_trips(st['vehicles'], st['drivers'], st['routes'])),
+        ('deliveries', lambda st: generate_deliveries(st['trips'], st['routes'])),
+        ('maintenance', lambda st: generate_maintenance(st['trips'], st['vehicles'], st['routes'])),
+    ]
+
+
+def calibrate_generation(sample_scale):
+    """
+    Genera una muestra dos veces: una para tiempos y otra con tracemalloc
+    (que distorsiona los tiempos) para la memoria pico de cada generador
+    
+    Returns:
+        tuple: ({tabla: DataFrame}, {tabla: {'rows', 'seconds', 'frame_bytes', 'peak_bytes'}})
+    """
+    measurements = {}
+    
+    for measure_memory in (False, True):
+        set_scale(sample_scale)
+        reset_random_state(STREAMS.seed)
+        frames = {}
+        
+        for name, call in _estimate_generator_calls():
+            if measure_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                frames[name] = call(frames)
+            elapsed = time.perf_counter() - start
+            
+            if measure_memory:
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                measurements[name]['peak_bytes'] = peak
+            else:
+                measurements[name] = {
+                    'rows': len(frames[name]),
+                    'seconds': elapsed,
+                    'frame_bytes': int(frames[name].memory_usage(deep=True).sum()),
+                }
+    
+    return frames, measurements
+
+
+def measure_sink(frames, sink):
+    """
+    Bytes en disco y segundos de escritura de la muestra en el destino
+    
+    - postgres: tablas TEMP con los mismos índices (LIKE ... INCLUDING INDEXES),
+      tamaño real de heap e índices (pg_relation_size / pg_indexes_size).
+      Sin INCLUDING DEFAULTS: el nextval() de la columna SERIAL avanzaría la
+      secuencia de la tabla real (el rollback no la revierte); los ids se
+      insertan explícitos
+    - columnstore / csv: tamaño de los archivos exportados
+    
+    Returns:
+        dict: {tabla: {'table_bytes', 'index_bytes', 'seconds'}}
+    """
+    results = {}
+    
+    if sink == 'postgres':
+        conn = get_connection()
+        cursor = conn.cursor()
+        try:
+            for name, df in frames.items():
+                temp_table = f"estimate_{name}"
+                cursor.execute(f"CREATE TEMP TABLE {temp_table} (LIKE {name} INCLUDING INDEXES)")
+                df = df.assign(**{TABLE_PRIMARY_KEYS[name]: np.arange(1, len(df) + 1)})
+                start = time.perf_counter()
+                insert_dataframe(cursor, df, temp_table, show_progress=False)
+                elapsed = time.perf_counter() - start
+                cursor.execute("""
+                    SELECT pg_relation_size(c.oid), pg_indexes_size(c.oid),
+                           (SELECT COUNT(*) FROM pg_index i WHERE i.indrelid = c.oid)
+                    FROM pg_class c WHERE c.oid = %s::regclass
+                """, (temp_table,))
+                heap_bytes, index_bytes, index_count = cursor.fetchone()
+                results[name] = {
+                    'table_bytes': heap_bytes,
+                    'index_bytes': max(0, index_bytes - index_count * BTREE_METAPAGE_BYTES),
+                    'seconds': elapsed,
+                }
+        finally:
+            # Las tablas TEMP desaparecen con la sesión
+            conn.rollback()
+            cursor.close()
+            conn.close()
+        return results
+    
+    directory = tempfile.mkdtemp(prefix='fleetlogix_estimate_')
+    try:
+        for name, df in frames.items():
+            start = time.perf_counter()
+            if sink == 'columnstore':
+                ColumnStore(directory).write_table(name, df)
+                path = os.path.join(directory, name)
+                size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            else:
+                path = os.path.join(directory, f"{name}.csv")
+                df.to_csv(path, index=False)
+                size = os.path.getsize(path)
+            results[name] = {'table_bytes': size, 'index_bytes': 0, 'seconds': time.perf_counter() - start}
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return results
+
+
+def _extrapolate(rows_small, value_small, rows_large, value_large, rows_target):
+    """
+    Recta fijo + por_registro × registros por dos muestras
+
+    Si el ruido de medición da una pendiente o un costo fijo negativos,
+    usa la proporción simple de la muestra mayor.
+    """
+    if rows_large > rows_small:
+        per_row = (value_large - value_small) / (rows_large - rows_small)
+        fixed = value_small - per_row * rows_small
+        if per_row >= 0 and fixed >= 0:
+            return fixed + per_row * rows_target
+    return value_large * rows_target / max(rows_large, 1)
+
+
+def estimate_run(target_scale, sample_scale=DEFAULT_ESTIMATE_SAMPLE, sink='postgres', workers=1):
+    """
+    Extrapola tiempo, memoria pico y tamaño final para una escala sin ejecutarla
+    
+    Modelo (por tabla, ajuste lineal sobre muestras de escala s y 2s):
+    - Generación: fijo + segundos/registro × registros; con workers > 1 las
+      maestras y las dependientes (deliveries/maintenance) corren en paralelo
+    - Memoria pico: DataFrames retenidos hasta la carga + pico transitorio del
+      generador en curso (los generadores paralelos suman sus picos)
+    - Destino: bytes/registro de heap e índices (o archivo) y registros/s de escritura
+    
+    Args:
+        target_scale (float): Escala a estimar (ej: 100)
+        sample_scale (float): Escala de la muestra de calibración
+        sink (str): postgres, columnstore o csv
+        workers (int): --generate-workers previsto
+    
+    Returns:
+        dict: {'tables': {tabla: estimación}, 'totals': {...}}
+    """
+    samples = []
+    for scale in (sample_scale, 2 * sample_scale):
+        frames, generation = calibrate_generation(scale)
+        for name, costs in measure_sink(frames, sink).items():
+            generation[name].update({
+                'table_bytes': costs['table_bytes'],
+                'index_bytes': costs['index_bytes'],
+                'write_seconds': costs['seconds'],
+            })
+        samples.append(generation)
+        del frames
+    
+    set_scale(target_scale)
+    target_rows = {
+        'vehicles': NUM_VEHICLES, 'drivers': NUM_DRIVERS, 'routes': NUM_ROUTES,
+        'trips': NUM_TRIPS, 'deliveries': NUM_DELIVERIES, 'maintenance': NUM_MAINTENANCE,
+    }
+    if MAINTENANCE_MODEL == 'odometer':
+        # Los servicios por odómetro son proporcionales a los viajes, no a NUM_MAINTENANCE
+        target_rows['maintenance'] = int(round(
+            samples[1]['maintenance']['rows'] * NUM_TRIPS / max(samples[1]['trips']['rows'], 1)))
+    
+    metrics = [('generate_seconds', 'seconds'), ('frame_bytes', 'frame_bytes'), ('peak_bytes', 'peak_bytes'),
+               ('table_bytes', 'table_bytes'), ('index_bytes', 'index_bytes'), ('write_seconds', 'write_seconds')]
+    tables = {}
+    for name, small in samples[0].items():
+        large = samples[1][name]
+        tables[name] = {'rows': target_rows[name]}
+        for key, measured in metrics:
+            tables[name][key] = _extrapolate(small['rows'], small[measured], large['rows'], large[measured],
+                                             target_rows[name])
+    
+    stages = [['vehicles', 'drivers', 'routes'], ['trips'], ['deliveries', 'maintenance']]
+    combine = max if workers > 1 else sum
+    generate_seconds = sum(combine(tables[t]['generate_seconds'] for t in stage) for stage in stages)
+    
+    # Secuencial: un generador a la vez; con workers, los de una etapa a la vez
+    groups = stages if workers > 1 else [[t] for stage in stages for t in stage]
+    peak_bytes = held = 0
+    for group in groups:
+        peak_bytes = max(peak_bytes, held + sum(tables[t]['peak_bytes'] for t in group))
+        held += sum(tables[t]['frame_bytes'] for t in group)
+    peak_bytes = max(peak_bytes, held)
+    
+    return {
+        'tables': tables,
+        'totals': {
+            'rows': sum(target_rows.values()),
+            'generate_seconds': generate_seconds,
+            'write_seconds': sum(t['write_seconds'] for t in tables.values()),
+            'peak_bytes': peak_bytes,
+            'table_bytes': sum(t['table_bytes'] for t in tables.values()),
+            'index_bytes': sum(t['index_bytes'] for t in tables.values()),
+        },
+    }
+
+
+def _format_bytes(value):
+    """Bytes en la unidad legible más grande (KB, MB, GB, TB)"""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024:
+            return f"{value:,.1f} {unit}"
+        value /= 1024
+    return f"{value:,.1f} TB"
+
+
+def _format_seconds(value):
+    """Segundos como h:mm:ss"""
+    value = int(round(value))
+    return f"{value // 3600}:{value % 3600 // 60:02d}:{value % 60:02d}"
+
+
+def print_estimate(estimate, target_scale, sample_scale, sink, workers):
+    """
+    Imprime la estimación por tabla y la compara con la RAM del equipo
+    """
+    print("\n" + "═" * 80)
+    print(f"  ESTIMACIÓN PARA ESCALA {target_scale}x (muestra {sample_scale}x, destino {sink}, "
+          f"{workers} worker(s))")
+    print("═" * 80)
+    
+    rows = [
+        [name, f"{t['rows']:,}", _format_seconds(t['generate_seconds']), _format_bytes(t['frame_bytes']),
+         _format_bytes(t['table_bytes']), _format_bytes(t['index_bytes']), _format_seconds(t['write_seconds'])]
+        for name, t in estimate['tables'].items()
+    ]
+    totals = estimate['totals']
+    rows.append(['TOTAL', f"{totals['rows']:,}", _format_seconds(totals['generate_seconds']), '',
+                 _format_bytes(totals['table_bytes']), _format_bytes(totals['index_bytes']),
+                 _format_seconds(totals['write_seconds'])])
+    print(tabulate(rows, headers=['Tabla', 'Registros', 'Generación', 'Memoria', 'Datos', 'Índices', 'Escritura'],
+                   tablefmt='simple'))
+    
+    wall = totals['generate_seconds'] + totals['write_seconds']
+    print(f"\n  ⏱️  Tiempo total estimado: {_format_seconds(wall)} (generación + escritura, sin validación)")
+    print(f"  🧠 Memoria pico estimada: {_format_bytes(totals['peak_bytes'])} + intérprete y librerías", end='')
+    
+    try:
+        ram = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        status = "✓ cabe" if totals['peak_bytes'] < ram * 0.8 else "⚠️  supera el 80% de"
+        print(f" ({status} la RAM de este equipo: {_format_bytes(ram)})")
+        if totals['peak_bytes'] >= ram * 0.8:
+            print("     Considere --column-store o --shard i/N para no retener las tablas en memoria")
+    except (ValueError, OSError, AttributeError):
+        print()
+    
+    print(f"  💽 Tamaño final estimado: {_format_bytes(totals['table_bytes'] + totals['index_bytes'])}"
+          + (" (heap + índices de PK/UNIQUE; sin índices de --optimize)" if sink == 'postgres' else ""))
+    print("═" * 80)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 13: FUNCIÓN PRINCIPAL
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    """
+    Procesa los argumentos de línea de comandos
+    
+    Args:
+        argv (list): Argumentos (default: sys.argv[1:])
+    
+    Returns:
+        argparse.Namespace: Opciones de ejecución
+    """
+    parser = argparse.ArgumentParser(
+        description="FleetLogix - Generador de datos sintéticos para PostgreSQL"
+    )
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Factor de escala sobre los conteos base (ej: 0.1, 10)")
+    parser.add_argument('--generate-only', action='store_true',
+                        help="Solo generar en memoria, sin verificar, cargar ni validar en PostgreSQL")
+    parser.add_argument('--partitioned', action='store_true',
+                        help="Cargar trips y deliveries por partición mensual "
+                             "(requiere fleetlogix_schema_particionado.sql)")
+    parser.add_argument('--generate-workers', type=int, default=1,
+                        help="Procesos para generar en paralelo las tablas independientes "
+                             "(vehicles/drivers/routes y deliveries/maintenance; default 1)")
+    parser.add_argument('--column-store', nargs='?', const=DEFAULT_STORE_DIR, metavar='DIR',
+                        help="Escribir cada tabla generada en un almacén columnar mapeado en memoria "
+                             f"y cargar desde ahí por lotes (default: {DEFAULT_STORE_DIR})")
+    parser.add_argument('--maintenance-model', choices=MAINTENANCE_MODELS, default=MAINTENANCE_MODEL,
+                        help="Mantenimientos: proportional (NUM_MAINTENANCE según viajes) u odometer "
+                             "(al cruzar intervalos de km o días por tipo) (default: proportional)")
+    parser.add_argument('--workload', type=parse_workload, default=WORKLOAD, metavar='PERFIL',
+                        help="Perfil de carga de los viajes: uniform, zipf[:s], hotset[:fracción[:cuota]], "
+                             "combinables con seasonal[:amplitud] (ej: zipf:1.2+seasonal) (default: uniform)")
+    parser.add_argument('--shard', type=parse_shard, metavar='i/N',
+                        help="Generar solo el shard i de N (0 <= i < N) en un almacén local con "
+                             "manifiesto, sin PostgreSQL (generación distribuida)")
+    parser.add_argument('--shard-dir', default=DEFAULT_SHARD_DIR,
+                        help=f"Con --shard: carpeta de salida de los shards (default: {DEFAULT_SHARD_DIR})")
+    parser.add_argument('--merge-shards', metavar='DIR',
+                        help="Verificar los manifiestos de todos los shards en DIR, cargarlos y validar")
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help="Tamaño de lote inicial de la carga; se ajusta según el throughput (default 1000)")
+    parser.add_argument('--fixed-batch', action='store_true',
+                        help="No ajustar el tamaño de lote durante la carga")
+    parser.add_argument('--commit-every', type=int, default=DEFAULT_COMMIT_EVERY,
+                        help="Registros por commit con checkpoint en load_checkpoints "
+                             f"(0 = un commit por tabla; default {DEFAULT_COMMIT_EVERY})")
+    parser.add_argument('--resume', action='store_true',
+                        help="Reanudar una carga interrumpida desde el último lote confirmado "
+                             "(no vacía las tablas; regenera los mismos datos)")
+    parser.add_argument('--load-workers', type=int, default=1,
+                        help="Con --partitioned: particiones cargadas en paralelo (default 1)")
+    parser.add_argument('--staging', action='store_true',
+                        help="Carga blue/green: cargar y validar en un schema de staging y "
+                             "luego intercambiarlo con el schema vivo en una transacción")
+    parser.add_argument('--validate-sample', type=float, metavar='FRACCION',
+                        help="Validar por muestreo una fracción de cada tabla (ej: 0.01) "
+                             "en lugar de la validación exhaustiva")
+    parser.add_argument('--sample-method', choices=['system', 'bernoulli', 'keyrange'], default='system',
+                        help="Método de muestreo para --validate-sample (default: system)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Validar solo las filas nuevas desde la última validación incremental "
+                             f"(marcas de agua en {VALIDATION_WATERMARKS_TABLE})")
+    parser.add_argument('--validate-only', action='store_true',
+                        help="No generar ni cargar: solo validar los datos existentes "
+                             "(exit code 1 si la validación falla)")
+    parser.add_argument('--conformance', action='store_true',
+                        help="Verificar que los datos generados sigan las distribuciones "
+                             "configuradas (pruebas chi-cuadrado y Kolmogorov-Smirnov)")
+    parser.add_argument('--conformance-alpha', type=float, default=DEFAULT_ALPHA,
+                        help=f"Nivel de significancia por prueba de conformidad (default: {DEFAULT_ALPHA})")
+    parser.add_argument('--estimate', action='store_true',
+                        help="No ejecutar: generar una muestra y estimar tiempo, memoria pico y "
+                             "tamaño final para --scale")
+    parser.add_argument('--estimate-sample', type=float, default=DEFAULT_ESTIMATE_SAMPLE,
+                        help=f"Escala de la muestra de calibración (default: {DEFAULT_ESTIMATE_SAMPLE})")
+    parser.add_argument('--estimate-sink', choices=ESTIMATE_SINKS, default='postgres',
+                        help="Destino a estimar: postgres (tablas TEMP), columnstore o csv (default: postgres)")
+    parser.add_argument('--summaries', action='store_true',
+                        help="Calcular y cargar las tablas de resumen de KPIs diarios")
+    parser.add_argument('--optimize', action='store_true',
+                        help="Etapa post-carga: índices de FK concurrentes y ANALYZE")
+    parser.add_argument('--cluster', action='store_true',
+                        help="Con --optimize: CLUSTER de deliveries por trip_id y trips por departure_datetime")
+    parser.add_argument('--profile', nargs='*', metavar='ETAPA',
+                        help="Perfilar etapas con cProfile y tracemalloc. Sin valores perfila "
+                             "todas; acepta etapas (generate_deliveries) o tablas (deliveries)")
+    parser.add_argument('--profile-dir', default=DEFAULT_PROFILE_DIR,
+                        help=f"Directorio de salida de perfiles (default: {DEFAULT_PROFILE_DIR})")
+    
+    args = parser.parse_args(argv)
+    if args.staging and args.partitioned:
+        parser.error("--staging usa fleetlogix_schema_completo.sql y no admite --partitioned")
+    if args.resume and (args.staging or args.partitioned):
+        parser.error("--resume aplica a la carga estándar (sin --staging ni --partitioned)")
+    if args.incremental and (args.validate_sample is not None or args.staging):
+        parser.error("--incremental no se combina con --validate-sample ni con --staging")
+    if args.shard and args.merge_shards:
+        parser.error("--shard genera un shard; --merge-shards se ejecuta después, con todos los shards")
+    if args.shard and args.column_store:
+        parser.error("--shard escribe su propio almacén en --shard-dir; no use --column-store")
+    if args.shard and args.maintenance_model == 'odometer':
+        parser.error("--maintenance-model odometer necesita todos los viajes de cada vehículo; "
+                     "un shard solo ve su rango de trip_id")
+    return args
+
+
+def run_validation(args, schema=None):
+    """
+    Ejecuta la validación exhaustiva o por muestreo según los argumentos
+    """
+    if args.incremental:
+        return validate_data_incremental(schema=schema)
+    if args.validate_sample is not None:
+        return validate_data_sampled(fraction=args.validate_sample, method=args.sample_method, schema=schema)
+    return validate_data(schema=schema)
+
+
+def main(argv=None):
+    """
+    Función principal que orquesta todo el proceso de generación y carga de datos
+    
+    Cada etapa (verify_tables, truncate_tables, generate_<tabla>, load_<tabla>,
+    validate_data) se ejecuta dentro de profiler.stage() para poder perfilarla
+    por separado con --profile.
+    """
+    args = parse_args(argv)
+    
+    if args.validate_only:
+        # Compuerta de validación sobre los datos ya cargados (ej: corrida nocturna)
+        profiler = StageProfiler(
+            output_dir=args.profile_dir,
+            stages=args.profile,
+            enabled=args.profile is not None
+        )
+        with profiler.stage('validate_data'):
+            validation_success = run_validation(args)
+        profiler.write_summary()
+        sys.exit(0 if validation_success else 1)
+    
+    set_maintenance_model(args.maintenance_model)
+    set_workload(args.workload)
+    
+    if args.estimate:
+        estimate = estimate_run(args.scale, args.estimate_sample, args.estimate_sink, args.generate_workers)
+        print_estimate(estimate, args.scale, args.estimate_sample, args.estimate_sink, args.generate_workers)
+        sys.exit(0)
+    
+    if args.merge_shards:
+        # Fusión de una generación distribuida: verificar, cargar y validar
+        profiler = StageProfiler(
+            output_dir=args.profile_dir,
+            stages=args.profile,
+            enabled=args.profile is not None
+        )
+        validation_success = False
+        with profiler.stage('merge_shards'):
+            merged = merge_shards(args.merge_shards)
+        if merged:
+            with profiler.stage('validate_data'):
+                validation_success = run_validation(args)
+        profiler.write_summary()
+        sys.exit(0 if validation_success else 1)
+    
+    if args.scale != 1.0:
+        set_scale(args.scale)
+    
+    shard_trip_ids = None
+    if args.shard:
+        shard_trip_ids = set_shard(*args.shard)
+        # Un shard nunca usa PostgreSQL: sus tablas van a su almacén local
+        args.generate_only = True
+        args.column_store = os.path.join(args.shard_dir, shard_name(*args.shard))
+        # Un manifiesto previo dejaría el shard como completo si esta corrida se interrumpe
+        stale_manifest = os.path.join(args.column_store, SHARD_MANIFEST)
+        if os.path.exists(stale_manifest):
+            os.remove(stale_manifest)
+    
+    profiler = StageProfiler(
+        output_dir=args.profile_dir,
+        stages=args.profile,
+        enabled=args.profile is not None
+    )
+    
+    print("\n" + "═" * 80)
+    print("  FLEETLOGIX - GENERADOR DE DATOS SINTÉTICOS")
+    print("  Sistema de Gestión de Transporte y Logística")
+    print("═" * 80)
+    print(f"\n  📊 Configuración:")
+    print(f"     • Vehículos: {NUM_VEHICLES:,}")
+    print(f"     • Conductores: {NUM_DRIVERS:,}")
+    print(f"     • Rutas: {NUM_ROUTES:,}")
+    print(f"     • Viajes: {NUM_TRIPS:,}")
+    print(f"     • Entregas: ~{NUM_DELIVERIES:,}")
+    print(f"     • Mantenimientos: ~{NUM_MAINTENANCE:,}")
+    print(f"     • Total aproximado: ~{NUM_VEHICLES + NUM_DRIVERS + NUM_ROUTES + NUM_TRIPS + NUM_DELIVERIES + NUM_MAINTENANCE:,} registros")
+    if SCALE_FACTOR != 1.0:
+        print(f"     • Factor de escala: {SCALE_FACTOR}x")
+    if not WORKLOAD.is_uniform:
+        print(f"     • Perfil de carga: {WORKLOAD.spec} ({WORKLOAD.describe()})")
+    if shard_trip_ids:
+        print(f"     • Shard: {SHARD_INDEX}/{SHARD_COUNT} (trip_id {shard_trip_ids[0]:,} a {shard_trip_ids[1] - 1:,})")
+    print(f"\n  🎲 Semilla aleatoria: {RANDOM_SEED} (reproducible)")
+    print(f"  📅 Período operativo: 2024-2025 (2 años)")
+    if profiler.enabled:
+        selected = ', '.join(sorted(profiler.stages)) if profiler.stages else 'todas las etapas'
+        print(f"  🔬 Perfilado: {selected} → {args.profile_dir}/")
+    print("\n" + "═" * 80)
+    
+    use_database = not args.generate_only
+    
+    if use_database and args.staging:
+        print(f"\nℹ️  Modo --staging: las tablas vivas no se vacían; la carga se hace en '{STAGING_SCHEMA}'")
+    elif use_database:
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 1: Verificaciones Previas
+        # ─────────────────────────────────────────────────────────────────────
+        print("\n🔍 PASO 1: Verificando requisitos previos...")
+        
+        with profiler.stage('verify_tables'):
+            tables_ok = verify_tables()
+        
+        if not tables_ok:
+            print("\n❌ ERROR: Las tablas no existen. Ejecute fleetlogix_db_schema.sql primero.")
+            sys.exit(1)
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 2: Limpieza de Tablas
+        # ─────────────────────────────────────────────────────────────────────
+        print("\n🔧 PASO 2: Preparando base de datos...")
+        if args.resume:
+            print("   ℹ️  Modo --resume: se conservan los lotes ya confirmados (ver load_checkpoints)")
+        else:
+            with profiler.stage('truncate_tables'):
+                truncate_tables()
+    else:
+        print("\nℹ️  Modo --generate-only: se omiten los pasos con PostgreSQL (1, 2, 5 y 6)")
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # PASO 3: Generación de Tablas Maestras
+    # ─────────────────────────────────────────────────────────────────────────
+    print("\n📋 PASO 3: Generando tablas maestras...")
+    print("─" * 80)
+    
+    # Almacén columnar opcional: cada tabla se escribe una vez y las etapas
+    # siguientes (y los workers) la leen mapeada en memoria
+    store = ColumnStore(args.column_store) if args.column_store else None
+    
+    if args.generate_workers > 1:
+        with profiler.stage('generate_masters'):
+            masters = generate_tables_parallel(
+                [('vehicles', ()), ('drivers', ()), ('routes', ())], args.generate_workers, store, profiler
+            )
+        # Las maestras son pequeñas y los generadores siguientes las necesitan completas
+        vehicles_df, drivers_df, routes_df = (
+            frame.to_frame() if isinstance(frame, StoredTable) else frame
+            for frame in (masters['vehicles'], masters['drivers'], masters['routes'])
+        )
+    else:
+        with profiler.stage('generate_vehicles'):
+            vehicles_df = generate_vehicles()
+        with profiler.stage('generate_drivers'):
+            drivers_df = generate_drivers()
+        with profiler.stage('generate_routes'):
+            routes_df = generate_routes()
+    
+    print(f"\n✓ Tablas maestras generadas: {len(vehicles_df) + len(drivers_df) + len(routes_df):,} registros")
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # PASO 4: Generación de Tablas Transaccionales
+    # ─────────────────────────────────────────────────────────────────────────
+    print("\n📊 PASO 4: Generando tablas transaccionales...")
+    print("─" * 80)
+    
+    with profiler.stage('generate_trips'):
+        trips_df = generate_trips(vehicles_df, drivers_df, routes_df)
+    if args.generate_workers > 1:
+        trips_input, vehicles_input, routes_input = trips_df, vehicles_df, routes_df
+        if store is not None:
+            # Los workers abren trips y las maestras desde el almacén en lugar de recibirlos por pickle
+            trips_input = store.write_table('trips', trips_df)
+            vehicles_input = store.table('vehicles')
+            routes_input = store.table('routes')
+        with profiler.stage('generate_dependents'):
+            dependents = generate_tables_parallel(
+                [('deliveries', (trips_input, routes_input)), ('maintenance', (trips_input, vehicles_input, routes_input))],
+                args.generate_workers, store, profiler
+            )
+        deliveries_df, maintenance_df = dependents['deliveries'], dependents['maintenance']
+    else:
+        with profiler.stage('generate_deliveries'):
+            deliveries_df = generate_deliveries(trips_df, routes_df)
+        with profiler.stage('generate_maintenance'):
+            maintenance_df = generate_maintenance(trips_df, vehicles_df, routes_df)
+        
+        if store is not None:
+            with profiler.stage('write_column_store'):
+                for table_name, df in (('vehicles', vehicles_df), ('drivers', drivers_df),
+                                       ('routes', routes_df), ('trips', trips_df),
+                                       ('deliveries', deliveries_df), ('maintenance', maintenance_df)):
+                    store.write_table(table_name, df)
+            print(f"\n💽 Tablas escritas en el almacén columnar: {store.directory}/")
+    
+    total_transactional = len(trips_df) + len(deliveries_df) + len(maintenance_df)
+    print(f"\n✓ Tablas transaccionales generadas: {total_transactional:,} registros")
+    
+    if args.shard:
+        with profiler.stage('write_shard_manifest'):
+            write_shard_manifest(store, SHARD_INDEX, SHARD_COUNT, STREAMS.seed, SCALE_FACTOR, shard_trip_ids,
+                                 WORKLOAD.spec)
+        print(f"🧩 Shard {SHARD_INDEX}/{SHARD_COUNT} con manifiesto en {store.directory}/ "
+              f"(fusionar con --merge-shards {args.shard_dir})")
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # PASO 4.1: Agregados de KPIs (opcional, sobre los datos en memoria)
+    # ─────────────────────────────────────────────────────────────────────────
+    if (args.summaries or args.conformance) and isinstance(deliveries_df, StoredTable):
+        deliveries_df = deliveries_df.to_frame()
+    if args.conformance and isinstance(maintenance_df, StoredTable):
+        maintenance_df = maintenance_df.to_frame()
+    
+    summaries = None
+    if args.summaries:
+        print("\n📈 PASO 4.1: Calculando agregados diarios de KPIs...")
+        with profiler.stage('build_summaries'):
+            summaries = build_summaries(trips_df, vehicles_df, routes_df, deliveries_df,
+                                        first_trip_id=TRIP_ID_OFFSET + 1)
+        for table_name, df in summaries.items():
+            print(f"   ✓ {table_name}: {len(df):,} registros")
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # PASO 4.2: Conformidad estadística (opcional, sobre los datos en memoria)
+    # ─────────────────────────────────────────────────────────────────────────
+    if args.conformance:
+        print("\n📐 PASO 4.2: Verificando conformidad de distribuciones...")
+        with profiler.stage('check_conformance'):
+            conformance = check_conformance(
+                trips_df, deliveries_df, vehicles_df, routes_df,
+                samplers={
+                    'hourly': HOURLY_SAMPLER,
+                    'trip_status': TRIP_STATUS_SAMPLER,
+                    'deliveries_per_trip': DELIVERIES_PER_TRIP_SAMPLER,
+                    'delivery_status': DELIVERY_STATUS_SAMPLER,
+                    'signature': SIGNATURE_SAMPLER
+                },
+                km_per_liter={vtype: specs['km_per_liter'] for vtype, specs in VEHICLE_TYPES.items()},
+                first_trip_id=TRIP_ID_OFFSET + 1
+            )
+        print_conformance_report(conformance, args.conformance_alpha)
+        
+        with profiler.stage('check_schedule'):
+            schedule = check_schedule(trips_df, maintenance_df, START_DATE, END_DATE, routes_df)
+        print()
+        print_schedule_report(schedule, len(trips_df))
+    
+    tables = [
+        ('vehicles', vehicles_df),
+        ('drivers', drivers_df),
+        ('routes', routes_df),
+        ('trips', trips_df),
+        ('deliveries', deliveries_df),
+        ('maintenance', maintenance_df)
+    ]
+    total_records = sum(len(df) for _, df in tables)
+    validation_success = None
+    
+    if store is not None:
+        # La carga lee lotes del almacén: los DataFrames completos se liberan y
+        # la memoria de cada etapa de carga se reduce a un lote
+        tables = [(table_name, store.table(table_name)) for table_name, _ in tables]
+        del vehicles_df, drivers_df, routes_df, trips_df, deliveries_df, maintenance_df
+    
+    if use_database:
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 5: Carga a Base de Datos
+        # ─────────────────────────────────────────────────────────────────────
+        print("\n💾 PASO 5: Cargando datos a PostgreSQL...")
+        print("─" * 80)
+        
+        if args.staging:
+            # Carga, validación (PASO 6) e intercambio atómico en un solo paso
+            with profiler.stage('load_staging'):
+                validation_success = load_via_staging(
+                    tables, summaries,
+                    validate=lambda schema: run_validation(args, schema=schema)
+                )
+            if not validation_success:
+                profiler.write_summary()
+                sys.exit(1)
+        else:
+            for table_name, df in tables:
+                with profiler.stage(f'load_{table_name}'):
+                    if args.partitioned and table_name in PARTITION_KEYS:
+                        load_partitioned_table(df, table_name, workers=args.load_workers)
+                    else:
+                        load_data_to_table(df, table_name, batch_size=args.batch_size,
+                                           commit_every=args.commit_every,
+                                           adaptive=not args.fixed_batch, resume=args.resume)
+            
+            if summaries is not None:
+                with profiler.stage('load_summaries'):
+                    load_summary_tables(summaries)
+        
+        print(f"\n✓ Total de registros cargados: {total_records:,}")
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 5.1: Optimización Post-Carga (opcional)
+        # ─────────────────────────────────────────────────────────────────────
+        if args.optimize or args.cluster:
+            print("\n⚙️  PASO 5.1: Optimización post-carga...")
+            print("─" * 80)
+            
+            with profiler.stage('optimize_database'):
+                optimize_database(cluster=args.cluster)
+        
+        # ─────────────────────────────────────────────────────────────────────
+        # PASO 6: Validación de Datos
+        # ─────────────────────────────────────────────────────────────────────
+        if not args.staging:
+            print("\n✅ PASO 6: Validando consistencia y coherencia de datos...")
+            print("─" * 80)
+            
+            with profiler.stage('validate_data'):
+                validation_success = run_validation(args)
+    
+    profiler.write_summary()
+    
+    # ─────────────────────────────────────────────────────────────────────────
+    # RESUMEN FINAL
+    # ─────────────────────────────────────────────────────────────────────────
+    print("\n" + "═" * 80)
+    print("  RESUMEN FINAL")
+    print("═" * 80)
+    
+    summary_data = [
+        ["Tabla", "Registros"],
+        ["─" * 20, "─" * 15]
+    ]
+    summary_data += [[table_name, f"{len(df):,}"] for table_name, df in tables]
+    summary_data += [
         ["─" * 20, "─" * 15],
         ["TOTAL", f"{total_records:,}"]
     ]
@@ -1664,7 +4064,9 @@ def main():
     print(tabulate(summary_data, headers="firstrow", tablefmt="simple"))
     
     print("\n" + "═" * 80)
-    if validation_success:
+    if validation_success is None:
+        print("  ✅ GENERACIÓN COMPLETADA (sin carga a PostgreSQL)")
+    elif validation_success:
         print("  ✅ PROCESO COMPLETADO EXITOSAMENTE")
         print("  Todos los datos han sido generados, cargados y validados correctamente")
     else:
@@ -0,0 +1,367 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Índice de Intervalos de Viajes por Vehículo y Conductor
+═══════════════════════════════════════════════════════════════════════════════
+Cada viaje es un intervalo [departure_datetime, arrival_datetime) de su
+vehículo (o conductor). El índice ordena una sola vez los viajes por
+(clave, salida) en O(n log n) y responde con búsquedas binarias:
+
+    at(t)                    viajes en ruta en el instante t
+    overlapping(inicio, fin) viajes que se solapan con la ventana [inicio, fin)
+    active_keys(t)           vehículos / conductores en ruta en t
+    busy_hours(inicio, fin)  horas de viajes terminados por clave dentro de la ventana
+    span()                   viajes, primera y última salida por clave
+    self_overlaps()          viajes que empiezan antes de que termine otro
+                             viaje de la misma clave (doble asignación)
+
+Búsquedas en O(log n) por clave: las salidas están ordenadas dentro de cada
+clave y, para el extremo final, se guarda el máximo acumulado de las
+llegadas (no decreciente), de modo que los candidatos de una ventana son un
+rango contiguo [lo, hi) que luego se filtra. Para buscar todas las claves
+a la vez con un solo searchsorted, los tiempos se reemplazan por su rango
+entre los valores distintos y se combinan con la posición de la clave:
+clave × (valores + 1) + rango, que es creciente en todo el arreglo.
+
+Viajes sin llegada:
+- in_progress más reciente de su clave: intervalo abierto (sigue en ruta)
+- in_progress anterior a otro viaje de la misma clave: el vehículo (o
+  conductor) ya volvió a salir, así que termina en salida +
+  estimated_duration_hours de su ruta, o en la siguiente salida de la
+  clave si no se pasan las rutas
+- cancelled sin llegada: no salió; cuenta en span() pero nunca está en ruta
+
+Uso:
+    vehicles = IntervalIndex.from_trips(trips_df, by='vehicle_id')
+    vehicles.active_keys('2024-06-01 08:00')
+    IntervalIndex.from_trips(trips_df, by='driver_id').busy_hours('2024-06-01', '2024-07-01')
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+from fleetlogix_catalog import RouteTable
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+# Llegada de un intervalo abierto (viaje en curso), en nanosegundos
+OPEN_END = np.iinfo(np.int64).max
+
+# Límites de una ventana sin inicio o sin fin
+_UNBOUNDED_START = np.iinfo(np.int64).min
+_UNBOUNDED_END = np.iinfo(np.int64).max
+
+NANOSECONDS_PER_HOUR = 3600 * 10**9
+
+
+def _to_ns(values):
+    """Fechas (escalar, Series o array) como enteros int64 en nanosegundos; NaT → mínimo int64"""
+    return np.asarray(pd.to_datetime(values), dtype='datetime64[ns]').view(np.int64)
+
+
+def _bound(value, default):
+    """Extremo de una ventana en nanosegundos (None = sin límite)"""
+    return default if value is None else int(_to_ns(pd.Timestamp(value)))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: ÍNDICE DE INTERVALOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class IntervalIndex:
+    """
+    Intervalos de viaje agrupados por una clave (vehicle_id o driver_id)
+
+    Atributos:
+        by (str): Nombre de la clave
+        key_values (numpy.array): Claves distintas, ordenadas
+        offsets (numpy.array): Filas [offsets[g], offsets[g+1]) de la clave g
+    """
+
+    def __init__(self, keys, starts, ends, ids, by='key'):
+        """
+        Args:
+            keys (array-like): Clave de cada viaje
+            starts (array-like): Salida en nanosegundos (int64)
+            ends (array-like): Llegada en nanosegundos; OPEN_END si sigue en
+                               ruta, <= salida si nunca estuvo en ruta
+            ids (array-like): trip_id de cada viaje
+            by (str): Nombre de la clave (columna de los resultados)
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+
+        order = np.lexsort((starts, keys))
+        self.by = by
+        self.keys = keys[order]
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+
+        self.key_values, first = np.unique(self.keys, return_index=True)
+        self.offsets = np.append(first, len(self.keys)).astype(np.int64)
+        groups = np.repeat(np.arange(len(self.key_values), dtype=np.int64), np.diff(self.offsets))
+
+        # Salidas: ya ordenadas dentro de cada clave
+        self._start_values = np.unique(self.starts)
+        self._start_keys = groups * (len(self._start_values) + 1) + np.searchsorted(self._start_values, self.starts)
+
+        # Llegadas: máximo acumulado por clave. Sumar la posición de la clave
+        # reinicia el acumulado en cada grupo con un solo maximum.accumulate
+        self._end_values = np.unique(self.ends)
+        end_stride = len(self._end_values) + 1
+        self._max_end_keys = np.maximum.accumulate(groups * end_stride + np.searchsorted(self._end_values, self.ends))
+
+    @classmethod
+    def from_trips(cls, trips_df, by='vehicle_id', first_trip_id=1, routes_df=None):
+        """
+        Construye el índice desde el DataFrame de viajes
+
+        Args:
+            trips_df (pd.DataFrame): Viajes (vehicle_id, driver_id, route_id,
+                                     departure_datetime, arrival_datetime, status)
+            by (str): Columna clave ('vehicle_id' o 'driver_id')
+            first_trip_id (int): trip_id de la primera fila (TRIP_ID_OFFSET + 1 en shards)
+            routes_df (pd.DataFrame): Rutas (estimated_duration_hours) para acotar
+                                      los in_progress que no son el último viaje
+                                      de su clave; sin rutas se acotan en la
+                                      siguiente salida de la clave
+
+        Returns:
+            IntervalIndex: Índice listo para consultas
+        """
+        keys = trips_df[by].to_numpy()
+        starts = _to_ns(trips_df['departure_datetime'])
+        arrival = pd.to_datetime(trips_df['arrival_datetime'])
+        ends = _to_ns(arrival)
+
+        missing = arrival.isna().to_numpy()
+        if 'status' in trips_df:
+            in_progress = (trips_df['status'] == 'in_progress').to_numpy()
+        else:
+            in_progress = missing
+        ends = np.where(missing, np.where(in_progress, OPEN_END, starts), ends)
+
+        # Solo el último viaje de cada clave puede seguir en ruta: un
+        # in_progress anterior quedaría "en ruta" para siempre
+        order = np.lexsort((starts, keys))
+        has_next = np.zeros(len(keys), dtype=bool)
+        has_next[order[:-1]] = keys[order[1:]] == keys[order[:-1]]
+        stale = (ends == OPEN_END) & has_next
+        if stale.any():
+            if routes_df is not None:
+                route_table = RouteTable(routes_df)
+                hours = route_table.estimated_duration_hours[trips_df['route_id'].to_numpy()[stale]]
+                ends[stale] = starts[stale] + (hours * NANOSECONDS_PER_HOUR).astype(np.int64)
+            else:
+                next_start = np.empty_like(starts)
+                next_start[order[:-1]] = starts[order[1:]]
+                ends[stale] = next_start[stale]
+
+        ids = np.arange(first_trip_id, first_trip_id + len(starts), dtype=np.int64)
+        return cls(keys, starts, ends, ids, by=by)
+
+    def __len__(self):
+        return len(self.keys)
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Búsqueda de candidatos
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _groups(self, keys):
+        """Posición de cada clave pedida (None = todas); las ausentes se descartan"""
+        if keys is None:
+            return np.arange(len(self.key_values), dtype=np.int64)
+        keys = np.atleast_1d(np.asarray(keys, dtype=np.int64))
+        positions = np.searchsorted(self.key_values, keys)
+        found = positions < len(self.key_values)
+        found[found] = self.key_values[positions[found]] == keys[found]
+        return positions[found]
+
+    def _window_rows(self, groups, after, before, include_before):
+        """
+        Filas de `groups` con salida <= before (o < before) y llegada > after
+
+        Dos searchsorted por clave (sobre todas las claves a la vez) delimitan
+        el rango [lo, hi); el filtro final descarta los intervalos de ese rango
+        que terminan antes de `after` o que nunca estuvieron en ruta.
+        """
+        side = 'right' if include_before else 'left'
+        start_rank = np.searchsorted(self._start_values, before, side=side)
+        hi = np.searchsorted(self._start_keys, groups * (len(self._start_values) + 1) + start_rank)
+
+        end_rank = np.searchsorted(self._end_values, after, side='right')
+        lo = np.searchsorted(self._max_end_keys, groups * (len(self._end_values) + 1) + end_rank)
+
+        lengths = np.maximum(hi - lo, 0)
+        rows = np.repeat(lo - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        keep = (self.ends[rows] > after) & (self.ends[rows] > self.starts[rows])
+        return rows[keep]
+
+    def _frame(self, rows):
+        """Viajes de las filas indicadas (llegada NaT si sigue en ruta)"""
+        ends = self.ends[rows]
+        return pd.DataFrame({
+            self.by: self.keys[rows],
+            'trip_id': self.ids[rows],
+            'departure_datetime': self.starts[rows].view('datetime64[ns]'),
+            'arrival_datetime': np.where(ends == OPEN_END, np.iinfo(np.int64).min, ends).view('datetime64[ns]'),
+        })
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Consultas
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def at(self, when, keys=None):
+        """
+        Viajes en ruta en el instante `when` (salida <= when < llegada)
+
+        Returns:
+            pd.DataFrame: Columnas <by>, trip_id, departure_datetime, arrival_datetime
+        """
+        t = _bound(when, None)
+        return self._frame(self._window_rows(self._groups(keys), t, t, include_before=True))
+
+    def overlapping(self, start=None, end=None, keys=None):
+        """
+        Viajes que se solapan con la ventana [start, end) (None = sin límite)
+
+        Returns:
+            pd.DataFrame: Columnas <by>, trip_id, departure_datetime, arrival_datetime
+        """
+        after = _bound(start, _UNBOUNDED_START)
+        before = _bound(end, _UNBOUNDED_END)
+        return self._frame(self._window_rows(self._groups(keys), after, before, include_before=False))
+
+    def active_keys(self, when):
+        """
+        Claves (vehículos o conductores) con al menos un viaje en ruta en `when`
+        """
+        return np.unique(self.at(when)[self.by].to_numpy())
+
+    def busy_hours(self, start=None, end=None, keys=None):
+        """
+        Horas en ruta por clave dentro de [start, end), recortando los viajes
+        que cruzan los bordes de la ventana
+
+        El viaje en curso más reciente de cada clave no suma horas: su
+        llegada es desconocida. Los in_progress anteriores suman su duración
+        acotada (ver from_trips). Los viajes solapados de una misma clave
+        suman cada uno su duración.
+
+        Returns:
+            pd.Series: Horas por clave (solo claves con viajes en la ventana)
+        """
+        after = _bound(start, _UNBOUNDED_START)
+        before = _bound(end, _UNBOUNDED_END)
+        rows = self._window_rows(self._groups(keys), after, before, include_before=False)
+        rows = rows[self.ends[rows] != OPEN_END]
+
+        seconds = np.minimum(self.ends[rows], before) - np.maximum(self.starts[rows], after)
+        hours = pd.Series(seconds / NANOSECONDS_PER_HOUR, index=pd.Index(self.keys[rows], name=self.by))
+        return hours.groupby(level=0).sum().rename('hours')
+
+    def span(self):
+        """
+        Viajes, primera y última salida por clave (O(claves), sin recorrer viajes)
+
+        Returns:
+            pd.DataFrame: Índice <by>; columnas trips, first_departure, last_departure
+        """
+        return pd.DataFrame({
+            'trips': np.diff(self.offsets),
+            'first_departure': self.starts[self.offsets[:-1]].view('datetime64[ns]'),
+            'last_departure': self.starts[self.offsets[1:] - 1].view('datetime64[ns]'),
+        }, index=pd.Index(self.key_values, name=self.by))
+
+    def self_overlaps(self):
+        """
+        Viajes que salen antes de que termine un viaje previo de la misma clave
+
+        Un viaje abierto nunca es previo (es el último de su clave); los
+        in_progress anteriores cuentan con su llegada acotada (ver from_trips).
+
+        Returns:
+            pd.Series: Viajes solapados por clave (solo claves con solapamientos)
+        """
+        closed_ends = np.where(self.ends == OPEN_END, self.starts, self.ends)
+        max_closed = pd.Series(closed_ends).groupby(self.keys).cummax().to_numpy()
+
+        previous_end = np.empty_like(max_closed)
+        previous_end[0:1] = _UNBOUNDED_START
+        previous_end[1:] = max_closed[:-1]
+        previous_end[self.offsets[:-1]] = _UNBOUNDED_START
+
+        overlapped = (self.starts < previous_end) & (self.ends > self.starts)
+        counts = pd.Series(self.keys[overlapped]).value_counts().sort_index()
+        counts.index.name = self.by
+        return counts.rename('overlapping_trips')
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: CHEQUEO DE AGENDA SOBRE LOS DATOS GENERADOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def check_schedule(trips_df, maintenance_df, start_date, end_date, routes_df=None):
+    """
+    Chequeos de agenda en memoria con los índices de vehículo y conductor
+
+    - Mantenimientos fuera del historial de viajes de su vehículo (error:
+      generate_maintenance los fecha entre la primera y la última salida)
+    - Vehículos y conductores con viajes solapados (informativo: el
+      generador asigna vehículo y conductor de forma independiente)
+
+    Args:
+        trips_df, maintenance_df (pd.DataFrame): Datos generados
+        start_date, end_date (datetime): Período operativo (vehículos sin viajes)
+        routes_df (pd.DataFrame): Rutas para acotar los in_progress (ver IntervalIndex.from_trips)
+
+    Returns:
+        dict: {'maintenance_outside_history', 'vehicle_overlaps', 'driver_overlaps'}
+    """
+    vehicles = IntervalIndex.from_trips(trips_df, by='vehicle_id', routes_df=routes_df)
+    drivers = IntervalIndex.from_trips(trips_df, by='driver_id', routes_df=routes_df)
+
+    span = vehicles.span()
+    vehicle_ids = maintenance_df['vehicle_id'].to_numpy()
+    positions = span.index.get_indexer(vehicle_ids)
+    has_trips = positions >= 0
+
+    first = np.full(len(vehicle_ids), np.datetime64(pd.Timestamp(start_date).normalize(), 'ns'))
+    last = np.full(len(vehicle_ids), np.datetime64(pd.Timestamp(end_date).normalize(), 'ns'))
+    first[has_trips] = span['first_departure'].to_numpy().astype('datetime64[D]')[positions[has_trips]]
+    last[has_trips] = span['last_departure'].to_numpy().astype('datetime64[D]')[positions[has_trips]]
+
+    dates = np.asarray(pd.to_datetime(maintenance_df['maintenance_date']), dtype='datetime64[ns]')
+    outside = int(((dates < first) | (dates > last)).sum())
+
+    return {
+        'maintenance_outside_history': outside,
+        'vehicle_overlaps': vehicles.self_overlaps(),
+        'driver_overlaps': drivers.self_overlaps(),
+    }
+
+
+def print_schedule_report(report, num_trips):
+    """
+    Imprime el chequeo de agenda
+
+    Returns:
+        bool: True si no hay mantenimientos fuera del historial de su vehículo
+    """
+    rows = [
+        ['Mantenimientos fuera del historial del vehículo', f"{report['maintenance_outside_history']:,}",
+         '✓' if report['maintenance_outside_history'] == 0 else '✗'],
+    ]
+    for label, overlaps in (('vehículo', report['vehicle_overlaps']), ('conductor', report['driver_overlaps'])):
+        total = int(overlaps.sum())
+        rows.append([f"Viajes solapados con otro del mismo {label}",
+                     f"{total:,} ({total / max(num_trips, 1) * 100:.1f}%) en {len(overlaps):,} claves", 'ℹ️'])
+
+    print(tabulate(rows, headers=['Chequeo de agenda', 'Resultado', ''], tablefmt='simple'))
+    return report['maintenance_outside_history'] == 0
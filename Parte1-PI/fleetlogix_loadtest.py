@@ -0,0 +1,463 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Prueba de Carga OLTP Concurrente contra PostgreSQL
+═══════════════════════════════════════════════════════════════════════════════
+Reproduce la actividad generada como transacciones operativas reales, una
+secuencia por viaje (en orden de salida):
+
+    1. open_trip               INSERT del viaje en estado in_progress
+    2. insert_deliveries       INSERT de sus entregas en estado pending
+    3. update_delivery_status  UPDATE de cada entrega a su estado final
+    4. close_trip              UPDATE del viaje con llegada, combustible y estado
+
+N workers concurrentes (un thread y una conexión cada uno) ejecutan los
+viajes con una tasa objetivo global de transacciones por segundo. Por tipo
+de transacción se reportan latencias p50/p95/p99, throughput, errores,
+deadlocks y reintentos.
+
+Requisitos: PostgreSQL con el schema creado y las tablas maestras cargadas
+(python fleetlogix_generator.py --scale <misma escala>). Los viajes
+insertados por la prueba se eliminan al terminar salvo --keep-data.
+
+Uso:
+    python fleetlogix_loadtest.py --workers 8 --trips 2000
+    python fleetlogix_loadtest.py --workers 16 --rate 500 --output loadtest.json
+    python fleetlogix_loadtest.py --workers 16 --workload hotset:0.02:0.9   # contención en claves calientes
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import psycopg2
+from tabulate import tabulate
+
+import fleetlogix_generator as flg
+from fleetlogix_workload import parse_workload
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_SCALE = 0.01
+DEFAULT_WORKERS = 8
+DEFAULT_TRIPS = 1000
+
+# Reintentos por transacción ante deadlock o fallo de serialización
+MAX_RETRIES = 3
+
+# SQLSTATE de errores reintentables
+DEADLOCK_DETECTED = '40P01'
+SERIALIZATION_FAILURE = '40001'
+
+TRANSACTION_TYPES = ['open_trip', 'insert_deliveries', 'update_delivery_status', 'close_trip']
+
+DELIVERY_COLUMNS = ['trip_id', 'tracking_number', 'customer_name', 'delivery_address',
+                    'package_weight_kg', 'scheduled_datetime', 'delivery_status', 'recipient_signature']
+
+OPEN_TRIP_SQL = """
+    INSERT INTO trips (vehicle_id, driver_id, route_id, departure_datetime, status)
+    VALUES (%s, %s, %s, %s, 'in_progress')
+    RETURNING trip_id
+"""
+
+INSERT_DELIVERIES_SQL = f"""
+    INSERT INTO deliveries ({', '.join(DELIVERY_COLUMNS)})
+    VALUES ({', '.join(['%s'] * len(DELIVERY_COLUMNS))})
+"""
+
+UPDATE_DELIVERY_SQL = """
+    UPDATE deliveries
+    SET delivery_status = %s, delivered_datetime = %s, recipient_signature = %s
+    WHERE tracking_number = %s
+"""
+
+CLOSE_TRIP_SQL = """
+    UPDATE trips
+    SET arrival_datetime = %s, fuel_consumed_liters = %s, total_weight_kg = %s, status = %s
+    WHERE trip_id = %s
+"""
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: ESCENARIOS A PARTIR DE LOS DATOS GENERADOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _records(df):
+    """
+    Filas como dicts de tipos Python (NaN/NaT → None), adaptables por psycopg2
+    """
+    return df.astype(object).where(df.notna(), None).to_dict('records')
+
+
+def build_scenarios(trips_df, deliveries_df, max_trips, run_tag):
+    """
+    Un escenario por viaje, en orden de salida, con sus entregas
+
+    Los tracking_number llevan el sufijo de la ejecución para no chocar con
+    el UNIQUE de los datos ya cargados ni con ejecuciones anteriores.
+
+    Args:
+        trips_df (pd.DataFrame): Viajes generados (trip_id = posición + 1)
+        deliveries_df (pd.DataFrame): Entregas generadas
+        max_trips (int): Viajes a reproducir (None = todos)
+        run_tag (str): Identificador de la ejecución
+
+    Returns:
+        list: Dicts {'trip': fila, 'deliveries': [filas]}
+    """
+    order = np.argsort(trips_df['departure_datetime'].to_numpy(), kind='stable')[:max_trips]
+    selected = trips_df.iloc[order]
+    groups = deliveries_df.groupby('trip_id').indices
+
+    scenarios = []
+    for position, trip in zip(order, _records(selected)):
+        rows = groups.get(position + 1, [])
+        deliveries = _records(deliveries_df.iloc[rows])
+        for delivery in deliveries:
+            delivery['tracking_number'] = f"{delivery['tracking_number']}-{run_tag}"
+        scenarios.append({'trip': trip, 'deliveries': deliveries})
+
+    return scenarios
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: CONTROL DE TASA Y MÉTRICAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class RateLimiter:
+    """
+    Reparte turnos de transacción a una tasa global fija entre todos los workers
+    """
+
+    def __init__(self, rate):
+        """
+        Args:
+            rate (float): Transacciones por segundo (0 = sin límite)
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_slot = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            slot = max(self.next_slot, time.perf_counter())
+            self.next_slot = slot + self.interval
+        delay = slot - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class TransactionStats:
+    """
+    Latencias y contadores por tipo de transacción (uno por worker, se combinan al final)
+    """
+
+    def __init__(self):
+        self.latencies = {name: [] for name in TRANSACTION_TYPES}
+        self.errors = dict.fromkeys(TRANSACTION_TYPES, 0)
+        self.deadlocks = dict.fromkeys(TRANSACTION_TYPES, 0)
+        self.retries = dict.fromkeys(TRANSACTION_TYPES, 0)
+
+    def merge(self, other):
+        for name in TRANSACTION_TYPES:
+            self.latencies[name].extend(other.latencies[name])
+            self.errors[name] += other.errors[name]
+            self.deadlocks[name] += other.deadlocks[name]
+            self.retries[name] += other.retries[name]
+
+    def report(self, elapsed):
+        """
+        Resumen por tipo: throughput, percentiles de latencia (ms) y fallas
+        """
+        rows = []
+        for name in TRANSACTION_TYPES:
+            latencies = np.array(self.latencies[name]) * 1000
+            p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (0.0, 0.0, 0.0)
+            rows.append({
+                'transaction': name,
+                'count': len(latencies),
+                'tps': round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+                'p50_ms': round(float(p50), 2),
+                'p95_ms': round(float(p95), 2),
+                'p99_ms': round(float(p99), 2),
+                'max_ms': round(float(latencies.max()), 2) if len(latencies) else 0.0,
+                'errors': self.errors[name],
+                'deadlocks': self.deadlocks[name],
+                'retries': self.retries[name],
+            })
+        return rows
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: WORKERS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def run_transaction(conn, stats, limiter, name, work):
+    """
+    Ejecuta una transacción con reintentos ante deadlock/serialización
+
+    Args:
+        conn: Conexión del worker
+        stats (TransactionStats): Métricas del worker
+        limiter (RateLimiter): Control de tasa global
+        name (str): Tipo de transacción
+        work (callable): Recibe el cursor y ejecuta las sentencias
+
+    Returns:
+        tuple: (éxito, valor retornado por work)
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        limiter.wait()
+        start = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                result = work(cursor)
+            conn.commit()
+            stats.latencies[name].append(time.perf_counter() - start)
+            return True, result
+        except psycopg2.Error as e:
+            conn.rollback()
+            if e.pgcode == DEADLOCK_DETECTED:
+                stats.deadlocks[name] += 1
+            if e.pgcode in (DEADLOCK_DETECTED, SERIALIZATION_FAILURE) and attempt < MAX_RETRIES:
+                stats.retries[name] += 1
+                continue
+            stats.errors[name] += 1
+            return False, None
+
+
+def run_scenario(conn, stats, limiter, scenario, created_trips):
+    """
+    Abre el viaje, inserta sus entregas, actualiza sus estados y lo cierra
+
+    Si una transacción falla se abandona el resto del escenario (las
+    siguientes dependen del viaje o de las entregas insertadas).
+    """
+    trip = scenario['trip']
+
+    def open_trip(cursor):
+        cursor.execute(OPEN_TRIP_SQL, (trip['vehicle_id'], trip['driver_id'],
+                                       trip['route_id'], trip['departure_datetime']))
+        return cursor.fetchone()[0]
+
+    ok, trip_id = run_transaction(conn, stats, limiter, 'open_trip', open_trip)
+    if not ok:
+        return
+    created_trips.append(trip_id)
+
+    deliveries = scenario['deliveries']
+    if deliveries:
+        rows = [tuple(trip_id if column == 'trip_id' else
+                      'pending' if column == 'delivery_status' else
+                      False if column == 'recipient_signature' else delivery[column]
+                      for column in DELIVERY_COLUMNS)
+                for delivery in deliveries]
+        ok, _ = run_transaction(conn, stats, limiter, 'insert_deliveries',
+                                lambda cursor: cursor.executemany(INSERT_DELIVERIES_SQL, rows))
+        if not ok:
+            return
+
+    for delivery in deliveries:
+        if delivery['delivery_status'] == 'pending':
+            continue
+        params = (delivery['delivery_status'], delivery['delivered_datetime'],
+                  delivery['recipient_signature'], delivery['tracking_number'])
+        run_transaction(conn, stats, limiter, 'update_delivery_status',
+                        lambda cursor, params=params: cursor.execute(UPDATE_DELIVERY_SQL, params))
+
+    # Los viajes que siguen en curso en los datos generados quedan abiertos
+    if trip['status'] != 'in_progress':
+        params = (trip['arrival_datetime'], trip['fuel_consumed_liters'],
+                  trip['total_weight_kg'], trip['status'], trip_id)
+        run_transaction(conn, stats, limiter, 'close_trip',
+                        lambda cursor: cursor.execute(CLOSE_TRIP_SQL, params))
+
+
+def worker(conn, scenarios, limiter, stats, created_trips, deadline):
+    """
+    Consume escenarios de la cola hasta vaciarla o alcanzar la duración máxima
+    """
+    while deadline is None or time.perf_counter() < deadline:
+        try:
+            scenario = scenarios.get_nowait()
+        except queue.Empty:
+            return
+        run_scenario(conn, stats, limiter, scenario, created_trips)
+
+
+def run_load_test(scenarios, workers, rate, duration=None):
+    """
+    Ejecuta los escenarios con N workers concurrentes
+
+    Args:
+        scenarios (list): Escenarios de build_scenarios()
+        workers (int): Threads concurrentes (una conexión cada uno)
+        rate (float): Transacciones por segundo objetivo (0 = sin límite)
+        duration (float): Segundos máximos de ejecución (None = todos los escenarios)
+
+    Returns:
+        tuple: (TransactionStats combinadas, segundos, ids de viajes creados)
+    """
+    pending = queue.Queue()
+    for scenario in scenarios:
+        pending.put(scenario)
+
+    # Las conexiones se abren en el thread principal: get_connection() termina
+    # el proceso si la base de datos no está disponible
+    connections = [flg.get_connection() for _ in range(workers)]
+    limiter = RateLimiter(rate)
+    worker_stats = [TransactionStats() for _ in range(workers)]
+    created_trips = []
+
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+    threads = [
+        threading.Thread(target=worker, args=(conn, pending, limiter, stats, created_trips, deadline))
+        for conn, stats in zip(connections, worker_stats)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    for conn in connections:
+        conn.close()
+
+    stats = TransactionStats()
+    for partial in worker_stats:
+        stats.merge(partial)
+    return stats, elapsed, created_trips
+
+
+def cleanup(trip_ids):
+    """
+    Elimina los viajes creados por la prueba (las entregas caen por ON DELETE CASCADE)
+    """
+    conn = flg.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("DELETE FROM trips WHERE trip_id = ANY(%s)", (list(trip_ids),))
+            deleted = cursor.rowcount
+        conn.commit()
+        return deleted
+    finally:
+        conn.close()
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 5: PUNTO DE ENTRADA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def verify_master_data(vehicles, drivers, routes):
+    """
+    Comprueba que las tablas maestras cubren los ids que usan los escenarios
+    """
+    conn = flg.get_connection()
+    try:
+        with conn.cursor() as cursor:
+            missing = []
+            for table, key, needed in [('vehicles', 'vehicle_id', vehicles),
+                                       ('drivers', 'driver_id', drivers),
+                                       ('routes', 'route_id', routes)]:
+                cursor.execute(f"SELECT COALESCE(MAX({key}), 0) FROM {table}")
+                available = cursor.fetchone()[0]
+                if available < needed:
+                    missing.append(f"{table}: {available} de {needed}")
+        return missing
+    finally:
+        conn.close()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Prueba de carga OLTP FleetLogix contra PostgreSQL")
+    parser.add_argument('--scale', type=float, default=DEFAULT_SCALE,
+                        help="Factor de escala de los datos a reproducir (default: 0.01)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help="Workers concurrentes (default: 8)")
+    parser.add_argument('--rate', type=float, default=0,
+                        help="Transacciones por segundo objetivo (default: 0 = sin límite)")
+    parser.add_argument('--trips', type=int, default=DEFAULT_TRIPS,
+                        help="Viajes a reproducir (default: 1000)")
+    parser.add_argument('--duration', type=float,
+                        help="Segundos máximos de ejecución")
+    parser.add_argument('--keep-data', action='store_true',
+                        help="No eliminar los viajes y entregas insertados")
+    parser.add_argument('--workload', type=parse_workload, default=flg.WORKLOAD, metavar='PERFIL',
+                        help="Perfil de carga de los viajes (ver fleetlogix_workload; default: uniform)")
+    parser.add_argument('--output', help="Guardar el reporte en JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("="*70)
+    print("PRUEBA DE CARGA OLTP - FLEETLOGIX")
+    print("="*70)
+
+    flg.set_scale(args.scale)
+    flg.set_workload(args.workload)
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_df = flg.generate_vehicles()
+        drivers_df = flg.generate_drivers()
+        routes_df = flg.generate_routes()
+        trips_df = flg.generate_trips(vehicles_df, drivers_df, routes_df)
+        deliveries_df = flg.generate_deliveries(trips_df, routes_df)
+
+    missing = verify_master_data(len(vehicles_df), len(drivers_df), len(routes_df))
+    if missing:
+        print("❌ ERROR: Las tablas maestras no cubren los ids de la escala pedida")
+        for line in missing:
+            print(f"   {line}")
+        print(f"   Cargue primero: python fleetlogix_generator.py --scale {args.scale}")
+        return 1
+
+    run_tag = f"LT{int(time.time()):x}"
+    scenarios = build_scenarios(trips_df, deliveries_df, args.trips, run_tag)
+    rate = f"{args.rate:,.0f} tx/s" if args.rate else "sin límite"
+    print(f"📋 {len(scenarios):,} viajes | {args.workers} workers | tasa objetivo: {rate} | "
+          f"perfil: {args.workload.spec}")
+
+    stats, elapsed, created_trips = run_load_test(scenarios, args.workers, args.rate, args.duration)
+    report = stats.report(elapsed)
+    total = sum(row['count'] for row in report)
+
+    print(f"\n✓ {total:,} transacciones en {elapsed:.1f} s ({total / elapsed:,.1f} tx/s)\n")
+    print(tabulate(report, headers='keys', tablefmt='grid'))
+
+    if not args.keep_data and created_trips:
+        deleted = cleanup(created_trips)
+        print(f"\n🧹 {deleted:,} viajes de prueba eliminados (con sus entregas)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'scale': args.scale,
+                'workers': args.workers,
+                'target_rate': args.rate,
+                'workload': args.workload.spec,
+                'trips': len(scenarios),
+                'elapsed_seconds': round(elapsed, 3),
+                'transactions': report,
+            }, f, indent=2)
+        print(f"💾 Reporte guardado en {args.output}")
+
+    return 0 if all(row['errors'] == 0 for row in report) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
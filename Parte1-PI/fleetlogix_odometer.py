@@ -0,0 +1,196 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Odómetro por Vehículo y Mantenimiento por Kilometraje
+═══════════════════════════════════════════════════════════════════════════════
+Calcula el odómetro de cada vehículo después de cada viaje (km iniciales +
+suma acumulada de routes.distance_km en orden de salida) y programa los
+mantenimientos cuando se cruza el intervalo de su tipo:
+
+    cada N km  (ej: cambio de aceite cada 10,000 km)   → disparo 'km'
+    cada D días sin llegar a N km                       → disparo 'days'
+
+lo que ocurra primero; ambos contadores se reinician en cada servicio.
+
+Costo lineal en viajes: un solo ordenamiento por (vehículo, salida), una
+suma acumulada, y luego una búsqueda binaria por servicio emitido, avanzando
+todos los pares (vehículo, tipo) a la vez. El número de iteraciones es el
+máximo de servicios de un par, que no crece con la escala (los viajes por
+vehículo son los mismos a cualquier escala).
+
+Uso:
+    log = OdometerLog(vehicle_ids, departure_seconds, km, initial_km)
+    events = schedule_maintenance(log, intervals, random_state=rng)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+SECONDS_PER_DAY = 86400
+
+TRIGGER_KM = 'km'
+TRIGGER_DAYS = 'days'
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: ODÓMETRO POR VEHÍCULO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class OdometerLog:
+    """
+    Lectura del odómetro de cada vehículo después de cada viaje
+
+    Atributos:
+        key_values (numpy.array): vehicle_id distintos, ordenados
+        offsets (numpy.array): Filas [offsets[g], offsets[g+1]) del vehículo g
+        times (numpy.array): Salida del viaje (segundos), ordenada por vehículo
+        odometer (numpy.array): km del vehículo al terminar cada viaje
+        initial_km (numpy.array): km del vehículo antes de su primer viaje
+    """
+
+    def __init__(self, vehicle_ids, departure_seconds, km, initial_km):
+        """
+        Args:
+            vehicle_ids (array-like): Vehículo de cada viaje
+            departure_seconds (array-like): Salida de cada viaje (segundos, int64)
+            km (array-like): Distancia recorrida en cada viaje
+            initial_km (dict | pd.Series): Odómetro inicial por vehicle_id
+        """
+        vehicle_ids = np.asarray(vehicle_ids, dtype=np.int64)
+        departure_seconds = np.asarray(departure_seconds, dtype=np.int64)
+        order = np.lexsort((departure_seconds, vehicle_ids))
+
+        self.keys = vehicle_ids[order]
+        self.times = departure_seconds[order]
+        self.key_values, first = np.unique(self.keys, return_index=True)
+        self.offsets = np.append(first, len(self.keys)).astype(np.int64)
+        self.groups = np.repeat(np.arange(len(self.key_values), dtype=np.int64), np.diff(self.offsets))
+
+        self.initial_km = pd.Series(initial_km).reindex(self.key_values).fillna(0.0).to_numpy(dtype=np.float64)
+
+        # Suma acumulada global menos lo acumulado antes del primer viaje de cada vehículo
+        km = np.asarray(km, dtype=np.float64)[order]
+        cumulative = np.cumsum(km)
+        before_group = (cumulative - km)[self.offsets[:-1]]
+        self.odometer = cumulative - before_group[self.groups] + self.initial_km[self.groups]
+
+        # Claves compuestas (vehículo, km) y (vehículo, tiempo) crecientes en todo
+        # el arreglo, para buscar en todos los vehículos con un solo searchsorted
+        self._km_stride = float(self.odometer.max(initial=0.0)) + 2.0
+        self._odometer_keys = self.groups * self._km_stride + self.odometer
+        self._time_origin = int(self.times.min(initial=0))
+        self._time_stride = int(self.times.max(initial=0)) - self._time_origin + 1
+        self._time_keys = self.groups * self._time_stride + (self.times - self._time_origin)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def total_km(self):
+        """km recorridos por vehículo en el período (sin el odómetro inicial)"""
+        last = self.odometer[self.offsets[1:] - 1] if len(self) else np.empty(0)
+        return pd.Series(last - self.initial_km, index=pd.Index(self.key_values, name='vehicle_id'))
+
+    def first_row_reaching(self, groups, km):
+        """
+        Primera fila de cada vehículo con odómetro >= km (offsets[g+1] si no llega)
+        """
+        km = np.minimum(km, self._km_stride - 1.0)
+        return np.searchsorted(self._odometer_keys, groups * self._km_stride + km, side='left')
+
+    def reading_before(self, groups, seconds):
+        """
+        Odómetro de cada vehículo en el instante `seconds` (último viaje que salió antes)
+        """
+        relative = np.clip(seconds - self._time_origin, 0, self._time_stride)
+        rows = np.searchsorted(self._time_keys, groups * self._time_stride + relative, side='left') - 1
+        started = rows >= self.offsets[groups]
+        return np.where(started, self.odometer[np.maximum(rows, 0)], self.initial_km[groups])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: PROGRAMACIÓN DE MANTENIMIENTOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def schedule_maintenance(log, intervals, random_state=None):
+    """
+    Servicios de cada tipo y vehículo al cruzar su intervalo de km o de días
+
+    La fase inicial de cada par (vehículo, tipo) es aleatoria: el último
+    servicio previo al período fue entre 0 y un intervalo antes, para que
+    los vehículos no coincidan todos en el mismo kilometraje. No se emiten
+    servicios después de la última salida de cada vehículo.
+
+    Args:
+        log (OdometerLog): Odómetro por vehículo
+        intervals (dict): {tipo: (km, días)}
+        random_state (np.random.Generator): Flujo aleatorio de las fases
+
+    Returns:
+        pd.DataFrame: vehicle_id, maintenance_type, service_seconds,
+                      odometer_km, trigger ('km' | 'days'), ordenado por
+                      vehículo y fecha
+    """
+    rng = random_state if random_state is not None else np.random.default_rng()
+    types = list(intervals)
+    if not len(log):
+        return pd.DataFrame({'vehicle_id': np.empty(0, dtype=np.int64), 'maintenance_type': np.empty(0, dtype=object),
+                             'service_seconds': np.empty(0, dtype=np.int64), 'odometer_km': np.empty(0),
+                             'trigger': np.empty(0, dtype=object)})
+
+    num_vehicles, num_types = len(log.key_values), len(types)
+
+    # Un estado por par (vehículo, tipo)
+    groups = np.repeat(np.arange(num_vehicles, dtype=np.int64), num_types)
+    type_codes = np.tile(np.arange(num_types, dtype=np.int64), num_vehicles)
+    interval_km = np.array([intervals[t][0] for t in types], dtype=np.float64)[type_codes]
+    interval_seconds = np.array([intervals[t][1] for t in types], dtype=np.int64)[type_codes] * SECONDS_PER_DAY
+
+    phase = rng.random((2, len(groups)))
+    last_km = log.initial_km[groups] - phase[0] * interval_km
+    last_time = log.times[log.offsets[groups]] - (phase[1] * interval_seconds).astype(np.int64)
+    history_end = log.times[log.offsets[groups + 1] - 1]
+
+    events = []
+    active = np.arange(len(groups))
+    while len(active):
+        g = groups[active]
+        row = log.first_row_reaching(g, last_km[active] + interval_km[active])
+        reached = row < log.offsets[g + 1]
+        km_time = np.where(reached, log.times[np.minimum(row, len(log) - 1)], np.iinfo(np.int64).max)
+
+        day_due = last_time[active] + interval_seconds[active]
+        by_km = reached & (km_time <= day_due)
+        by_days = ~by_km & (day_due <= history_end[active])
+
+        service_time = np.where(by_km, km_time, day_due)
+        service_km = np.where(by_km, log.odometer[np.minimum(row, len(log) - 1)],
+                              log.reading_before(g, day_due))
+
+        done = by_km | by_days
+        events.append(pd.DataFrame({
+            'group': g[done],
+            'type_code': type_codes[active][done],
+            'service_seconds': service_time[done],
+            'odometer_km': service_km[done],
+            'trigger': np.where(by_km[done], TRIGGER_KM, TRIGGER_DAYS),
+        }))
+
+        last_km[active[done]] = service_km[done]
+        last_time[active[done]] = service_time[done]
+        active = active[done]
+
+    events = pd.concat(events, ignore_index=True).sort_values(
+        ['group', 'service_seconds', 'type_code'], kind='stable', ignore_index=True)
+
+    return pd.DataFrame({
+        'vehicle_id': log.key_values[events['group'].to_numpy(dtype=np.int64)],
+        'maintenance_type': np.asarray(types, dtype=object)[events['type_code'].to_numpy(dtype=np.int64)],
+        'service_seconds': events['service_seconds'].to_numpy(dtype=np.int64),
+        'odometer_km': events['odometer_km'].to_numpy(dtype=np.float64),
+        'trigger': events['trigger'].to_numpy(dtype=object),
+    })
@@ -0,0 +1,265 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Perfilado por Etapa (cProfile + tracemalloc)
+═══════════════════════════════════════════════════════════════════════════════
+Envuelve cada etapa de main() por separado y guarda, por etapa:
+- <etapa>.prof        Estadísticas cProfile (abrir con pstats, snakeviz, etc.)
+- <etapa>.alloc.txt   Top de asignaciones de memoria (tracemalloc)
+
+Y para todas las etapas perfiladas:
+- profile.folded      Pilas "colapsadas" compatibles con flamegraph.pl /
+                      speedscope (una raíz por etapa, valores en microsegundos)
+- summary.txt         Tiempo y memoria pico de cada etapa
+
+Las etapas se pueden filtrar por nombre exacto (ej: generate_deliveries)
+o por tabla (ej: deliveries → generate_deliveries y load_deliveries). Los
+nombres que no coinciden con ninguna etapa ejecutada se informan en el
+resumen. Las etapas de procesos worker se perfilan en el worker
+(StageProfiler.settings) y se incorporan con merge().
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import contextlib
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+
+from tabulate import tabulate
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_PROFILE_DIR = 'profiles'
+TOP_ALLOCATIONS = 25
+
+# Límites para la reconstrucción de pilas desde el grafo de llamadas
+MAX_STACK_DEPTH = 64
+MIN_STACK_MICROSECONDS = 1
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: PILAS COLAPSADAS (FORMATO FLAMEGRAPH)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _frame_label(func):
+    """
+    Etiqueta legible de una función de cProfile: archivo:función
+    """
+    filename, _, name = func
+    if filename == '~':
+        return name.strip('<>').replace(' ', '_')
+    return f"{os.path.basename(filename)}:{name}".replace(';', ',').replace(' ', '_')
+
+
+def folded_stacks(profile, root_label):
+    """
+    Reconstruye pilas colapsadas a partir del grafo llamador→llamado de cProfile
+
+    cProfile no guarda pilas completas, solo aristas con tiempo acumulado.
+    El tiempo de cada función se reparte entre sus llamadores en proporción
+    al tiempo acumulado de cada arista (mismo criterio que flameprof).
+
+    Args:
+        profile (cProfile.Profile): Perfil ya detenido
+        root_label (str): Marco raíz agregado a cada pila (nombre de etapa)
+
+    Returns:
+        Counter: {"raíz;f1;f2": microsegundos propios}
+    """
+    stats = pstats.Stats(profile).stats
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees[caller].append((func, edge[3]))
+
+    stacks = Counter()
+
+    def visit(func, path, labels, budget):
+        _, _, own_time, cumulative, _ = stats[func]
+        ratio = budget / cumulative if cumulative > 0 else 0.0
+
+        own_us = int(own_time * ratio * 1e6)
+        if own_us >= MIN_STACK_MICROSECONDS:
+            stacks[';'.join(labels)] += own_us
+
+        if len(path) >= MAX_STACK_DEPTH:
+            return
+
+        for child, edge_time in callees.get(func, ()):
+            child_budget = edge_time * ratio
+            if child in path or child_budget * 1e6 < MIN_STACK_MICROSECONDS:
+                continue
+            visit(child, path | {child}, labels + [_frame_label(child)], child_budget)
+
+    for func, (_, _, _, cumulative, callers) in stats.items():
+        if not callers:
+            visit(func, {func}, [root_label, _frame_label(func)], cumulative)
+
+    return stacks
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: PERFILADOR POR ETAPAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class StageProfiler:
+    """
+    Perfilador de etapas con cProfile y tracemalloc
+
+    Uso:
+        profiler = StageProfiler('profiles', stages=['generate_deliveries'])
+        with profiler.stage('generate_deliveries'):
+            deliveries_df = generate_deliveries(trips_df, routes_df)
+        profiler.write_summary()
+
+    Con enabled=False, stage() no agrega ningún costo (modo normal).
+    """
+
+    def __init__(self, output_dir=DEFAULT_PROFILE_DIR, stages=None,
+                 top_allocations=TOP_ALLOCATIONS, enabled=True):
+        """
+        Args:
+            output_dir (str): Directorio de salida de los archivos de perfil
+            stages (list): Etapas o tablas a perfilar (None/vacío = todas)
+            top_allocations (int): Líneas del top de asignaciones por etapa
+            enabled (bool): Activar el perfilado
+        """
+        self.output_dir = output_dir
+        self.stages = set(stages or [])
+        self.top_allocations = top_allocations
+        self.enabled = enabled
+        self.results = []
+        self._folded = Counter()
+
+    def is_selected(self, name):
+        """
+        Indica si una etapa debe perfilarse (por nombre exacto o por tabla)
+
+        'deliveries' selecciona 'generate_deliveries' y 'load_deliveries'.
+        """
+        if not self.enabled:
+            return False
+        if not self.stages:
+            return True
+        return name in self.stages or name.split('_', 1)[-1] in self.stages
+
+    def unmatched_stages(self):
+        """
+        Nombres pedidos que no seleccionaron ninguna etapa perfilada
+        """
+        profiled = {r['stage'] for r in self.results}
+        profiled |= {stage.split('_', 1)[-1] for stage in profiled}
+        return sorted(self.stages - profiled)
+
+    @property
+    def settings(self):
+        """
+        Argumentos para crear el perfilador equivalente en un proceso worker
+        """
+        return {'output_dir': self.output_dir, 'stages': sorted(self.stages),
+                'top_allocations': self.top_allocations, 'enabled': self.enabled}
+
+    def merge(self, results, folded):
+        """
+        Incorpora las etapas perfiladas en un worker (results y pilas colapsadas)
+        """
+        self.results.extend(results)
+        self._folded.update(folded)
+
+    def collected(self):
+        """
+        Etapas perfiladas y pilas colapsadas, para enviarlas al proceso principal
+
+        Returns:
+            tuple: (results, {pila: microsegundos})
+        """
+        return self.results, dict(self._folded)
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Context manager que perfila el bloque como la etapa `name`
+        """
+        if not self.is_selected(name):
+            yield
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        profile = cProfile.Profile()
+        tracemalloc.start()
+        start = time.perf_counter()
+        profile.enable()
+
+        try:
+            yield
+        finally:
+            profile.disable()
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            self._save_stage(name, profile, snapshot, elapsed, peak)
+
+    def _save_stage(self, name, profile, snapshot, elapsed, peak):
+        """
+        Guarda .prof, top de asignaciones y acumula pilas colapsadas de la etapa
+        """
+        prof_file = os.path.join(self.output_dir, f"{name}.prof")
+        profile.dump_stats(prof_file)
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        alloc_file = os.path.join(self.output_dir, f"{name}.alloc.txt")
+        with open(alloc_file, 'w', encoding='utf-8') as f:
+            f.write(f"Etapa: {name}\n")
+            f.write(f"Tiempo: {elapsed:.3f} s | Memoria pico: {peak / 1024 / 1024:.2f} MB\n\n")
+            for i, stat in enumerate(snapshot.statistics('lineno')[:self.top_allocations], 1):
+                frame = stat.traceback[0]
+                f.write(f"{i:>3}. {frame.filename}:{frame.lineno}  "
+                        f"{stat.size / 1024:.1f} KiB en {stat.count:,} bloques\n")
+
+        self._folded.update(folded_stacks(profile, name))
+        self.results.append({'stage': name, 'seconds': elapsed, 'peak_mb': peak / 1024 / 1024})
+
+        print(f"   🔬 Perfil de {name}: {elapsed:.2f} s, pico {peak / 1024 / 1024:.1f} MB → {prof_file}")
+
+    def write_summary(self):
+        """
+        Escribe profile.folded (todas las etapas) y summary.txt
+
+        Returns:
+            str | None: Ruta del archivo de pilas colapsadas, None si no se perfiló nada
+        """
+        unmatched = self.unmatched_stages() if self.enabled else []
+        if unmatched:
+            print(f"\n⚠️  --profile: ninguna etapa ejecutada coincide con {', '.join(unmatched)}")
+
+        if not self.results:
+            return None
+
+        folded_file = os.path.join(self.output_dir, 'profile.folded')
+        with open(folded_file, 'w', encoding='utf-8') as f:
+            for stack, microseconds in sorted(self._folded.items()):
+                f.write(f"{stack} {microseconds}\n")
+
+        table = tabulate(
+            [[r['stage'], f"{r['seconds']:.3f}", f"{r['peak_mb']:.1f}"] for r in self.results],
+            headers=["Etapa", "Segundos", "Pico MB"], tablefmt="simple"
+        )
+        with open(os.path.join(self.output_dir, 'summary.txt'), 'w', encoding='utf-8') as f:
+            f.write(table + "\n")
+
+        print("\n🔬 Resumen de perfilado:")
+        print(table)
+        print(f"\n   Pilas colapsadas (flamegraph.pl / speedscope): {folded_file}")
+
+        return folded_file
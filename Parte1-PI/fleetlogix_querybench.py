@@ -0,0 +1,553 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Benchmark de Consultas Analíticas con EXPLAIN ANALYZE
+═══════════════════════════════════════════════════════════════════════════════
+Mide cómo responde el schema a la carga analítica. Para cada factor de
+escala genera el dataset una vez y lo carga en un schema por configuración
+de índices/particiones:
+
+    base          fleetlogix_schema_completo.sql tal cual
+    fk_indexes    + índices de foreign keys de --optimize (FK_INDEXES)
+    covering      + índices compuestos/cubrientes para el catálogo de consultas
+    partitioned   fleetlogix_schema_particionado.sql + índices de foreign keys
+
+Cada consulta del catálogo se ejecuta con EXPLAIN (ANALYZE, BUFFERS): una
+corrida de calentamiento y luego --repeat corridas medidas (caché caliente).
+Se reporta la mediana del Execution Time, el planning, los bloques leídos
+de caché y de disco y los nodos de scan del plan, con las configuraciones
+lado a lado y el exponente de escalado por consulta. Los planes JSON se
+guardan en --plans-dir (visualizables en explain.dalibo.com).
+
+Requisitos: PostgreSQL accesible con la configuración de .env. Los schemas
+qbench_* se eliminan al terminar salvo --keep-schemas.
+
+Uso:
+    python fleetlogix_querybench.py                                   # escalas 0.01 0.05, todas las configuraciones
+    python fleetlogix_querybench.py --scales 0.1 0.5 1 --repeat 5 --output querybench.json
+    python fleetlogix_querybench.py --configs base covering --queries on_time_by_route
+    python fleetlogix_querybench.py --workload hotset:0.02:0.9             # claves calientes
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from tabulate import tabulate
+
+import fleetlogix_generator as flg
+from fleetlogix_analytics import ON_TIME_TOLERANCE_MINUTES
+from fleetlogix_benchmark import scaling_exponent
+from fleetlogix_workload import parse_workload
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_SCALES = [0.01, 0.05]
+DEFAULT_REPEAT = 3
+DEFAULT_TIMEOUT = 300          # Segundos por consulta (statement_timeout)
+DEFAULT_PLANS_DIR = 'querybench_plans'
+
+SCHEMA_PREFIX = 'qbench'
+
+PARTITIONED_SCHEMA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                       'fleetlogix_schema_particionado.sql')
+
+# Índices para el catálogo (nombre, tabla, definición): filtros por vehículo y
+# fecha, y columnas INCLUDE para resolver los joins con index-only scans
+COVERING_INDEXES = [
+    ('idx_trips_vehicle_departure', 'trips', '(vehicle_id, departure_datetime)'),
+    ('idx_trips_completed_cover', 'trips',
+     "(vehicle_id) INCLUDE (route_id, fuel_consumed_liters, departure_datetime) WHERE status = 'completed'"),
+    ('idx_deliveries_delivered_cover', 'deliveries',
+     "(trip_id) INCLUDE (scheduled_datetime, delivered_datetime) WHERE delivery_status = 'delivered'"),
+    ('idx_maintenance_vehicle_cost', 'maintenance', '(vehicle_id) INCLUDE (cost)'),
+]
+
+FK_INDEX_DEFINITIONS = [(name, table, f'({column})') for name, table, column in flg.FK_INDEXES]
+
+# Configuración: (descripción, archivo de schema, índices adicionales)
+CONFIGURATIONS = {
+    'base': ('Schema completo sin índices adicionales', flg.SCHEMA_FILE, []),
+    'fk_indexes': ('Schema completo + índices de FK (--optimize)', flg.SCHEMA_FILE, FK_INDEX_DEFINITIONS),
+    'covering': ('Índices de FK + compuestos/cubrientes del catálogo', flg.SCHEMA_FILE,
+                 FK_INDEX_DEFINITIONS + COVERING_INDEXES),
+    'partitioned': ('Schema particionado por mes + índices de FK', PARTITIONED_SCHEMA_FILE,
+                    FK_INDEX_DEFINITIONS),
+}
+
+# Ventanas fijas dentro del período generado (2024-2025)
+QUERY_PARAMS = {
+    'window_start': datetime(2024, 4, 1),
+    'window_end': datetime(2024, 7, 1),
+    'month_start': datetime(2024, 6, 1),
+    'month_end': datetime(2024, 7, 1),
+    'vehicle_id': 1,
+    'tolerance': f'{ON_TIME_TOLERANCE_MINUTES} minutes',
+}
+
+# Catálogo de consultas: (nombre, descripción, SQL con parámetros de QUERY_PARAMS)
+QUERIES = [
+    ('fuel_by_vehicle_type_month', 'Combustible y rendimiento por tipo de vehículo y mes', """
+        SELECT v.vehicle_type,
+               date_trunc('month', t.departure_datetime) AS month,
+               COUNT(*) AS trips,
+               SUM(t.fuel_consumed_liters) AS fuel_liters,
+               ROUND(SUM(r.distance_km) / NULLIF(SUM(t.fuel_consumed_liters), 0), 3) AS km_per_liter
+        FROM trips t
+        JOIN vehicles v ON v.vehicle_id = t.vehicle_id
+        JOIN routes r ON r.route_id = t.route_id
+        WHERE t.status = 'completed'
+        GROUP BY v.vehicle_type, month
+        ORDER BY v.vehicle_type, month
+    """),
+    ('on_time_by_route', f'Entregas a tiempo (≤ {ON_TIME_TOLERANCE_MINUTES} min) por ruta', """
+        SELECT t.route_id,
+               COUNT(*) AS delivered,
+               COUNT(*) FILTER (WHERE d.delivered_datetime <= d.scheduled_datetime + %(tolerance)s::interval) AS on_time,
+               ROUND(COUNT(*) FILTER (WHERE d.delivered_datetime <= d.scheduled_datetime + %(tolerance)s::interval)::numeric
+                     / COUNT(*), 4) AS on_time_rate
+        FROM deliveries d
+        JOIN trips t ON t.trip_id = d.trip_id
+        WHERE d.delivery_status = 'delivered'
+        GROUP BY t.route_id
+        ORDER BY t.route_id
+    """),
+    ('driver_productivity', 'Viajes, km, horas y entregas por hora por conductor en un trimestre', """
+        WITH trip_totals AS (
+            SELECT t.driver_id,
+                   COUNT(*) AS trips,
+                   SUM(r.distance_km) AS km,
+                   SUM(EXTRACT(EPOCH FROM t.arrival_datetime - t.departure_datetime)) / 3600 AS hours
+            FROM trips t
+            JOIN routes r ON r.route_id = t.route_id
+            WHERE t.status = 'completed'
+            AND t.departure_datetime >= %(window_start)s AND t.departure_datetime < %(window_end)s
+            GROUP BY t.driver_id
+        ), delivery_totals AS (
+            SELECT t.driver_id, COUNT(*) AS delivered
+            FROM deliveries d
+            JOIN trips t ON t.trip_id = d.trip_id
+            WHERE d.delivery_status = 'delivered'
+            AND t.departure_datetime >= %(window_start)s AND t.departure_datetime < %(window_end)s
+            GROUP BY t.driver_id
+        )
+        SELECT dr.driver_id, dr.employee_code, tt.trips, tt.km,
+               ROUND(tt.hours, 1) AS hours,
+               COALESCE(dt.delivered, 0) AS delivered,
+               ROUND(COALESCE(dt.delivered, 0) / NULLIF(tt.hours, 0), 2) AS deliveries_per_hour
+        FROM trip_totals tt
+        JOIN drivers dr ON dr.driver_id = tt.driver_id
+        LEFT JOIN delivery_totals dt ON dt.driver_id = tt.driver_id
+        ORDER BY deliveries_per_hour DESC NULLS LAST
+    """),
+    ('maintenance_cost_per_km', 'Costo de mantenimiento por km recorrido por vehículo', """
+        WITH km AS (
+            SELECT t.vehicle_id, SUM(r.distance_km) AS km
+            FROM trips t
+            JOIN routes r ON r.route_id = t.route_id
+            WHERE t.status = 'completed'
+            GROUP BY t.vehicle_id
+        ), costs AS (
+            SELECT vehicle_id, COUNT(*) AS services, SUM(cost) AS cost
+            FROM maintenance
+            GROUP BY vehicle_id
+        )
+        SELECT v.vehicle_id, v.vehicle_type, km.km,
+               COALESCE(costs.services, 0) AS services,
+               COALESCE(costs.cost, 0) AS cost,
+               ROUND(COALESCE(costs.cost, 0) / NULLIF(km.km, 0), 4) AS cost_per_km
+        FROM vehicles v
+        JOIN km ON km.vehicle_id = v.vehicle_id
+        LEFT JOIN costs ON costs.vehicle_id = v.vehicle_id
+        ORDER BY cost_per_km DESC NULLS LAST
+    """),
+    ('vehicle_month_history', 'Viajes de un vehículo en un mes con sus entregas (consulta selectiva)', """
+        SELECT t.trip_id, t.departure_datetime, t.arrival_datetime, t.status,
+               COUNT(d.delivery_id) AS deliveries
+        FROM trips t
+        LEFT JOIN deliveries d ON d.trip_id = t.trip_id
+        WHERE t.vehicle_id = %(vehicle_id)s
+        AND t.departure_datetime >= %(month_start)s AND t.departure_datetime < %(month_end)s
+        GROUP BY t.trip_id, t.departure_datetime, t.arrival_datetime, t.status
+        ORDER BY t.departure_datetime
+    """),
+]
+
+QUERY_NAMES = [name for name, _, _ in QUERIES]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: DATASET Y SCHEMAS POR CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def generate_dataset(scale):
+    """
+    Genera las 6 tablas a un factor de escala (salida de los generadores descartada)
+
+    Returns:
+        list: [(tabla, DataFrame)] en orden de dependencias
+    """
+    flg.set_scale(scale)
+    flg.reset_random_state()
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles_df = flg.generate_vehicles()
+        drivers_df = flg.generate_drivers()
+        routes_df = flg.generate_routes()
+        trips_df = flg.generate_trips(vehicles_df, drivers_df, routes_df)
+        deliveries_df = flg.generate_deliveries(trips_df, routes_df)
+        maintenance_df = flg.generate_maintenance(trips_df, vehicles_df, routes_df)
+
+    return [('vehicles', vehicles_df), ('drivers', drivers_df), ('routes', routes_df),
+            ('trips', trips_df), ('deliveries', deliveries_df), ('maintenance', maintenance_df)]
+
+
+def schema_name(config, scale):
+    """Schema de una configuración y escala (ej: qbench_covering_0_05)"""
+    return f"{SCHEMA_PREFIX}_{config}_{format(scale, 'g').replace('.', '_')}"
+
+
+def schema_exists(cursor, schema):
+    cursor.execute("SELECT 1 FROM pg_namespace WHERE nspname = %s", (schema,))
+    return cursor.fetchone() is not None
+
+
+def build_schema(cursor, schema, config, tables, batch_size=1000):
+    """
+    Crea el schema de una configuración, carga el dataset, crea sus índices y ejecuta ANALYZE
+
+    Con el schema particionado las particiones mensuales se crean antes de
+    cargar y las filas se enrutan por la tabla padre, en el mismo orden que
+    la carga estándar (los SERIAL asignan los mismos ids).
+
+    Returns:
+        float: Segundos de la construcción
+    """
+    _, schema_file, indexes = CONFIGURATIONS[config]
+    start = time.perf_counter()
+
+    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+    cursor.execute(f"CREATE SCHEMA {schema}")
+    cursor.execute(f"SET search_path TO {schema}")
+    with open(schema_file, encoding='utf-8') as f:
+        cursor.execute(f.read())
+
+    cursor.execute("SELECT relname FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+                   "WHERE n.nspname = %s AND c.relkind = 'p'", (schema,))
+    partitioned = {row[0] for row in cursor.fetchall()}
+
+    for table_name, df in tables:
+        if table_name in partitioned:
+            _, partition_column = flg.PARTITION_KEYS[table_name]
+            months = pd.to_datetime(df[partition_column]).dt.to_period('M').dropna().unique()
+            flg.ensure_partitions(cursor, table_name, sorted(months))
+        flg.insert_dataframe(cursor, df, table_name, batch_size, show_progress=False)
+
+    for index_name, table_name, definition in indexes:
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} {definition}")
+    for table_name, _ in tables:
+        cursor.execute(f"ANALYZE {table_name}")
+
+    return time.perf_counter() - start
+
+
+def schema_size(cursor, schema):
+    """
+    Bytes de tablas, particiones e índices del schema (sin las tablas de resumen)
+    """
+    cursor.execute("""
+        SELECT COALESCE(SUM(pg_total_relation_size(c.oid)), 0)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = %s AND c.relkind = 'r' AND c.relname NOT LIKE 'daily\\_%%'
+    """, (schema,))
+    return int(cursor.fetchone()[0])
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: EJECUCIÓN CON EXPLAIN (ANALYZE, BUFFERS)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def scan_summary(plan):
+    """
+    Nodos de scan del plan agrupados por tipo (ej: 'Seq Scan×2, Index Only Scan×1')
+
+    Con tablas particionadas cuenta un scan por partición visitada.
+    """
+    counts = Counter()
+    pending = [plan]
+    while pending:
+        node = pending.pop()
+        if node['Node Type'].endswith('Scan') and 'Relation Name' in node:
+            counts[node['Node Type']] += 1
+        pending.extend(node.get('Plans', []))
+    return ', '.join(f"{node_type}×{count}" for node_type, count in counts.most_common())
+
+
+def explain_query(cursor, sql, params, repeat):
+    """
+    Ejecuta una consulta con EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+
+    La primera corrida calienta la caché y no se mide; el plan retornado
+    es el de la última corrida medida.
+
+    Returns:
+        dict: median_ms, min_ms, planning_ms, rows, shared_hit, shared_read, scans, plan
+    """
+    explain = f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"
+    cursor.execute(explain, params)
+
+    execution, planning = [], []
+    for _ in range(repeat):
+        cursor.execute(explain, params)
+        result = cursor.fetchone()[0][0]
+        execution.append(result['Execution Time'])
+        planning.append(result['Planning Time'])
+
+    plan = result['Plan']
+    return {
+        'median_ms': round(float(np.median(execution)), 2),
+        'min_ms': round(min(execution), 2),
+        'planning_ms': round(float(np.median(planning)), 2),
+        'rows': plan['Actual Rows'],
+        'shared_hit': plan.get('Shared Hit Blocks', 0),
+        'shared_read': plan.get('Shared Read Blocks', 0),
+        'scans': scan_summary(plan),
+        'plan': result,
+    }
+
+
+def run_configuration(schema, queries, repeat, timeout, plans_dir=None):
+    """
+    Ejecuta el catálogo sobre un schema ya cargado
+
+    Una consulta que supera el timeout o falla queda registrada con su
+    error y no detiene las demás.
+
+    Returns:
+        dict: {consulta: métricas de explain_query (sin el plan) o {'error': mensaje}}
+    """
+    conn = flg.get_connection(schema)
+    conn.autocommit = True
+    results = {}
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SET statement_timeout = %s", (int(timeout * 1000),))
+            for name, _, sql in queries:
+                try:
+                    metrics = explain_query(cursor, sql, QUERY_PARAMS, repeat)
+                except Exception as e:
+                    results[name] = {'error': str(e).strip().splitlines()[0]}
+                    print(f"   ❌ {name}: {results[name]['error']}")
+                    continue
+
+                plan = metrics.pop('plan')
+                if plans_dir:
+                    with open(os.path.join(plans_dir, f"{name}.json"), 'w', encoding='utf-8') as f:
+                        json.dump([plan], f, indent=2)
+                results[name] = metrics
+                print(f"   ✓ {name}: {metrics['median_ms']:,.2f} ms ({metrics['scans']})")
+    finally:
+        conn.close()
+    return results
+
+
+def run_querybench(scales, configs, queries, repeat=DEFAULT_REPEAT, timeout=DEFAULT_TIMEOUT,
+                   plans_dir=DEFAULT_PLANS_DIR, reuse=False, keep_schemas=False, batch_size=1000):
+    """
+    Ejecuta el catálogo en cada escala y configuración
+
+    Returns:
+        dict: {escala: {'trips': filas, 'configs': {config: {'schema', 'bytes',
+               'build_seconds', 'queries'}}}}
+    """
+    results = {}
+    for scale in scales:
+        print(f"\n📦 Escala {scale:g}: generando dataset...")
+        tables = generate_dataset(scale)
+        trips = len(dict(tables)['trips'])
+        print(f"   ✓ {sum(len(df) for _, df in tables):,} registros ({trips:,} viajes)")
+        results[scale] = {'trips': trips, 'configs': {}}
+
+        for config in configs:
+            schema = schema_name(config, scale)
+            print(f"\n🔧 {config} ({schema}): {CONFIGURATIONS[config][0]}")
+
+            conn = flg.get_connection()
+            try:
+                with conn.cursor() as cursor:
+                    build_seconds = None
+                    if reuse and schema_exists(cursor, schema):
+                        print("   ℹ️  Schema existente reutilizado (--reuse)")
+                    else:
+                        build_seconds = build_schema(cursor, schema, config, tables, batch_size)
+                        conn.commit()
+                        print(f"   ✓ Cargado e indexado en {build_seconds:.1f} s")
+                    size = schema_size(cursor, schema)
+            finally:
+                conn.close()
+
+            config_plans = None
+            if plans_dir:
+                config_plans = os.path.join(plans_dir, format(scale, 'g'), config)
+                os.makedirs(config_plans, exist_ok=True)
+
+            results[scale]['configs'][config] = {
+                'schema': schema,
+                'bytes': size,
+                'build_seconds': round(build_seconds, 2) if build_seconds is not None else None,
+                'queries': run_configuration(schema, queries, repeat, timeout, config_plans),
+            }
+
+            if not keep_schemas:
+                conn = flg.get_connection()
+                with conn.cursor() as cursor:
+                    cursor.execute(f"DROP SCHEMA IF EXISTS {schema} CASCADE")
+                conn.commit()
+                conn.close()
+
+    return results
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 4: REPORTE LADO A LADO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _cell(metrics, reference=None):
+    """Mediana en ms y, si hay referencia, aceleración frente a ella"""
+    if 'error' in metrics:
+        return "❌ error"
+    text = f"{metrics['median_ms']:,.2f}"
+    if reference is not None and 'error' not in reference and metrics['median_ms'] > 0:
+        text += f" ({reference['median_ms'] / metrics['median_ms']:.1f}x)"
+    return text
+
+
+def print_results(results, configs, queries):
+    for scale, by_scale in results.items():
+        by_config = by_scale['configs']
+        print(f"\n⏱️  Escala {scale:g} ({by_scale['trips']:,} viajes): mediana ms "
+              f"(aceleración vs {configs[0]})")
+        rows = []
+        for name, _, _ in queries:
+            reference = by_config[configs[0]]['queries'][name]
+            rows.append([name, _cell(reference)] +
+                        [_cell(by_config[c]['queries'][name], reference) for c in configs[1:]])
+        rows.append(['tamaño (tablas + índices)'] +
+                    [f"{by_config[c]['bytes'] / 1024 / 1024:,.1f} MB" for c in configs])
+        print(tabulate(rows, headers=['Consulta'] + configs, tablefmt='grid'))
+
+        rows = []
+        for name, _, _ in queries:
+            for config in configs:
+                metrics = by_config[config]['queries'][name]
+                if 'error' in metrics:
+                    continue
+                rows.append([name, config, metrics['rows'], metrics['planning_ms'],
+                             f"{metrics['shared_hit']:,}", f"{metrics['shared_read']:,}", metrics['scans']])
+        print(tabulate(rows, headers=['Consulta', 'Config', 'Filas', 'Planning ms',
+                                      'Bloques caché', 'Bloques disco', 'Scans'], tablefmt='simple'))
+
+    if len(results) > 1:
+        print("\n📈 Exponente de escalado (tiempo ∝ viajes^k; 1.0 = lineal)")
+        rows = []
+        for name, _, _ in queries:
+            row = [name]
+            for config in configs:
+                points = {scale: {'rows': by_scale['trips'],
+                                  'seconds': by_scale['configs'][config]['queries'][name].get('median_ms', 0)}
+                          for scale, by_scale in results.items()}
+                exponent = scaling_exponent(points)
+                row.append(f"{exponent:.2f}" if exponent is not None else "-")
+            rows.append(row)
+        print(tabulate(rows, headers=['Consulta'] + configs, tablefmt='simple', disable_numparse=True))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 5: PUNTO DE ENTRADA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de consultas analíticas FleetLogix con EXPLAIN ANALYZE")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES,
+                        help="Factores de escala (default: 0.01 0.05)")
+    parser.add_argument('--configs', nargs='+', choices=list(CONFIGURATIONS), default=list(CONFIGURATIONS),
+                        help="Configuraciones a comparar; la primera es la referencia (default: todas)")
+    parser.add_argument('--queries', nargs='+', choices=QUERY_NAMES, default=QUERY_NAMES,
+                        help="Consultas del catálogo a ejecutar (default: todas)")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help="Corridas medidas por consulta, tras una de calentamiento (default: 3)")
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help="Segundos máximos por consulta (default: 300)")
+    parser.add_argument('--plans-dir', default=DEFAULT_PLANS_DIR,
+                        help="Carpeta para los planes EXPLAIN en JSON (default: querybench_plans)")
+    parser.add_argument('--reuse', action='store_true',
+                        help="Reutilizar schemas qbench_* existentes en lugar de recargarlos")
+    parser.add_argument('--keep-schemas', action='store_true',
+                        help="No eliminar los schemas qbench_* al terminar")
+    parser.add_argument('--workload', type=parse_workload, default=flg.WORKLOAD, metavar='PERFIL',
+                        help="Perfil de carga de los viajes (ver fleetlogix_workload; default: uniform)")
+    parser.add_argument('--output', help="Guardar el reporte en JSON")
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat debe ser al menos 1")
+    if args.timeout <= 0:
+        parser.error("--timeout debe ser mayor que 0")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("="*70)
+    print("BENCHMARK DE CONSULTAS ANALÍTICAS - FLEETLOGIX")
+    print("="*70)
+
+    flg.set_workload(args.workload)
+    configs = list(dict.fromkeys(args.configs))
+    queries = [query for query in QUERIES if query[0] in args.queries]
+    print(f"📋 {len(queries)} consultas | configuraciones: {', '.join(configs)} | "
+          f"escalas: {', '.join(format(s, 'g') for s in args.scales)} | {args.repeat} corridas")
+    print(f"🎲 Perfil de carga: {args.workload.spec} ({args.workload.describe()})")
+
+    try:
+        results = run_querybench(args.scales, configs, queries, args.repeat, args.timeout,
+                                 args.plans_dir, args.reuse, args.keep_schemas)
+    except Exception as e:
+        print(f"\n❌ ERROR durante el benchmark de consultas: {e}")
+        return 1
+
+    print_results(results, configs, queries)
+    if args.plans_dir:
+        print(f"\n🗺️  Planes EXPLAIN guardados en {args.plans_dir}/<escala>/<config>/<consulta>.json")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+                'repeat': args.repeat,
+                'workload': args.workload.spec,
+                'params': {key: str(value) for key, value in QUERY_PARAMS.items()},
+                'configurations': {c: CONFIGURATIONS[c][0] for c in configs},
+                'results': {format(scale, 'g'): by_scale for scale, by_scale in results.items()},
+            }, f, indent=2)
+        print(f"💾 Reporte guardado en {args.output}")
+
+    failed = any('error' in metrics for by_scale in results.values()
+                 for by_config in by_scale['configs'].values() for metrics in by_config['queries'].values())
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
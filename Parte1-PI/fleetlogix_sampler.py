@@ -0,0 +1,282 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Muestreo Categórico Precompilado (Tablas Alias)
+═══════════════════════════════════════════════════════════════════════════════
+Compila cada distribución categórica UNA sola vez en una tabla alias
+(método de Vose) y genera lotes completos de muestras en O(1) por muestra.
+
+Reemplaza las llamadas por fila a np.random.choice(..., p=...), que validan
+y normalizan las probabilidades en cada invocación.
+
+Componentes:
+- CategoricalSampler: distribución categórica simple (hora, estados, tipos)
+- ConditionalSampler: columna hija condicionada a una columna padre
+  (ej: estado de entrega dado el estado del viaje)
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import numpy as np
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: FUNCIONES AUXILIARES
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _normalize_probabilities(probabilities):
+    """
+    Valida y normaliza un vector de probabilidades (una sola vez, al compilar)
+
+    Args:
+        probabilities (array-like): Pesos no negativos
+
+    Returns:
+        numpy.array: Probabilidades normalizadas que suman 1.0
+    """
+    probs = np.asarray(probabilities, dtype=np.float64)
+
+    if probs.ndim != 1 or len(probs) == 0:
+        raise ValueError("Las probabilidades deben ser un vector no vacío")
+    if np.any(probs < 0) or not np.all(np.isfinite(probs)):
+        raise ValueError("Las probabilidades deben ser finitas y no negativas")
+
+    total = probs.sum()
+    if total <= 0:
+        raise ValueError("La suma de probabilidades debe ser mayor que 0")
+
+    return probs / total
+
+
+def _build_alias_table(probs):
+    """
+    Construye la tabla alias de Vose para un vector de probabilidades
+
+    Cada columna k de la tabla contiene un umbral prob[k] y un alias[k]:
+    se elige k uniformemente y se retorna k si u < prob[k], alias[k] si no.
+
+    Args:
+        probs (numpy.array): Probabilidades normalizadas
+
+    Returns:
+        tuple: (prob, alias) como arrays de longitud n
+    """
+    n = len(probs)
+    scaled = probs * n
+    prob = np.zeros(n, dtype=np.float64)
+    alias = np.arange(n, dtype=np.int64)
+
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = (scaled[l] + scaled[s]) - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Los restantes tienen probabilidad 1.0 (salvo error de redondeo)
+    for i in large + small:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+def _draw_uniforms(n, size, random_state):
+    """
+    Genera columnas uniformes e umbrales para un lote de muestras
+
+    Acepta tanto el módulo np.random (estado global, comportamiento por
+    defecto del generador) como un np.random.Generator o RandomState.
+
+    Returns:
+        tuple: (columnas enteras en [0, n), uniformes en [0, 1))
+    """
+    rs = np.random if random_state is None else random_state
+
+    if isinstance(rs, np.random.Generator):
+        columns = rs.integers(0, n, size=size)
+    else:
+        columns = rs.randint(0, n, size=size)
+
+    return columns, rs.random(size)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: DISTRIBUCIÓN CATEGÓRICA SIMPLE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class CategoricalSampler:
+    """
+    Distribución categórica compilada en tabla alias
+
+    Ejemplo:
+        status_sampler = CategoricalSampler(
+            ['completed', 'in_progress', 'cancelled'], [0.95, 0.03, 0.02]
+        )
+        statuses = status_sampler.sample(100000)
+    """
+
+    def __init__(self, values, probabilities):
+        """
+        Args:
+            values (array-like): Valores posibles de la categoría
+            probabilities (array-like): Probabilidad (o peso) de cada valor
+        """
+        self.values = np.asarray(values)
+        self.probabilities = _normalize_probabilities(probabilities)
+
+        if len(self.values) != len(self.probabilities):
+            raise ValueError(
+                f"Se recibieron {len(self.values)} valores y "
+                f"{len(self.probabilities)} probabilidades"
+            )
+
+        self._prob, self._alias = _build_alias_table(self.probabilities)
+
+    @classmethod
+    def from_dict(cls, distribution):
+        """
+        Crea el muestreador desde un diccionario {valor: probabilidad}
+        """
+        return cls(list(distribution.keys()), list(distribution.values()))
+
+    @classmethod
+    def uniform(cls, values):
+        """
+        Crea un muestreador equiprobable sobre los valores dados
+        """
+        return cls(values, np.ones(len(values)))
+
+    def sample_indices(self, size=None, random_state=None):
+        """
+        Genera índices de categoría (posiciones dentro de self.values)
+
+        Args:
+            size (int): Cantidad de muestras (None = una sola muestra escalar)
+            random_state: np.random.Generator/RandomState (default: np.random)
+
+        Returns:
+            numpy.array | int: Índices muestreados
+        """
+        columns, uniforms = _draw_uniforms(len(self._prob), size, random_state)
+        return np.where(uniforms < self._prob[columns], columns, self._alias[columns])
+
+    def sample(self, size=None, random_state=None):
+        """
+        Genera un lote de valores de la distribución
+
+        Args:
+            size (int): Cantidad de muestras (None = una sola muestra escalar)
+            random_state: np.random.Generator/RandomState (default: np.random)
+
+        Returns:
+            numpy.array: Valores muestreados
+        """
+        return self.values[self.sample_indices(size, random_state)]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        pairs = ', '.join(f"{v}={p:.3f}" for v, p in zip(self.values, self.probabilities))
+        return f"CategoricalSampler({pairs})"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: DISTRIBUCIÓN CONDICIONADA A UNA COLUMNA PADRE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class ConditionalSampler:
+    """
+    Distribución categórica condicionada al valor de una columna padre
+
+    Todas las distribuciones hijas se compilan en una única tabla alias 2D
+    (una fila por valor padre, una columna por valor hijo), de modo que un
+    lote completo se muestrea con operaciones vectorizadas sin agrupar.
+
+    Ejemplo:
+        delivery_status = ConditionalSampler({
+            'completed':   {'delivered': 0.85, 'pending': 0.10, 'failed': 0.05},
+            'in_progress': {'delivered': 0.30, 'pending': 0.70},
+            'cancelled':   {'pending': 0.60, 'failed': 0.40},
+        })
+        statuses = delivery_status.sample(trip_status_por_entrega)
+    """
+
+    def __init__(self, distributions):
+        """
+        Args:
+            distributions (dict): {valor_padre: {valor_hijo: probabilidad}}
+        """
+        if not distributions:
+            raise ValueError("Se requiere al menos una distribución condicional")
+
+        self.parent_values = list(distributions.keys())
+        self._parent_codes = {parent: i for i, parent in enumerate(self.parent_values)}
+
+        # Unión ordenada de valores hijos (orden de primera aparición)
+        child_values = []
+        for child_dist in distributions.values():
+            for value in child_dist:
+                if value not in child_values:
+                    child_values.append(value)
+        self.values = np.asarray(child_values)
+
+        n_parents = len(self.parent_values)
+        n_children = len(child_values)
+        self.probabilities = np.zeros((n_parents, n_children), dtype=np.float64)
+        self._prob = np.zeros((n_parents, n_children), dtype=np.float64)
+        self._alias = np.zeros((n_parents, n_children), dtype=np.int64)
+
+        for row, child_dist in enumerate(distributions.values()):
+            weights = np.array([child_dist.get(v, 0.0) for v in child_values])
+            self.probabilities[row] = _normalize_probabilities(weights)
+            self._prob[row], self._alias[row] = _build_alias_table(self.probabilities[row])
+
+    def parent_codes(self, parents):
+        """
+        Convierte valores padre a códigos de fila de la tabla alias
+
+        Args:
+            parents (array-like): Valores de la columna padre
+
+        Returns:
+            numpy.array: Código de fila para cada valor padre
+        """
+        parents = np.asarray(parents)
+        uniques, inverse = np.unique(parents, return_inverse=True)
+
+        try:
+            unique_codes = np.array([self._parent_codes[p] for p in uniques], dtype=np.int64)
+        except KeyError as e:
+            raise ValueError(f"Valor padre sin distribución definida: {e}") from None
+
+        return unique_codes[inverse.reshape(-1)]
+
+    def sample(self, parents, random_state=None):
+        """
+        Genera un valor hijo por cada valor padre
+
+        Args:
+            parents (array-like): Valores de la columna padre (uno por muestra)
+            random_state: np.random.Generator/RandomState (default: np.random)
+
+        Returns:
+            numpy.array: Valores hijos muestreados, alineados con parents
+        """
+        rows = self.parent_codes(parents)
+        columns, uniforms = _draw_uniforms(self.values.size, len(rows), random_state)
+        indices = np.where(
+            uniforms < self._prob[rows, columns],
+            columns,
+            self._alias[rows, columns]
+        )
+        return self.values[indices]
+
+    def __repr__(self):
+        return (f"ConditionalSampler(padres={self.parent_values}, "
+                f"valores={list(self.values)})")
@@ -8,6 +8,8 @@
 -- ELIMINAR TABLAS SI EXISTEN (para re-creación limpia)
 -- ───────────────────────────────────────────────────────────────────────────────
 
+DROP TABLE IF EXISTS daily_route_summary CASCADE;
+DROP TABLE IF EXISTS daily_vehicle_summary CASCADE;
 DROP TABLE IF EXISTS maintenance CASCADE;
 DROP TABLE IF EXISTS deliveries CASCADE;
 DROP TABLE IF EXISTS trips CASCADE;
@@ -189,6 +191,7 @@ CREATE TABLE maintenance (
     cost DECIMAL(10,2),
     next_maintenance_date DATE,
     performed_by VARCHAR(200),
+    odometer_km DECIMAL(12,1),
     
     -- FOREIGN KEY
     CONSTRAINT fk_maintenance_vehicle 
@@ -199,11 +202,70 @@ CREATE TABLE maintenance (
     CONSTRAINT chk_maintenance_next_date_after 
         CHECK (next_maintenance_date IS NULL OR next_maintenance_date > maintenance_date),
     CONSTRAINT chk_maintenance_cost_positive 
-        CHECK (cost IS NULL OR cost > 0)
+        CHECK (cost IS NULL OR cost > 0),
+    CONSTRAINT chk_maintenance_odometer_positive 
+        CHECK (odometer_km IS NULL OR odometer_km >= 0)
 );
 
 COMMENT ON TABLE maintenance IS 'Historial de mantenimiento de vehículos (~1 cada 20 viajes)';
 COMMENT ON COLUMN maintenance.maintenance_type IS 'Tipo: Cambio de aceite, Revisión de frenos, Cambio de llantas, etc.';
+COMMENT ON COLUMN maintenance.odometer_km IS 'Odómetro del vehículo en el servicio (solo --maintenance-model odometer)';
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- TABLAS DE RESUMEN (KPIs DIARIOS PRE-AGREGADOS)
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- Calculadas por el generador sobre los datos en memoria (--summaries), para que
+-- los dashboards no recorran trips/deliveries completas en cada actualización.
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: daily_vehicle_summary (KPIs diarios por vehículo)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE daily_vehicle_summary (
+    summary_date DATE NOT NULL,
+    vehicle_id INTEGER NOT NULL,
+    trips INTEGER NOT NULL,
+    completed_trips INTEGER NOT NULL,
+    total_km DECIMAL(12,2),
+    fuel_liters DECIMAL(12,2),
+    avg_load_factor DECIMAL(5,4),
+    deliveries_delivered INTEGER NOT NULL,
+    deliveries_failed INTEGER NOT NULL,
+    deliveries_pending INTEGER NOT NULL,
+    toll_cost DECIMAL(12,2),
+    
+    CONSTRAINT pk_daily_vehicle_summary PRIMARY KEY (summary_date, vehicle_id),
+    CONSTRAINT fk_daily_vehicle_summary_vehicle 
+        FOREIGN KEY (vehicle_id) REFERENCES vehicles(vehicle_id) 
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE daily_vehicle_summary IS 'KPIs diarios por vehículo: viajes, km, combustible, carga, entregas y peajes';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: daily_route_summary (KPIs diarios por ruta)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE daily_route_summary (
+    summary_date DATE NOT NULL,
+    route_id INTEGER NOT NULL,
+    trips INTEGER NOT NULL,
+    completed_trips INTEGER NOT NULL,
+    total_km DECIMAL(12,2),
+    fuel_liters DECIMAL(12,2),
+    avg_load_factor DECIMAL(5,4),
+    deliveries_delivered INTEGER NOT NULL,
+    deliveries_failed INTEGER NOT NULL,
+    deliveries_pending INTEGER NOT NULL,
+    toll_cost DECIMAL(12,2),
+    
+    CONSTRAINT pk_daily_route_summary PRIMARY KEY (summary_date, route_id),
+    CONSTRAINT fk_daily_route_summary_route 
+        FOREIGN KEY (route_id) REFERENCES routes(route_id) 
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE daily_route_summary IS 'KPIs diarios por ruta: viajes, km, combustible, carga, entregas y peajes';
 
 -- ═══════════════════════════════════════════════════════════════════════════════
 -- ÍNDICES PERSONALIZADOS
@@ -217,6 +279,12 @@ COMMENT ON INDEX idx_trips_departure IS 'Índice para búsquedas por fecha de sa
 COMMENT ON INDEX idx_deliveries_status IS 'Índice para filtros por estado de entrega';
 COMMENT ON INDEX idx_vehicles_status IS 'Índice para filtros por estado de vehículo';
 
+-- Los índices sobre foreign keys (trips.vehicle_id, trips.driver_id,
+-- trips.route_id, deliveries.trip_id, maintenance.vehicle_id) se crean en la
+-- etapa post-carga del generador (--optimize) con CREATE INDEX CONCURRENTLY,
+-- para no penalizar la carga masiva. Ver optimize_database() en
+-- fleetlogix_generator.py.
+
 -- ═══════════════════════════════════════════════════════════════════════════════
 -- RESUMEN DE CONSTRAINTS IMPLEMENTADOS
 -- ═══════════════════════════════════════════════════════════════════════════════
@@ -252,7 +320,7 @@ DEFAULT VALUES (6):
   ✓ deliveries.delivery_status   DEFAULT 'pending'
   ✓ deliveries.recipient_signature DEFAULT FALSE
 
-CHECK CONSTRAINTS (16):
+CHECK CONSTRAINTS (17):
   ✓ vehicles.capacity_kg         > 0 AND <= 15000
   ✓ vehicles.status              IN ('active', 'inactive', 'maintenance')
   ✓ drivers.license_expiry       >= hire_date
@@ -269,11 +337,16 @@ CHECK CONSTRAINTS (16):
   ✓ deliveries.delivery_status   IN ('delivered', 'pending', 'failed')
   ✓ maintenance.next_date        > maintenance_date
   ✓ maintenance.cost             > 0
+  ✓ maintenance.odometer_km      >= 0
 
 ÍNDICES (3):
   ✓ idx_trips_departure          ON trips(departure_datetime)
   ✓ idx_deliveries_status        ON deliveries(delivery_status)
   ✓ idx_vehicles_status          ON vehicles(status)
+
+TABLAS DE RESUMEN (2):
+  ✓ daily_vehicle_summary        PK (summary_date, vehicle_id)
+  ✓ daily_route_summary          PK (summary_date, route_id)
 */
 
 -- ═══════════════════════════════════════════════════════════════════════════════
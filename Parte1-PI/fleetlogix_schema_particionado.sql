@@ -0,0 +1,317 @@
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- FLEETLOGIX - Schema Particionado (trips y deliveries por mes)
+-- Base de datos PostgreSQL 12+
+-- Variante de fleetlogix_schema_completo.sql para datasets a gran escala (100x)
+-- ═══════════════════════════════════════════════════════════════════════════════
+--
+-- DIFERENCIAS CON EL SCHEMA COMPLETO:
+--   • trips:      PARTITION BY RANGE (departure_datetime), un mes por partición
+--   • deliveries: PARTITION BY RANGE (scheduled_datetime), un mes por partición
+--   • PostgreSQL exige que PRIMARY KEY y UNIQUE incluyan la clave de partición:
+--       trips       PRIMARY KEY (trip_id, departure_datetime)
+--       deliveries  PRIMARY KEY (delivery_id, scheduled_datetime)
+--       deliveries  UNIQUE (tracking_number, scheduled_datetime)
+--   • deliveries.scheduled_datetime pasa a ser NOT NULL (clave de partición)
+--   • Se elimina fk_deliveries_trip: trip_id por sí solo ya no es único en
+--     trips, por lo que no puede ser referenciado. La integridad
+--     deliveries → trips la verifica validate_data() (anti-join).
+--
+-- Las particiones mensuales (trips_2024_01, deliveries_2024_01, ...) las crea
+-- el generador bajo demanda al cargar (--partitioned). Las particiones DEFAULT
+-- reciben cualquier fila fuera de los meses creados.
+--
+-- Uso:
+--   psql -d fleetlogix -f fleetlogix_schema_particionado.sql
+--   python fleetlogix_generator.py --partitioned --load-workers 4
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- ELIMINAR TABLAS SI EXISTEN (para re-creación limpia)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+DROP TABLE IF EXISTS daily_route_summary CASCADE;
+DROP TABLE IF EXISTS daily_vehicle_summary CASCADE;
+DROP TABLE IF EXISTS maintenance CASCADE;
+DROP TABLE IF EXISTS deliveries CASCADE;
+DROP TABLE IF EXISTS trips CASCADE;
+DROP TABLE IF EXISTS routes CASCADE;
+DROP TABLE IF EXISTS drivers CASCADE;
+DROP TABLE IF EXISTS vehicles CASCADE;
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- TABLAS MAESTRAS
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: vehicles (Vehículos de la flota - 200 registros)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE vehicles (
+    vehicle_id SERIAL PRIMARY KEY,
+    license_plate VARCHAR(20) NOT NULL UNIQUE,
+    vehicle_type VARCHAR(50) NOT NULL,
+    capacity_kg DECIMAL(10,2),
+    fuel_type VARCHAR(20),
+    acquisition_date DATE,
+    status VARCHAR(20) DEFAULT 'active',
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_vehicles_capacity_positive 
+        CHECK (capacity_kg > 0 AND capacity_kg <= 15000),
+    CONSTRAINT chk_vehicles_status_valid 
+        CHECK (status IN ('active', 'inactive', 'maintenance'))
+);
+
+COMMENT ON TABLE vehicles IS 'Vehículos de la flota de FleetLogix';
+COMMENT ON COLUMN vehicles.license_plate IS 'Placa única del vehículo (formato: A123456)';
+COMMENT ON COLUMN vehicles.capacity_kg IS 'Capacidad de carga en kilogramos (50-15,000)';
+COMMENT ON COLUMN vehicles.status IS 'Estado del vehículo: active, inactive, maintenance';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: drivers (Conductores empleados - 400 registros)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE drivers (
+    driver_id SERIAL PRIMARY KEY,
+    employee_code VARCHAR(20) NOT NULL UNIQUE,
+    first_name VARCHAR(100) NOT NULL,
+    last_name VARCHAR(100) NOT NULL,
+    license_number VARCHAR(50) NOT NULL UNIQUE,
+    license_expiry DATE,
+    phone VARCHAR(20),
+    hire_date DATE,
+    status VARCHAR(20) DEFAULT 'active',
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_drivers_license_expiry 
+        CHECK (license_expiry IS NULL OR license_expiry >= hire_date),
+    CONSTRAINT chk_drivers_status_valid 
+        CHECK (status IN ('active', 'inactive', 'on_leave'))
+);
+
+COMMENT ON TABLE drivers IS 'Información de conductores empleados';
+COMMENT ON COLUMN drivers.employee_code IS 'Código único de empleado (formato: EMP-0001)';
+COMMENT ON COLUMN drivers.license_number IS 'Número de licencia de conducir (formato: LIC-123456789)';
+COMMENT ON COLUMN drivers.status IS 'Estado del conductor: active, inactive, on_leave';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: routes (Rutas predefinidas - 50 registros)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE routes (
+    route_id SERIAL PRIMARY KEY,
+    route_code VARCHAR(20) NOT NULL UNIQUE,
+    origin_city VARCHAR(100) NOT NULL,
+    destination_city VARCHAR(100) NOT NULL,
+    distance_km DECIMAL(10,2),
+    estimated_duration_hours DECIMAL(5,2),
+    toll_cost DECIMAL(10,2) DEFAULT 0,
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_routes_distance_positive 
+        CHECK (distance_km > 0 AND distance_km <= 500),
+    CONSTRAINT chk_routes_duration_positive 
+        CHECK (estimated_duration_hours > 0),
+    CONSTRAINT chk_routes_toll_nonnegative 
+        CHECK (toll_cost >= 0)
+);
+
+COMMENT ON TABLE routes IS 'Rutas predefinidas entre ciudades principales';
+COMMENT ON COLUMN routes.route_code IS 'Código único de ruta (formato: RT-001)';
+COMMENT ON COLUMN routes.distance_km IS 'Distancia de la ruta en kilómetros (50-500)';
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- TABLAS TRANSACCIONALES PARTICIONADAS
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: trips (Viajes realizados - particionada por mes de departure_datetime)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE trips (
+    trip_id SERIAL,
+    vehicle_id INTEGER NOT NULL,
+    driver_id INTEGER NOT NULL,
+    route_id INTEGER NOT NULL,
+    departure_datetime TIMESTAMP NOT NULL,
+    arrival_datetime TIMESTAMP,
+    fuel_consumed_liters DECIMAL(10,2),
+    total_weight_kg DECIMAL(10,2),
+    status VARCHAR(20) DEFAULT 'in_progress',
+    
+    -- PRIMARY KEY (debe incluir la clave de partición)
+    CONSTRAINT pk_trips PRIMARY KEY (trip_id, departure_datetime),
+    
+    -- FOREIGN KEYS
+    CONSTRAINT fk_trips_vehicle 
+        FOREIGN KEY (vehicle_id) REFERENCES vehicles(vehicle_id) 
+        ON DELETE RESTRICT,
+    CONSTRAINT fk_trips_driver 
+        FOREIGN KEY (driver_id) REFERENCES drivers(driver_id) 
+        ON DELETE RESTRICT,
+    CONSTRAINT fk_trips_route 
+        FOREIGN KEY (route_id) REFERENCES routes(route_id) 
+        ON DELETE RESTRICT,
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_trips_arrival_after_departure 
+        CHECK (arrival_datetime IS NULL OR arrival_datetime > departure_datetime),
+    CONSTRAINT chk_trips_fuel_positive 
+        CHECK (fuel_consumed_liters IS NULL OR fuel_consumed_liters > 0),
+    CONSTRAINT chk_trips_weight_positive 
+        CHECK (total_weight_kg IS NULL OR total_weight_kg > 0),
+    CONSTRAINT chk_trips_status_valid 
+        CHECK (status IN ('completed', 'in_progress', 'cancelled'))
+) PARTITION BY RANGE (departure_datetime);
+
+CREATE TABLE trips_default PARTITION OF trips DEFAULT;
+
+COMMENT ON TABLE trips IS 'Registro de viajes realizados, particionado por mes de salida';
+COMMENT ON COLUMN trips.status IS 'Estado: completed (95%), in_progress (3%), cancelled (2%)';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: deliveries (Entregas individuales - particionada por mes de scheduled_datetime)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE deliveries (
+    delivery_id SERIAL,
+    trip_id INTEGER NOT NULL,
+    tracking_number VARCHAR(50) NOT NULL,
+    customer_name VARCHAR(200) NOT NULL,
+    delivery_address TEXT NOT NULL,
+    package_weight_kg DECIMAL(10,2),
+    scheduled_datetime TIMESTAMP NOT NULL,
+    delivered_datetime TIMESTAMP,
+    delivery_status VARCHAR(20) DEFAULT 'pending',
+    recipient_signature BOOLEAN DEFAULT FALSE,
+    
+    -- PRIMARY KEY y UNIQUE (deben incluir la clave de partición)
+    CONSTRAINT pk_deliveries PRIMARY KEY (delivery_id, scheduled_datetime),
+    CONSTRAINT uq_deliveries_tracking UNIQUE (tracking_number, scheduled_datetime),
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_deliveries_weight_positive 
+        CHECK (package_weight_kg IS NULL OR package_weight_kg > 0),
+    CONSTRAINT chk_deliveries_datetime_order 
+        CHECK (delivered_datetime IS NULL OR scheduled_datetime IS NULL 
+               OR delivered_datetime >= scheduled_datetime),
+    CONSTRAINT chk_deliveries_status_valid 
+        CHECK (delivery_status IN ('delivered', 'pending', 'failed'))
+) PARTITION BY RANGE (scheduled_datetime);
+
+CREATE TABLE deliveries_default PARTITION OF deliveries DEFAULT;
+
+COMMENT ON TABLE deliveries IS 'Entregas individuales (2-6 por viaje), particionadas por mes programado';
+COMMENT ON COLUMN deliveries.tracking_number IS 'Número de rastreo (único por generación; ver validate_data)';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: maintenance (Mantenimientos de vehículos - 5,000 registros)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE maintenance (
+    maintenance_id SERIAL PRIMARY KEY,
+    vehicle_id INTEGER NOT NULL,
+    maintenance_date DATE NOT NULL,
+    maintenance_type VARCHAR(50) NOT NULL,
+    description TEXT,
+    cost DECIMAL(10,2),
+    next_maintenance_date DATE,
+    performed_by VARCHAR(200),
+    odometer_km DECIMAL(12,1),
+    
+    -- FOREIGN KEY
+    CONSTRAINT fk_maintenance_vehicle 
+        FOREIGN KEY (vehicle_id) REFERENCES vehicles(vehicle_id) 
+        ON DELETE CASCADE,
+    
+    -- CHECK Constraints
+    CONSTRAINT chk_maintenance_next_date_after 
+        CHECK (next_maintenance_date IS NULL OR next_maintenance_date > maintenance_date),
+    CONSTRAINT chk_maintenance_cost_positive 
+        CHECK (cost IS NULL OR cost > 0),
+    CONSTRAINT chk_maintenance_odometer_positive 
+        CHECK (odometer_km IS NULL OR odometer_km >= 0)
+);
+
+COMMENT ON TABLE maintenance IS 'Historial de mantenimiento de vehículos (~1 cada 20 viajes)';
+COMMENT ON COLUMN maintenance.maintenance_type IS 'Tipo: Cambio de aceite, Revisión de frenos, Cambio de llantas, etc.';
+COMMENT ON COLUMN maintenance.odometer_km IS 'Odómetro del vehículo en el servicio (solo --maintenance-model odometer)';
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- TABLAS DE RESUMEN (KPIs DIARIOS PRE-AGREGADOS)
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- Calculadas por el generador sobre los datos en memoria (--summaries), para que
+-- los dashboards no recorran trips/deliveries completas en cada actualización.
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: daily_vehicle_summary (KPIs diarios por vehículo)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE daily_vehicle_summary (
+    summary_date DATE NOT NULL,
+    vehicle_id INTEGER NOT NULL,
+    trips INTEGER NOT NULL,
+    completed_trips INTEGER NOT NULL,
+    total_km DECIMAL(12,2),
+    fuel_liters DECIMAL(12,2),
+    avg_load_factor DECIMAL(5,4),
+    deliveries_delivered INTEGER NOT NULL,
+    deliveries_failed INTEGER NOT NULL,
+    deliveries_pending INTEGER NOT NULL,
+    toll_cost DECIMAL(12,2),
+    
+    CONSTRAINT pk_daily_vehicle_summary PRIMARY KEY (summary_date, vehicle_id),
+    CONSTRAINT fk_daily_vehicle_summary_vehicle 
+        FOREIGN KEY (vehicle_id) REFERENCES vehicles(vehicle_id) 
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE daily_vehicle_summary IS 'KPIs diarios por vehículo: viajes, km, combustible, carga, entregas y peajes';
+
+-- ───────────────────────────────────────────────────────────────────────────────
+-- TABLA: daily_route_summary (KPIs diarios por ruta)
+-- ───────────────────────────────────────────────────────────────────────────────
+
+CREATE TABLE daily_route_summary (
+    summary_date DATE NOT NULL,
+    route_id INTEGER NOT NULL,
+    trips INTEGER NOT NULL,
+    completed_trips INTEGER NOT NULL,
+    total_km DECIMAL(12,2),
+    fuel_liters DECIMAL(12,2),
+    avg_load_factor DECIMAL(5,4),
+    deliveries_delivered INTEGER NOT NULL,
+    deliveries_failed INTEGER NOT NULL,
+    deliveries_pending INTEGER NOT NULL,
+    toll_cost DECIMAL(12,2),
+    
+    CONSTRAINT pk_daily_route_summary PRIMARY KEY (summary_date, route_id),
+    CONSTRAINT fk_daily_route_summary_route 
+        FOREIGN KEY (route_id) REFERENCES routes(route_id) 
+        ON DELETE CASCADE
+);
+
+COMMENT ON TABLE daily_route_summary IS 'KPIs diarios por ruta: viajes, km, combustible, carga, entregas y peajes';
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- ÍNDICES PERSONALIZADOS (se propagan a cada partición)
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+CREATE INDEX idx_trips_departure ON trips(departure_datetime);
+CREATE INDEX idx_deliveries_status ON deliveries(delivery_status);
+CREATE INDEX idx_deliveries_trip_id ON deliveries(trip_id);
+CREATE INDEX idx_vehicles_status ON vehicles(status);
+
+-- ═══════════════════════════════════════════════════════════════════════════════
+-- VERIFICACIÓN DE PARTICIONES
+-- ═══════════════════════════════════════════════════════════════════════════════
+
+SELECT
+    parent.relname AS tabla,
+    child.relname AS particion,
+    pg_get_expr(child.relpartbound, child.oid) AS rango
+FROM pg_inherits
+JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+WHERE parent.relname IN ('trips', 'deliveries')
+ORDER BY parent.relname, child.relname;
@@ -0,0 +1,223 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Shards para Generación Distribuida
+═══════════════════════════════════════════════════════════════════════════════
+Reparte la generación entre N nodos. El shard i de N genera:
+
+- Las tablas maestras completas (idénticas en todos los shards)
+- Su rango contiguo de trip_id [inicio, fin) y las entregas y
+  mantenimientos correspondientes a su parte
+
+Cada shard escribe sus tablas en un almacén columnar local más un
+manifiesto (shard_manifest.json) con filas y checksum SHA-256 por tabla.
+Solo se necesitan archivos locales; para fusionar basta con copiar los
+directorios de todos los shards a una misma carpeta.
+
+Estructura:
+    <directorio>/shard-000-of-004/shard_manifest.json
+    <directorio>/shard-000-of-004/<tabla>/...   (ver fleetlogix_columnstore)
+    ...
+
+Uso:
+    python fleetlogix_generator.py --scale 100 --shard 0/4 --shard-dir shards   # en cada nodo
+    python fleetlogix_generator.py --merge-shards shards                        # verificar y cargar
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+from fleetlogix_columnstore import ColumnStore, MANIFEST_FILE
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+DEFAULT_SHARD_DIR = 'shards'
+SHARD_MANIFEST = 'shard_manifest.json'
+
+MASTER_TABLES = ['vehicles', 'drivers', 'routes']
+SHARDED_TABLES = ['trips', 'deliveries', 'maintenance']
+
+# Bloque de lectura para los checksums
+CHECKSUM_BLOCK_SIZE = 1 << 20
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: REPARTO DE RANGOS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def parse_shard(text):
+    """
+    Convierte 'i/N' en (i, N) con 0 <= i < N (para argparse)
+    """
+    try:
+        index, count = (int(part) for part in text.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Formato de shard inválido '{text}' (use i/N, ej: 0/4)")
+    if count < 1 or not 0 <= index < count:
+        raise argparse.ArgumentTypeError(f"Shard fuera de rango '{text}' (i debe estar entre 0 y N-1)")
+    return index, count
+
+
+def shard_range(total, index, count):
+    """
+    Rango [inicio, fin) de la parte `index` de `total` elementos en `count` partes
+
+    Las partes son contiguas, disjuntas, cubren todo el total y difieren en
+    tamaño a lo sumo en 1.
+    """
+    return total * index // count, total * (index + 1) // count
+
+
+def shard_name(index, count):
+    """Nombre del directorio de un shard (ej: shard-002-of-008)"""
+    return f"shard-{index:03d}-of-{count:03d}"
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: MANIFIESTOS Y CHECKSUMS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def table_checksum(directory):
+    """
+    SHA-256 de todos los archivos de una tabla del almacén (nombre y contenido)
+    """
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        digest.update(name.encode('utf-8'))
+        with open(os.path.join(directory, name), 'rb') as f:
+            for block in iter(lambda: f.read(CHECKSUM_BLOCK_SIZE), b''):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def write_shard_manifest(store, index, count, seed, scale, trip_ids, workload='uniform'):
+    """
+    Escribe el manifiesto de un shard ya generado en su almacén
+
+    Args:
+        store (ColumnStore): Almacén local del shard
+        index (int): Índice del shard (0..count-1)
+        count (int): Total de shards
+        seed (int): Semilla raíz de la generación
+        scale (float): Factor de escala
+        trip_ids (tuple): Rango [inicio, fin) de trip_id del shard
+        workload (str): Especificación del perfil de carga (ver fleetlogix_workload)
+
+    Returns:
+        dict: Manifiesto escrito
+    """
+    tables = {}
+    for table_name in MASTER_TABLES + SHARDED_TABLES:
+        table = store.table(table_name)
+        tables[table_name] = {
+            'rows': len(table),
+            'sha256': table_checksum(table.directory),
+        }
+
+    manifest = {
+        'shard': index,
+        'shards': count,
+        'seed': seed,
+        'scale': scale,
+        'trip_ids': list(trip_ids),
+        'workload': workload,
+        'tables': tables,
+    }
+
+    # El manifiesto se escribe al final: un shard sin manifiesto está incompleto
+    with open(os.path.join(store.directory, SHARD_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def verify_shards(directory):
+    """
+    Verifica que los shards de un directorio forman una generación completa
+
+    Comprueba que estén todos los shards 0..N-1 con la misma semilla, escala
+    y perfil de carga,
+    que los checksums y filas coincidan con los archivos, que las tablas
+    maestras sean idénticas en todos y que los rangos de trip_id sean
+    contiguos y disjuntos.
+
+    Args:
+        directory (str): Carpeta con los directorios shard-*
+
+    Returns:
+        tuple: (manifiestos ordenados por shard, lista de errores)
+    """
+    manifests = []
+    for entry in sorted(os.listdir(directory)):
+        path = os.path.join(directory, entry, SHARD_MANIFEST)
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                manifests.append({**json.load(f), 'directory': os.path.join(directory, entry)})
+
+    if not manifests:
+        return [], [f"No hay shards con {SHARD_MANIFEST} en {directory}"]
+
+    errors = []
+    manifests.sort(key=lambda m: m['shard'])
+    first = manifests[0]
+
+    # Los manifiestos sin 'workload' (anteriores a los perfiles de carga) son uniformes
+    for key in ('shards', 'seed', 'scale', 'workload'):
+        values = sorted({str(m.get(key, 'uniform')) for m in manifests})
+        if len(values) > 1:
+            errors.append(f"Los shards difieren en '{key}': {', '.join(values)}")
+
+    indices = [m['shard'] for m in manifests]
+    expected = list(range(first['shards']))
+    if indices != expected:
+        missing = sorted(set(expected) - set(indices))
+        duplicated = sorted({i for i in indices if indices.count(i) > 1})
+        if missing:
+            errors.append(f"Faltan shards: {', '.join(map(str, missing))}")
+        if duplicated:
+            errors.append(f"Shards duplicados: {', '.join(map(str, duplicated))}")
+
+    next_trip_id = 1
+    for manifest in manifests:
+        label = shard_name(manifest['shard'], manifest['shards'])
+
+        for table_name, spec in manifest['tables'].items():
+            table_dir = os.path.join(manifest['directory'], table_name)
+            if not os.path.exists(os.path.join(table_dir, MANIFEST_FILE)):
+                errors.append(f"{label}: falta la tabla {table_name}")
+                continue
+            if table_checksum(table_dir) != spec['sha256']:
+                errors.append(f"{label}: checksum de {table_name} no coincide")
+            if len(ColumnStore(manifest['directory']).table(table_name)) != spec['rows']:
+                errors.append(f"{label}: filas de {table_name} no coinciden con el manifiesto")
+
+        for table_name in MASTER_TABLES:
+            if manifest['tables'][table_name]['sha256'] != first['tables'][table_name]['sha256']:
+                errors.append(f"{label}: {table_name} difiere del shard {first['shard']} (semilla o catálogo distintos)")
+
+        start, stop = manifest['trip_ids']
+        if start != next_trip_id:
+            errors.append(f"{label}: trip_id empieza en {start:,}, se esperaba {next_trip_id:,}")
+        if stop - start != manifest['tables']['trips']['rows']:
+            errors.append(f"{label}: el rango de trip_id no coincide con las filas de trips")
+        next_trip_id = stop
+
+    return manifests, errors
+
+
+def merge_plan(manifests):
+    """
+    Orden de carga de la fusión: maestras del primer shard y luego cada
+    tabla transaccional de todos los shards en orden (trip_id crece con el shard)
+
+    Returns:
+        list: [(tabla, [StoredTable, ...])]
+    """
+    stores = [ColumnStore(m['directory']) for m in manifests]
+    plan = [(table_name, [stores[0].table(table_name)]) for table_name in MASTER_TABLES]
+    plan += [(table_name, [store.table(table_name) for store in stores]) for table_name in SHARDED_TABLES]
+    return plan
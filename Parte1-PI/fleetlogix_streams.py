@@ -0,0 +1,126 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Flujos Aleatorios Independientes por Tabla y Columna
+═══════════════════════════════════════════════════════════════════════════════
+Deriva de RANDOM_SEED un árbol de semillas (np.random.SeedSequence):
+
+    RANDOM_SEED
+    ├── vehicles
+    │   ├── license_plate      → np.random.Generator propio
+    │   ├── capacity_kg        → np.random.Generator propio
+    │   └── ...
+    ├── trips
+    │   └── ...
+    └── ...
+
+Cada nodo se identifica por el NOMBRE de la tabla y de la columna (no por
+el orden de uso), de modo que:
+- Cambiar la cantidad de filas de una tabla no altera las demás tablas
+- Agregar o quitar una columna no altera las otras columnas de la tabla
+- Tablas independientes pueden generarse en procesos distintos y el
+  resultado es idéntico al de la generación secuencial
+- Cada shard de una generación distribuida (shard(i)) tiene su propio
+  subárbol, determinista e independiente de los demás shards
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import zlib
+
+import numpy as np
+from faker import Faker
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+FAKER_LOCALE = 'es_MX'
+
+
+def _node_key(name):
+    """
+    Clave entera estable de un nodo del árbol (igual entre procesos y ejecuciones)
+
+    No se usa hash() porque Python aleatoriza el hash de str por proceso.
+    """
+    return zlib.crc32(name.encode('utf-8'))
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: ÁRBOL DE SEMILLAS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class TableStreams:
+    """
+    Flujos aleatorios de una tabla: un np.random.Generator (o Faker) por columna
+
+    Cada llamada a column()/faker() con el mismo nombre retorna un flujo
+    nuevo desde el inicio, por lo que regenerar una tabla es reproducible.
+    """
+
+    def __init__(self, seed, table, shard=None):
+        self.seed = seed
+        self.table = table
+        self.shard = shard
+        self._table_key = _node_key(table)
+
+    def seed_sequence(self, column):
+        """
+        Nodo del árbol de semillas para (tabla, columna[, shard])
+        """
+        spawn_key = (self._table_key, _node_key(column))
+        if self.shard is not None:
+            spawn_key += (self.shard,)
+        return np.random.SeedSequence(self.seed, spawn_key=spawn_key)
+
+    def column(self, column):
+        """
+        Generador NumPy independiente para una columna lógica de la tabla
+
+        Returns:
+            np.random.Generator: Compatible con CategoricalSampler y generate_route_frame
+        """
+        return np.random.default_rng(self.seed_sequence(column))
+
+    def faker(self, column, locale=FAKER_LOCALE):
+        """
+        Instancia de Faker sembrada con el nodo de la columna
+
+        Returns:
+            Faker: Instancia propia (no comparte estado con Faker.seed global)
+        """
+        fake = Faker(locale)
+        fake.seed_instance(int(self.seed_sequence(column).generate_state(1)[0]))
+        return fake
+
+
+class RandomStreams:
+    """
+    Raíz del árbol de semillas de la generación
+
+    Uso:
+        streams = RandomStreams(RANDOM_SEED)
+        rng = streams.table('trips')
+        hours = HOURLY_SAMPLER.sample(n, random_state=rng.column('departure_hour'))
+    """
+
+    def __init__(self, seed, shard=None):
+        """
+        Args:
+            seed (int): Semilla raíz (RANDOM_SEED)
+            shard (int): Índice de shard (None = generación completa)
+        """
+        self.seed = seed
+        self.shard = shard
+
+    def table(self, table):
+        """
+        Flujos de una tabla (vehicles, drivers, routes, trips, deliveries, maintenance)
+        """
+        return TableStreams(self.seed, table, self.shard)
+
+    def for_shard(self, shard):
+        """
+        Subárbol de un shard: mismas tablas y columnas, flujos distintos por shard
+        """
+        return RandomStreams(self.seed, shard)
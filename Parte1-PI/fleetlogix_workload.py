@@ -0,0 +1,247 @@
+"""
+═══════════════════════════════════════════════════════════════════════════════
+FLEETLOGIX - Perfiles de Carga Sesgada (Zipf, Hot-set, Picos Estacionales)
+═══════════════════════════════════════════════════════════════════════════════
+Con el perfil uniforme cada vehículo, conductor y ruta recibe una cuota
+similar de viajes, lo que oculta la contención sobre claves calientes y
+los errores de estimación del planner que aparecen cuando unos pocos
+depósitos y rutas concentran la operación. Un perfil define:
+
+    uniform                       todas las claves equiprobables (default)
+    zipf[:s]                      popularidad ∝ 1 / rango^s          (default s=1.1)
+    hotset[:fracción[:cuota]]     la fracción de claves más popular recibe
+                                  la cuota de los viajes             (default 0.05, 0.8)
+    seasonal[:amplitud]           los días de temporada alta reciben
+                                  (1 + amplitud) veces el volumen    (default 3)
+
+La popularidad (zipf o hotset) se combina con los picos estacionales
+usando '+', ej: zipf:1.3+seasonal. Los picos reparten los DÍAS de salida;
+la hora sigue get_hourly_distribution().
+
+Los rangos de popularidad se asignan con una permutación sembrada (las
+claves calientes no son siempre los ids más bajos) y se compilan en tablas
+alias (CategoricalSampler): muestrear sigue siendo O(1) por viaje.
+
+Uso:
+    profile = WorkloadProfile.parse('zipf:1.2+seasonal:4')
+    sampler = profile.key_sampler(num_vehicles, random_state=rng)   # None si es uniforme
+    python fleetlogix_generator.py --workload hotset:0.02:0.9
+═══════════════════════════════════════════════════════════════════════════════
+"""
+
+import argparse
+
+import numpy as np
+
+from fleetlogix_sampler import CategoricalSampler
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 1: CONFIGURACIÓN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+UNIFORM = 'uniform'
+POPULARITY_PROFILES = {
+    'zipf': (1.1,),          # exponente s
+    'hotset': (0.05, 0.8),   # fracción de claves calientes, cuota de viajes
+}
+SEASONAL = 'seasonal'
+DEFAULT_SEASONAL_AMPLITUDE = 3.0
+
+# Temporadas altas (mes, día) inicio y fin inclusivos, repetidas cada año
+SEASONAL_BURSTS = [
+    ((5, 20), (5, 31), 'Día de las Madres'),
+    ((8, 15), (9, 5), 'Regreso a clases'),
+    ((11, 15), (12, 31), 'Temporada navideña'),
+]
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 2: PERFIL DE CARGA
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class WorkloadProfile:
+    """
+    Popularidad de claves y picos estacionales de la generación de viajes
+
+    Atributos:
+        popularity (str): 'uniform', 'zipf' o 'hotset'
+        params (tuple): Parámetros de la popularidad
+        seasonal_amplitude (float): Volumen extra de los días de temporada alta (0 = sin picos)
+    """
+
+    def __init__(self, popularity=UNIFORM, params=(), seasonal_amplitude=0.0):
+        if popularity != UNIFORM and popularity not in POPULARITY_PROFILES:
+            raise ValueError(f"Perfil de popularidad desconocido: {popularity}")
+        params = tuple(float(p) for p in params) or POPULARITY_PROFILES.get(popularity, ())
+
+        if popularity == 'zipf' and params[0] <= 0:
+            raise ValueError(f"El exponente Zipf debe ser positivo: {params[0]}")
+        if popularity == 'hotset' and not (0 < params[0] < 1 and 0 < params[1] < 1):
+            raise ValueError(f"hotset requiere 0 < fracción < 1 y 0 < cuota < 1: {params}")
+        if seasonal_amplitude < 0:
+            raise ValueError(f"La amplitud estacional no puede ser negativa: {seasonal_amplitude}")
+
+        self.popularity = popularity
+        self.params = params
+        self.seasonal_amplitude = float(seasonal_amplitude)
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Crea el perfil desde su especificación (ej: 'zipf:1.3+seasonal')
+        """
+        popularity, params, amplitude = UNIFORM, (), 0.0
+        for part in spec.strip().lower().split('+'):
+            name, *values = part.strip().split(':')
+            try:
+                values = [float(v) for v in values]
+            except ValueError:
+                raise ValueError(f"Parámetro no numérico en '{part}'")
+
+            if name == SEASONAL:
+                if len(values) > 1:
+                    raise ValueError("seasonal acepta un solo parámetro (amplitud)")
+                amplitude = values[0] if values else DEFAULT_SEASONAL_AMPLITUDE
+            elif name == UNIFORM or name in POPULARITY_PROFILES:
+                if popularity != UNIFORM or params:
+                    raise ValueError("Solo se admite un perfil de popularidad (uniform, zipf o hotset)")
+                if len(values) > len(POPULARITY_PROFILES.get(name, ())):
+                    raise ValueError(f"Demasiados parámetros para {name}")
+                popularity = name
+                params = tuple(values) + POPULARITY_PROFILES.get(name, ())[len(values):]
+            else:
+                raise ValueError(f"Perfil desconocido '{name}' "
+                                 f"(disponibles: uniform, {', '.join(POPULARITY_PROFILES)}, seasonal)")
+
+        return cls(popularity, params, amplitude)
+
+    @property
+    def spec(self):
+        """Especificación canónica con todos los parámetros (ej: 'zipf:1.1+seasonal:3')"""
+        parts = []
+        if self.popularity != UNIFORM or not self.seasonal_amplitude:
+            parts.append(':'.join([self.popularity] + [f"{p:g}" for p in self.params]))
+        if self.seasonal_amplitude:
+            parts.append(f"{SEASONAL}:{self.seasonal_amplitude:g}")
+        return '+'.join(parts)
+
+    @property
+    def is_uniform(self):
+        return self.popularity == UNIFORM and not self.seasonal_amplitude
+
+    def __repr__(self):
+        return f"WorkloadProfile('{self.spec}')"
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Popularidad de claves
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def rank_weights(self, count):
+        """
+        Peso de cada rango de popularidad 1..count (el rango 1 es el más popular)
+
+        Returns:
+            numpy.array | None: Pesos, o None si la popularidad es uniforme
+        """
+        if self.popularity == 'zipf':
+            return 1.0 / np.arange(1, count + 1, dtype=np.float64) ** self.params[0]
+        if self.popularity == 'hotset':
+            fraction, share = self.params
+            hot = min(count, max(1, int(round(fraction * count))))
+            if hot == count:
+                return np.ones(count)
+            return np.where(np.arange(count) < hot, share / hot, (1.0 - share) / (count - hot))
+        return None
+
+    def key_sampler(self, count, random_state):
+        """
+        Tabla alias sobre los ids 1..count con la popularidad del perfil
+
+        Args:
+            count (int): Cantidad de claves (ej: NUM_VEHICLES)
+            random_state (np.random.Generator): Flujo de la permutación de rangos
+
+        Returns:
+            CategoricalSampler | None: None si la popularidad es uniforme
+        """
+        weights = self.rank_weights(count)
+        if weights is None:
+            return None
+        ranks = random_state.permutation(count)
+        return CategoricalSampler(np.arange(1, count + 1), weights[ranks])
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # Picos estacionales
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def day_weights(self, start, end):
+        """
+        Peso de cada día del período [start, end] (1 normal, 1 + amplitud en temporada alta)
+
+        Returns:
+            numpy.array | None: Un peso por día, o None si no hay picos
+        """
+        if not self.seasonal_amplitude:
+            return None
+
+        days = np.arange(np.datetime64(start.date()), np.datetime64(end.date()) + 1)
+        month_day = (days.astype('datetime64[M]').astype(np.int64) % 12 + 1) * 100 + \
+                    (days - days.astype('datetime64[M]')).astype(np.int64) + 1
+
+        weights = np.ones(len(days))
+        for (start_month, start_day), (end_month, end_day), _ in SEASONAL_BURSTS:
+            in_burst = (month_day >= start_month * 100 + start_day) & (month_day <= end_month * 100 + end_day)
+            weights[in_burst] = 1.0 + self.seasonal_amplitude
+        return weights
+
+    def day_sampler(self, start, end):
+        """
+        Tabla alias sobre el desplazamiento en días desde start, o None sin picos
+        """
+        weights = self.day_weights(start, end)
+        if weights is None:
+            return None
+        return CategoricalSampler(np.arange(len(weights)), weights)
+
+    def describe(self):
+        """
+        Descripción legible del perfil para los reportes
+        """
+        if self.popularity == 'zipf':
+            text = f"Zipf s={self.params[0]:g}"
+        elif self.popularity == 'hotset':
+            text = f"hot-set: {self.params[0]:.0%} de las claves con {self.params[1]:.0%} de los viajes"
+        else:
+            text = "claves uniformes"
+        if self.seasonal_amplitude:
+            text += f" + picos estacionales x{1 + self.seasonal_amplitude:g} " \
+                    f"({', '.join(name for _, _, name in SEASONAL_BURSTS)})"
+        return text
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# SECCIÓN 3: MEDICIÓN DEL SESGO
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def top_share(keys, fraction=0.1):
+    """
+    Cuota de filas que concentra la fracción de claves más frecuentes
+
+    Con claves uniformes es cercana a `fraction`; con Zipf o hot-set, mucho mayor.
+    """
+    counts = np.sort(np.unique(np.asarray(keys), return_counts=True)[1])[::-1]
+    if not len(counts):
+        return 0.0
+    top = max(1, int(round(fraction * len(counts))))
+    return float(counts[:top].sum() / counts.sum())
+
+
+def parse_workload(text):
+    """
+    Convierte la especificación de --workload en WorkloadProfile (para argparse)
+    """
+    try:
+        return WorkloadProfile.parse(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"Perfil de carga inválido '{text}': {e}")
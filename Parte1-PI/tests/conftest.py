@@ -0,0 +1,18 @@
+"""
+Fixtures compartidas: el generador guarda escala, shard, perfil de carga y
+semilla en variables de módulo, que cada prueba deja como las encontró.
+"""
+
+import pytest
+
+import fleetlogix_generator as flg
+
+
+@pytest.fixture
+def generator():
+    """Módulo generador con la configuración por defecto restaurada al terminar"""
+    yield flg
+    flg.set_scale(1.0)
+    flg.set_workload('uniform')
+    flg.set_maintenance_model('proportional')
+    flg.reset_random_state(flg.RANDOM_SEED)
@@ -0,0 +1,73 @@
+"""
+Smoke tests de línea de comandos: cada modo de --generate-only termina sin
+errores a escala mínima (no requieren PostgreSQL)
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCALE = '0.01'
+
+
+def run(script, *args, cwd):
+    result = subprocess.run(
+        [sys.executable, os.path.join(PACKAGE_DIR, script), *args],
+        cwd=cwd, capture_output=True, text=True, timeout=600,
+        env={**os.environ, 'PYTHONPATH': PACKAGE_DIR},
+    )
+    assert result.returncode == 0, result.stdout[-3000:] + result.stderr[-3000:]
+    assert 'Traceback' not in result.stderr
+    return result.stdout
+
+
+@pytest.mark.parametrize('args', [
+    [],
+    ['--generate-workers', '2'],
+    ['--column-store', 'store'],
+    ['--generate-workers', '2', '--column-store', 'store', '--conformance', '--summaries'],
+    ['--conformance', '--summaries'],
+    ['--maintenance-model', 'odometer', '--conformance'],
+    ['--workload', 'zipf:1.2+seasonal', '--conformance'],
+    ['--generate-workers', '2', '--profile', 'deliveries', '--profile-dir', 'profiles'],
+], ids=['sequential', 'workers', 'column-store', 'workers-column-store', 'summaries',
+        'odometer', 'workload', 'profile-workers'])
+def test_generate_only_modes(tmp_path, args):
+    output = run('fleetlogix_generator.py', '--generate-only', '--scale', SCALE, *args, cwd=tmp_path)
+    assert 'GENERACIÓN COMPLETADA' in output
+    if '--conformance' in args:
+        assert 'Todas las distribuciones conformes' in output
+    if '--profile' in args:
+        assert (tmp_path / 'profiles' / 'generate_deliveries.prof').exists()
+
+
+def test_shards_and_events(tmp_path):
+    for index in range(2):
+        run('fleetlogix_generator.py', '--scale', SCALE, '--shard', f'{index}/2', '--shard-dir', 'shards',
+            '--conformance', '--summaries', cwd=tmp_path)
+
+    shard_dir = tmp_path / 'shards' / 'shard-001-of-002'
+    with open(shard_dir / 'shard_manifest.json', encoding='utf-8') as f:
+        first_trip_id, stop = json.load(f)['trip_ids']
+
+    run('fleetlogix_events.py', '--column-store', str(shard_dir), '--output', 'events.jsonl', cwd=tmp_path)
+    with open(tmp_path / 'events.jsonl', encoding='utf-8') as f:
+        trip_ids = {json.loads(line)['trip_id'] for line in f}
+    assert min(trip_ids) >= first_trip_id and max(trip_ids) < stop
+
+
+def test_benchmark_require_baseline(tmp_path):
+    args = ['--scales', SCALE, '--no-memory', '--baseline', str(tmp_path / 'baseline.json')]
+    run('fleetlogix_benchmark.py', *args, '--save-baseline', cwd=tmp_path)
+    run('fleetlogix_benchmark.py', *args, '--require-baseline', '--max-regression', '0.99', cwd=tmp_path)
+
+    missing = subprocess.run(
+        [sys.executable, os.path.join(PACKAGE_DIR, 'fleetlogix_benchmark.py'), '--scales', SCALE, '--no-memory',
+         '--baseline', str(tmp_path / 'missing.json'), '--require-baseline'],
+        cwd=tmp_path, capture_output=True, text=True, timeout=600,
+    )
+    assert missing.returncode == 1
@@ -0,0 +1,172 @@
+"""Pruebas de funciones puras y reproducibilidad de fleetlogix_generator"""
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fleetlogix_aggregates import build_summaries
+from fleetlogix_conformance import check_conformance
+
+SCALE = 0.01
+
+
+def generate_all(flg):
+    """Genera las seis tablas en secuencia sin salida por consola"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        vehicles = flg.generate_vehicles()
+        drivers = flg.generate_drivers()
+        routes = flg.generate_routes()
+        trips = flg.generate_trips(vehicles, drivers, routes)
+        deliveries = flg.generate_deliveries(trips, routes)
+        maintenance = flg.generate_maintenance(trips, vehicles, routes)
+    return {'vehicles': vehicles, 'drivers': drivers, 'routes': routes,
+            'trips': trips, 'deliveries': deliveries, 'maintenance': maintenance}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Validación por muestreo y carga adaptativa
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_wilson_interval(generator):
+    assert generator.wilson_interval(0, 0) == (0.0, 1.0)
+    low, high = generator.wilson_interval(0, 1000)
+    assert low == pytest.approx(0.0, abs=1e-12) and high == pytest.approx(0.00383, abs=1e-4)
+    low, high = generator.wilson_interval(50, 100)
+    assert low == pytest.approx(0.404, abs=1e-3) and high == pytest.approx(0.596, abs=1e-3)
+    assert generator.wilson_interval(10, 100, confidence=0.99)[1] > generator.wilson_interval(10, 100)[1]
+
+
+def test_adaptive_batch_sizer_grows_then_returns_to_best(generator):
+    sizer = generator.AdaptiveBatchSizer(1000, minimum=100, maximum=8000)
+    sizer.record(1000, 1.0)                 # 1,000 r/s → crece
+    assert sizer.size == 2000
+    sizer.record(2000, 1.0)                 # 2,000 r/s → crece
+    assert sizer.size == 4000
+    sizer.record(4000, 8.0)                 # 500 r/s → vuelve al mejor y cambia de dirección
+    assert sizer.size == 2000 and not sizer.growing
+
+
+def test_adaptive_batch_sizer_limits_and_fixed_mode(generator):
+    sizer = generator.AdaptiveBatchSizer(6000, minimum=100, maximum=8000)
+    sizer.record(6000, 1.0)
+    assert sizer.size == 8000
+    fixed = generator.AdaptiveBatchSizer(1000, adaptive=False)
+    fixed.record(1000, 0.001)
+    assert fixed.size == 1000
+
+
+def test_load_signature_identifies_dataset(generator):
+    base = generator.load_signature(10)
+    generator.set_workload('zipf')
+    assert generator.load_signature(10) != base
+    generator.set_workload('uniform')
+    generator.set_maintenance_model('odometer')
+    assert generator.load_signature(10) != base
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Mantenimientos en modo shard
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_allocate_maintenance_hits_target_with_one_per_vehicle(generator):
+    generator.set_scale(SCALE)
+    counts = generator.allocate_maintenance({1: 90, 2: 10}, 60, np.random.default_rng(0))
+    assert sum(counts.values()) == 60
+    assert set(counts) == set(range(1, generator.NUM_VEHICLES + 1))
+    assert min(counts.values()) >= 1
+
+
+def test_shard_maintenance_slices_cover_full_allocation(generator):
+    generator.set_scale(SCALE)
+    full = {vehicle_id: vehicle_id % 4 + 1 for vehicle_id in range(1, generator.NUM_VEHICLES + 1)}
+    total = sum(full.values())
+    merged = {vehicle_id: 0 for vehicle_id in full}
+    for index in range(3):
+        start, stop = generator.shard_range(total, index, 3)
+        for vehicle_id, n in generator.shard_maintenance_counts(full, start, stop - start).items():
+            merged[vehicle_id] += n
+    assert merged == full
+
+
+@pytest.mark.parametrize('count', [2, 16])
+def test_sharded_totals_match_single_run(generator, count):
+    generator.set_scale(SCALE)
+    expected = dict(generator.FULL_COUNTS)
+    totals = dict.fromkeys(expected, 0)
+    trip_ids = []
+    for index in range(count):
+        generator.set_shard(index, count)
+        tables = generate_all(generator)
+        for table_name in totals:
+            totals[table_name] += len(tables[table_name])
+        trip_ids.append(tables['deliveries']['trip_id'].agg(['min', 'max']).tolist())
+    assert totals == expected
+    assert trip_ids[0][0] == 1 and trip_ids[-1][1] == expected['trips']
+
+
+def test_full_trips_per_vehicle_matches_shards(generator):
+    generator.set_scale(SCALE)
+    counts = pd.Series(0, index=range(1, generator.NUM_VEHICLES + 1))
+    for index in range(3):
+        generator.set_shard(index, 3)
+        counts = counts.add(generate_all(generator)['trips']['vehicle_id'].value_counts(), fill_value=0)
+    assert generator.full_trips_per_vehicle() == {k: int(v) for k, v in counts.items() if v}
+
+
+def test_shard_summaries_and_conformance_use_shard_trip_ids(generator):
+    generator.set_scale(0.05)
+    generator.set_shard(1, 2)
+    tables = generate_all(generator)
+    first_trip_id = generator.TRIP_ID_OFFSET + 1
+
+    summaries = build_summaries(tables['trips'], tables['vehicles'], tables['routes'], tables['deliveries'],
+                                first_trip_id=first_trip_id)
+    delivered = (tables['deliveries']['delivery_status'] == 'delivered').sum()
+    assert summaries['daily_vehicle_summary']['deliveries_delivered'].sum() == delivered
+
+    results = check_conformance(
+        tables['trips'], tables['deliveries'], tables['vehicles'], tables['routes'],
+        samplers={
+            'hourly': generator.HOURLY_SAMPLER,
+            'trip_status': generator.TRIP_STATUS_SAMPLER,
+            'deliveries_per_trip': generator.DELIVERIES_PER_TRIP_SAMPLER,
+            'delivery_status': generator.DELIVERY_STATUS_SAMPLER,
+            'signature': generator.SIGNATURE_SAMPLER,
+        },
+        km_per_liter={vtype: specs['km_per_liter'] for vtype, specs in generator.VEHICLE_TYPES.items()},
+        first_trip_id=first_trip_id,
+    )
+    assert results
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reproducibilidad
+# ─────────────────────────────────────────────────────────────────────────────
+
+def test_generation_is_reproducible(generator):
+    generator.set_scale(SCALE)
+    first = generate_all(generator)
+    generator.reset_random_state(generator.RANDOM_SEED)
+    second = generate_all(generator)
+    for table_name, df in first.items():
+        pd.testing.assert_frame_equal(df, second[table_name])
+
+
+def test_parallel_generation_matches_sequential(generator):
+    generator.set_scale(SCALE)
+    sequential = generate_all(generator)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        masters = generator.generate_tables_parallel(
+            [('vehicles', ()), ('drivers', ()), ('routes', ())], workers=2)
+        trips = generator.generate_trips(masters['vehicles'], masters['drivers'], masters['routes'])
+        dependents = generator.generate_tables_parallel(
+            [('deliveries', (trips, masters['routes'])),
+             ('maintenance', (trips, masters['vehicles'], masters['routes']))], workers=2)
+
+    parallel = {**masters, 'trips': trips, **dependents}
+    for table_name, df in sequential.items():
+        pd.testing.assert_frame_equal(df, parallel[table_name])
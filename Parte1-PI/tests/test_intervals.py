@@ -0,0 +1,111 @@
+"""Pruebas de fleetlogix_intervals (índice de intervalos de viajes)"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fleetlogix_intervals import OPEN_END, IntervalIndex
+
+
+@pytest.fixture
+def trips_df():
+    """
+    Vehículo 1: dos viajes terminados y un in_progress antiguo seguido de
+    otro viaje; vehículo 2: un cancelado sin llegada y un in_progress final
+    """
+    return pd.DataFrame({
+        'vehicle_id':   [1, 1, 1, 1, 2, 2],
+        'driver_id':    [10, 11, 10, 12, 11, 13],
+        'route_id':     [1, 1, 2, 1, 2, 1],
+        'departure_datetime': pd.to_datetime([
+            '2024-01-01 08:00', '2024-01-01 10:00', '2024-01-05 08:00', '2024-03-01 08:00',
+            '2024-01-01 09:00', '2024-06-01 08:00',
+        ]),
+        'arrival_datetime': pd.to_datetime([
+            '2024-01-01 12:00', '2024-01-01 14:00', None, '2024-03-01 09:00',
+            None, None,
+        ]),
+        'status': ['completed', 'completed', 'in_progress', 'completed', 'cancelled', 'in_progress'],
+    })
+
+
+@pytest.fixture
+def routes_df():
+    return pd.DataFrame({
+        'route_code': ['RT-001', 'RT-002'], 'origin_city': ['A', 'A'], 'destination_city': ['B', 'C'],
+        'distance_km': [100.0, 300.0], 'estimated_duration_hours': [2.0, 6.0], 'toll_cost': [0.0, 0.0],
+    })
+
+
+def test_at_returns_trips_on_the_road(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, routes_df=routes_df)
+    on_road = index.at('2024-01-01 11:00')
+    assert sorted(on_road['trip_id']) == [1, 2]
+    assert list(index.active_keys('2024-01-01 11:00')) == [1]
+
+
+def test_arrival_is_exclusive_and_cancelled_never_on_road(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, routes_df=routes_df)
+    assert list(index.at('2024-01-01 14:00')['trip_id']) == []
+    assert 5 not in set(index.overlapping()['trip_id'])
+
+
+def test_stale_in_progress_is_bounded_by_route_duration(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, routes_df=routes_df)
+    assert list(index.at('2024-01-05 13:00')['trip_id']) == [3]      # salida + 6 h de la ruta 2
+    assert list(index.at('2024-01-05 15:00')['trip_id']) == []
+    assert list(index.at('2024-02-01 08:00')['trip_id']) == []
+
+
+def test_stale_in_progress_without_routes_ends_at_next_departure(trips_df):
+    index = IntervalIndex.from_trips(trips_df)
+    assert list(index.at('2024-02-01 08:00')['trip_id']) == [3]
+    assert list(index.at('2024-03-01 08:30')['trip_id']) == [4]
+
+
+def test_latest_in_progress_stays_open(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, routes_df=routes_df)
+    assert (index.ends == OPEN_END).sum() == 1
+    on_road = index.at('2025-12-31 23:00')
+    assert list(on_road['trip_id']) == [6]
+    assert on_road['arrival_datetime'].isna().all()
+
+
+def test_overlapping_window_and_keys(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, routes_df=routes_df)
+    assert sorted(index.overlapping('2024-01-01 11:00', '2024-01-01 13:00')['trip_id']) == [1, 2]
+    assert list(index.overlapping('2024-01-01', '2024-02-01', keys=[2])['trip_id']) == []
+    assert list(index.overlapping(keys=[99])['trip_id']) == []
+
+
+def test_busy_hours_clip_to_window(trips_df, routes_df):
+    index = IntervalIndex.from_trips(trips_df, by='driver_id', routes_df=routes_df)
+    hours = index.busy_hours('2024-01-01 09:00', '2024-01-01 13:00')
+    assert hours.to_dict() == {10: pytest.approx(3.0), 11: pytest.approx(3.0)}
+
+
+def test_self_overlaps_counts_double_assignment(trips_df, routes_df):
+    overlaps = IntervalIndex.from_trips(trips_df, routes_df=routes_df).self_overlaps()
+    assert overlaps.to_dict() == {1: 1}
+
+
+def test_span_and_shard_trip_ids(trips_df):
+    index = IntervalIndex.from_trips(trips_df, first_trip_id=101)
+    span = index.span()
+    assert span['trips'].to_dict() == {1: 4, 2: 2}
+    assert span.loc[1, 'last_departure'] == pd.Timestamp('2024-03-01 08:00')
+    assert sorted(index.overlapping()['trip_id']) == [101, 102, 103, 104, 106]
+
+
+def test_matches_brute_force_on_random_trips():
+    rng = np.random.default_rng(0)
+    n = 500
+    starts = rng.integers(0, 10_000, n) * 60
+    ends = starts + rng.integers(1, 600, n) * 60
+    keys = rng.integers(1, 8, n)
+    index = IntervalIndex(keys, starts * 10**9, ends * 10**9, np.arange(1, n + 1))
+
+    for t in rng.integers(0, 10_000, 50) * 60:
+        expected = np.flatnonzero((starts <= t) & (ends > t)) + 1
+        found = index.at(pd.Timestamp(int(t) * 10**9))['trip_id'].to_numpy()
+        np.testing.assert_array_equal(np.sort(found), expected)
@@ -0,0 +1,48 @@
+"""Pruebas de fleetlogix_odometer (odómetro y programación por km / días)"""
+
+import numpy as np
+import pytest
+
+from fleetlogix_odometer import SECONDS_PER_DAY, OdometerLog, schedule_maintenance
+
+
+@pytest.fixture
+def log():
+    # Vehículo 1: 4 viajes de 100 km, uno por día; vehículo 2: 1 viaje de 50 km
+    return OdometerLog(
+        vehicle_ids=[1, 2, 1, 1, 1],
+        departure_seconds=np.array([0, 0, 1, 2, 3]) * SECONDS_PER_DAY,
+        km=[100, 50, 100, 100, 100],
+        initial_km={1: 1000.0, 2: 0.0},
+    )
+
+
+def test_odometer_accumulates_per_vehicle(log):
+    np.testing.assert_allclose(log.odometer, [1100, 1200, 1300, 1400, 50])
+    assert log.total_km().to_dict() == {1: 400.0, 2: 50.0}
+
+
+def test_reading_before(log):
+    groups = np.array([0, 0, 1])
+    seconds = np.array([-1, 2 * SECONDS_PER_DAY + 1, SECONDS_PER_DAY])
+    np.testing.assert_allclose(log.reading_before(groups, seconds), [1000, 1300, 50])
+
+
+def test_schedule_maintenance_respects_km_interval(log):
+    services = schedule_maintenance(log, {'Cambio de aceite': (150, 365)}, random_state=np.random.default_rng(0))
+    vehicle_1 = services[services['vehicle_id'] == 1]
+    assert (vehicle_1['trigger'] == 'km').all()
+    assert (np.diff(vehicle_1['odometer_km'].to_numpy()) >= 150).all()
+    assert (services['service_seconds'] <= 3 * SECONDS_PER_DAY).all()
+
+
+def test_schedule_maintenance_by_days(log):
+    services = schedule_maintenance(log, {'Revisión': (10**6, 1)}, random_state=np.random.default_rng(0))
+    vehicle_1 = services[services['vehicle_id'] == 1]
+    assert (vehicle_1['trigger'] == 'days').all()
+    assert (np.diff(vehicle_1['service_seconds'].to_numpy()) == SECONDS_PER_DAY).all()
+
+
+def test_schedule_maintenance_empty_log():
+    empty = OdometerLog([], [], [], {})
+    assert schedule_maintenance(empty, {'Revisión': (100, 10)}).empty
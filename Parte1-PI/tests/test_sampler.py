@@ -0,0 +1,60 @@
+"""Pruebas de fleetlogix_sampler (tablas alias)"""
+
+import numpy as np
+import pytest
+
+from fleetlogix_sampler import CategoricalSampler, ConditionalSampler
+
+SAMPLES = 200_000
+
+
+def frequencies(values, categories):
+    return np.array([(values == c).mean() for c in categories])
+
+
+def test_categorical_frequencies_match_probabilities():
+    sampler = CategoricalSampler(['completed', 'in_progress', 'cancelled'], [0.95, 0.03, 0.02])
+    values = sampler.sample(SAMPLES, random_state=np.random.default_rng(1))
+    np.testing.assert_allclose(frequencies(values, sampler.values), [0.95, 0.03, 0.02], atol=0.003)
+
+
+def test_categorical_normalizes_weights_and_never_samples_zero_weight():
+    sampler = CategoricalSampler(['a', 'b', 'c'], [3, 0, 1])
+    np.testing.assert_allclose(sampler.probabilities, [0.75, 0.0, 0.25])
+    values = sampler.sample(SAMPLES, random_state=np.random.default_rng(2))
+    assert not (values == 'b').any()
+    np.testing.assert_allclose(frequencies(values, ['a', 'c']), [0.75, 0.25], atol=0.005)
+
+
+def test_categorical_is_deterministic_per_seed():
+    sampler = CategoricalSampler.uniform(np.arange(10))
+    first = sampler.sample(1000, random_state=np.random.default_rng(7))
+    second = sampler.sample(1000, random_state=np.random.default_rng(7))
+    np.testing.assert_array_equal(first, second)
+
+
+def test_categorical_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        CategoricalSampler(['a', 'b'], [1.0])
+
+
+def test_conditional_frequencies_per_parent():
+    sampler = ConditionalSampler({
+        'completed': {'delivered': 0.85, 'pending': 0.10, 'failed': 0.05},
+        'cancelled': {'pending': 0.60, 'failed': 0.40},
+    })
+    parents = np.repeat(['completed', 'cancelled'], SAMPLES // 2)
+    values = sampler.sample(parents, random_state=np.random.default_rng(3))
+
+    completed = values[parents == 'completed']
+    cancelled = values[parents == 'cancelled']
+    np.testing.assert_allclose(frequencies(completed, ['delivered', 'pending', 'failed']),
+                               [0.85, 0.10, 0.05], atol=0.005)
+    np.testing.assert_allclose(frequencies(cancelled, ['delivered', 'pending', 'failed']),
+                               [0.0, 0.60, 0.40], atol=0.005)
+
+
+def test_conditional_rejects_unknown_parent():
+    sampler = ConditionalSampler({'completed': {'delivered': 1.0}})
+    with pytest.raises(ValueError):
+        sampler.sample(['in_progress'])
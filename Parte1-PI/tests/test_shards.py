@@ -0,0 +1,71 @@
+"""Pruebas de fleetlogix_shards (rangos, manifiestos y verificación)"""
+
+import argparse
+
+import pandas as pd
+import pytest
+
+from fleetlogix_columnstore import ColumnStore
+from fleetlogix_shards import (
+    MASTER_TABLES, parse_shard, shard_name, shard_range, verify_shards, write_shard_manifest
+)
+
+
+@pytest.mark.parametrize('total, count', [(10, 3), (7, 7), (100_000, 32), (5, 1)])
+def test_shard_ranges_are_contiguous_disjoint_and_balanced(total, count):
+    ranges = [shard_range(total, i, count) for i in range(count)]
+    assert ranges[0][0] == 0 and ranges[-1][1] == total
+    assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+    sizes = [stop - start for start, stop in ranges]
+    assert max(sizes) - min(sizes) <= 1
+
+
+def test_parse_shard():
+    assert parse_shard('2/8') == (2, 8)
+    for text in ('8/8', '-1/4', 'a/b', '1'):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(text)
+
+
+def write_shards(directory, trips_per_shard, seed=42):
+    """Shards mínimos: maestras idénticas y rangos de trip_id consecutivos"""
+    masters = {name: pd.DataFrame({'code': [f'{name}-1', f'{name}-2']}) for name in MASTER_TABLES}
+    count = len(trips_per_shard)
+    first = 1
+    for index, trips in enumerate(trips_per_shard):
+        store = ColumnStore(str(directory / shard_name(index, count)))
+        for name, df in masters.items():
+            store.write_table(name, df)
+        store.write_table('trips', pd.DataFrame({'vehicle_id': [1] * trips}))
+        store.write_table('deliveries', pd.DataFrame({'trip_id': list(range(first, first + trips))}))
+        store.write_table('maintenance', pd.DataFrame({'vehicle_id': [1]}))
+        write_shard_manifest(store, index, count, seed, 0.01, (first, first + trips))
+        first += trips
+
+
+def test_verify_shards_accepts_complete_generation(tmp_path):
+    write_shards(tmp_path, [3, 2, 3])
+    manifests, errors = verify_shards(str(tmp_path))
+    assert errors == []
+    assert [m['trip_ids'] for m in manifests] == [[1, 4], [4, 6], [6, 9]]
+
+
+def test_verify_shards_reports_missing_shard(tmp_path):
+    write_shards(tmp_path, [3, 2, 3])
+    manifest = tmp_path / shard_name(1, 3) / 'shard_manifest.json'
+    manifest.unlink()
+    _, errors = verify_shards(str(tmp_path))
+    assert any('Faltan shards: 1' in e for e in errors)
+    assert any('trip_id empieza' in e for e in errors)
+
+
+def test_verify_shards_reports_tampered_table(tmp_path):
+    write_shards(tmp_path, [2, 2])
+    ColumnStore(str(tmp_path / shard_name(1, 2))).write_table('trips', pd.DataFrame({'vehicle_id': [9, 9]}))
+    _, errors = verify_shards(str(tmp_path))
+    assert any('checksum de trips' in e for e in errors)
+
+
+def test_verify_shards_empty_directory(tmp_path):
+    manifests, errors = verify_shards(str(tmp_path))
+    assert manifests == [] and errors
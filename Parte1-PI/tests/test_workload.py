@@ -0,0 +1,66 @@
+"""Pruebas de fleetlogix_workload (perfiles de carga)"""
+
+import argparse
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from fleetlogix_workload import WorkloadProfile, parse_workload, top_share
+
+
+@pytest.mark.parametrize('text, spec', [
+    ('uniform', 'uniform'),
+    ('zipf', 'zipf:1.1'),
+    ('ZIPF:1.3 + seasonal', 'zipf:1.3+seasonal:3'),
+    ('hotset:0.02', 'hotset:0.02:0.8'),
+    ('seasonal:4', 'seasonal:4'),
+])
+def test_parse_canonical_spec(text, spec):
+    profile = WorkloadProfile.parse(text)
+    assert profile.spec == spec
+    assert WorkloadProfile.parse(profile.spec).spec == spec
+
+
+@pytest.mark.parametrize('text', [
+    'pareto', 'zipf:0', 'zipf:x', 'zipf+hotset', 'hotset:1.5', 'seasonal:1:2', 'seasonal:-1', 'zipf:1:2',
+])
+def test_parse_rejects_invalid_specs(text):
+    with pytest.raises(ValueError):
+        WorkloadProfile.parse(text)
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_workload(text)
+
+
+def test_uniform_has_no_samplers():
+    profile = WorkloadProfile.parse('uniform')
+    assert profile.is_uniform
+    assert profile.key_sampler(10, np.random.default_rng(0)) is None
+    assert profile.day_sampler(datetime(2024, 1, 1), datetime(2024, 12, 31)) is None
+
+
+def test_hotset_share_goes_to_hot_keys():
+    profile = WorkloadProfile.parse('hotset:0.1:0.8')
+    sampler = profile.key_sampler(100, np.random.default_rng(0))
+    keys = sampler.sample(200_000, random_state=np.random.default_rng(1))
+    assert keys.min() >= 1 and keys.max() <= 100
+    assert top_share(keys, 0.1) == pytest.approx(0.8, abs=0.01)
+
+
+def test_zipf_is_more_skewed_than_uniform():
+    rng = np.random.default_rng(2)
+    zipf_keys = WorkloadProfile.parse('zipf:1.2').key_sampler(200, np.random.default_rng(0)).sample(100_000, rng)
+    uniform_keys = rng.integers(1, 201, size=100_000)
+    assert top_share(zipf_keys) > 2 * top_share(uniform_keys)
+
+
+def test_seasonal_day_weights_mark_bursts():
+    weights = WorkloadProfile.parse('seasonal:3').day_weights(datetime(2024, 1, 1), datetime(2024, 12, 31))
+    assert len(weights) == 366
+    assert weights[0] == 1.0                                  # 1 de enero
+    assert weights[(datetime(2024, 12, 24) - datetime(2024, 1, 1)).days] == 4.0
+    assert weights[(datetime(2024, 5, 25) - datetime(2024, 1, 1)).days] == 4.0
+
+
+def test_top_share_of_empty_keys():
+    assert top_share([]) == 0.0